@@ -6,6 +6,8 @@
 #   ./scripts/security/validate-deployment.sh resin
 #   ./scripts/security/validate-deployment.sh evergreen
 #   RESIN_API_KEY=your-key ./scripts/security/validate-deployment.sh resin
+#   ./scripts/security/validate-deployment.sh --all
+#   ./scripts/security/validate-deployment.sh --workers resin,evergreen
 
 set -e
 
@@ -32,12 +34,21 @@ if [ -z "$1" ]; then
     echo "Examples:"
     echo "  $0 resin"
     echo "  $0 evergreen"
+    echo "  $0 --all"
+    echo "  $0 --workers resin,evergreen"
     echo ""
     echo "Available workers are defined in tools/security/deployments.yaml"
     exit 1
 fi
 
-WORKER="$1"
+# Bare worker name validates one worker; flags (--all, --workers ...) pass through
+if [[ "$1" == --* ]]; then
+    WORKER="$*"
+    VALIDATOR_ARGS=("$@")
+else
+    WORKER="$1"
+    VALIDATOR_ARGS=(--worker "$1")
+fi
 
 echo -e "${BLUE}================================================${NC}"
 echo "Resin Security Validator"
@@ -68,10 +79,10 @@ cd "$REPO_ROOT"
 
 # Run validator
 echo ""
-echo -e "${BLUE}Running validator for worker: $WORKER${NC}"
+echo -e "${BLUE}Running validator for: $WORKER${NC}"
 echo ""
 
-cd "$REPO_ROOT/tools/security" && uv run python validator.py --worker "$WORKER"
+cd "$REPO_ROOT/tools/security" && uv run python validator.py "${VALIDATOR_ARGS[@]}"
 
 echo ""
 echo -e "${GREEN}✓ Validation complete${NC}"
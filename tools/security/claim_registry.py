@@ -0,0 +1,179 @@
+"""
+Security Claim Registry
+Immutable, indexed claim catalogue loaded from claims.yaml
+
+The catalogue is parsed once per process (per set of files) and shared by
+every ResinSecurityValidator, so creating a validator no longer rebuilds
+the claim definitions. Lookups by ID and by category use prebuilt indexes
+instead of scanning all claims.
+
+Usage:
+    registry = load_registry()                        # claims.yaml
+    registry = load_registry(CLAIMS_FILE, "tenant-claims.yaml")  # plus tenant claims
+    registry["ENC_TLS_TRANSIT"].expected_result
+    registry.by_category(ClaimCategory.ENCRYPTION)
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Tuple, Union
+
+CLAIMS_FILE = Path(__file__).parent / "claims.yaml"
+
+CATALOGUE_VERSION = 1
+
+
+class ClaimCategory(Enum):
+    AUTHENTICATION = "Authentication & Authorization"
+    ENCRYPTION = "Encryption"
+    DATA_HANDLING = "Data Handling"
+    INFRASTRUCTURE = "Infrastructure"
+    COMPLIANCE = "Compliance"
+    LOGGING = "Logging & Monitoring"
+    API_SECURITY = "API Security"
+    PERFORMANCE = "Performance"
+
+
+@dataclass(frozen=True, slots=True)
+class ClaimDefinition:
+    """One claim from the catalogue (what is claimed and how it is tested)"""
+    id: str
+    category: ClaimCategory
+    claim: str
+    test_procedure: str
+    expected_result: str
+
+
+class ClaimRegistry:
+    """
+    Read-only claim catalogue with ID and category indexes
+
+    Iteration follows catalogue order: categories in ClaimCategory order,
+    claims in file order within each category.
+    """
+
+    __slots__ = ("_claims", "_by_id", "_by_upper_id", "_by_category")
+
+    def __init__(self, definitions: List[ClaimDefinition]):
+        """
+        Args:
+            definitions: Claims in any order; IDs must be unique (case-insensitively)
+        """
+        by_upper_id: Dict[str, ClaimDefinition] = {}
+        grouped: Dict[ClaimCategory, List[ClaimDefinition]] = {c: [] for c in ClaimCategory}
+        for definition in definitions:
+            key = definition.id.upper()
+            if key in by_upper_id:
+                raise ValueError(f"Duplicate claim ID: {definition.id}")
+            by_upper_id[key] = definition
+            grouped[definition.category].append(definition)
+
+        ordered = tuple(d for category in ClaimCategory for d in grouped[category])
+        object.__setattr__(self, "_claims", ordered)
+        object.__setattr__(self, "_by_id", MappingProxyType({d.id: d for d in ordered}))
+        object.__setattr__(self, "_by_upper_id", MappingProxyType(by_upper_id))
+        object.__setattr__(self, "_by_category", MappingProxyType(
+            {category: tuple(claims) for category, claims in grouped.items()}
+        ))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ClaimRegistry is immutable")
+
+    def __len__(self) -> int:
+        return len(self._claims)
+
+    def __iter__(self) -> Iterator[ClaimDefinition]:
+        return iter(self._claims)
+
+    def __contains__(self, claim_id: str) -> bool:
+        return claim_id.upper() in self._by_upper_id
+
+    def __getitem__(self, claim_id: str) -> ClaimDefinition:
+        return self._by_id[claim_id]
+
+    @property
+    def ids(self) -> Mapping[str, ClaimDefinition]:
+        """Claims keyed by ID (read-only)"""
+        return self._by_id
+
+    def get(self, claim_id: str):
+        """Claim by ID, matched case-insensitively (None if unknown)"""
+        return self._by_upper_id.get(claim_id.upper())
+
+    def by_category(self, category: ClaimCategory) -> Tuple[ClaimDefinition, ...]:
+        """Claims in one category, in catalogue order"""
+        return self._by_category[category]
+
+    @classmethod
+    def from_files(cls, *paths: Union[str, Path]) -> "ClaimRegistry":
+        """Parse one or more catalogue files into a single registry"""
+        definitions: List[ClaimDefinition] = []
+        for path in paths:
+            definitions.extend(_read_catalogue(Path(path).expanduser()))
+        return cls(definitions)
+
+
+@lru_cache(maxsize=32)
+def _load(paths: Tuple[str, ...]) -> ClaimRegistry:
+    return ClaimRegistry.from_files(*paths)
+
+
+def load_registry(*paths: Union[str, Path]) -> ClaimRegistry:
+    """
+    Shared registry for catalogue files (default: claims.yaml)
+
+    Each distinct list of files is parsed once per process; later calls
+    return the same immutable registry.
+    """
+    resolved = tuple(str(Path(p).expanduser().resolve()) for p in (paths or (CLAIMS_FILE,)))
+    return _load(resolved)
+
+
+def registry_for_worker(config: Mapping) -> ClaimRegistry:
+    """
+    Registry for a deployments.yaml entry: claims.yaml plus the entry's
+    `claims_file` (relative paths are resolved against tools/security)
+    """
+    extra = config.get("claims_file")
+    if not extra:
+        return load_registry()
+    return load_registry(CLAIMS_FILE, CLAIMS_FILE.parent / Path(extra).expanduser())
+
+
+# ============================================================================
+# Helper functions
+# ============================================================================
+
+def _read_catalogue(path: Path) -> List[ClaimDefinition]:
+    import yaml  # Deferred: only needed once a catalogue is actually parsed
+
+    with open(path) as f:
+        data = yaml.safe_load(f) or {}
+
+    version = data.get("version", CATALOGUE_VERSION)
+    if version != CATALOGUE_VERSION:
+        raise ValueError(f"{path}: unsupported catalogue version {version}")
+
+    definitions = []
+    for category_name, claims in (data.get("categories") or {}).items():
+        try:
+            category = ClaimCategory[category_name]
+        except KeyError:
+            raise ValueError(f"{path}: unknown claim category {category_name}") from None
+        for entry in claims or []:
+            missing = [key for key in ("id", "claim", "test_procedure", "expected_result")
+                       if not entry.get(key)]
+            if missing:
+                raise ValueError(f"{path}: claim {entry.get('id', '?')} missing "
+                                 f"{', '.join(missing)}")
+            definitions.append(ClaimDefinition(
+                id=str(entry["id"]),
+                category=category,
+                claim=str(entry["claim"]),
+                test_procedure=str(entry["test_procedure"]),
+                expected_result=str(entry["expected_result"]),
+            ))
+    return definitions
@@ -0,0 +1,246 @@
+"""
+Deployment Registry
+Compiled, validated cache of deployments.yaml
+
+Parsing deployments.yaml with PyYAML takes seconds once it lists thousands
+of tenant workers, and the validator is started many times a day. The first
+load parses and validates the file and writes a compiled (marshal) copy to
+.state/deployments/; later loads read that copy instead of the YAML.
+
+The compiled copy is keyed on the YAML file: when its mtime and size are
+unchanged the copy is used as is; otherwise the file is hashed and only
+re-parsed if its SHA-256 differs (a touch or checkout without changes
+does not trigger a parse). The copy also records a hash of the schema
+(OPTIONAL_KEYS and VALIDATOR_VERSION), so adding a key or tightening
+validation re-validates the file. Schema errors are raised at compile
+time, all at once, and an invalid file is never cached.
+
+Usage:
+    deployments = load_deployments()          # deployments.yaml
+    deployments["resin"]["url"]               # dict lookup, no parsing
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+DEPLOYMENTS_FILE = Path(__file__).parent / "deployments.yaml"
+
+# Compiled copies, one per source file (marshal data is per Python version)
+DEFAULT_COMPILED_DIR = Path(__file__).resolve().parent / ".state" / "deployments"
+
+COMPILED_VERSION = 1
+
+# Bump whenever _validate_entry's rules change (key additions are picked up
+# from OPTIONAL_KEYS); compiled copies from another schema are re-validated
+VALIDATOR_VERSION = 3
+
+# Optional per-deployment keys and their expected types
+OPTIONAL_KEYS: Dict[str, Tuple[type, ...]] = {
+    "name": (str,),
+    "api_key_env": (str,),
+    "description": (str,),
+    "logpush_path": (str,),
+    "log_scan_processes": (int,),
+    "log_incremental": (bool,),
+    "log_checkpoint_dir": (str,),
+    "log_retention": (dict,),
+    "audit_db": (str,),
+    "cache_ttls": (dict,),
+    "result_cache_dir": (str,),
+    "rate_limit_probe": (dict,),
+    "latency_budget": (dict,),
+    "claims_file": (str,),
+    "tls_probe": (dict,),
+    "watch": (dict,),
+    "http": (dict,),
+}
+
+
+class DeploymentConfigError(ValueError):
+    """deployments.yaml failed validation (one message per problem)"""
+
+    def __init__(self, path: Path, errors: List[str]):
+        self.path = path
+        self.errors = errors
+        super().__init__(f"{path}: " + "; ".join(errors))
+
+
+_memo: Dict[str, Tuple[Tuple[int, int], Mapping[str, Dict]]] = {}
+_memo_lock = threading.Lock()
+
+
+def load_deployments(path: Union[str, Path] = DEPLOYMENTS_FILE,
+                     compiled_dir: Union[str, Path, None] = None) -> Mapping[str, Dict]:
+    """
+    Deployments from a deployments.yaml file, via its compiled copy
+
+    Args:
+        path: YAML file with a top-level `deployments` mapping
+        compiled_dir: Where compiled copies are kept (default: .state/deployments)
+
+    Returns:
+        Read-only mapping of worker name to deployment entry
+
+    Raises:
+        DeploymentConfigError: The file does not match the schema
+        OSError: The file cannot be read
+    """
+    path = Path(path).expanduser().resolve()
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    with _memo_lock:
+        memo = _memo.get(str(path))
+        if memo is not None and memo[0] == stamp:
+            return memo[1]
+
+        compiled_path = _compiled_path(path, compiled_dir)
+        header, deployments = _read_compiled(compiled_path, path)
+        if header is not None and header.get("schema") != schema_digest():
+            header = None
+        if header is None or (header.get("mtime_ns"), header.get("size")) != stamp:
+            source = path.read_bytes()
+            digest = hashlib.sha256(source).hexdigest()
+            if header is None or header.get("sha256") != digest:
+                deployments = compile_deployments(source, path)
+            _write_compiled(compiled_path, path, stamp, digest, deployments)
+
+        result = MappingProxyType(deployments)
+        _memo[str(path)] = (stamp, result)
+        return result
+
+
+def compile_deployments(source: Union[bytes, str],
+                        path: Path = DEPLOYMENTS_FILE) -> Dict[str, Dict]:
+    """
+    Parse and validate deployments.yaml content
+
+    Every problem is collected before raising, so one run reports them all.
+    """
+    import yaml  # Deferred: only needed when the compiled copy is stale
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        data = yaml.load(source, Loader=loader) or {}
+    except yaml.YAMLError as e:
+        raise DeploymentConfigError(path, [f"invalid YAML: {e}"]) from None
+
+    if not isinstance(data, dict) or not isinstance(data.get("deployments", {}), dict):
+        raise DeploymentConfigError(path, ["`deployments` must be a mapping"])
+
+    deployments = data.get("deployments") or {}
+    errors = []
+    for worker, entry in deployments.items():
+        errors.extend(_validate_entry(worker, entry))
+    if errors:
+        raise DeploymentConfigError(path, errors)
+    return deployments
+
+
+def schema_digest() -> str:
+    """Short hash of the deployment schema (OPTIONAL_KEYS and VALIDATOR_VERSION)"""
+    keys = sorted((key, [t.__name__ for t in types]) for key, types in OPTIONAL_KEYS.items())
+    return hashlib.sha256(repr((VALIDATOR_VERSION, keys)).encode()).hexdigest()[:16]
+
+
+# ============================================================================
+# Helper functions
+# ============================================================================
+
+def _validate_entry(worker, entry) -> List[str]:
+    if not isinstance(worker, str):
+        return [f"deployment name {worker!r} must be a string"]
+    if worker.startswith("_"):
+        # Reserved for tool-generated reports (fleet.FLEET_REPORT_NAME)
+        return [f"{worker}: deployment names must not start with '_'"]
+    if not isinstance(entry, dict):
+        return [f"{worker}: entry must be a mapping"]
+
+    errors = []
+    url = entry.get("url")
+    if not isinstance(url, str) or not url.startswith(("https://", "http://")):
+        errors.append(f"{worker}: url must be an http(s) URL")
+    for key, types in OPTIONAL_KEYS.items():
+        value = entry.get(key)
+        if value is None:
+            continue
+        # bool is an int subclass; only accept it where bool is expected
+        if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+            errors.append(f"{worker}: {key} must be {' or '.join(t.__name__ for t in types)}")
+    if isinstance(entry.get("log_scan_processes"), int) and entry["log_scan_processes"] < 1:
+        errors.append(f"{worker}: log_scan_processes must be at least 1")
+    for claim, ttl in (entry.get("cache_ttls") or {}).items():
+        if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl < 0:
+            errors.append(f"{worker}: cache_ttls.{claim} must be a number of seconds >= 0")
+    http = entry.get("http")
+    for key, value in (http.items() if isinstance(http, dict) else ()):
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            errors.append(f"{worker}: http.{key} must be a number >= 0")
+    watch = entry.get("watch")
+    if isinstance(watch, dict):
+        intervals = watch.get("intervals") or {}
+        if not isinstance(intervals, dict):
+            errors.append(f"{worker}: watch.intervals must be dict")
+            intervals = {}
+        for key, value in [*(("intervals." + str(k), v) for k, v in intervals.items()),
+                           *((k, watch[k]) for k in ("max_backoff",) if k in watch)]:
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                errors.append(f"{worker}: watch.{key} must be a number of seconds > 0")
+        jitter = watch.get("jitter", 0)
+        if isinstance(jitter, bool) or not isinstance(jitter, (int, float)) \
+                or not 0 <= jitter < 1:
+            errors.append(f"{worker}: watch.jitter must be a fraction in [0, 1)")
+    retention = entry.get("log_retention")
+    if isinstance(retention, dict):
+        for key, value in retention.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0 \
+                    or (key == "days" and value == 0):
+                bound = "> 0" if key == "days" else ">= 0"
+                errors.append(f"{worker}: log_retention.{key} must be a number of days {bound}")
+    return errors
+
+
+def _compiled_path(path: Path, compiled_dir: Union[str, Path, None]) -> Path:
+    directory = Path(compiled_dir or DEFAULT_COMPILED_DIR)
+    key = hashlib.sha256(str(path).encode()).hexdigest()[:16]
+    return directory / f"{path.stem}-{key}.{sys.implementation.cache_tag}.marshal"
+
+
+def _read_compiled(compiled_path: Path, path: Path) -> Tuple[Optional[Dict], Optional[Dict]]:
+    try:
+        with open(compiled_path, "rb") as f:
+            header, deployments = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None, None
+    if (not isinstance(header, dict) or header.get("version") != COMPILED_VERSION
+            or header.get("source") != str(path) or not isinstance(deployments, dict)):
+        return None, None
+    return header, deployments
+
+
+def _write_compiled(compiled_path: Path, path: Path, stamp: Tuple[int, int],
+                    digest: str, deployments: Dict[str, Dict]):
+    header = {"version": COMPILED_VERSION, "source": str(path), "schema": schema_digest(),
+              "mtime_ns": stamp[0], "size": stamp[1], "sha256": digest}
+    try:
+        compiled_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=compiled_path.parent, prefix=".tmp-")
+    except OSError:
+        return  # Read-only checkout: keep working from the YAML
+    try:
+        with os.fdopen(fd, "wb") as f:
+            marshal.dump((header, deployments), f)
+        os.replace(tmp, compiled_path)
+    except ValueError:
+        os.unlink(tmp)  # Values marshal cannot store (e.g. YAML dates): stay uncached
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
@@ -0,0 +1,245 @@
+"""
+Concurrent claim execution engine
+Runs claim test methods on a sized worker pool with per-claim timeouts and cancellation
+
+Network-bound claims (TLS, CORS, rate limiting, log fetches) spend most of
+their time waiting, so running them on a thread pool lets them overlap.
+Results keep the run_all_tests() shape: claim ID -> (ValidationStatus, details).
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    # When imported from tests or validator.py (tools/security on sys.path)
+    from claim_tests import ValidationStatus
+except ImportError:
+    # When imported normally as a package
+    from .claim_tests import ValidationStatus
+
+
+ClaimFunc = Callable[[], Tuple[ValidationStatus, str]]
+ClaimResult = Tuple[ValidationStatus, str]
+# Called as each claim finishes: (claim ID, result, seconds it ran or None if cancelled)
+ResultCallback = Callable[[str, ClaimResult, Optional[float]], None]
+
+
+@dataclass
+class ExecutionReport:
+    """Timing summary for one claim run"""
+    max_workers: int
+    wall_time: float = 0.0
+    durations: Dict[str, float] = field(default_factory=dict)
+    timed_out: List[str] = field(default_factory=list)
+    cancelled: List[str] = field(default_factory=list)
+    cached: List[str] = field(default_factory=list)
+    metrics: Dict[str, float] = field(default_factory=dict)  # e.g. tls_handshake_ms
+    # Claim ID -> instrumentation.ClaimStats (set by run_all_tests)
+    claim_stats: Dict[str, object] = field(default_factory=dict)
+
+    @property
+    def claim_time(self) -> float:
+        """Sum of per-claim durations (what a serial run would have cost)"""
+        return sum(self.durations.values())
+
+    @property
+    def speedup(self) -> float:
+        """Summed claim time divided by wall-clock time"""
+        if self.wall_time <= 0:
+            return 1.0
+        return self.claim_time / self.wall_time
+
+    def summary(self) -> str:
+        """One-line human readable timing summary"""
+        line = (
+            f"{len(self.durations)} claims in {self.wall_time:.2f}s wall-clock "
+            f"({self.claim_time:.2f}s summed claim time, {self.speedup:.1f}x, "
+            f"{self.max_workers} workers)"
+        )
+        if self.timed_out:
+            line += f", {len(self.timed_out)} timed out"
+        if self.cancelled:
+            line += f", {len(self.cancelled)} cancelled"
+        if self.cached:
+            line += f", {len(self.cached)} cached"
+        if "tls_handshake_ms" in self.metrics:
+            line += f", TLS handshake {self.metrics['tls_handshake_ms']:.0f}ms"
+        return line
+
+
+class ClaimExecutor:
+    """
+    Execute claim test functions, optionally in parallel
+
+    With max_workers=1 and no timeout, claims run inline in the calling
+    thread exactly as the original serial loop did. Otherwise each claim runs
+    on its own daemon thread, at most `max_workers` at a time; a claim that
+    exceeds `timeout` seconds is reported as WARN and abandoned (Python
+    threads cannot be killed) and its slot goes to the next queued claim, and
+    setting `cancel_event` (or calling cancel()) stops claims that have not
+    started yet.
+    """
+
+    def __init__(self, max_workers: int = 1, timeout: Optional[float] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        """
+        Args:
+            max_workers: Size of the worker pool (1 = serial)
+            timeout: Per-claim timeout in seconds (None = no limit)
+            cancel_event: Event that cancels the run when set
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cancel_event = cancel_event or threading.Event()
+        self.report: Optional[ExecutionReport] = None
+        self._on_result: Optional[ResultCallback] = None
+
+    def cancel(self):
+        """Cancel the current run; claims already running finish in the background"""
+        self.cancel_event.set()
+
+    def run(self, claims: Dict[str, ClaimFunc],
+            on_result: Optional[ResultCallback] = None) -> Dict[str, ClaimResult]:
+        """
+        Run all claims and return results in the same order as `claims`
+
+        NotImplementedError becomes PENDING, as in the serial loop. Any other
+        exception propagates to the caller.
+
+        Args:
+            claims: Claim ID -> zero-argument test function
+            on_result: Called in the calling thread as each claim finishes,
+                times out or is cancelled (completion order, not `claims` order)
+        """
+        self.report = ExecutionReport(max_workers=self.max_workers)
+        self._on_result = on_result
+        start = time.perf_counter()
+
+        if self.max_workers == 1 and self.timeout is None:
+            results = self._run_serial(claims)
+        else:
+            results = self._run_pooled(claims)
+
+        self.report.wall_time = time.perf_counter() - start
+        return {claim_id: results[claim_id] for claim_id in claims}
+
+    # ============================================================================
+    # Helper methods
+    # ============================================================================
+
+    def _call(self, claim_id: str, func: ClaimFunc, started: Dict[str, float],
+              report: ExecutionReport) -> ClaimResult:
+        """Run one claim, recording its duration"""
+        claim_start = time.perf_counter()
+        started[claim_id] = claim_start
+        try:
+            return func()
+        except NotImplementedError as e:
+            return (ValidationStatus.PENDING, str(e))
+        finally:
+            # A claim abandoned on timeout keeps the duration recorded at expiry
+            report.durations.setdefault(claim_id, time.perf_counter() - claim_start)
+
+    def _run_serial(self, claims: Dict[str, ClaimFunc]) -> Dict[str, ClaimResult]:
+        started: Dict[str, float] = {}
+        results = {}
+        for claim_id, func in claims.items():
+            if self.cancel_event.is_set():
+                results[claim_id] = self._cancelled(claim_id)
+                continue
+            results[claim_id] = self._call(claim_id, func, started, self.report)
+            self._finished(claim_id, results[claim_id])
+        return results
+
+    def _run_pooled(self, claims: Dict[str, ClaimFunc]) -> Dict[str, ClaimResult]:
+        started: Dict[str, float] = {}
+        results: Dict[str, ClaimResult] = {}
+        waiting = deque(claims.items())
+        running: Dict[str, threading.Thread] = {}
+        done: queue.Queue = queue.Queue()  # (claim ID, result, exception)
+
+        while waiting or running:
+            if self.cancel_event.is_set():
+                for claim_id in list(running) + [claim_id for claim_id, _ in waiting]:
+                    results[claim_id] = self._cancelled(claim_id)
+                break
+
+            # A timed-out claim leaves `running`, so its slot is reused even
+            # though its thread may never return
+            while waiting and len(running) < self.max_workers:
+                claim_id, func = waiting.popleft()
+                thread = threading.Thread(
+                    target=self._worker, args=(claim_id, func, started, done),
+                    name=f"claim-{claim_id}", daemon=True,
+                )
+                running[claim_id] = thread
+                thread.start()
+
+            try:
+                claim_id, result, error = done.get(timeout=self._next_wait(running, started))
+            except queue.Empty:
+                pass
+            else:
+                # Late results from abandoned claims are dropped
+                if running.pop(claim_id, None) is not None:
+                    if error is not None:
+                        raise error
+                    results[claim_id] = result
+                    self._finished(claim_id, result)
+
+            self._expire(running, started, results)
+
+        return results
+
+    def _worker(self, claim_id: str, func: ClaimFunc, started: Dict[str, float],
+                done: queue.Queue):
+        """Thread body: run one claim and hand its outcome back to the run loop"""
+        try:
+            done.put((claim_id, self._call(claim_id, func, started, self.report), None))
+        except BaseException as e:
+            done.put((claim_id, None, e))
+
+    def _next_wait(self, running: Dict[str, threading.Thread], started: Dict[str, float]) -> float:
+        """How long to wait before re-checking deadlines and cancellation"""
+        poll = 0.05
+        if self.timeout is None:
+            return poll
+        now = time.perf_counter()
+        deadlines = [
+            started[claim_id] + self.timeout - now
+            for claim_id in running if claim_id in started
+        ]
+        return max(0.0, min(deadlines + [poll]))
+
+    def _expire(self, running: Dict[str, threading.Thread], started: Dict[str, float],
+                results: Dict[str, ClaimResult]):
+        """Abandon running claims that exceeded the per-claim timeout"""
+        if self.timeout is None:
+            return
+        now = time.perf_counter()
+        for claim_id in list(running):
+            if claim_id in started and now - started[claim_id] >= self.timeout:
+                del running[claim_id]
+                self.report.timed_out.append(claim_id)
+                self.report.durations[claim_id] = now - started[claim_id]
+                results[claim_id] = (
+                    ValidationStatus.WARN,
+                    f"Claim timed out after {self.timeout:g}s"
+                )
+                self._finished(claim_id, results[claim_id])
+
+    def _cancelled(self, claim_id: str) -> ClaimResult:
+        self.report.cancelled.append(claim_id)
+        result = (ValidationStatus.PENDING, "Claim cancelled before completion")
+        self._finished(claim_id, result)
+        return result
+
+    def _finished(self, claim_id: str, result: ClaimResult):
+        if self._on_result is not None:
+            self._on_result(claim_id, result, self.report.durations.get(claim_id))
@@ -0,0 +1,283 @@
+"""
+Fleet-wide Security Validation
+Validates many worker deployments from deployments.yaml concurrently
+
+Each worker gets its own ClaimTester run and its own report; a fleet rollup
+summarises every worker in one file. Concurrency is capped overall and per
+host so a large tenant list does not hammer a single account or zone.
+
+Usage:
+  python tools/security/validator.py --all
+  python tools/security/validator.py --workers resin,evergreen --max-concurrency 32
+"""
+
+import io
+import os
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, TextIO
+from urllib.parse import urlparse
+
+# Report name of the rollup; deployment names may not start with "_", so it
+# never collides with a worker's own report
+FLEET_REPORT_NAME = "_fleet-rollup"
+
+
+@dataclass
+class WorkerValidation:
+    """Outcome of validating one worker deployment"""
+    worker: str
+    name: str
+    url: str
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    duration: float = 0.0
+    report_path: Optional[str] = None
+    report_paths: Dict[str, str] = field(default_factory=dict)  # format -> path
+    timing: Optional[str] = None
+    metrics: Dict[str, float] = field(default_factory=dict)
+    claim_stats: Dict = field(default_factory=dict)  # Claim ID -> instrumentation.ClaimStats
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def validate_worker(worker_name: str, config: dict, api_key: str,
+                    claim_workers: int = 1, claim_timeout: Optional[float] = None,
+                    save: bool = True, validator=None, use_cache: bool = False,
+                    force: bool = False, invalidate: Optional[List[str]] = None,
+                    report_formats: Sequence[str] = ("md",),
+                    history=None, on_result: Optional[Callable] = None,
+                    instrumentation=None) -> WorkerValidation:
+    """
+    Run every claim against one worker, apply results and save its report
+
+    Args:
+        worker_name: Key from deployments.yaml
+        config: Deployment entry (name, url, api_key_env, ...)
+        api_key: Bearer token for the worker
+        claim_workers: Claims run in parallel within this worker
+        claim_timeout: Per-claim timeout in seconds
+        save: Write the worker report to docs/reports
+        validator: ResinSecurityValidator to record results on (default: a new
+            one with the worker's claim registry, including its `claims_file`)
+        use_cache: Reuse fresh results from the worker's result cache
+        force: Discard the worker's cached results and re-run every claim
+        invalidate: Claim IDs or categories to drop from the cache first
+        report_formats: report_writer.RENDERERS keys written in one pass
+            (report_path is the first)
+        history: result_history.ResultHistory to append this run's results to
+        on_result: Called as on_result(worker_name, claim_id, (status, details),
+            duration, cached) as each claim's result becomes known
+        instrumentation: instrumentation.ClaimInstrumentation wrapping each
+            claim (e.g. to profile it); per-claim stats are recorded either way
+    """
+    from claim_registry import registry_for_worker
+    from claim_tests import run_all_tests
+    from executor import ClaimExecutor
+    from report_writer import save_reports
+    from result_cache import ResultCache
+    import tracing
+    from validator import ResinSecurityValidator
+
+    start = time.perf_counter()
+    result = WorkerValidation(worker=worker_name, name=config.get("name", worker_name),
+                              url=config["url"])
+
+    with tracing.span(worker_name, "worker", url=config["url"]) as span_args:
+        cache = None
+        if use_cache:
+            cache = ResultCache.for_worker(worker_name, config)
+            if force:
+                cache.invalidate()
+            elif invalidate:
+                cache.invalidate(invalidate)
+
+        claim_result = None
+        if on_result is not None:
+            def claim_result(claim_id, claim, duration, cached):
+                on_result(worker_name, claim_id, claim, duration, cached)
+
+        executor = ClaimExecutor(max_workers=claim_workers, timeout=claim_timeout)
+        claim_results = run_all_tests(config["url"], api_key, executor=executor,
+                                      worker_config=config, worker_name=worker_name,
+                                      cache=cache, on_result=claim_result,
+                                      instrumentation=instrumentation)
+        result.timing = executor.report.summary()
+        result.metrics = dict(executor.report.metrics)
+        result.claim_stats = dict(executor.report.claim_stats)
+        if history is not None:
+            history.record_run(worker_name, config["url"], claim_results,
+                               durations=executor.report.durations,
+                               cached=executor.report.cached,
+                               wall_time=executor.report.wall_time)
+
+        if validator is None:
+            validator = ResinSecurityValidator(registry_for_worker(config))
+        validator.apply_results(claim_results)
+
+        for claim in validator.claims.values():
+            status = claim.status.value
+            result.status_counts[status] = result.status_counts.get(status, 0) + 1
+
+        if save:
+            with tracing.span("reports", "report", formats=list(report_formats)):
+                paths = save_reports(worker_name, validator, report_formats)
+            result.report_paths = {name: str(path) for name, path in paths.items()}
+            result.report_path = result.report_paths[report_formats[0]]
+        span_args.update(result.status_counts)
+
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def validate_fleet(worker_names: List[str], deployments: dict,
+                   max_concurrency: int = 16, per_host_limit: int = 4,
+                   claim_workers: int = 1, claim_timeout: Optional[float] = None,
+                   save: bool = True,
+                   on_complete: Optional[Callable[[WorkerValidation], None]] = None,
+                   use_cache: bool = False, force: bool = False,
+                   invalidate: Optional[List[str]] = None,
+                   report_formats: Sequence[str] = ("md",),
+                   history=None, on_result: Optional[Callable] = None
+                   ) -> List[WorkerValidation]:
+    """
+    Validate several workers concurrently
+
+    Args:
+        worker_names: Workers to validate (keys of `deployments`)
+        deployments: Output of load_deployments_config()
+        max_concurrency: Workers validated at the same time across the fleet
+        per_host_limit: Workers validated at the same time against one host
+        claim_workers: Claims run in parallel within each worker
+        claim_timeout: Per-claim timeout in seconds
+        save: Write per-worker reports to docs/reports
+        on_complete: Called with each WorkerValidation as it finishes
+        use_cache / force / invalidate: Result cache handling, as for validate_worker
+        report_formats: Per-worker report formats, as for validate_worker
+        history: ResultHistory shared by all workers, as for validate_worker
+        on_result: Per-claim callback, as for validate_worker; called from the
+            workers' threads, so it must be thread-safe
+
+    Returns:
+        WorkerValidation per worker, in the order of `worker_names`
+    """
+    if max_concurrency < 1 or per_host_limit < 1:
+        raise ValueError("max_concurrency and per_host_limit must be at least 1")
+
+    unknown = [w for w in worker_names if w not in deployments]
+    if unknown:
+        raise ValueError(f"Unknown workers: {', '.join(unknown)}")
+
+    def run_one(worker: str) -> WorkerValidation:
+        config = deployments[worker]
+        env_var = config.get("api_key_env")
+        api_key = os.getenv(env_var) if env_var else None
+        if not api_key:
+            return WorkerValidation(
+                worker=worker, name=config.get("name", worker), url=config["url"],
+                error=f"Environment variable '{env_var}' not set" if env_var
+                else "No api_key_env defined for worker"
+            )
+
+        try:
+            return validate_worker(worker, config, api_key, claim_workers,
+                                   claim_timeout, save, use_cache=use_cache,
+                                   force=force, invalidate=invalidate,
+                                   report_formats=report_formats, history=history,
+                                   on_result=on_result)
+        except Exception as e:
+            return WorkerValidation(worker=worker, name=config.get("name", worker),
+                                    url=config["url"], error=str(e))
+
+    # Per-host limits are enforced here, before submitting: a worker waiting
+    # for its host never occupies one of the max_concurrency pool threads
+    queues: Dict[str, deque] = defaultdict(deque)
+    for worker in worker_names:
+        queues[_host(deployments[worker]["url"])].append(worker)
+    active: Dict[str, int] = defaultdict(int)
+    running: Dict[Future, str] = {}
+    results: Dict[str, WorkerValidation] = {}
+
+    with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="fleet") as pool:
+        while queues or running:
+            # Round-robin across hosts so one host never starves the pool
+            started = True
+            while started and len(running) < max_concurrency:
+                started = False
+                for host in list(queues):
+                    if len(running) >= max_concurrency:
+                        break
+                    if active[host] < per_host_limit:
+                        worker = queues[host].popleft()
+                        if not queues[host]:
+                            del queues[host]
+                        active[host] += 1
+                        running[pool.submit(run_one, worker)] = worker
+                        started = True
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                worker = running.pop(future)
+                active[_host(deployments[worker]["url"])] -= 1
+                result = results[worker] = future.result()
+                if on_complete:
+                    on_complete(result)
+
+    return [results[worker] for worker in worker_names]
+
+
+def generate_fleet_report(results: List[WorkerValidation]) -> str:
+    """Generate markdown rollup across all validated workers"""
+    output = io.StringIO()
+    write_fleet_report(results, output)
+    return output.getvalue()
+
+
+def write_fleet_report(results: List[WorkerValidation], stream: TextIO):
+    """Stream the markdown rollup one worker row at a time"""
+    write = stream.write
+    write("# Resin AI Fleet Security Report\n\n")
+    write(f"Generated: {datetime.now().isoformat()}\n\n")
+
+    totals: Dict[str, int] = {}
+    failed = 0
+    for result in results:
+        failed += not result.ok
+        for status, count in result.status_counts.items():
+            totals[status] = totals.get(status, 0) + count
+
+    write("## Summary\n\n")
+    write(f"Workers: {len(results)}\n")
+    write(f"Validated: {len(results) - failed}\n")
+    write(f"Errors: {failed}\n")
+    for status, count in sorted(totals.items()):
+        write(f"{status}: {count}\n")
+    write("\n")
+
+    write("## Workers\n\n")
+    write("| Worker | URL | Results | Duration | TLS handshake | Report |\n")
+    write("|--------|-----|---------|----------|---------------|--------|\n")
+    for result in results:
+        if result.ok:
+            counts = ", ".join(f"{s}: {c}" for s, c in sorted(result.status_counts.items()))
+        else:
+            counts = f"ERROR: {result.error}"
+        report = result.report_path or "-"
+        handshake = result.metrics.get("tls_handshake_ms")
+        handshake = f"{handshake:.0f}ms" if handshake is not None else "-"
+        write(f"| {result.name} ({result.worker}) | {result.url} | {counts} "
+              f"| {result.duration:.1f}s | {handshake} | {report} |\n")
+    write("\n")
+
+
+# ============================================================================
+# Helper functions
+# ============================================================================
+
+def _host(url: str) -> str:
+    return urlparse(url).hostname or url
@@ -0,0 +1,125 @@
+"""
+Encryption Claims - Implementations
+Tests for claims: ENC_TLS_TRANSIT, ENC_AES256_REST, ENC_MEMORY_PROCESSING
+"""
+
+import re
+from typing import Tuple, Optional, Dict
+
+# Import ValidationStatus from parent package using relative import
+# Use ..claim_tests to go up to tools/security/ then import claim_tests
+try:
+    # When imported from tests
+    from claim_tests import ValidationStatus
+except ImportError:
+    # When imported normally as a package
+    from ..claim_tests import ValidationStatus
+
+from .tls_probe import ProbeResult, TLSProbe
+
+# Protocol versions accepted for data in transit (ssl.SSLSocket.version() names)
+ACCEPTED_TLS_VERSIONS = ("TLSv1.2", "TLSv1.3")
+
+
+class EncryptionImplementations:
+    """
+    Encryption claim implementations
+    """
+
+    def __init__(self, worker_url: str, api_key: str, worker_config: Optional[Dict] = None):
+        """
+        Initialize encryption tests
+
+        Args:
+            worker_url: Full URL to worker (e.g., https://resin.mpazbot.workers.dev)
+            api_key: Bearer token for authentication
+            worker_config: Deployment entry from deployments.yaml
+        """
+        self.worker_url = worker_url.rstrip("/")
+        self.api_key = api_key
+        self.worker_config = worker_config or {}
+
+    def test_enc_tls_transit(self, probe: Optional[ProbeResult] = None) -> Tuple[ValidationStatus, str]:
+        """
+        Test: TLS 1.2+ encryption for data in transit
+        Read the negotiated protocol and HSTS header from the shared TLS probe
+
+        This test checks:
+        1. The worker URL is HTTPS
+        2. The negotiated protocol is TLS 1.2 or 1.3
+        3. Strict-Transport-Security is sent with a non-zero max-age
+
+        Args:
+            probe: Result of the worker's shared TLSProbe (ClaimTester.tls_probe());
+                probed here if not given
+        """
+        if probe is None:
+            probe = TLSProbe(self.worker_url).run()
+
+        if not probe.tls:
+            return (
+                ValidationStatus.FAIL,
+                f"Worker URL is not HTTPS ({self.worker_url}); data in transit is unencrypted"
+            )
+        if probe.tls_version is None:
+            return (
+                ValidationStatus.WARN,
+                f"TLS verification incomplete: {probe.error or 'no handshake'}"
+            )
+
+        connection = (f"{probe.tls_version} ({probe.cipher}, {probe.cipher_bits}-bit), "
+                      f"handshake {probe.handshake_ms:.0f}ms")
+        if probe.tls_version not in ACCEPTED_TLS_VERSIONS:
+            return (
+                ValidationStatus.FAIL,
+                f"Negotiated {connection}; expected TLS 1.2 or higher"
+            )
+
+        if probe.error:
+            return (
+                ValidationStatus.WARN,
+                f"Negotiated {connection} but HSTS check incomplete: {probe.error}"
+            )
+        hsts = probe.header("strict-transport-security")
+        max_age = _hsts_max_age(hsts)
+        if not max_age:
+            return (
+                ValidationStatus.WARN,
+                f"Negotiated {connection} but HSTS header "
+                f"{'missing' if hsts is None else f'ineffective ({hsts})'}"
+            )
+
+        return (
+            ValidationStatus.PASS,
+            f"Negotiated {connection}; HSTS: {hsts}"
+        )
+
+    def test_enc_aes256_rest(self) -> Tuple[ValidationStatus, str]:
+        """
+        Test: AES-256 encryption for credentials at rest in Cloudflare KV
+        Verify encrypted values differ on each write (IV randomization)
+        """
+        raise NotImplementedError(
+            "KV encryption verification not yet implemented. "
+            "Need to: 1) Inspect KV storage encryption, "
+            "2) Verify key rotation, "
+            "3) Test IV randomization"
+        )
+
+    def test_enc_memory_processing(self) -> Tuple[ValidationStatus, str]:
+        """
+        Test: Data encrypted in memory during AI processing
+        Verify sensitive data cleared after processing
+        """
+        raise NotImplementedError(
+            "Memory encryption verification not yet implemented. "
+            "Need to: 1) Review code path for API call prep, "
+            "2) Verify memory clearing, "
+            "3) Test with instrumentation"
+        )
+
+
+def _hsts_max_age(value: Optional[str]) -> int:
+    """max-age directive of a Strict-Transport-Security header (0 if absent)"""
+    match = re.search(r"max-age\s*=\s*\"?(\d+)", value or "", re.IGNORECASE)
+    return int(match.group(1)) if match else 0
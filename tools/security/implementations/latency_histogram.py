@@ -0,0 +1,144 @@
+"""
+Latency Histogram
+Fixed-size log-linear (HDR-style) histogram for latency percentiles
+
+Values are recorded in microseconds into a counts array whose size depends
+only on the trackable range and precision, never on how many samples are
+recorded, so a sampler can take millions of measurements in constant
+memory. Buckets double in width; each is split into linear sub-buckets, so
+any recorded value is reproduced to within 10^-significant_digits relative
+error (1% by default).
+"""
+
+import math
+from typing import Dict, Iterator, Sequence, Tuple
+
+
+class LatencyHistogram:
+    """
+    Bounded-memory latency histogram
+
+    Usage:
+        histogram = LatencyHistogram()
+        histogram.record_ms(12.5)
+        histogram.percentiles()  # {"p50": 12.5, "p95": ..., "p99": ...}
+    """
+
+    def __init__(self, lowest_us: int = 1, highest_us: int = 60_000_000,
+                 significant_digits: int = 2):
+        """
+        Args:
+            lowest_us: Smallest distinguishable value (microseconds)
+            highest_us: Largest trackable value; larger values are clamped
+            significant_digits: Decimal precision kept for every value (1-5)
+        """
+        if lowest_us < 1 or highest_us < 2 * lowest_us:
+            raise ValueError("Need 1 <= lowest_us and highest_us >= 2 * lowest_us")
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+
+        self.lowest_us = lowest_us
+        self.highest_us = highest_us
+        self.significant_digits = significant_digits
+
+        sub_bucket_count = 2 ** math.ceil(math.log2(2 * 10 ** significant_digits))
+        self._unit_magnitude = int(math.floor(math.log2(lowest_us)))
+        self._sub_bucket_half_magnitude = int(math.log2(sub_bucket_count)) - 1
+        self._sub_bucket_half_count = sub_bucket_count // 2
+        self._sub_bucket_mask = (sub_bucket_count - 1) << self._unit_magnitude
+
+        buckets = 1
+        smallest_untrackable = sub_bucket_count << self._unit_magnitude
+        while smallest_untrackable <= highest_us:
+            smallest_untrackable <<= 1
+            buckets += 1
+        self._counts = [0] * ((buckets + 1) * self._sub_bucket_half_count)
+
+        self.count = 0
+        self.min_us = 0
+        self.max_us = 0
+        self._total_us = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, value_us: int, count: int = 1):
+        """Record a value in microseconds (clamped to the trackable range)"""
+        value_us = min(max(int(value_us), 0), self.highest_us)
+        self._counts[self._index(value_us)] += count
+        if self.count == 0 or value_us < self.min_us:
+            self.min_us = value_us
+        self.max_us = max(self.max_us, value_us)
+        self.count += count
+        self._total_us += value_us * count
+
+    def record_ms(self, value_ms: float):
+        """Record a latency in milliseconds"""
+        self.record(round(value_ms * 1000))
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add another histogram's counts (same range and precision)"""
+        if len(other._counts) != len(self._counts) or \
+                other._unit_magnitude != self._unit_magnitude:
+            raise ValueError("Histograms have different layouts")
+        if other.count == 0:
+            return
+        for index, count in enumerate(other._counts):
+            self._counts[index] += count
+        self.min_us = other.min_us if self.count == 0 else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+        self.count += other.count
+        self._total_us += other._total_us
+
+    @property
+    def mean_ms(self) -> float:
+        return self._total_us / self.count / 1000 if self.count else 0.0
+
+    def value_at_quantile(self, q: float) -> int:
+        """
+        Value (microseconds) at quantile q in [0, 1]
+
+        Returns the highest value equivalent to the bucket holding the
+        nearest-rank sample, capped at the largest value recorded.
+        """
+        if self.count == 0:
+            return 0
+        rank = min(self.count, max(1, math.ceil(q * self.count)))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(self._highest_equivalent(index), self.max_us)
+        return self.max_us
+
+    def percentiles(self, quantiles: Sequence[float] = (0.5, 0.95, 0.99)) -> Dict[str, float]:
+        """Percentiles in milliseconds, keyed p50/p95/p99"""
+        if self.count == 0:
+            return {}
+        return {f"p{round(q * 100)}": self.value_at_quantile(q) / 1000 for q in quantiles}
+
+    def buckets(self) -> Iterator[Tuple[int, int]]:
+        """(highest equivalent value in microseconds, count) for non-empty buckets"""
+        for index, count in enumerate(self._counts):
+            if count:
+                yield self._highest_equivalent(index), count
+
+    # ============================================================================
+    # Helper methods
+    # ============================================================================
+
+    def _index(self, value_us: int) -> int:
+        pow2_ceiling = (value_us | self._sub_bucket_mask).bit_length()
+        bucket = pow2_ceiling - self._unit_magnitude - (self._sub_bucket_half_magnitude + 1)
+        sub_bucket = value_us >> (bucket + self._unit_magnitude)
+        return ((bucket + 1) << self._sub_bucket_half_magnitude) + \
+            (sub_bucket - self._sub_bucket_half_count)
+
+    def _highest_equivalent(self, index: int) -> int:
+        bucket = (index >> self._sub_bucket_half_magnitude) - 1
+        sub_bucket = (index & (self._sub_bucket_half_count - 1)) + self._sub_bucket_half_count
+        if bucket < 0:
+            sub_bucket -= self._sub_bucket_half_count
+            bucket = 0
+        shift = bucket + self._unit_magnitude
+        return (sub_bucket << shift) + (1 << shift) - 1
@@ -0,0 +1,463 @@
+"""
+Async Burst Load Generator
+Fires requests at a precise rate to find where a worker starts throttling
+
+Requests are scheduled open-loop: request i is due at start + i / rate,
+independent of how fast earlier responses come back, so the offered rate
+is what was asked for rather than what one sequential client can reach.
+They are sent over a pool of keep-alive HTTP/1.1 connections using raw
+asyncio streams (no extra dependencies).
+
+For each request the generator records its index, when it was sent
+(relative to the start of the burst), its latency and status and the
+X-RateLimit-* / Retry-After headers. BurstReport locates the first 429 and
+compares latency percentiles before and after throttling began.
+
+sample_latency() is the closed-loop counterpart for latency SLOs: a fixed
+number of workers send requests back to back and record each latency in a
+LatencyHistogram, so memory stays constant however many samples are taken.
+"""
+
+import asyncio
+import json
+import math
+import ssl
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+try:
+    # When imported from tests or validator.py (tools/security on sys.path)
+    import instrumentation
+    import tracing
+except ImportError:
+    # When imported normally as a package
+    from .. import instrumentation, tracing
+
+from .latency_histogram import LatencyHistogram
+
+# Response headers kept per request (lowercase)
+RATE_LIMIT_HEADERS = (
+    "x-ratelimit-limit",
+    "x-ratelimit-remaining",
+    "x-ratelimit-reset",
+    "retry-after",
+    "ratelimit",
+    "ratelimit-policy",
+)
+
+
+@dataclass
+class BurstResult:
+    """Outcome of one request in a burst"""
+    index: int
+    scheduled: float  # Seconds after burst start the request was due
+    sent: float  # Seconds after burst start the request was written
+    latency: float = 0.0  # Seconds from send to complete response
+    status: Optional[int] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class BurstReport:
+    """All results of one burst, in request order"""
+    url: str
+    rate: float
+    results: List[BurstResult] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def first_429(self) -> Optional[BurstResult]:
+        """First throttled request by send order"""
+        throttled = [r for r in self.results if r.status == 429]
+        return min(throttled, key=lambda r: (r.sent, r.index)) if throttled else None
+
+    @property
+    def errors(self) -> List[BurstResult]:
+        return [r for r in self.results if r.error is not None]
+
+    @property
+    def achieved_rate(self) -> float:
+        """Requests actually sent per second"""
+        sent = [r.sent for r in self.results if r.error is None]
+        if len(sent) < 2 or max(sent) <= 0:
+            return 0.0
+        return (len(sent) - 1) / max(sent)
+
+    def status_counts(self) -> Dict[int, int]:
+        counts: Dict[int, int] = {}
+        for result in self.results:
+            if result.status is not None:
+                counts[result.status] = counts.get(result.status, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def rate_limit_headers(self) -> Dict[str, str]:
+        """X-RateLimit-* headers from the first 429 (or the last response seen)"""
+        source = self.first_429
+        if source is None:
+            answered = [r for r in self.results if r.headers]
+            source = answered[-1] if answered else None
+        return dict(source.headers) if source else {}
+
+    def latency_percentiles(self, before_throttling: bool = True,
+                            quantiles: Sequence[float] = (0.5, 0.95, 0.99)) -> Dict[str, float]:
+        """
+        Latency percentiles in milliseconds for requests sent before (or from)
+        the first 429; without a 429 every answered request counts as before
+        """
+        first = self.first_429
+        cutoff = first.sent if first else float("inf")
+        latencies = [
+            r.latency for r in self.results
+            if r.status is not None and ((r.sent < cutoff) == before_throttling)
+        ]
+        return {f"p{round(q * 100)}": percentile(latencies, q) * 1000
+                for q in quantiles} if latencies else {}
+
+    def summary(self) -> str:
+        """One-line human readable burst summary"""
+        line = (f"{len(self.results)} requests at {self.rate:g} req/s "
+                f"(achieved {self.achieved_rate:.0f} req/s) in {self.duration:.2f}s")
+        first = self.first_429
+        if first:
+            line += f"; first 429 at request #{first.index + 1} after {first.sent:.2f}s"
+        for label, before in (("before", True), ("after", False)):
+            stats = self.latency_percentiles(before)
+            if stats:
+                line += f"; {label}: " + ", ".join(f"{k} {v:.0f}ms" for k, v in stats.items())
+        if self.errors:
+            line += f"; {len(self.errors)} errors"
+        return line
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (q in [0, 1])"""
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(q * len(ordered))))
+    return ordered[rank - 1]
+
+
+def run_burst(url: str, total: int, rate: float, concurrency: int = 16,
+              method: str = "GET", headers: Optional[Dict[str, str]] = None,
+              body: Optional[bytes] = None, timeout: float = 10.0,
+              stop_after_throttled: Optional[int] = None) -> BurstReport:
+    """
+    Send `total` requests at `rate` requests/second and collect the results
+
+    Args:
+        url: Target URL (http or https)
+        total: Maximum number of requests
+        rate: Offered request rate (requests/second)
+        concurrency: Connections (and requests in flight) at most
+        method / headers / body: Request to send
+        timeout: Per-request timeout in seconds (connect + response)
+        stop_after_throttled: Stop scheduling once this many requests have
+            been sent after the first 429 (None = send all `total`)
+    """
+    with tracing.span("burst", "http", url=url, total=total, rate=rate) as span_args:
+        report = asyncio.run(burst(url, total, rate, concurrency, method, headers, body,
+                                   timeout, stop_after_throttled))
+        span_args.update(sent=len(report.results), errors=len(report.errors))
+    return report
+
+
+async def burst(url: str, total: int, rate: float, concurrency: int = 16,
+                method: str = "GET", headers: Optional[Dict[str, str]] = None,
+                body: Optional[bytes] = None, timeout: float = 10.0,
+                stop_after_throttled: Optional[int] = None) -> BurstReport:
+    """Async version of run_burst()"""
+    if rate <= 0 or total < 1 or concurrency < 1:
+        raise ValueError("rate, total and concurrency must be positive")
+
+    target = _Target(url)
+    request = target.request(method, headers or {}, body)
+    pool = _ConnectionPool(target, concurrency, timeout)
+    report = BurstReport(url=url, rate=rate)
+    slots = asyncio.Semaphore(concurrency)
+    throttled_at: List[int] = []  # Index of the first request sent after a 429
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    async def fire(result: BurstResult):
+        try:
+            result.sent = loop.time() - start
+            status, response_headers = await pool.send(request)
+            result.latency = loop.time() - start - result.sent
+            result.status = status
+            result.headers = {
+                name: value for name, value in response_headers.items()
+                if name in RATE_LIMIT_HEADERS
+            }
+            if status == 429 and not throttled_at:
+                throttled_at.append(len(report.results))
+        except Exception as e:
+            result.latency = loop.time() - start - result.sent
+            result.error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+        finally:
+            slots.release()
+
+    tasks = []
+    try:
+        for index in range(total):
+            if stop_after_throttled is not None and throttled_at \
+                    and index - throttled_at[0] >= stop_after_throttled:
+                break
+            due = index / rate
+            delay = start + due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await slots.acquire()
+            result = BurstResult(index=index, scheduled=due, sent=0.0)
+            report.results.append(result)
+            tasks.append(asyncio.create_task(fire(result)))
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await pool.close()
+
+    report.duration = loop.time() - start
+    return report
+
+
+@dataclass
+class SampleReport:
+    """Latency histogram and outcome counts of one sampling run"""
+    url: str
+    histogram: LatencyHistogram
+    status_counts: Dict[int, int] = field(default_factory=dict)
+    errors: int = 0
+    first_error: Optional[str] = None
+    duration: float = 0.0
+
+    @property
+    def answered(self) -> int:
+        return sum(self.status_counts.values())
+
+    def summary(self) -> str:
+        """One-line human readable sample summary"""
+        line = f"{self.answered} samples in {self.duration:.2f}s"
+        stats = self.histogram.percentiles()
+        if stats:
+            line += ": " + ", ".join(f"{k} {v:.0f}ms" for k, v in stats.items())
+            line += f", max {self.histogram.max_us / 1000:.0f}ms"
+        if self.errors:
+            line += f"; {self.errors} errors ({self.first_error})"
+        return line
+
+
+def sample_latency(url: str, samples: int, concurrency: int = 4, method: str = "GET",
+                   headers: Optional[Dict[str, str]] = None, timeout: float = 10.0,
+                   warmup: int = 0, max_errors: Optional[int] = None) -> SampleReport:
+    """
+    Send `samples` requests from `concurrency` closed-loop workers and
+    histogram their latencies
+
+    Args:
+        url: Target URL (http or https)
+        samples: Requests recorded
+        concurrency: Requests in flight at once (one keep-alive connection each)
+        method / headers: Request to send
+        timeout: Per-request timeout in seconds (connect + response)
+        warmup: Extra requests sent first and not recorded (connection setup)
+        max_errors: Stop once this many requests have failed (None = never);
+            an unreachable worker then costs a few timeouts, not `samples`
+    """
+    with tracing.span("latency samples", "http", url=url, samples=samples,
+                      concurrency=concurrency):
+        return asyncio.run(sample(url, samples, concurrency, method, headers, timeout,
+                                  warmup, max_errors))
+
+
+async def sample(url: str, samples: int, concurrency: int = 4, method: str = "GET",
+                 headers: Optional[Dict[str, str]] = None, timeout: float = 10.0,
+                 warmup: int = 0, max_errors: Optional[int] = None) -> SampleReport:
+    """Async version of sample_latency()"""
+    if samples < 1 or concurrency < 1 or warmup < 0:
+        raise ValueError("samples and concurrency must be positive")
+
+    target = _Target(url)
+    request = target.request(method, headers or {}, None)
+    pool = _ConnectionPool(target, concurrency, timeout)
+    report = SampleReport(url=url, histogram=LatencyHistogram())
+    remaining = [warmup + samples]
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    async def worker():
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            recorded = remaining[0] < samples
+            sent = loop.time()
+            try:
+                status, _ = await pool.send(request)
+            except Exception as e:
+                # Failed warm-up requests count too: they are real errors
+                report.errors += 1
+                if report.first_error is None:
+                    report.first_error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+                if max_errors is not None and report.errors >= max_errors:
+                    remaining[0] = 0
+                continue
+            if recorded:
+                report.histogram.record_ms((loop.time() - sent) * 1000)
+                report.status_counts[status] = report.status_counts.get(status, 0) + 1
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        await pool.close()
+
+    report.status_counts = dict(sorted(report.status_counts.items()))
+    report.duration = loop.time() - start
+    return report
+
+
+# ============================================================================
+# Minimal HTTP/1.1 client
+# ============================================================================
+
+class _Target:
+    """Parsed URL plus connection details"""
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        self.host = parts.hostname
+        self.tls = parts.scheme == "https"
+        self.port = parts.port or (443 if self.tls else 80)
+        self.path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        default_port = self.port == (443 if self.tls else 80)
+        self.host_header = self.host if default_port else f"{self.host}:{self.port}"
+
+    def request(self, method: str, headers: Dict[str, str], body: Optional[bytes]) -> bytes:
+        lines = [f"{method} {self.path} HTTP/1.1", f"Host: {self.host_header}"]
+        merged = {"User-Agent": "Resin-SecurityValidator/1.0", "Connection": "keep-alive",
+                  **headers}
+        if body is not None:
+            merged["Content-Length"] = str(len(body))
+        lines += [f"{name}: {value}" for name, value in merged.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b"")
+
+
+class _ConnectionPool:
+    """Keep-alive connections, opened on demand up to `size`"""
+
+    def __init__(self, target: _Target, size: int, timeout: float):
+        self.target = target
+        self.timeout = timeout
+        self.idle: List = []
+        self.ssl_context = ssl.create_default_context() if target.tls else None
+
+    async def send(self, request: bytes):
+        """Send a request; returns (status, headers), discarding the body"""
+        status, headers, _ = await self._send(request, keep_body=False)
+        return status, headers
+
+    async def fetch(self, request: bytes):
+        """Send a request; returns (status, headers, body bytes)"""
+        return await self._send(request, keep_body=True)
+
+    async def close(self):
+        for _, writer in self.idle:
+            writer.close()
+        self.idle.clear()
+
+    async def _send(self, request: bytes, keep_body: bool):
+        connection = self.idle.pop() if self.idle else None
+        try:
+            if connection is None:
+                connection = await asyncio.wait_for(self._open(), self.timeout)
+            status, headers, body, keep_alive = await asyncio.wait_for(
+                self._exchange(connection, request, keep_body), self.timeout
+            )
+        except BaseException:
+            if connection is not None:
+                connection[1].close()
+            raise
+        if keep_alive:
+            self.idle.append(connection)
+        else:
+            connection[1].close()
+        return status, headers, body
+
+    async def _open(self):
+        return await asyncio.open_connection(
+            self.target.host, self.target.port, ssl=self.ssl_context,
+            server_hostname=self.target.host if self.target.tls else None,
+        )
+
+    async def _exchange(self, connection, request: bytes, keep_body: bool = False):
+        reader, writer = connection
+        writer.write(request)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed before response")
+        version, status = status_line.decode("latin-1").split(" ", 2)[:2]
+        received = len(status_line)
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            received += len(line)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        chunks: Optional[List[bytes]] = [] if keep_body else None
+        delimited, body_bytes = await _read_body(reader, headers, int(status), chunks)
+        instrumentation.record_request(len(request), received + body_bytes)
+        connection_header = headers.get("connection", "").lower()
+        keep_alive = delimited and version == "HTTP/1.1" and connection_header != "close"
+        return int(status), headers, b"".join(chunks or ()), keep_alive
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: Dict[str, str], status: int,
+                     chunks: Optional[List[bytes]] = None) -> Tuple[bool, int]:
+    """
+    Consume the response body (appending it to `chunks` if given)
+
+    Returns (delimited, body bytes read). `delimited` is False if the body
+    ran to end of stream (the connection cannot be reused).
+    """
+    size = 0
+
+    def keep(data: bytes):
+        nonlocal size
+        size += len(data)
+        if chunks is not None:
+            chunks.append(data)
+
+    if status in (204, 304) or 100 <= status < 200:
+        return True, size
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            chunk_size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if chunk_size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass  # Trailers
+                return True, size
+            keep(await reader.readexactly(chunk_size))
+            await reader.readline()
+    if "content-length" in headers:
+        length = int(headers["content-length"])
+        if length:
+            keep(await reader.readexactly(length))
+        return True, size
+    keep(await reader.read())
+    return False, size
+
+
+def jsonrpc_body(method: str, request_id: int = 1, params: Optional[Dict] = None) -> bytes:
+    """Encode a JSON-RPC 2.0 request body"""
+    message = {"jsonrpc": "2.0", "method": method, "id": request_id}
+    if params is not None:
+        message["params"] = params
+    return json.dumps(message).encode()
@@ -0,0 +1,215 @@
+"""
+Incremental Log Scanning
+Per-worker watermarks so repeated LOG_WHAT_LOGGED runs only scan new logs
+
+A checkpoint records, for one worker, how far each Logpush segment has been
+scanned and the LogPipeline counters accumulated so far. The next run scans
+only what was appended since and merges it into the stored counters, so the
+result equals a full scan of everything seen while the cost tracks new
+traffic.
+
+Watermarks are byte offsets:
+- Plain NDJSON files are scanned up to their last complete line; a line
+  still being written is picked up on the next run.
+- Gzip segments are scanned whole once and then treated as immutable.
+
+If a file shrinks, a scanned gzip segment changes size, a scanned segment
+is deleted (retention) or the sensitive data patterns change, the stored
+counters no longer describe the archive and the worker is rescanned from
+scratch, so the result always equals a full scan of the files present.
+
+Runs for the same worker (a watch daemon and a cron job, say) are
+serialised with an exclusive lock file next to the checkpoint.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: runs are not serialised
+    fcntl = None
+
+from .log_pipeline import LogPipeline
+from .log_sharding import DEFAULT_SHARD_BYTES, Shard, scan_shards, split_range
+from .log_sources import LogpushSource
+
+# Default location of checkpoint files (one JSON file per worker)
+DEFAULT_CHECKPOINT_DIR = Path(__file__).resolve().parent.parent / ".state" / "log_checkpoints"
+
+CHECKPOINT_VERSION = 2
+
+
+class CheckpointStore:
+    """
+    Directory of per-worker checkpoint files
+
+    One file per worker keeps concurrent fleet runs from contending on a
+    shared file; writes go through a temp file and os.replace so a crashed
+    run never leaves a half-written checkpoint behind.
+    """
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_CHECKPOINT_DIR):
+        self.directory = Path(directory).expanduser()
+
+    def path_for(self, worker: str) -> Path:
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in worker)
+        return self.directory / f"{safe}.json"
+
+    @contextmanager
+    def lock(self, worker: str) -> Iterator[None]:
+        """Hold worker's lock file exclusively (blocks while another run holds it)"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.path_for(worker).with_suffix(".lock"), "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def load(self, worker: str) -> Optional[Dict]:
+        """Stored checkpoint for worker, or None if missing or unreadable"""
+        try:
+            with open(self.path_for(worker), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != CHECKPOINT_VERSION:
+            return None
+        return data
+
+    def save(self, worker: str, data: Dict):
+        """Atomically write worker's checkpoint"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path_for(worker))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def clear(self, worker: str) -> bool:
+        """Delete worker's checkpoint; returns True if one existed"""
+        try:
+            self.path_for(worker).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+
+def scan_incremental(store: CheckpointStore, worker: str, source: LogpushSource,
+                     patterns: Dict[str, str], processes: int = 1,
+                     shard_bytes: int = DEFAULT_SHARD_BYTES) -> Tuple[LogPipeline, int]:
+    """
+    Scan log data added since worker's last checkpoint and save a new one
+
+    Args:
+        store: Where checkpoints live
+        worker: Worker name from deployments.yaml
+        source: Unlimited LogpushSource for the worker
+        patterns: Sensitive data patterns
+        processes: Worker processes for scanning new data
+        shard_bytes: Maximum byte range per plain-file shard
+
+    Returns:
+        (pipeline with all counters so far, number of records scanned this run)
+    """
+    with store.lock(worker):
+        files = source.files()
+        digest = patterns_digest(patterns)
+        checkpoint = store.load(worker)
+        if checkpoint is not None and (checkpoint.get("source") != str(source.path)
+                                       or checkpoint.get("patterns") != digest):
+            checkpoint = None
+
+        plan = _plan_new_data(files, checkpoint["files"], shard_bytes) if checkpoint else None
+        if plan is None:
+            # First run, changed source or patterns, rewritten or deleted files: start over
+            checkpoint = None
+            plan = _plan_new_data(files, {}, shard_bytes)
+        shards, watermarks = plan
+
+        new = scan_shards(shards, patterns, processes)
+        pipeline = LogPipeline(patterns)
+        if checkpoint:
+            pipeline.load(checkpoint["pipeline"])
+        pipeline.merge(new)
+
+        store.save(worker, {
+            "version": CHECKPOINT_VERSION,
+            "source": str(source.path),
+            "patterns": digest,
+            "updated": datetime.now().isoformat(),
+            "files": watermarks,
+            "pipeline": pipeline.to_dict(),
+        })
+    return pipeline, new.records
+
+
+def patterns_digest(patterns: Dict[str, str]) -> str:
+    """Short hash of the sensitive data patterns a checkpoint's counters came from"""
+    encoded = json.dumps(patterns, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _plan_new_data(files: List[Path], seen: Dict[str, Dict],
+                   shard_bytes: int = DEFAULT_SHARD_BYTES
+                   ) -> Optional[Tuple[List[Shard], Dict[str, Dict]]]:
+    """
+    Shards covering data not yet scanned, plus the watermarks after scanning them
+
+    Returns None if a previously scanned file was truncated, rewritten or deleted.
+    """
+    if not set(seen) <= {str(path) for path in files}:
+        return None
+
+    shards: List[Shard] = []
+    watermarks: Dict[str, Dict] = {}
+
+    for path in files:
+        key = str(path)
+        size = path.stat().st_size
+        previous = seen.get(key)
+
+        if path.name.lower().endswith(".gz"):
+            if previous is not None:
+                if previous.get("size") != size:
+                    return None
+            else:
+                shards.append(Shard(key))
+            watermarks[key] = {"offset": size, "size": size}
+            continue
+
+        offset = previous.get("offset", 0) if previous else 0
+        if size < offset:
+            return None
+        end = _complete_end(path, offset, size)
+        shards.extend(split_range(path, offset, end, shard_bytes))
+        watermarks[key] = {"offset": end, "size": size}
+
+    return shards, watermarks
+
+
+def _complete_end(path: Path, start: int, size: int, chunk: int = 64 * 1024) -> int:
+    """Offset just past the last newline in [start, size), or start if none"""
+    with open(path, "rb") as f:
+        pos = size
+        while pos > start:
+            chunk_start = max(start, pos - chunk)
+            f.seek(chunk_start)
+            index = f.read(pos - chunk_start).rfind(b"\n")
+            if index != -1:
+                return chunk_start + index + 1
+            pos = chunk_start
+    return start
@@ -0,0 +1,270 @@
+"""
+Single-pass Log Evaluation Pipeline
+Feeds each log record once to every LOG_WHAT_LOGGED checker
+
+Each checker is an accumulator: feed() one record at a time, then result()
+returns the same (ValidationStatus, details) the standalone check would.
+LogPipeline drives all three from a single walk over the source, so the
+input is read and parsed once and can be a true stream.
+
+Accumulators built over consecutive slices of the input can be merge()d
+in input order; the merged result equals a serial run over the whole input.
+to_dict()/load() persist accumulator state between runs.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+try:
+    # When imported from tests
+    from claim_tests import ValidationStatus
+except ImportError:
+    # When imported normally as a package
+    from ..claim_tests import ValidationStatus
+
+from .log_scanner import SensitiveDataScanner
+
+
+class LogCheck:
+    """Base accumulator: feed() records, then read result()"""
+
+    def feed(self, log: Dict):
+        raise NotImplementedError
+
+    def result(self) -> Tuple[ValidationStatus, str]:
+        raise NotImplementedError
+
+    def run(self, logs: Iterable[Dict]) -> "LogCheck":
+        """Feed every record from logs and return self"""
+        for log in logs:
+            self.feed(log)
+        return self
+
+    def merge(self, other: "LogCheck") -> "LogCheck":
+        """Fold in an accumulator built over the records that follow ours"""
+        raise NotImplementedError
+
+    def to_dict(self) -> Dict:
+        """Accumulator state as JSON-serialisable data"""
+        raise NotImplementedError
+
+    def load(self, data: Dict) -> "LogCheck":
+        """Restore state saved with to_dict() and return self"""
+        raise NotImplementedError
+
+
+class StructureCheck(LogCheck):
+    """Required top-level fields: timestamp, level, message"""
+
+    REQUIRED_FIELDS = ("timestamp", "level", "message")
+    MAX_EXAMPLES = 3
+
+    def __init__(self):
+        self.records = 0
+        self.invalid_count = 0
+        self.examples: List[Tuple[int, List[str]]] = []
+
+    def feed(self, log: Dict):
+        missing_fields = [f for f in self.REQUIRED_FIELDS if f not in log]
+        if missing_fields:
+            self.invalid_count += 1
+            if len(self.examples) < self.MAX_EXAMPLES:
+                self.examples.append((self.records, missing_fields))
+        self.records += 1
+
+    def merge(self, other: "StructureCheck") -> "StructureCheck":
+        for index, fields in other.examples:
+            if len(self.examples) >= self.MAX_EXAMPLES:
+                break
+            self.examples.append((self.records + index, fields))
+        self.invalid_count += other.invalid_count
+        self.records += other.records
+        return self
+
+    def to_dict(self) -> Dict:
+        return {
+            "records": self.records,
+            "invalid_count": self.invalid_count,
+            "examples": [[index, fields] for index, fields in self.examples],
+        }
+
+    def load(self, data: Dict) -> "StructureCheck":
+        self.records = data.get("records", 0)
+        self.invalid_count = data.get("invalid_count", 0)
+        self.examples = [(index, list(fields)) for index, fields in data.get("examples", [])]
+        return self
+
+    def result(self) -> Tuple[ValidationStatus, str]:
+        if self.invalid_count:
+            details = f"Found {self.invalid_count} logs with missing fields. Examples: "
+            details += ", ".join([f"Log {i}: missing {', '.join(fields)}" for i, fields in self.examples])
+            return (ValidationStatus.WARN, details)
+
+        return (ValidationStatus.PASS, "Log structure valid")
+
+
+class SensitiveDataCheck(LogCheck):
+    """PII and credential patterns via the compiled scanner"""
+
+    def __init__(self, patterns: Dict[str, str]):
+        self.scanner = SensitiveDataScanner(patterns)
+
+    def feed(self, log: Dict):
+        self.scanner.scan_record(log)
+
+    def merge(self, other: "SensitiveDataCheck") -> "SensitiveDataCheck":
+        self.scanner.merge(other.scanner)
+        return self
+
+    def to_dict(self) -> Dict:
+        return self.scanner.to_dict()
+
+    def load(self, data: Dict) -> "SensitiveDataCheck":
+        self.scanner.load(data)
+        return self
+
+    def result(self) -> Tuple[ValidationStatus, str]:
+        scanner = self.scanner
+        if scanner.counts:
+            leaked_list = ", ".join([f"{name} ({count}x)" for name, count in scanner.counts.items()])
+            return (
+                ValidationStatus.FAIL,
+                f"SECURITY ISSUE: Found sensitive data in logs: {leaked_list}. "
+                "Logs must not contain PII or credentials."
+            )
+
+        throughput = scanner.throughput_mb_s
+        return (
+            ValidationStatus.PASS,
+            "No sensitive data detected in logs"
+            + (f" ({scanner.records} logs, {throughput:.1f} MB/s)" if throughput else "")
+        )
+
+
+class MetadataCheck(LogCheck):
+    """Presence of timestamp, requestId, endpoint, method, statusCode, durationMs"""
+
+    # Allow 20% missing (e.g., statusCode for logs without responses)
+    MIN_PRESENCE = 0.8
+
+    def __init__(self):
+        self.total_logs = 0
+        self.fields = {
+            "timestamp": 0,
+            "requestId": 0,
+            "endpoint": 0,
+            "method": 0,
+            "statusCode": 0,
+            "durationMs": 0,
+        }
+
+    def feed(self, log: Dict):
+        fields = self.fields
+        self.total_logs += 1
+
+        # Check top-level fields
+        if "timestamp" in log:
+            fields["timestamp"] += 1
+
+        # Check context object
+        context = log.get("context", {})
+        if "requestId" in context:
+            fields["requestId"] += 1
+        if "endpoint" in context:
+            fields["endpoint"] += 1
+        if "method" in context:
+            fields["method"] += 1
+
+        # Check data object
+        data = log.get("data", {})
+        if "statusCode" in data:
+            fields["statusCode"] += 1
+        if "durationMs" in data:
+            fields["durationMs"] += 1
+
+    def merge(self, other: "MetadataCheck") -> "MetadataCheck":
+        self.total_logs += other.total_logs
+        for field, count in other.fields.items():
+            self.fields[field] += count
+        return self
+
+    def to_dict(self) -> Dict:
+        return {"total_logs": self.total_logs, "fields": dict(self.fields)}
+
+    def load(self, data: Dict) -> "MetadataCheck":
+        self.total_logs = data.get("total_logs", 0)
+        for field, count in data.get("fields", {}).items():
+            if field in self.fields:
+                self.fields[field] = count
+        return self
+
+    def result(self) -> Tuple[ValidationStatus, str]:
+        total_logs = self.total_logs
+        missing_fields = [
+            field for field, count in self.fields.items()
+            if count < total_logs * self.MIN_PRESENCE
+        ]
+
+        if missing_fields:
+            return (
+                ValidationStatus.WARN,
+                f"Some metadata fields missing from logs: {', '.join(missing_fields)}. "
+                "Logs should include timestamp, requestId, endpoint, method, statusCode, durationMs."
+            )
+
+        return (
+            ValidationStatus.PASS,
+            f"All metadata fields present in {total_logs} logs. "
+            "Metadata-only logging confirmed, no sensitive data in logs."
+        )
+
+
+class LogPipeline(LogCheck):
+    """
+    Structure, sensitive data and metadata checks in one pass
+
+    result() keeps the early-FAIL order of the original three-pass method:
+    the first non-PASS of structure, then sensitive data, wins; otherwise
+    the metadata result is returned.
+    """
+
+    def __init__(self, patterns: Dict[str, str]):
+        self.structure = StructureCheck()
+        self.sensitive = SensitiveDataCheck(patterns)
+        self.metadata = MetadataCheck()
+        self.checks = (self.structure, self.sensitive, self.metadata)
+
+    @property
+    def records(self) -> int:
+        return self.structure.records
+
+    def feed(self, log: Dict):
+        self.structure.feed(log)
+        self.sensitive.feed(log)
+        self.metadata.feed(log)
+
+    def merge(self, other: "LogPipeline") -> "LogPipeline":
+        self.structure.merge(other.structure)
+        self.sensitive.merge(other.sensitive)
+        self.metadata.merge(other.metadata)
+        return self
+
+    def to_dict(self) -> Dict:
+        return {
+            "structure": self.structure.to_dict(),
+            "sensitive": self.sensitive.to_dict(),
+            "metadata": self.metadata.to_dict(),
+        }
+
+    def load(self, data: Dict) -> "LogPipeline":
+        self.structure.load(data.get("structure", {}))
+        self.sensitive.load(data.get("sensitive", {}))
+        self.metadata.load(data.get("metadata", {}))
+        return self
+
+    def result(self) -> Tuple[ValidationStatus, str]:
+        for check in (self.structure, self.sensitive):
+            status, details = check.result()
+            if status != ValidationStatus.PASS:
+                return (status, details)
+
+        return self.metadata.result()
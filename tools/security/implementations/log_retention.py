@@ -0,0 +1,399 @@
+"""
+Log Retention Boundary Check
+Oldest and newest surviving Logpush records and the retention boundary, without a full scan
+
+Logpush archives are partitioned by day and each partition holds segments
+in time order:
+
+    logs/20251105/20251105T071906Z_20251105T072006Z_a1b2c3d4.log.gz
+
+so whether an archive keeps 90 days, and nothing more, is decided at its
+edges. RetentionChecker lists partition names (reading no records),
+bisects them for the retention cutoff and reads only a few records from
+the segments it lands on:
+
+- oldest / newest surviving record: the head of the first, and the tail
+  of the last, non-empty partition
+- expired partitions: those dated before the cutoff (less a grace period
+  for the daily deletion job) that still hold a record; a compliant
+  archive has none, so nothing is read for them
+- boundary: the first record at or after the cutoff, found by bisecting
+  the boundary partition's segments (by the start time in their names, or
+  their first record) and then byte offsets within a plain segment
+
+Records are expected in time order within a segment; the first and last
+`probe_records` of a segment are read so slight reordering does not
+matter. Gzip segments cannot be entered mid-stream: seeking in one, or
+reading its tail, decompresses that one segment.
+
+Usage:
+    report = RetentionChecker("/var/log/resin/logs").check(days=90)
+    status, details = report.result()
+"""
+
+import re
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    # When imported from tests or validator.py (tools/security on sys.path)
+    from claim_tests import ValidationStatus
+except ImportError:
+    # When imported normally as a package
+    from ..claim_tests import ValidationStatus
+
+from .log_sources import is_ndjson_file, iter_ndjson, parse_line
+
+DAY = 24 * 60 * 60
+
+DEFAULT_RETENTION_DAYS = 90
+DEFAULT_GRACE_DAYS = 1  # Deletion runs on a daily cron trigger
+DEFAULT_PROBE_RECORDS = 8
+
+# Bytes read from the end of a plain segment for its newest records
+TAIL_BYTES = 64 * 1024
+
+# Partition directories: 20251105, 2025-11-05, date=2025-11-05, dt=20251105
+_PARTITION_NAME = re.compile(r"^(?:date=|dt=)?(\d{4})-?(\d{2})-?(\d{2})$")
+# Segment files directly under the root: named from their first timestamp
+_FILE_DATE = re.compile(r"^(\d{4})-?(\d{2})-?(\d{2})")
+# Logpush segment names: <start>_<end>_<hash>
+_SEGMENT_START = re.compile(r"^(\d{8}T\d{6}Z)_")
+
+
+@dataclass
+class Partition:
+    """One day of the archive: partition directories and/or segment files"""
+    day: date
+    paths: List[Path]
+    _segments: Optional[List[Path]] = field(default=None, repr=False)
+
+    @property
+    def name(self) -> str:
+        return self.day.isoformat()
+
+    def segments(self) -> List[Path]:
+        """NDJSON segments in name (= time) order"""
+        if self._segments is None:
+            found = []
+            for path in self.paths:
+                if path.is_dir():
+                    found += [p for p in path.rglob("*") if p.is_file() and is_ndjson_file(p)]
+                else:
+                    found.append(path)
+            self._segments = sorted(found, key=lambda p: (p.name, str(p)))
+        return self._segments
+
+
+@dataclass
+class RetentionReport:
+    """Edges of a Logpush archive relative to the retention cutoff"""
+    retention_days: float
+    grace_days: float
+    checked_at: float  # Epoch seconds
+    partitions: int = 0
+    oldest: Optional[float] = None  # Epoch seconds of the oldest surviving record
+    newest: Optional[float] = None
+    boundary: Optional[float] = None  # First record at or after the cutoff
+    expired_partitions: List[str] = field(default_factory=list)
+    records_read: int = 0
+
+    @property
+    def cutoff(self) -> float:
+        """Records older than this are past retention"""
+        return self.checked_at - self.retention_days * DAY
+
+    @property
+    def oldest_age_days(self) -> Optional[float]:
+        return None if self.oldest is None else (self.checked_at - self.oldest) / DAY
+
+    def result(self) -> Tuple[ValidationStatus, str]:
+        """LOG_RETENTION_90 verdict"""
+        days = f"{self.retention_days:g}"
+        if self.oldest is None:
+            return (
+                ValidationStatus.WARN,
+                f"No timestamped log records found; cannot verify {days}-day retention."
+            )
+
+        age = self.oldest_age_days
+        read = f"{self.partitions} partitions, {self.records_read} records read"
+        if self.oldest < self.cutoff - self.grace_days * DAY:
+            expired = ""
+            if self.expired_partitions:
+                shown = ", ".join(self.expired_partitions[:5])
+                more = len(self.expired_partitions) - 5
+                expired = (f"; {len(self.expired_partitions)} partitions past the boundary: "
+                           f"{shown}" + (f" (+{more} more)" if more > 0 else ""))
+            return (
+                ValidationStatus.FAIL,
+                f"Logs older than the {days}-day retention period still exist: oldest "
+                f"{_iso(self.oldest)} ({age:.1f} days old){expired}. Automatic deletion "
+                f"is not running or not deleting everything ({read})."
+            )
+
+        if age < self.retention_days - self.grace_days:
+            return (
+                ValidationStatus.WARN,
+                f"Oldest log is {age:.1f} days old ({_iso(self.oldest)}): {days}-day "
+                f"retention cannot be confirmed until the archive spans {days} days, or "
+                f"logs are being deleted early ({read})."
+            )
+
+        return (
+            ValidationStatus.PASS,
+            f"{days}-day log retention holds: oldest log {_iso(self.oldest)} "
+            f"({age:.1f} days old), newest {_iso(self.newest)}; nothing older than the "
+            f"boundary {_iso(self.cutoff)}, first retained record {_iso(self.boundary)} "
+            f"({read})."
+        )
+
+
+class RetentionChecker:
+    """Bisecting reader for the edges of a date-partitioned Logpush archive"""
+
+    def __init__(self, path: Union[str, Path], clock: Callable[[], float] = time.time,
+                 probe_records: int = DEFAULT_PROBE_RECORDS):
+        """
+        Args:
+            path: Archive root holding day partitions (directories or segment files)
+            clock: Current time in epoch seconds
+            probe_records: Records read from each end of a segment
+        """
+        if probe_records < 1:
+            raise ValueError("probe_records must be at least 1")
+        self.root = Path(path).expanduser()
+        self.clock = clock
+        self.probe_records = probe_records
+        self.records_read = 0
+        self._partitions: Optional[List[Partition]] = None
+
+    def partitions(self) -> List[Partition]:
+        """Day partitions in date order (directory listing only)"""
+        if self._partitions is None:
+            if not self.root.is_dir():
+                if self.root.exists():
+                    raise ValueError(f"Log retention needs a date-partitioned directory, "
+                                     f"not a single file: {self.root}")
+                raise FileNotFoundError(f"Log source not found: {self.root}")
+            by_day: Dict[date, List[Path]] = {}
+            for child in self.root.iterdir():
+                if child.is_dir():
+                    match = _PARTITION_NAME.match(child.name)
+                elif child.is_file() and is_ndjson_file(child):
+                    match = _FILE_DATE.match(child.name)
+                else:
+                    continue
+                day = _date(match)
+                if day is not None:
+                    by_day.setdefault(day, []).append(child)
+            self._partitions = [Partition(day, sorted(paths))
+                                for day, paths in sorted(by_day.items())]
+        return self._partitions
+
+    def oldest(self) -> Optional[float]:
+        """Time of the oldest surviving record (head of the first non-empty partition)"""
+        for partition in self.partitions():
+            for segment in partition.segments():
+                times = self._head(segment)
+                if times:
+                    return min(times)
+        return None
+
+    def newest(self) -> Optional[float]:
+        """Time of the newest record (tail of the last non-empty partition)"""
+        for partition in reversed(self.partitions()):
+            for segment in reversed(partition.segments()):
+                times = self._tail(segment)
+                if times:
+                    return max(times)
+        return None
+
+    def first_at_or_after(self, cutoff: float) -> Optional[Tuple[float, Path]]:
+        """(time, segment) of the first record at or after `cutoff`"""
+        partitions = self.partitions()
+        start = bisect_left([p.day for p in partitions], _day(cutoff))
+        for partition in partitions[start:]:
+            found = self._first_in_partition(partition, cutoff)
+            if found is not None:
+                return found
+        return None
+
+    def expired_partitions(self, before: float) -> List[Partition]:
+        """Partitions dated before the day of `before` that still hold a record"""
+        partitions = self.partitions()
+        end = bisect_left([p.day for p in partitions], _day(before))
+        return [p for p in partitions[:end]
+                if any(self._head(segment, 1) for segment in p.segments())]
+
+    def check(self, days: float = DEFAULT_RETENTION_DAYS,
+              grace_days: float = DEFAULT_GRACE_DAYS) -> RetentionReport:
+        """Oldest, newest, boundary and expired partitions for a retention period"""
+        report = RetentionReport(retention_days=days, grace_days=grace_days,
+                                 checked_at=self.clock())
+        report.partitions = len(self.partitions())
+        report.oldest = self.oldest()
+        if report.oldest is not None:
+            report.newest = self.newest()
+            limit = report.cutoff - grace_days * DAY
+            if report.oldest < limit:
+                report.expired_partitions = [p.name for p in self.expired_partitions(limit)]
+            boundary = self.first_at_or_after(report.cutoff)
+            report.boundary = boundary[0] if boundary else None
+        report.records_read = self.records_read
+        return report
+
+    # ============================================================================
+    # Helper methods
+    # ============================================================================
+
+    def _first_in_partition(self, partition: Partition,
+                            cutoff: float) -> Optional[Tuple[float, Path]]:
+        segments = partition.segments()
+        # First segment starting after the cutoff; the boundary is in the one before
+        lo, hi = 0, len(segments)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = self._segment_start(segments[mid])
+            if start is not None and start <= cutoff:
+                lo = mid + 1
+            else:
+                hi = mid
+        for segment in segments[max(lo - 1, 0):]:
+            found = self._seek(segment, cutoff)
+            if found is not None:
+                return found, segment
+        return None
+
+    def _segment_start(self, segment: Path) -> Optional[float]:
+        """Start time from a Logpush segment name, else from its first records"""
+        match = _SEGMENT_START.match(segment.name)
+        if match:
+            start = datetime.strptime(match.group(1), "%Y%m%dT%H%M%SZ")
+            return start.replace(tzinfo=timezone.utc).timestamp()
+        times = self._head(segment)
+        return min(times) if times else None
+
+    def _seek(self, segment: Path, cutoff: float) -> Optional[float]:
+        """Time of the first record at or after `cutoff` in one segment"""
+        if segment.name.lower().endswith(".gz"):
+            for record in iter_ndjson(segment):
+                self.records_read += 1
+                stamp = record_time(record)
+                if stamp is not None and stamp >= cutoff:
+                    return stamp
+            return None
+
+        with open(segment, "rb") as f:
+            size = f.seek(0, 2)
+            # Smallest offset whose next line starts a record at/after the cutoff
+            lo, hi = 0, size
+            while lo < hi:
+                mid = (lo + hi) // 2
+                stamp = self._time_at(f, mid)
+                if stamp is None or stamp >= cutoff:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            return self._time_at(f, lo)
+
+    def _time_at(self, f, offset: int) -> Optional[float]:
+        """Time of the first timestamped record in a line starting at or after `offset`"""
+        f.seek(max(offset - 1, 0))
+        if offset > 0:
+            f.readline()  # Finish the line `offset` falls in (or the one ending at it)
+        for _ in range(self.probe_records):
+            raw = f.readline()
+            if not raw:
+                return None
+            times = self._times([raw.decode("utf-8", errors="replace")])
+            if times:
+                return times[0]
+        return None
+
+    def _head(self, segment: Path, count: Optional[int] = None) -> List[float]:
+        records = islice(iter_ndjson(segment), count or self.probe_records)
+        return self._record_times(records)
+
+    def _tail(self, segment: Path) -> List[float]:
+        if segment.name.lower().endswith(".gz"):
+            return self._record_times(deque(iter_ndjson(segment), maxlen=self.probe_records))
+
+        with open(segment, "rb") as f:
+            size = f.seek(0, 2)
+            f.seek(max(size - TAIL_BYTES, 0))
+            lines = f.read().decode("utf-8", errors="replace").split("\n")
+        if size > TAIL_BYTES:
+            lines = lines[1:]  # Starts mid-line
+        lines = [line for line in lines if line.strip()][-self.probe_records:]
+        times = self._times(lines)
+        if not times and size > TAIL_BYTES:
+            # Lines longer than the tail window: read the segment
+            return self._record_times(deque(iter_ndjson(segment), maxlen=self.probe_records))
+        return times
+
+    def _times(self, lines: Iterable[str]) -> List[float]:
+        return self._record_times(record for line in lines
+                                  for record in parse_line(line.strip()))
+
+    def _record_times(self, records: Iterable[Dict]) -> List[float]:
+        times = []
+        for record in records:
+            self.records_read += 1
+            stamp = record_time(record)
+            if stamp is not None:
+                times.append(stamp)
+        return times
+
+
+def record_time(record: Dict) -> Optional[float]:
+    """
+    Epoch seconds of a log record
+
+    createLogger entries carry an ISO 8601 `timestamp` (naive times are
+    UTC); Workers Trace Events carry `EventTimestampMs`.
+    """
+    value = record.get("timestamp")
+    if value is None:
+        value = record.get("EventTimestampMs")
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value / 1000
+        return None
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value / 1000 if value > 1e11 else float(value)  # Milliseconds or seconds
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    return None
+
+
+def _date(match) -> Optional[date]:
+    if match is None:
+        return None
+    try:
+        return date(*(int(group) for group in match.groups()))
+    except ValueError:
+        return None
+
+
+def _day(timestamp: float) -> date:
+    return datetime.fromtimestamp(timestamp, timezone.utc).date()
+
+
+def _iso(timestamp: Optional[float]) -> str:
+    if timestamp is None:
+        return "none"
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec="seconds")
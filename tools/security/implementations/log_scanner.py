@@ -0,0 +1,204 @@
+"""
+Sensitive Data Scanner
+Compiled, literal-gated matcher for PII/credential patterns in log records
+
+Every pattern is compiled once. At compile time the scanner also derives
+the literal strings a pattern cannot match without (e.g. "@" for emails,
+"password"/"passwd"/"pwd" for passwords); a record is only handed to the
+regex engine for that pattern if one of those literals is present, which
+is a C-speed substring test. Clean records therefore skip most regex work.
+
+A single alternation of all patterns was measured slower than separate
+searches under CPython's backtracking engine, so patterns stay separate.
+"""
+
+import json
+import re
+import time
+from typing import Dict, FrozenSet, List, Optional
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse
+
+
+class SensitiveDataScanner:
+    """
+    Compiled pattern scanner with per-pattern hit attribution
+
+    Counters accumulate across scan() calls:
+    - counts: records containing each pattern, in order of first hit
+    - records / bytes_scanned / elapsed: for throughput reporting
+    """
+
+    def __init__(self, patterns: Dict[str, str], flags: int = re.IGNORECASE):
+        """
+        Args:
+            patterns: Pattern name -> regex string
+            flags: re flags applied to every pattern
+        """
+        self.patterns = dict(patterns)
+        self.flags = flags
+        folded = bool(flags & re.IGNORECASE)
+
+        # (name, compiled pattern, required literals or None, literals are lowercased)
+        self._checks = []
+        for name, pattern in self.patterns.items():
+            required = _required_literals(pattern, flags)
+            if required is not None and folded:
+                required = frozenset(literal.lower() for literal in required)
+            self._checks.append((name, re.compile(pattern, flags), required, folded))
+
+        self.counts: Dict[str, int] = {}
+        self.records = 0
+        self.bytes_scanned = 0
+        self.elapsed = 0.0
+
+    def matches(self, text: str) -> List[str]:
+        """
+        Return names of all patterns found in text, in pattern order
+
+        Does not update counters.
+        """
+        found = []
+        lowered = None
+        ascii_text = None
+
+        for name, compiled, required, folded in self._checks:
+            if required is not None:
+                haystack = text
+                if folded:
+                    # str.lower() only mirrors re's case folding for ASCII text
+                    if ascii_text is None:
+                        ascii_text = text.isascii()
+                    if ascii_text:
+                        if lowered is None:
+                            lowered = text.lower()
+                        haystack = lowered
+                    else:
+                        haystack = None
+                if haystack is not None and not any(lit in haystack for lit in required):
+                    continue
+
+            if compiled.search(text):
+                found.append(name)
+
+        return found
+
+    def scan(self, text: str) -> List[str]:
+        """Scan one record's text, updating hit counts and throughput counters"""
+        start = time.perf_counter()
+        found = self.matches(text)
+        self.elapsed += time.perf_counter() - start
+
+        self.records += 1
+        self.bytes_scanned += len(text)
+        for name in found:
+            self.counts[name] = self.counts.get(name, 0) + 1
+        return found
+
+    def scan_record(self, record: Dict) -> List[str]:
+        """Scan a parsed log record (json.dumps output is ASCII, so chars == bytes)"""
+        return self.scan(json.dumps(record))
+
+    @property
+    def throughput_mb_s(self) -> Optional[float]:
+        """Scan throughput in MB/s (None until something has been scanned)"""
+        if self.elapsed <= 0:
+            return None
+        return self.bytes_scanned / self.elapsed / 1_000_000
+
+    def merge(self, other: "SensitiveDataScanner"):
+        """
+        Add counters from a scanner that saw the records following ours
+
+        Hit order is preserved: our patterns first, then ones only `other` saw.
+        `elapsed` becomes total scan time across both (CPU time when sharded).
+        """
+        for name, count in other.counts.items():
+            self.counts[name] = self.counts.get(name, 0) + count
+        self.records += other.records
+        self.bytes_scanned += other.bytes_scanned
+        self.elapsed += other.elapsed
+
+    def to_dict(self) -> Dict:
+        """Counters as JSON-serialisable data (patterns are not included)"""
+        return {
+            "counts": dict(self.counts),
+            "records": self.records,
+            "bytes_scanned": self.bytes_scanned,
+            "elapsed": self.elapsed,
+        }
+
+    def load(self, data: Dict):
+        """Restore counters saved with to_dict()"""
+        self.counts = dict(data.get("counts", {}))
+        self.records = data.get("records", 0)
+        self.bytes_scanned = data.get("bytes_scanned", 0)
+        self.elapsed = data.get("elapsed", 0.0)
+
+    def reset(self):
+        """Clear all counters"""
+        self.counts = {}
+        self.records = 0
+        self.bytes_scanned = 0
+        self.elapsed = 0.0
+
+
+# ============================================================================
+# Required-literal extraction
+# ============================================================================
+
+def _required_literals(pattern: str, flags: int) -> Optional[FrozenSet[str]]:
+    """
+    Strings of which at least one must occur in any text the pattern matches
+
+    Returns None when no such set can be derived (the pattern always runs).
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except re.error:
+        return None
+    return _sequence_literals(list(parsed))
+
+
+def _sequence_literals(items) -> Optional[FrozenSet[str]]:
+    """Most selective required-literal set for a parsed sequence"""
+    best = None
+    run: List[str] = []
+
+    def consider(candidate):
+        nonlocal best
+        if candidate and all(candidate):
+            if best is None or _selectivity(candidate) > _selectivity(best):
+                best = candidate
+
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+
+        consider(frozenset({"".join(run)}))
+        run = []
+
+        if op is sre_parse.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            if not (add_flags or del_flags):
+                consider(_sequence_literals(list(sub)))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            low, _, sub = av
+            if low >= 1:
+                consider(_sequence_literals(list(sub)))
+        elif op is sre_parse.BRANCH:
+            branches = [_sequence_literals(list(branch)) for branch in av[1]]
+            if all(branches):
+                consider(frozenset().union(*branches))
+
+    consider(frozenset({"".join(run)}))
+    return best
+
+
+def _selectivity(literals: FrozenSet[str]):
+    """Longer shortest-literal first, then fewer alternatives"""
+    return (min(len(literal) for literal in literals), -len(literals))
@@ -0,0 +1,147 @@
+"""
+Sharded Log Scanning
+Runs the LOG_WHAT_LOGGED pipeline across CPU cores
+
+Input files are split into shards: one per gzip segment (gzip cannot be
+entered mid-stream) and newline-aligned byte ranges for large plain NDJSON
+files. Each shard is scanned in its own process with a fresh LogPipeline;
+the per-shard accumulators are merged back in input order, which gives
+exactly the counters, hit order and examples a serial run would produce.
+
+When a tracing.Tracer runs, every shard is a span (on the track of the
+process that scanned it) with its record count and regex scan time.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    # When imported from tests or validator.py (tools/security on sys.path)
+    import tracing
+except ImportError:
+    # When imported normally as a package
+    from .. import tracing
+
+from .log_pipeline import LogPipeline
+from .log_sources import iter_ndjson, parse_line
+
+# Plain files larger than this are split into byte-range shards
+DEFAULT_SHARD_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Shard:
+    """A file, or a [start, end) byte range of a plain file"""
+    path: str
+    start: int = 0
+    end: Optional[int] = None
+
+
+def plan_shards(files: List[Path], shard_bytes: int = DEFAULT_SHARD_BYTES) -> List[Shard]:
+    """Split files into shards, keeping input order"""
+    shards = []
+    for path in files:
+        size = path.stat().st_size
+        if path.name.lower().endswith(".gz") or size <= shard_bytes:
+            shards.append(Shard(str(path)))
+        else:
+            shards.extend(split_range(path, 0, size, shard_bytes))
+    return shards
+
+
+def split_range(path: Path, start: int, end: int,
+                shard_bytes: int = DEFAULT_SHARD_BYTES) -> List[Shard]:
+    """Split the [start, end) byte range of a plain file into shards"""
+    return [
+        Shard(str(path), offset, min(offset + shard_bytes, end))
+        for offset in range(start, end, shard_bytes)
+    ]
+
+
+def iter_shard(shard: Shard) -> Iterator[Dict]:
+    """
+    Yield the records of one shard
+
+    A line belongs to the shard in which it starts, so adjacent byte ranges
+    never drop or duplicate a record.
+    """
+    if shard.end is None:
+        yield from iter_ndjson(shard.path)
+        return
+
+    with open(shard.path, "rb") as f:
+        if shard.start > 0:
+            # Skip the tail of a line that started in the previous shard
+            f.seek(shard.start - 1)
+            f.readline()
+        while f.tell() < shard.end:
+            raw = f.readline()
+            if not raw:
+                break
+            line = raw.decode("utf-8", errors="replace").strip()
+            if line:
+                yield from parse_line(line)
+
+
+def scan_shard(shard: Shard, patterns: Dict[str, str]) -> LogPipeline:
+    """Scan one shard (runs in a worker process)"""
+    return LogPipeline(patterns).run(iter_shard(shard))
+
+
+def _scan_shard_timed(shard: Shard,
+                      patterns: Dict[str, str]) -> Tuple[LogPipeline, float, float, int]:
+    """scan_shard() plus its perf_counter start/end and process ID, for tracing"""
+    start = time.perf_counter()
+    pipeline = scan_shard(shard, patterns)
+    return pipeline, start, time.perf_counter(), os.getpid()
+
+
+def _trace_shard(shard: Shard, pipeline: LogPipeline, start: float, end: float, **track):
+    name = Path(shard.path).name
+    if shard.end is not None:
+        name += f" [{shard.start}:{shard.end}]"
+    tracing.add_span(name, "log", start, end, records=pipeline.records,
+                     regex_ms=round(pipeline.sensitive.scanner.elapsed * 1000, 3), **track)
+
+
+def scan_sharded(files: List[Path], patterns: Dict[str, str],
+                 processes: Optional[int] = None,
+                 shard_bytes: int = DEFAULT_SHARD_BYTES) -> LogPipeline:
+    """
+    Scan files on a process pool and merge per-shard results in order
+
+    Args:
+        files: NDJSON segments in input order (e.g. LogpushSource.files())
+        patterns: Sensitive data patterns
+        processes: Worker processes (default: os.cpu_count())
+        shard_bytes: Maximum byte range per plain-file shard
+    """
+    return scan_shards(plan_shards(files, shard_bytes), patterns, processes)
+
+
+def scan_shards(shards: List[Shard], patterns: Dict[str, str],
+                processes: Optional[int] = None) -> LogPipeline:
+    """Scan shards on a process pool (or inline for one process), merged in order"""
+    merged = LogPipeline(patterns)
+    if not shards:
+        return merged
+
+    processes = min(processes or os.cpu_count() or 1, len(shards))
+    if processes == 1:
+        for shard in shards:
+            start = time.perf_counter()
+            result = scan_shard(shard, patterns)
+            _trace_shard(shard, result, start, time.perf_counter())
+            merged.merge(result)
+        return merged
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for shard, (result, start, end, pid) in zip(shards, pool.map(
+                _scan_shard_timed, shards, [patterns] * len(shards))):
+            _trace_shard(shard, result, start, end, pid=pid, tid=pid)
+            merged.merge(result)
+    return merged
@@ -3,20 +3,28 @@ Logging & Monitoring Security Claims - Implementations
 Tests for claims: LOG_WHAT_LOGGED, LOG_RETENTION_90, LOG_AUDIT_TRAIL
 """
 
-import json
-import re
-from typing import Tuple, Optional, List, Dict
-import requests
+import sqlite3
+from typing import Tuple, Optional, Dict, Iterable
 
 # Import ValidationStatus from parent package using relative import
 # Use ..claim_tests to go up to tools/security/ then import claim_tests
 try:
     # When imported from tests
+    import tracing
+    from audit_store import DEFAULT_AUDIT_DIR, AuditStore, check_audit_trail
     from claim_tests import ValidationStatus
 except ImportError:
     # When imported normally as a package
+    from .. import tracing
+    from ..audit_store import DEFAULT_AUDIT_DIR, AuditStore, check_audit_trail
     from ..claim_tests import ValidationStatus
 
+from .log_checkpoints import DEFAULT_CHECKPOINT_DIR, CheckpointStore, scan_incremental
+from .log_pipeline import LogPipeline, MetadataCheck, SensitiveDataCheck, StructureCheck
+from .log_retention import DEFAULT_GRACE_DAYS, DEFAULT_RETENTION_DAYS, RetentionChecker
+from .log_sharding import scan_sharded
+from .log_sources import LogpushSource
+
 
 class LoggingImplementations:
     """
@@ -35,16 +43,32 @@ class LoggingImplementations:
         "ip_address": r"\b(?:\d{1,3}\.){3}\d{1,3}\b",
     }
 
-    def __init__(self, worker_url: str, api_key: str):
+    def __init__(self, worker_url: str, api_key: str, worker_config: Optional[Dict] = None,
+                 worker_name: Optional[str] = None):
         """
         Initialize logging tests
 
         Args:
             worker_url: Full URL to worker (e.g., https://resin.mpazbot.workers.dev)
             api_key: Bearer token for authentication
+            worker_config: Deployment entry from deployments.yaml; `logpush_path`
+                points at a local NDJSON Logpush file or directory and
+                `log_scan_processes` shards scanning across that many cores
+            worker_name: Key from deployments.yaml; enables incremental log
+                scanning with checkpoints under `log_checkpoint_dir`
+                (disable with `log_incremental: false`)
         """
         self.worker_url = worker_url
         self.api_key = api_key
+        self.worker_config = worker_config or {}
+        self.worker_name = worker_name
+        self.log_source = self.worker_config.get("logpush_path")
+        self.scan_processes = int(self.worker_config.get("log_scan_processes", 1))
+        self.checkpoints = None
+        if worker_name and self.worker_config.get("log_incremental", True):
+            self.checkpoints = CheckpointStore(
+                self.worker_config.get("log_checkpoint_dir", DEFAULT_CHECKPOINT_DIR)
+            )
 
     def test_log_what_logged(self) -> Tuple[ValidationStatus, str]:
         """
@@ -68,29 +92,36 @@ class LoggingImplementations:
         }
         """
         try:
-            # Query recent logs from worker
-            logs = self._fetch_recent_logs(limit=50)
-
-            if not logs:
+            # Stream logs from the worker's Logpush output
+            logs = self._fetch_recent_logs()
+
+            # One pass: structure, sensitive data and metadata checks see each
+            # record once; results keep the original early-return order
+            streamed = isinstance(logs, LogpushSource) and logs.limit is None
+            with tracing.span("log scan", "log") as span_args:
+                if self.checkpoints is not None and streamed:
+                    # Only data added since the last run is read; counters so far
+                    # come from the worker's checkpoint
+                    pipeline, scanned = scan_incremental(
+                        self.checkpoints, self.worker_name, logs,
+                        self.SENSITIVE_PATTERNS, self.scan_processes)
+                    span_args.update(mode="incremental", scanned=scanned)
+                elif self.scan_processes > 1 and streamed:
+                    pipeline = scan_sharded(logs.files(), self.SENSITIVE_PATTERNS,
+                                            self.scan_processes)
+                    span_args["mode"] = "sharded"
+                else:
+                    pipeline = LogPipeline(self.SENSITIVE_PATTERNS).run(logs)
+                    span_args["mode"] = "inline"
+                span_args["records"] = pipeline.records
+
+            if not pipeline.records:
                 return (
                     ValidationStatus.WARN,
                     "No logs available for analysis. Ensure logging is enabled."
                 )
 
-            # Validate log structure and content
-            validation = self._validate_log_structure(logs)
-            if validation[0] != ValidationStatus.PASS:
-                return validation
-
-            # Check for sensitive data leaks
-            sensitive_check = self._check_for_sensitive_data(logs)
-            if sensitive_check[0] != ValidationStatus.PASS:
-                return sensitive_check
-
-            # Analyze metadata presence
-            metadata_check = self._verify_metadata_presence(logs)
-
-            return metadata_check
+            return pipeline.result()
 
         except Exception as e:
             return (
@@ -107,14 +138,34 @@ class LoggingImplementations:
         This test checks:
         1. Oldest logs are approximately 90 days old
         2. No logs older than 90 days exist
-        3. Log deletion is automated
+        3. Log deletion is automated (an archive that keeps exactly 90 days
+           is the observable effect; the cron trigger itself is not visible)
+
+        The Logpush archive must be partitioned by day; only the edges of the
+        archive and the retention boundary are read (see log_retention).
         """
-        raise NotImplementedError(
-            "90-day log retention verification not yet implemented. "
-            "Need to: 1) Query log timestamps, "
-            "2) Verify oldest log is ~90 days old, "
-            "3) Confirm deletion automation"
-        )
+        if not self.log_source:
+            return (
+                ValidationStatus.WARN,
+                "No Logpush archive configured (logpush_path); cannot verify 90-day "
+                "log retention."
+            )
+
+        options = self.worker_config.get("log_retention") or {}
+        days = options.get("days", DEFAULT_RETENTION_DAYS)
+        try:
+            with tracing.span("retention check", "log", days=days) as span_args:
+                checker = RetentionChecker(self.log_source)
+                report = checker.check(days=days,
+                                       grace_days=options.get("grace_days", DEFAULT_GRACE_DAYS))
+                span_args["records"] = report.records_read
+            return report.result()
+
+        except (OSError, ValueError) as e:
+            return (
+                ValidationStatus.WARN,
+                f"Log retention check incomplete: {str(e)}"
+            )
 
     def test_log_audit_trail(self) -> Tuple[ValidationStatus, str]:
         """
@@ -126,39 +177,67 @@ class LoggingImplementations:
         2. Logs queryable by user
         3. Logs queryable by date range
         4. Logs exportable for audits
+
+        Logpush output is ingested into an indexed audit store (see
+        audit_store.py): `.state/audit/<worker>.sqlite3` by default, or
+        `audit_db`. Only entries added since the last run are read.
         """
-        raise NotImplementedError(
-            "Audit trail verification not yet implemented. "
-            "Need to: 1) Test log retrieval via Cloudflare Analytics, "
-            "2) Verify filtering (org, user, date), "
-            "3) Test export capabilities"
-        )
+        if not self.log_source:
+            return (
+                ValidationStatus.WARN,
+                "No Logpush archive configured (logpush_path); cannot verify audit "
+                "trail queries and export."
+            )
+
+        store = None
+        try:
+            store = AuditStore(self._audit_db())
+            with tracing.span("audit ingest", "log") as span_args:
+                ingested = store.ingest(LogpushSource(self.log_source))
+                span_args.update(entries=ingested.entries, removed=ingested.removed)
+            return check_audit_trail(store)
+
+        except (OSError, ValueError, sqlite3.Error) as e:
+            return (
+                ValidationStatus.WARN,
+                f"Audit trail verification incomplete: {str(e)}"
+            )
+        finally:
+            if store is not None:
+                store.close()
 
     # ============================================================================
     # Helper Methods
     # ============================================================================
 
-    def _fetch_recent_logs(self, limit: int = 50) -> List[Dict]:
+    def _fetch_recent_logs(self, limit: Optional[int] = None) -> Iterable[Dict]:
         """
-        Fetch recent logs from the worker
-
-        For Cloudflare Workers, this would typically query:
-        - Cloudflare Logpush API
-        - Or tail logs via wrangler
-        - Or Analytics Engine
-
-        For now, we're stubbing this for testing.
-        Real implementation would:
-        1. Use Cloudflare API with account token
-        2. Filter by worker name
-        3. Get most recent N logs
+        Stream logs for the worker from local Logpush output
+
+        Reads the NDJSON file or directory configured as `logpush_path`
+        (plain or gzip-compressed segments). The returned LogpushSource is
+        re-iterable and holds no records in memory, so every check below
+        consumes it in constant memory.
+
+        Without a configured path there is nothing to read. Querying the
+        Cloudflare Logpush API directly would need account credentials,
+        not just the worker API key.
         """
-        # TODO: Implement actual Cloudflare log querying
-        # This requires Cloudflare API credentials, not just the worker API key
+        if not self.log_source:
+            return []
+
+        return LogpushSource(self.log_source, limit=limit)
 
-        return []  # Placeholder
+    def _audit_db(self) -> str:
+        """Audit store for this worker (in memory when run outside a deployment)"""
+        if self.worker_config.get("audit_db"):
+            return self.worker_config["audit_db"]
+        if not self.worker_name:
+            return ":memory:"
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in self.worker_name)
+        return str(DEFAULT_AUDIT_DIR / f"{safe}.sqlite3")
 
-    def _validate_log_structure(self, logs: List[Dict]) -> Tuple[ValidationStatus, str]:
+    def _validate_log_structure(self, logs: Iterable[Dict]) -> Tuple[ValidationStatus, str]:
         """
         Validate log structure matches expected format
 
@@ -169,22 +248,9 @@ class LoggingImplementations:
         - context (dict with requestId, endpoint, method)
         - data (dict with statusCode, durationMs)
         """
-        required_fields = ["timestamp", "level", "message"]
-        invalid_logs = []
+        return StructureCheck().run(logs).result()
 
-        for i, log in enumerate(logs):
-            missing_fields = [f for f in required_fields if f not in log]
-            if missing_fields:
-                invalid_logs.append((i, missing_fields))
-
-        if invalid_logs:
-            details = f"Found {len(invalid_logs)} logs with missing fields. Examples: "
-            details += ", ".join([f"Log {i}: missing {', '.join(fields)}" for i, fields in invalid_logs[:3]])
-            return (ValidationStatus.WARN, details)
-
-        return (ValidationStatus.PASS, "Log structure valid")
-
-    def _check_for_sensitive_data(self, logs: List[Dict]) -> Tuple[ValidationStatus, str]:
+    def _check_for_sensitive_data(self, logs: Iterable[Dict]) -> Tuple[ValidationStatus, str]:
         """
         Check logs for sensitive data leaks
 
@@ -198,33 +264,9 @@ class LoggingImplementations:
         - Full names
         - IP addresses
         """
-        leaked_patterns = {}
-        found_sensitive = False
-
-        for log in logs:
-            log_str = json.dumps(log)
-
-            for pattern_name, pattern in self.SENSITIVE_PATTERNS.items():
-                if re.search(pattern, log_str, re.IGNORECASE):
-                    if pattern_name not in leaked_patterns:
-                        leaked_patterns[pattern_name] = 0
-                    leaked_patterns[pattern_name] += 1
-                    found_sensitive = True
+        return SensitiveDataCheck(self.SENSITIVE_PATTERNS).run(logs).result()
 
-        if found_sensitive:
-            leaked_list = ", ".join([f"{name} ({count}x)" for name, count in leaked_patterns.items()])
-            return (
-                ValidationStatus.FAIL,
-                f"SECURITY ISSUE: Found sensitive data in logs: {leaked_list}. "
-                "Logs must not contain PII or credentials."
-            )
-
-        return (
-            ValidationStatus.PASS,
-            "No sensitive data detected in logs"
-        )
-
-    def _verify_metadata_presence(self, logs: List[Dict]) -> Tuple[ValidationStatus, str]:
+    def _verify_metadata_presence(self, logs: Iterable[Dict]) -> Tuple[ValidationStatus, str]:
         """
         Verify logs contain required metadata fields
 
@@ -236,52 +278,4 @@ class LoggingImplementations:
         - statusCode: HTTP response code
         - durationMs: how long the request took
         """
-        metadata_fields = {
-            "timestamp": 0,
-            "requestId": 0,
-            "endpoint": 0,
-            "method": 0,
-            "statusCode": 0,
-            "durationMs": 0,
-        }
-
-        for log in logs:
-            # Check top-level fields
-            if "timestamp" in log:
-                metadata_fields["timestamp"] += 1
-
-            # Check context object
-            context = log.get("context", {})
-            if "requestId" in context:
-                metadata_fields["requestId"] += 1
-            if "endpoint" in context:
-                metadata_fields["endpoint"] += 1
-            if "method" in context:
-                metadata_fields["method"] += 1
-
-            # Check data object
-            data = log.get("data", {})
-            if "statusCode" in data:
-                metadata_fields["statusCode"] += 1
-            if "durationMs" in data:
-                metadata_fields["durationMs"] += 1
-
-        # Calculate presence percentage
-        total_logs = len(logs)
-        missing_fields = [
-            field for field, count in metadata_fields.items()
-            if count < total_logs * 0.8  # Allow 20% missing (e.g., statusCode for logs without responses)
-        ]
-
-        if missing_fields:
-            return (
-                ValidationStatus.WARN,
-                f"Some metadata fields missing from logs: {', '.join(missing_fields)}. "
-                "Logs should include timestamp, requestId, endpoint, method, statusCode, durationMs."
-            )
-
-        return (
-            ValidationStatus.PASS,
-            f"All metadata fields present in {total_logs} logs. "
-            "Metadata-only logging confirmed, no sensitive data in logs."
-        )
+        return MetadataCheck().run(logs).result()
@@ -0,0 +1,132 @@
+"""
+Performance Claims - Implementations
+Tests for claims: PERF_HEALTH_LATENCY, PERF_READY_LATENCY
+"""
+
+from typing import Tuple, Optional, Dict
+
+# Import ValidationStatus from parent package using relative import
+# Use ..claim_tests to go up to tools/security/ then import claim_tests
+try:
+    # When imported from tests
+    from claim_tests import ValidationStatus
+except ImportError:
+    # When imported normally as a package
+    from ..claim_tests import ValidationStatus
+
+from .load_generator import SampleReport, sample_latency
+
+
+class PerformanceImplementations:
+    """
+    Performance claim implementations
+    """
+
+    # Latency budgets in milliseconds and sampling per endpoint; override per
+    # deployment with `latency_budget` in deployments.yaml
+    LATENCY_BUDGET = {
+        "concurrency": 4,
+        "timeout": 10.0,
+        "health": {"path": "/health", "samples": 200, "p50": 100, "p95": 300, "p99": 500},
+        # /ready queries Salesforce on every call; sample it lightly
+        "ready": {"path": "/ready", "samples": 20, "p50": 800, "p95": 2000, "p99": 3000},
+    }
+
+    def __init__(self, worker_url: str, api_key: str, worker_config: Optional[Dict] = None):
+        """
+        Initialize performance tests
+
+        Args:
+            worker_url: Full URL to worker (e.g., https://resin.mpazbot.workers.dev)
+            api_key: Bearer token for authentication
+            worker_config: Deployment entry from deployments.yaml
+        """
+        self.worker_url = worker_url.rstrip("/")
+        self.api_key = api_key
+        self.worker_config = worker_config or {}
+        # Measured percentiles (e.g. health_p95_ms), merged into ClaimTester.metrics
+        self.metrics: Dict[str, float] = {}
+
+    def test_perf_health_latency(self) -> Tuple[ValidationStatus, str]:
+        """
+        Test: /health latency within budget
+        Sample the liveness endpoint and compare p50/p95/p99 to the budget
+        """
+        return self._check_endpoint("health")
+
+    def test_perf_ready_latency(self) -> Tuple[ValidationStatus, str]:
+        """
+        Test: /ready latency within budget
+        Sample the readiness endpoint (Salesforce connectivity check) and
+        compare p50/p95/p99 to the budget
+        """
+        return self._check_endpoint("ready")
+
+    # ============================================================================
+    # Helper methods
+    # ============================================================================
+
+    def budget(self, endpoint: str) -> Dict:
+        """Effective budget for an endpoint (defaults merged with deployment overrides)"""
+        overrides = self.worker_config.get("latency_budget", {})
+        merged = {key: overrides.get(key, value) for key, value in self.LATENCY_BUDGET.items()
+                  if not isinstance(value, dict)}
+        merged.update(self.LATENCY_BUDGET[endpoint])
+        merged.update(overrides.get(endpoint, {}))
+        return merged
+
+    def _check_endpoint(self, endpoint: str) -> Tuple[ValidationStatus, str]:
+        budget = self.budget(endpoint)
+        samples = int(budget["samples"])
+        concurrency = min(int(budget["concurrency"]), samples)
+        report = sample_latency(
+            f"{self.worker_url}{budget['path']}",
+            samples=samples,
+            concurrency=concurrency,
+            timeout=float(budget["timeout"]),
+            warmup=concurrency,  # Connection setup is not endpoint latency
+            max_errors=concurrency,
+        )
+        return self._evaluate(endpoint, budget, report)
+
+    def _evaluate(self, endpoint: str, budget: Dict,
+                  report: SampleReport) -> Tuple[ValidationStatus, str]:
+        """Compare measured percentiles to the budget"""
+        path = budget["path"]
+        if report.answered == 0:
+            return (
+                ValidationStatus.WARN,
+                f"{path} latency not measured: all {report.errors} requests failed "
+                f"({report.first_error})"
+            )
+
+        measured = report.histogram.percentiles()
+        for name, value in measured.items():
+            self.metrics[f"{endpoint}_{name}_ms"] = value
+
+        over = [
+            f"{name} {measured[name]:.0f}ms > {float(budget[name]):g}ms"
+            for name in ("p50", "p95", "p99") if name in budget and measured[name] > float(budget[name])
+        ]
+        if over:
+            return (
+                ValidationStatus.FAIL,
+                f"{path} over latency budget ({', '.join(over)}): {report.summary()}"
+            )
+
+        limits = ", ".join(f"{name} {float(budget[name]):g}ms" for name in ("p50", "p95", "p99")
+                           if name in budget)
+        unhealthy = {status: count for status, count in report.status_counts.items()
+                     if status >= 400}
+        if report.errors or unhealthy:
+            statuses = ", ".join(f"{status}: {count}" for status, count in unhealthy.items())
+            return (
+                ValidationStatus.WARN,
+                f"{path} within latency budget ({limits}) but not all requests succeeded"
+                f"{f' ({statuses})' if statuses else ''}: {report.summary()}"
+            )
+
+        return (
+            ValidationStatus.PASS,
+            f"{path} within latency budget ({limits}): {report.summary()}"
+        )
@@ -0,0 +1,291 @@
+"""
+Shared TLS / Header Probe
+One connection per worker feeds ENC_TLS_TRANSIT, HSTS and API_CORS_HEADERS
+
+The probe performs a single TCP connect and TLS handshake, records the
+negotiated protocol, cipher and handshake latency, then sends the HEAD and
+OPTIONS requests the header claims need over that same keep-alive
+connection. If the server closes it, the next connection resumes the TLS
+session instead of doing a full handshake.
+
+SSL contexts (CA bundle load, one per CA file) and TLS sessions are
+shared by every probe in the process, so fleet runs pay that setup once
+per host rather than once per claim.
+"""
+
+import http.client
+import socket
+import ssl
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    # When imported from tests or validator.py (tools/security on sys.path)
+    import instrumentation
+    import tracing
+except ImportError:
+    # When imported normally as a package
+    from .. import instrumentation, tracing
+
+# Origin sent with the CORS preflight; a restrictive worker must not allow it
+PROBE_ORIGIN = "https://security-probe.invalid"
+
+# Latest TLS session per (host, port) with the context that created it;
+# sessions only resume with that context. A session keeps its context
+# alive, so a new context replaces the entry rather than adding one
+_sessions: Dict[Tuple[str, int], Tuple[ssl.SSLContext, ssl.SSLSession]] = {}
+_sessions_lock = threading.Lock()
+
+
+@dataclass
+class ProbeResponse:
+    """Status and headers (lowercase names) of one probe request"""
+    status: int
+    headers: Dict[str, str]
+    elapsed_ms: float
+
+
+@dataclass
+class ProbeResult:
+    """Everything learned from one probe run"""
+    url: str
+    tls: bool
+    tls_version: Optional[str] = None
+    cipher: Optional[str] = None
+    cipher_bits: Optional[int] = None
+    dns_ms: Optional[float] = None
+    tcp_connect_ms: Optional[float] = None
+    handshake_ms: Optional[float] = None
+    connections: int = 0
+    resumed_connections: int = 0
+    responses: Dict[str, ProbeResponse] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def head(self) -> Optional[ProbeResponse]:
+        return self.responses.get("HEAD")
+
+    @property
+    def preflight(self) -> Optional[ProbeResponse]:
+        return self.responses.get("OPTIONS")
+
+    def header(self, name: str) -> Optional[str]:
+        """Header from the HEAD response"""
+        return self.head.headers.get(name.lower()) if self.head else None
+
+    def metrics(self) -> Dict[str, float]:
+        """Connection timings for tracking across runs"""
+        values = {
+            "dns_ms": self.dns_ms,
+            "tcp_connect_ms": self.tcp_connect_ms,
+            "tls_handshake_ms": self.handshake_ms,
+        }
+        return {name: value for name, value in values.items() if value is not None}
+
+
+@lru_cache(maxsize=None)
+def default_context(ca_file: Optional[str] = None) -> ssl.SSLContext:
+    """Verifying client context (system CAs, or `ca_file`), created once per process"""
+    return ssl.create_default_context(cafile=ca_file)
+
+
+class TLSProbe:
+    """
+    Probe a worker over one (resumable) connection
+
+    Usage:
+        result = TLSProbe("https://resin.mpazbot.workers.dev").run()
+        result.tls_version, result.handshake_ms, result.header("strict-transport-security")
+    """
+
+    def __init__(self, url: str, timeout: float = 10.0,
+                 context: Optional[ssl.SSLContext] = None,
+                 head_path: str = "/health", options_path: str = "/mcp",
+                 origin: str = PROBE_ORIGIN):
+        """
+        Args:
+            url: Worker URL (https, or http for local stand-ins)
+            timeout: Socket timeout in seconds
+            context: SSL context (default: shared verifying context)
+            head_path: Path for the HEAD request (security headers, HSTS)
+            options_path: Path for the CORS preflight
+            origin: Origin sent with the preflight
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        self.url = url
+        self.host = parts.hostname
+        self.tls = parts.scheme == "https"
+        self.port = parts.port or (443 if self.tls else 80)
+        self.timeout = timeout
+        self.context = (context or default_context()) if self.tls else None
+        self.head_path = head_path
+        self.options_path = options_path
+        self.origin = origin
+        self._connection: Optional[_ProbeConnection] = None
+
+    def run(self) -> ProbeResult:
+        """Handshake once, then HEAD and OPTIONS over the same connection"""
+        result = ProbeResult(url=self.url, tls=self.tls)
+        requests: List[Tuple[str, str, Dict[str, str]]] = [
+            ("HEAD", self.head_path, {}),
+            ("OPTIONS", self.options_path, {
+                "Origin": self.origin,
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "authorization, content-type",
+            }),
+        ]
+        try:
+            for method, path, headers in requests:
+                result.responses[method] = self._request(result, method, path, headers)
+        except (OSError, http.client.HTTPException) as e:
+            result.error = f"{type(e).__name__}: {e}"
+        finally:
+            self.close()
+        return result
+
+    @property
+    def _session_key(self) -> Tuple[str, int]:
+        return (self.host, self.port)
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    # ============================================================================
+    # Helper methods
+    # ============================================================================
+
+    def _request(self, result: ProbeResult, method: str, path: str,
+                 headers: Dict[str, str]) -> ProbeResponse:
+        if self._connection is None:
+            self._connection = self._connect(result)
+
+        start = time.perf_counter()
+        sent = self._connection.bytes_sent
+        self._connection.request(method, path, headers={
+            "User-Agent": "Resin-SecurityValidator/1.0", **headers,
+        })
+        written = time.perf_counter()
+        response = self._connection.getresponse()
+        first_byte = time.perf_counter()
+        body = response.read()
+        end = time.perf_counter()
+        elapsed = (end - start) * 1000
+        tracing.add_span("server wait", "http", written, first_byte)
+        tracing.add_span(f"{method} {path}", "http", start, end, host=self.host,
+                         status=response.status)
+        instrumentation.record_request(
+            self._connection.bytes_sent - sent,
+            instrumentation.message_size(f"HTTP/1.1 {response.status} {response.reason}",
+                                         response.getheaders()) + len(body),
+        )
+
+        if self.tls:
+            # TLS 1.3 tickets arrive after the handshake; keep the latest one
+            session = self._connection.sock.session
+            if session is not None:
+                with _sessions_lock:
+                    _sessions[self._session_key] = (self.context, session)
+        if response.will_close:
+            self.close()
+
+        return ProbeResponse(
+            status=response.status,
+            headers={name.lower(): value for name, value in response.getheaders()},
+            elapsed_ms=elapsed,
+        )
+
+    def _connect(self, result: ProbeResult) -> "_ProbeConnection":
+        session = None
+        if self.tls:
+            with _sessions_lock:
+                context, stored = _sessions.get(self._session_key, (None, None))
+            if context is self.context:
+                session = stored
+
+        connection = _ProbeConnection(self.host, self.port, self.timeout, self.context, session)
+        connection.connect()
+        result.connections += 1
+
+        if result.tcp_connect_ms is None:
+            result.dns_ms = connection.dns_ms
+            result.tcp_connect_ms = connection.tcp_connect_ms
+        if self.tls:
+            sock = connection.sock
+            if sock.session_reused:
+                result.resumed_connections += 1
+            if result.handshake_ms is None:
+                result.handshake_ms = connection.handshake_ms
+                result.tls_version = sock.version()
+                name, _, bits = sock.cipher()
+                result.cipher, result.cipher_bits = name, bits
+        return connection
+
+
+class _ProbeConnection(http.client.HTTPConnection):
+    """HTTP(S) connection that times DNS, TCP connect and TLS handshake separately"""
+
+    def __init__(self, host: str, port: int, timeout: float,
+                 context: Optional[ssl.SSLContext], session: Optional[ssl.SSLSession]):
+        super().__init__(host, port, timeout=timeout)
+        self.context = context
+        self.session = session
+        self.dns_ms: Optional[float] = None
+        self.tcp_connect_ms: Optional[float] = None
+        self.handshake_ms: Optional[float] = None
+        self.bytes_sent = 0
+
+    def send(self, data):
+        if isinstance(data, (bytes, bytearray)):
+            self.bytes_sent += len(data)
+        super().send(data)
+
+    def connect(self):
+        start = time.perf_counter()
+        addresses = socket.getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM)
+        resolved = time.perf_counter()
+        self.dns_ms = (resolved - start) * 1000
+        tracing.add_span("dns", "net", start, resolved, host=self.host)
+
+        sock = _open_socket(addresses, self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connected = time.perf_counter()
+        self.tcp_connect_ms = (connected - resolved) * 1000
+        tracing.add_span("tcp connect", "net", resolved, connected, host=self.host)
+
+        if self.context is not None:
+            try:
+                sock = self.context.wrap_socket(sock, server_hostname=self.host,
+                                                session=self.session,
+                                                do_handshake_on_connect=False)
+                sock.do_handshake()
+            except BaseException:
+                sock.close()
+                raise
+            handshaken = time.perf_counter()
+            self.handshake_ms = (handshaken - connected) * 1000
+            tracing.add_span("tls handshake", "net", connected, handshaken, host=self.host,
+                             resumed=sock.session_reused)
+        self.sock = sock
+
+
+def _open_socket(addresses: List[Tuple], timeout: float) -> socket.socket:
+    """Connect to the first reachable getaddrinfo() address (as socket.create_connection)"""
+    error: Optional[OSError] = None
+    for family, kind, proto, _, address in addresses:
+        sock = socket.socket(family, kind, proto)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(address)
+            return sock
+        except OSError as e:
+            sock.close()
+            error = e
+    raise error or OSError("getaddrinfo returned no addresses")
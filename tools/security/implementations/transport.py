@@ -0,0 +1,211 @@
+"""
+Shared HTTP transport
+Pooled, keep-alive, retrying requests adapter shared by every claim implementation
+
+Each claim used to create its own requests.Session (or none at all) with
+default pool sizes and no retries, so a fleet run opened a fresh
+connection, TLS handshake included, for almost every request. A Transport
+owns one HTTPAdapter: its urllib3 pool manager keeps connections alive
+per host, caps them at `pool_maxsize` per host (callers wait for a free
+connection instead of opening more) and retries idempotent requests on
+connection errors and 502/503/504 with exponential backoff and jitter,
+honouring Retry-After.
+
+Sessions are per worker (they carry its Authorization header) but all
+mount the same adapter, so workers on one host share its connections.
+get_transport() returns one Transport per distinct `http` setting for the
+whole process.
+
+The load generator, fuzzer and TLS probe keep their own sockets: they
+measure connection and response behaviour and must not be retried.
+
+While a claim is instrumented, the adapter reports each request's
+attempts and bytes to instrumentation.record_request(). While a
+tracing.Tracer runs, each request is a span with its connection set-up
+(DNS + TCP connect, TLS handshake) and body read as children; the rest of
+the request span is upload and server latency.
+
+Usage:
+    transport = get_transport(worker_config.get("http"))
+    session = transport.session(api_key)
+    session.get(f"{worker_url}/health", timeout=10)
+"""
+
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+try:
+    # When imported from tests or validator.py (tools/security on sys.path)
+    import instrumentation
+    import tracing
+except ImportError:
+    # When imported normally as a package
+    from .. import instrumentation, tracing
+
+USER_AGENT = "Resin-SecurityValidator/1.0"
+
+# Defaults; override per deployment with `http` in deployments.yaml
+HTTP_DEFAULTS = {
+    "pool_connections": 32,  # Hosts with a pool kept open
+    "pool_maxsize": 8,  # Connections per host (callers block when all are busy)
+    "retries": 2,  # Retries after the first attempt
+    "backoff_factor": 0.2,  # Seconds; doubles per retry (urllib3: first retry immediate)
+    "backoff_jitter": 0.1,  # Seconds of random extra backoff (urllib3 >= 2)
+    "backoff_max": 10.0,
+}
+
+# Responses worth retrying: the edge or origin was briefly unavailable
+RETRY_STATUSES = (502, 503, 504)
+
+
+class Transport:
+    """One connection pool and retry policy, shared by many sessions"""
+
+    def __init__(self, **options):
+        """
+        Args:
+            **options: HTTP_DEFAULTS keys
+        """
+        unknown = set(options) - set(HTTP_DEFAULTS)
+        if unknown:
+            raise ValueError(f"Unknown http options: {', '.join(sorted(unknown))}")
+        self.options = {**HTTP_DEFAULTS, **options}
+        self.retry = _retry(self.options)
+        self.adapter = _InstrumentedAdapter(
+            pool_connections=int(self.options["pool_connections"]),
+            pool_maxsize=int(self.options["pool_maxsize"]),
+            pool_block=True,
+            max_retries=self.retry,
+        )
+
+    def session(self, api_key: Optional[str] = None) -> requests.Session:
+        """Session for one worker, using this transport's pools"""
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        if api_key:
+            session.headers["Authorization"] = f"Bearer {api_key}"
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        return session
+
+    def close(self):
+        """Close every pooled connection"""
+        self.adapter.close()
+
+
+_transports: Dict[Tuple, Transport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(options: Optional[Mapping] = None) -> Transport:
+    """Process-wide Transport for a deployment's `http` settings"""
+    key = tuple(sorted((options or {}).items()))
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = _transports[key] = Transport(**dict(key))
+        return transport
+
+
+class _InstrumentedAdapter(HTTPAdapter):
+    """HTTPAdapter that reports requests to the running claim's stats and the tracer"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TracedHTTPConnectionPool,
+            "https": _TracedHTTPSConnectionPool,
+        }
+
+    def send(self, request, stream=False, **kwargs):
+        with tracing.span(f"{request.method} {request.path_url}", "http") as span_args:
+            response = super().send(request, stream=stream, **kwargs)
+            if instrumentation.current() is None and tracing.active() is None:
+                return response
+
+            body = request.body
+            sent = instrumentation.message_size(
+                f"{request.method} {request.path_url} HTTP/1.1", request.headers.items())
+            sent += len(body) if isinstance(body, (bytes, str)) else 0
+            received = instrumentation.message_size(
+                f"HTTP/1.1 {response.status_code} {response.reason}", response.headers.items())
+            if not stream:
+                # Read now (requests would right after) so the body can be counted
+                with tracing.span("read body", "http"):
+                    received += _raw_bytes(response)
+            retries = getattr(response.raw, "retries", None)
+            attempts = 1 + len(retries.history) if retries is not None else 1
+            instrumentation.record_request(sent * attempts, received, requests=attempts)
+            span_args.update(host=urlsplit(request.url).netloc, status=response.status_code,
+                             attempts=attempts, bytes_received=received)
+            return response
+
+
+class _TracedConnection:
+    """Records connection set-up spans while tracing (mixed into urllib3 connections)"""
+
+    def _new_conn(self):
+        with tracing.span("dns + tcp connect", "net", host=self.host, port=self.port):
+            sock = super()._new_conn()
+        self._connected_at = time.perf_counter()
+        return sock
+
+    def connect(self):
+        if tracing.active() is None:
+            return super().connect()
+        with tracing.span(f"connect {self.host}", "net"):
+            super().connect()
+            if isinstance(self, HTTPSConnection):
+                tracing.add_span("tls handshake", "net", self._connected_at,
+                                 time.perf_counter(), host=self.host)
+
+
+class _TracedHTTPConnection(_TracedConnection, HTTPConnection):
+    pass
+
+
+class _TracedHTTPSConnection(_TracedConnection, HTTPSConnection):
+    pass
+
+
+class _TracedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TracedHTTPConnection
+
+
+class _TracedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TracedHTTPSConnection
+
+
+def _raw_bytes(response: requests.Response) -> int:
+    """Body bytes as received (before content decoding)"""
+    content = response.content
+    try:
+        return int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        return len(content or b"")
+
+
+def _retry(options: Dict) -> Retry:
+    settings = dict(
+        total=int(options["retries"]),
+        connect=int(options["retries"]),
+        read=int(options["retries"]),
+        status=int(options["retries"]),
+        backoff_factor=float(options["backoff_factor"]),
+        status_forcelist=RETRY_STATUSES,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # Hand the last response to the caller
+    )
+    try:
+        return Retry(**settings, backoff_jitter=float(options["backoff_jitter"]),
+                     backoff_max=float(options["backoff_max"]))
+    except TypeError:
+        return Retry(**settings)  # urllib3 1.26: no jitter, fixed 120s backoff cap
@@ -0,0 +1,268 @@
+"""
+Per-claim instrumentation
+Wall time, CPU time, requests, bytes and peak memory of every claim, with optional profiles
+
+run_all_tests() wraps each claim function in a ClaimInstrumentation. While
+a claim runs, its ClaimStats is the current stats of the claim's thread;
+the HTTP layers (the shared transport, the load generator / fuzzer
+connection pool and the TLS probe) call record_request() for every
+request they send, so requests and bytes are attributed to the claim that
+made them. Outside a claim record_request() does nothing. When a
+tracing.Tracer is running, every claim is also recorded as a span.
+
+Measured per claim:
+- wall_time: seconds from start to finish
+- cpu_time: CPU seconds of the claim's thread (time.thread_time); work in
+  child processes, such as sharded log scans, is not included
+- requests / bytes_sent / bytes_received: HTTP requests including retries,
+  with request and status lines, headers and bodies (bodies of streamed
+  responses are not counted)
+- peak_memory: bytes allocated above the claim's starting point at its
+  peak, when tracemalloc is tracing (`trace_memory`, on with profiling);
+  None otherwise. Peaks of claims running at the same time overlap.
+
+With `profile_dir`, every claim also writes:
+- <claim_id>.prof: cProfile statistics (python -m pstats, snakeviz)
+- <claim_id>.folded: collapsed stacks sampled every `sample_interval`
+  seconds, one "frame;frame;frame count" line per distinct stack
+  (flamegraph.pl, speedscope, inferno)
+validator.py --profile writes them to .state/profiles/<worker>-<UTC time>/
+together with stats.json. Profiled claims must run one at a time, so
+--profile runs them serially: newer Pythons allow one active cProfile
+profiler per process and tracemalloc peaks are process-wide.
+
+Usage:
+    instrumentation = ClaimInstrumentation(profile_dir=".state/profiles/resin")
+    results = run_all_tests(url, api_key, executor=executor,
+                            instrumentation=instrumentation)
+    print(format_stats(instrumentation.stats))
+"""
+
+import json
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple, TypeVar, Union
+
+import tracing
+
+T = TypeVar("T")
+
+DEFAULT_PROFILE_DIR = Path(__file__).resolve().parent / ".state" / "profiles"
+
+# Seconds between stack samples of a profiled claim
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+@dataclass
+class ClaimStats:
+    """Resources used by one claim run"""
+    claim_id: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    requests: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    peak_memory: Optional[int] = None  # Bytes, when tracemalloc is tracing
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+_local = threading.local()
+
+# Instrumented claims currently tracing memory; tracemalloc is stopped again
+# when the last one finishes if instrumentation started it
+_tracing = {"claims": 0, "started": False}
+_tracing_lock = threading.Lock()
+
+
+def current() -> Optional[ClaimStats]:
+    """Stats of the claim running in this thread, if any"""
+    return getattr(_local, "stats", None)
+
+
+def record_request(sent: int, received: int, requests: int = 1):
+    """Attribute one HTTP exchange (or `requests` attempts of it) to the running claim"""
+    stats = current()
+    if stats is not None:
+        stats.requests += requests
+        stats.bytes_sent += sent
+        stats.bytes_received += received
+
+
+def message_size(start_line: str, headers: Iterable[Tuple[str, str]]) -> int:
+    """Bytes of an HTTP/1.1 start line and header block, blank line included"""
+    size = len(start_line) + 2
+    for name, value in headers:
+        size += len(name) + len(value) + 4  # "name: value\r\n"
+    return size + 2
+
+
+class ClaimInstrumentation:
+    """Wrap claim functions so each run records a ClaimStats (and optionally profiles)"""
+
+    def __init__(self, profile_dir: Optional[Union[str, Path]] = None,
+                 trace_memory: Optional[bool] = None,
+                 sample_interval: float = DEFAULT_SAMPLE_INTERVAL):
+        """
+        Args:
+            profile_dir: Directory for per-claim .prof and .folded files
+                (None = no profiling)
+            trace_memory: Measure peak memory with tracemalloc (default: on
+                when profiling); tracemalloc slows allocation-heavy claims
+            sample_interval: Seconds between stack samples when profiling
+        """
+        self.profile_dir = Path(profile_dir) if profile_dir is not None else None
+        self.trace_memory = self.profile_dir is not None if trace_memory is None else trace_memory
+        self.sample_interval = sample_interval
+        self.stats: Dict[str, ClaimStats] = {}
+        self._lock = threading.Lock()
+        if self.profile_dir is not None:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+
+    def wrap(self, claim_id: str, func: Callable[[], T]) -> Callable[[], T]:
+        """Instrumented version of a zero-argument claim function"""
+        def run():
+            return self.call(claim_id, func)
+        return run
+
+    def call(self, claim_id: str, func: Callable[[], T]) -> T:
+        """Run a claim function in this thread, recording its stats"""
+        stats = ClaimStats(claim_id)
+        with self._lock:
+            self.stats[claim_id] = stats
+
+        previous, _local.stats = current(), stats
+        memory_start = self._start_memory()
+        profiler = sampler = None
+        if self.profile_dir is not None:
+            import cProfile
+            profiler = cProfile.Profile()
+            sampler = _StackSampler(threading.get_ident(), sys._getframe(), self.sample_interval)
+            sampler.start()
+            profiler.enable()
+
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            with tracing.span(claim_id, "claim") as span_args:
+                result = func()
+                if isinstance(result, tuple) and isinstance(result[0], Enum):
+                    span_args["status"] = result[0].name
+                return result
+        finally:
+            stats.wall_time = time.perf_counter() - start
+            stats.cpu_time = time.thread_time() - cpu_start
+            if profiler is not None:
+                profiler.disable()
+                sampler.stop()
+                profiler.dump_stats(self.profile_dir / f"{claim_id}.prof")
+                sampler.write(self.profile_dir / f"{claim_id}.folded")
+            if memory_start is not None:
+                stats.peak_memory = self._stop_memory(memory_start)
+            _local.stats = previous
+
+    def write_json(self, path: Union[str, Path]) -> Path:
+        """Write every claim's stats as a JSON object keyed by claim ID"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {claim_id: stats.to_dict() for claim_id, stats in self.stats.items()}
+        path.write_text(json.dumps(data, indent=2) + "\n")
+        return path
+
+    # ============================================================================
+    # Helper methods
+    # ============================================================================
+
+    def _start_memory(self) -> Optional[int]:
+        """Start (or reset the peak of) tracemalloc; returns current traced bytes"""
+        if not self.trace_memory:
+            return None
+        import tracemalloc
+        with _tracing_lock:
+            if _tracing["claims"] == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _tracing["started"] = True
+            _tracing["claims"] += 1
+            tracemalloc.reset_peak()
+            return tracemalloc.get_traced_memory()[0]
+
+    def _stop_memory(self, start: int) -> int:
+        """Peak traced bytes above `start`; stops tracemalloc if we started it"""
+        import tracemalloc
+        with _tracing_lock:
+            peak = max(0, tracemalloc.get_traced_memory()[1] - start)
+            _tracing["claims"] -= 1
+            if _tracing["claims"] == 0 and _tracing["started"]:
+                tracemalloc.stop()
+                _tracing["started"] = False
+            return peak
+
+
+def format_stats(stats: Dict[str, ClaimStats], limit: Optional[int] = None) -> str:
+    """Text table of claim stats, slowest claim first"""
+    rows = sorted(stats.values(), key=lambda s: s.wall_time, reverse=True)[:limit]
+    lines = [f"{'Claim':<32} {'Wall':>8} {'CPU':>8} {'Reqs':>6} {'Sent':>9} "
+             f"{'Received':>9} {'Peak mem':>9}"]
+    for s in rows:
+        peak = _size(s.peak_memory) if s.peak_memory is not None else "-"
+        lines.append(f"{s.claim_id:<32} {s.wall_time:>7.2f}s {s.cpu_time:>7.2f}s "
+                     f"{s.requests:>6} {_size(s.bytes_sent):>9} "
+                     f"{_size(s.bytes_received):>9} {peak:>9}")
+    return "\n".join(lines)
+
+
+def _size(count: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if count < 1024 or unit == "MiB":
+            return f"{count:.0f}{unit}" if unit == "B" else f"{count:.1f}{unit}"
+        count /= 1024
+
+
+class _StackSampler:
+    """Samples one thread's Python stack on a timer, counting collapsed stacks"""
+
+    def __init__(self, thread_id: int, root, interval: float):
+        """
+        Args:
+            thread_id: Thread to sample
+            root: Frame the stacks are rooted at (frames above it are dropped)
+            interval: Seconds between samples
+        """
+        self.thread_id = thread_id
+        self.root = root
+        self.interval = interval
+        self.counts: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="claim-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, path: Path):
+        lines = [f"{stack} {count}" for stack, count in sorted(self.counts.items())]
+        path.write_text("".join(line + "\n" for line in lines))
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and frame is not self.root:
+                stack.append(_label(frame))
+                frame = frame.f_back
+            if frame is self.root and stack:
+                key = ";".join(reversed(stack))
+                self.counts[key] = self.counts.get(key, 0) + 1
+
+
+def _label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
@@ -0,0 +1,272 @@
+"""
+Streaming Report Writer
+Renders validator reports section by section straight to files or streams
+
+The validator walks its claims once and feeds each category to a
+ReportWriter, which fans the section out to one renderer per output format.
+Every renderer writes to its own text stream as sections arrive, so a
+report is never assembled as one string in memory and several formats
+(markdown report, checklist, JSON) come out of the same pass.
+
+Usage:
+    with open("report.md", "w") as md, open("report.json", "w") as js:
+        validator.write_report(MarkdownReportRenderer(md), JsonReportRenderer(js))
+
+    save_reports("resin", validator, formats=("md", "json"))  # docs/reports/...
+
+Claim results can also be streamed as they complete (validator.py
+--output ndjson) with NdjsonResultStream, one JSON object per line.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Type
+
+# docs/reports in the repository root
+REPORTS_DIR = Path(__file__).parent.parent.parent / "docs" / "reports"
+
+
+class Renderer:
+    """
+    One output format written to one text stream
+
+    Claims are validator.SecurityClaim objects (id, claim, status,
+    details, test_procedure, expected_result, last_tested).
+    """
+
+    extension = "txt"
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def begin(self, generated: str, total: int, by_status: Dict[str, int]):
+        """Title and summary, before any category"""
+
+    def category(self, name: str, claims: Sequence):
+        """One category section with its claims"""
+
+    def end(self):
+        """Anything written after the last category"""
+
+
+class MarkdownReportRenderer(Renderer):
+    """Compliance report: summary counts and one status line per claim"""
+
+    extension = "md"
+
+    def begin(self, generated: str, total: int, by_status: Dict[str, int]):
+        write = self.stream.write
+        write("# Resin AI Security Compliance Report\n\n")
+        write(f"Generated: {generated}\n")
+        write("Document Version: 1.0 (Nov 4, 2025)\n\n")
+        write("## Summary\n\n")
+        write(f"Total Claims: {total}\n")
+        for status, count in sorted(by_status.items()):
+            write(f"{status}: {count}\n")
+        write("\n")
+        write("## Claims by Category\n\n")
+
+    def category(self, name: str, claims: Sequence):
+        write = self.stream.write
+        write(f"### {name} ({len(claims)} claims)\n\n")
+        for claim in claims:
+            write(f"- [{claim.status.value}] {claim.claim}\n")
+        write("\n")
+
+
+class MarkdownChecklistRenderer(Renderer):
+    """Manual validation checklist: procedure, expected result and status per claim"""
+
+    extension = "checklist.md"
+
+    def begin(self, generated: str, total: int, by_status: Dict[str, int]):
+        self.stream.write("# Security Claims Validation Checklist\n\n")
+        self.stream.write(f"Generated: {generated}\n\n")
+
+    def category(self, name: str, claims: Sequence):
+        write = self.stream.write
+        write(f"## {name}\n\n")
+        for claim in claims:
+            write(f"### {claim.claim} ({claim.id})\n\n")
+            write(f"**Expected Result:** {claim.expected_result}\n\n")
+            write("**Test Procedure:**\n")
+            write(f"{claim.test_procedure}\n\n")
+            write(f"**Status:** {claim.status.value}\n\n")
+            if claim.details:
+                write(f"**Details:** {claim.details}\n\n")
+            write("---\n\n")
+
+
+class JsonReportRenderer(Renderer):
+    """Machine-readable report, streamed one category at a time"""
+
+    extension = "json"
+
+    def begin(self, generated: str, total: int, by_status: Dict[str, int]):
+        header = json.dumps({
+            "title": "Resin AI Security Compliance Report",
+            "generated": generated,
+            "summary": {"total": total, "by_status": dict(sorted(by_status.items()))},
+        }, ensure_ascii=False)
+        # Reopen the object to append the categories array
+        self.stream.write(header[:-1] + ', "categories": [')
+        self._first = True
+
+    def category(self, name: str, claims: Sequence):
+        if not self._first:
+            self.stream.write(", ")
+        self._first = False
+        self.stream.write(f'{{"name": {json.dumps(name)}, "claims": [')
+        for index, claim in enumerate(claims):
+            if index:
+                self.stream.write(", ")
+            self.stream.write(json.dumps({
+                "id": claim.id,
+                "claim": claim.claim,
+                "status": claim.status.name,
+                "details": claim.details,
+                "expected_result": claim.expected_result,
+                "last_tested": claim.last_tested,
+            }, ensure_ascii=False))
+        self.stream.write("]}")
+
+    def end(self):
+        self.stream.write("]}\n")
+
+
+# Output formats by name (--report-formats)
+RENDERERS: Dict[str, Type[Renderer]] = {
+    "md": MarkdownReportRenderer,
+    "checklist": MarkdownChecklistRenderer,
+    "json": JsonReportRenderer,
+}
+
+
+class ReportWriter:
+    """Fan report sections out to several renderers"""
+
+    def __init__(self, renderers: Iterable[Renderer]):
+        self.renderers: List[Renderer] = list(renderers)
+
+    def begin(self, total: int, by_status: Dict[str, int], generated: str = None):
+        generated = generated or datetime.now().isoformat()
+        for renderer in self.renderers:
+            renderer.begin(generated, total, by_status)
+
+    def category(self, name: str, claims: Sequence):
+        for renderer in self.renderers:
+            renderer.category(name, claims)
+
+    def end(self):
+        for renderer in self.renderers:
+            renderer.end()
+
+
+class NdjsonResultStream:
+    """
+    Claim results written as NDJSON the moment each one is known
+
+    Every claim becomes one line, flushed immediately, so CI dashboards and
+    aggregators reading the stream see progress during long fleet runs:
+
+        {"type": "claim", "worker": "resin", "claim_id": "API_RATE_LIMIT",
+         "status": "PASS", "details": "...", "duration": 1.234, "cached": false,
+         "completed_at": "2026-10-17T09:30:00"}
+
+    summary() writes the last line ("type": "summary") with counts by status.
+    Fleet runs report from several threads; writes are serialised by a lock.
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.claims = 0
+        self.by_status: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, worker: str, claim_id: str, result: Tuple, duration: Optional[float],
+              cached: bool):
+        """fleet.validate_worker on_result callback"""
+        status, details = result
+        with self._lock:
+            self.claims += 1
+            self.by_status[status.name] = self.by_status.get(status.name, 0) + 1
+            self._write({
+                "type": "claim",
+                "worker": worker,
+                "claim_id": claim_id,
+                "status": status.name,
+                "details": details,
+                "duration": round(duration, 3) if duration is not None else None,
+                "cached": cached,
+                "completed_at": datetime.now().isoformat(timespec="seconds"),
+            })
+
+    def summary(self, **fields):
+        """Final record: claim count, counts by status and `fields`"""
+        with self._lock:
+            self._write({"type": "summary", "claims": self.claims,
+                         "by_status": dict(sorted(self.by_status.items())), **fields})
+
+    def _write(self, record: dict):
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+def report_path(worker_name: str, extension: str = "md", directory: Path = None) -> Path:
+    """docs/reports/{worker}-security-{date}.{extension}"""
+    date_str = datetime.now().strftime("%Y-%m-%d")
+    return Path(directory or REPORTS_DIR) / f"{worker_name}-security-{date_str}.{extension}"
+
+
+@contextmanager
+def atomic_report(path: Path) -> Iterator[TextIO]:
+    """
+    Text stream that replaces `path` only once writing completes
+
+    The report is streamed to a temporary file next to `path` and renamed
+    into place on success, so readers never see half a report; on error
+    the temporary file is removed and `path` is left untouched.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with open(fd, "w", encoding="utf-8") as stream:
+            yield stream
+        os.chmod(temporary, 0o644)  # mkstemp creates files as 0600
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def save_reports(worker_name: str, validator, formats: Sequence[str] = ("md",),
+                 directory: Path = None) -> Dict[str, Path]:
+    """
+    Render every format in one pass over the validator's claims
+
+    Args:
+        worker_name: Used in the file names
+        validator: validator.ResinSecurityValidator with results applied
+        formats: Keys of RENDERERS
+        directory: Output directory (default: docs/reports)
+
+    Returns:
+        Dict mapping format to the written path
+    """
+    unknown = [name for name in formats if name not in RENDERERS]
+    if unknown:
+        raise ValueError(f"Unknown report formats: {', '.join(unknown)}")
+
+    paths = {name: report_path(worker_name, RENDERERS[name].extension, directory)
+             for name in formats}
+    with ExitStack() as stack:
+        renderers = [RENDERERS[name](stack.enter_context(atomic_report(path)))
+                     for name, path in paths.items()]
+        validator.write_report(*renderers)
+    return paths
@@ -0,0 +1,203 @@
+"""
+Claim Result Cache
+Persistent per-worker cache of claim results with per-claim and per-category TTLs
+
+Compliance claims are backed by documents reviewed on a monthly cadence
+and infrastructure facts rarely change, so re-probing them on every run
+only adds latency. Each worker's results are kept in one JSON file; a
+claim is re-run once its entry is older than its TTL.
+
+TTL lookup order: exact claim ID, then category prefix (the part of the
+claim ID before the first "_", e.g. COMPLIANCE), then DEFAULT_TTL. A TTL
+of 0 disables caching for that claim. Only settled outcomes (PASS, FAIL,
+MANUAL) are cached; WARN (often a timeout or unreachable dependency) and
+PENDING are always re-run.
+
+Usage:
+  python tools/security/validator.py --worker resin            # cache hits where fresh
+  python tools/security/validator.py --worker resin --force    # re-run everything
+  python tools/security/validator.py --all --invalidate API,ENC_TLS_TRANSIT
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    # When imported from tests or validator.py (tools/security on sys.path)
+    from claim_tests import ValidationStatus
+except ImportError:
+    # When imported normally as a package
+    from .claim_tests import ValidationStatus
+
+# Default location of cache files (one JSON file per worker)
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".state" / "result_cache"
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# TTL in seconds per category prefix of the claim ID
+CATEGORY_TTLS: Dict[str, float] = {
+    "COMPLIANCE": 30 * DAY,  # Manual attestations, reviewed monthly
+    "INFRA": DAY,
+    "ENC": DAY,
+    "AUTH": HOUR,
+    "DATA": HOUR,
+    "API": HOUR,
+    "LOG": 0,  # Log checks track new traffic (incremental); always run
+    "PERF": 0,  # Latency regressions must be measured every run
+}
+
+# TTL in seconds for individual claims (overrides the category)
+CLAIM_TTLS: Dict[str, float] = {}
+
+DEFAULT_TTL: float = HOUR
+
+CACHEABLE_STATUSES = (ValidationStatus.PASS, ValidationStatus.FAIL, ValidationStatus.MANUAL)
+
+CACHE_VERSION = 1
+
+ClaimResult = Tuple[ValidationStatus, str]
+
+
+class ResultCache:
+    """
+    Cached claim results for one worker
+
+    Entries are loaded when the cache is created and written back by save();
+    lookup() and update() are safe to call from executor threads.
+    """
+
+    def __init__(self, path: Union[str, Path], worker_url: Optional[str] = None,
+                 ttls: Optional[Dict[str, float]] = None, clock=time.time):
+        """
+        Args:
+            path: JSON file holding this worker's entries
+            worker_url: Entries recorded for a different URL are discarded
+            ttls: Overrides keyed by claim ID or category prefix (seconds)
+            clock: Time source (seconds since epoch)
+        """
+        self.path = Path(path).expanduser()
+        self.worker_url = worker_url
+        self.ttls = dict(ttls or {})
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self._read()
+
+    @classmethod
+    def for_worker(cls, worker_name: str, config: Dict,
+                   directory: Union[str, Path, None] = None) -> "ResultCache":
+        """
+        Cache for a deployments.yaml entry
+
+        `result_cache_dir` and `cache_ttls` on the deployment override the
+        location and TTLs.
+        """
+        directory = Path(directory or config.get("result_cache_dir") or DEFAULT_CACHE_DIR)
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in worker_name)
+        return cls(directory / f"{safe}.json", worker_url=config.get("url"),
+                   ttls=config.get("cache_ttls"))
+
+    def ttl(self, claim_id: str) -> float:
+        """TTL in seconds for a claim (0 = never cached)"""
+        category = claim_id.split("_", 1)[0]
+        for table in (self.ttls, CLAIM_TTLS):
+            if claim_id in table:
+                return table[claim_id]
+        for table in (self.ttls, CATEGORY_TTLS):
+            if category in table:
+                return table[category]
+        return DEFAULT_TTL
+
+    def lookup(self, claim_ids: Iterable[str],
+               fresh_only: bool = True) -> Dict[str, ClaimResult]:
+        """
+        Cached results for the given claims
+
+        Args:
+            claim_ids: Claims to look up
+            fresh_only: Skip entries older than their TTL (False returns the
+                last recorded result whatever its age, e.g. for --report-only)
+        """
+        now = self.clock()
+        fresh = {}
+        with self._lock:
+            for claim_id in claim_ids:
+                entry = self._entries.get(claim_id)
+                if entry is None:
+                    continue
+                if fresh_only and now - entry["checked_at"] >= self.ttl(claim_id):
+                    continue
+                try:
+                    fresh[claim_id] = (ValidationStatus(entry["status"]), entry["details"])
+                except ValueError:
+                    continue
+        return fresh
+
+    def update(self, results: Dict[str, ClaimResult]):
+        """Record freshly computed results (uncacheable outcomes drop old entries)"""
+        now = self.clock()
+        with self._lock:
+            for claim_id, (status, details) in results.items():
+                if status in CACHEABLE_STATUSES and self.ttl(claim_id) > 0:
+                    self._entries[claim_id] = {
+                        "status": status.value,
+                        "details": details,
+                        "checked_at": now,
+                    }
+                else:
+                    self._entries.pop(claim_id, None)
+
+    def invalidate(self, selectors: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Drop entries by claim ID or category prefix (all entries if None)
+
+        Returns the claim IDs that were dropped.
+        """
+        with self._lock:
+            if selectors is None:
+                dropped = list(self._entries)
+            else:
+                wanted = {s.strip().upper() for s in selectors if s.strip()}
+                dropped = [
+                    claim_id for claim_id in self._entries
+                    if claim_id.upper() in wanted or claim_id.split("_", 1)[0].upper() in wanted
+                ]
+            for claim_id in dropped:
+                del self._entries[claim_id]
+        return dropped
+
+    def save(self):
+        """Atomically write entries to disk"""
+        with self._lock:
+            data = {"version": CACHE_VERSION, "url": self.worker_url,
+                    "entries": dict(self._entries)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        if self.worker_url is not None and data.get("url") != self.worker_url:
+            return {}
+        return data.get("entries", {})
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Claim Result History
+Indexed SQLite time series of every claim result across validator runs
+
+Reports in docs/reports are one markdown file per worker per day (a second
+run the same day replaces the first), so answering "when did this claim
+first fail?" meant grepping hundreds of files. Every validator run now
+appends one row per claim (worker, claim ID, status, details, duration,
+timestamp) to .state/history.sqlite3; indexes on (worker, claim, time),
+(claim, status, time) and (worker, time) keep the queries below in the
+millisecond range with years of history.
+
+Results served from the result cache are recorded with the time of the
+run that reused them, not the time they were probed, so first() and
+trend() skip them unless include_cached is set.
+
+Usage:
+  python tools/security/result_history.py first-failure API_RATE_LIMIT --worker resin
+  python tools/security/result_history.py trend resin --days 90
+  python tools/security/result_history.py history resin ENC_TLS_TRANSIT --limit 20
+"""
+
+import argparse
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+# Default database (shared by all workers)
+DEFAULT_HISTORY_PATH = Path(__file__).resolve().parent / ".state" / "history.sqlite3"
+
+SCHEMA_VERSION = 1
+
+DAY = 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    worker TEXT NOT NULL,
+    url TEXT,
+    started_at REAL NOT NULL,
+    wall_time REAL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    worker TEXT NOT NULL,
+    claim_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    details TEXT NOT NULL,
+    duration REAL,
+    cached INTEGER NOT NULL DEFAULT 0,
+    checked_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_worker_claim ON results (worker, claim_id, checked_at);
+CREATE INDEX IF NOT EXISTS results_claim_status ON results (claim_id, status, checked_at);
+CREATE INDEX IF NOT EXISTS results_worker_time ON results (worker, checked_at);
+"""
+
+_COLUMNS = "run_id, worker, claim_id, status, details, duration, cached, checked_at"
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    """One recorded claim result"""
+    run_id: int
+    worker: str
+    claim_id: str
+    status: str  # ValidationStatus name, e.g. FAIL
+    details: str
+    duration: Optional[float]  # Seconds the claim ran (None if not run)
+    cached: bool  # Served from the result cache rather than probed
+    checked_at: float  # Seconds since epoch
+
+    @property
+    def checked(self) -> str:
+        """checked_at as an ISO timestamp (UTC)"""
+        return datetime.fromtimestamp(self.checked_at, timezone.utc).isoformat(timespec="seconds")
+
+
+class ResultHistory:
+    """
+    SQLite store of claim results
+
+    One connection is shared by all threads (fleet runs record from worker
+    threads); every call holds a lock for its statement or transaction.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_HISTORY_PATH, clock=time.time):
+        """
+        Args:
+            path: Database file (":memory:" for a throwaway store)
+            clock: Time source (seconds since epoch)
+        """
+        self.path = path if str(path) == ":memory:" else Path(path).expanduser()
+        if isinstance(self.path, Path):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            version = self._db.execute("PRAGMA user_version").fetchone()[0]
+            if version > SCHEMA_VERSION:
+                raise RuntimeError(f"{self.path}: history schema {version} is newer than "
+                                   f"this validator ({SCHEMA_VERSION})")
+            self._db.executescript(_SCHEMA)
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "ResultHistory":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record_run(self, worker: str, url: Optional[str], results: Mapping[str, Tuple],
+                   durations: Optional[Mapping[str, float]] = None,
+                   cached: Iterable[str] = (), wall_time: Optional[float] = None,
+                   checked_at: Optional[float] = None) -> int:
+        """
+        Append one run's results
+
+        Args:
+            worker: Key from deployments.yaml
+            url: Worker URL
+            results: Claim ID -> (ValidationStatus, details), as from run_all_tests()
+            durations: Claim ID -> seconds (executor.report.durations)
+            cached: Claim IDs served from the result cache
+            wall_time: Wall-clock seconds of the whole run
+            checked_at: Timestamp for every row (default: now)
+
+        Returns:
+            The run ID
+        """
+        checked_at = self.clock() if checked_at is None else checked_at
+        durations = durations or {}
+        cached = set(cached)
+        with self._lock, self._db:
+            run_id = self._db.execute(
+                "INSERT INTO runs (worker, url, started_at, wall_time) VALUES (?, ?, ?, ?)",
+                (worker, url, checked_at, wall_time),
+            ).lastrowid
+            self._db.executemany(
+                f"INSERT INTO results ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, worker, claim_id, status.name, details, durations.get(claim_id),
+                  int(claim_id in cached), checked_at)
+                 for claim_id, (status, details) in results.items()],
+            )
+        return run_id
+
+    def first(self, claim_id: str, status: str = "FAIL", worker: Optional[str] = None,
+              since: Optional[float] = None,
+              include_cached: bool = False) -> Optional[HistoryEntry]:
+        """Earliest probed result of a claim with `status` (on one worker or any)"""
+        rows = self._query(*self._first_sql(claim_id, status, worker, since, include_cached))
+        return rows[0] if rows else None
+
+    def history(self, worker: str, claim_id: str, since: Optional[float] = None,
+                limit: Optional[int] = None) -> List[HistoryEntry]:
+        """Results of one claim on one worker, newest first"""
+        return self._query(*self._history_sql(worker, claim_id, since, limit))
+
+    def latest(self, worker: str) -> Dict[str, HistoryEntry]:
+        """Most recent result of every claim recorded for a worker"""
+        rows = self._query(
+            f"SELECT {_COLUMNS} FROM results WHERE worker = ? AND rowid IN ("
+            " SELECT MAX(rowid) FROM results WHERE worker = ? GROUP BY claim_id"
+            ") ORDER BY claim_id",
+            [worker, worker],
+        )
+        return {entry.claim_id: entry for entry in rows}
+
+    def trend(self, worker: str, days: int = 90, claim_id: Optional[str] = None,
+              now: Optional[float] = None,
+              include_cached: bool = False) -> List[Tuple[str, Dict[str, int]]]:
+        """
+        Status counts per day (UTC) of probed results for a worker over the
+        last `days` days
+
+        Returns:
+            [(YYYY-MM-DD, {status: count}), ...] oldest day first; days
+            without results are omitted
+        """
+        query, params = self._trend_sql(worker, days, claim_id, now, include_cached)
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        trend: Dict[str, Dict[str, int]] = {}
+        for day, status, count in rows:
+            trend.setdefault(day, {})[status] = count
+        return list(trend.items())
+
+    def explain(self, method: str, *args, **kwargs) -> List[str]:
+        """
+        SQLite's query plan for first(), history() or trend() with these
+        arguments, one line per step
+        """
+        builders = {"first": self._first_sql, "history": self._history_sql,
+                    "trend": self._trend_sql}
+        if method not in builders:
+            raise ValueError(f"No query plan for {method}()")
+        query, params = builders[method](*args, **kwargs)
+        with self._lock:
+            rows = self._db.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+        return [row[-1] for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    # ============================================================================
+    # Helper methods
+    # ============================================================================
+
+    def _first_sql(self, claim_id: str, status: str = "FAIL", worker: Optional[str] = None,
+                   since: Optional[float] = None,
+                   include_cached: bool = False) -> Tuple[str, List]:
+        query = f"SELECT {_COLUMNS} FROM results WHERE claim_id = ? AND status = ?"
+        params: List = [claim_id, status.upper()]
+        if not include_cached:
+            query += " AND cached = 0"
+        if worker is not None:
+            query += " AND worker = ?"
+            params.append(worker)
+        if since is not None:
+            query += " AND checked_at >= ?"
+            params.append(since)
+        return query + " ORDER BY checked_at, rowid LIMIT 1", params
+
+    def _history_sql(self, worker: str, claim_id: str, since: Optional[float] = None,
+                     limit: Optional[int] = None) -> Tuple[str, List]:
+        query = f"SELECT {_COLUMNS} FROM results WHERE worker = ? AND claim_id = ?"
+        params: List = [worker, claim_id]
+        if since is not None:
+            query += " AND checked_at >= ?"
+            params.append(since)
+        query += " ORDER BY checked_at DESC, rowid DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return query, params
+
+    def _trend_sql(self, worker: str, days: int = 90, claim_id: Optional[str] = None,
+                   now: Optional[float] = None,
+                   include_cached: bool = False) -> Tuple[str, List]:
+        since = (self.clock() if now is None else now) - days * DAY
+        query = ("SELECT date(checked_at, 'unixepoch') AS day, status, COUNT(*) FROM results "
+                 "WHERE worker = ? AND checked_at >= ?")
+        params: List = [worker, since]
+        if claim_id is not None:
+            query += " AND claim_id = ?"
+            params.append(claim_id)
+        if not include_cached:
+            query += " AND cached = 0"
+        return query + " GROUP BY day, status ORDER BY day, status", params
+
+    def _query(self, query: str, params: List) -> List[HistoryEntry]:
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        return [HistoryEntry(run_id, worker, claim_id, status, details, duration,
+                             bool(cached), checked_at)
+                for run_id, worker, claim_id, status, details, duration, cached, checked_at
+                in rows]
+
+
+def main(argv: Optional[List[str]] = None):
+    """Query the history from the command line"""
+    parser = argparse.ArgumentParser(description="Query recorded claim results")
+    parser.add_argument("--db", default=str(DEFAULT_HISTORY_PATH), help="History database")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    first = commands.add_parser("first-failure", help="First time a claim had a status")
+    first.add_argument("claim_id")
+    first.add_argument("--worker")
+    first.add_argument("--status", default="FAIL")
+    first.add_argument("--include-cached", action="store_true",
+                       help="Count results reused from the result cache")
+
+    trend = commands.add_parser("trend", help="Status counts per day for a worker")
+    trend.add_argument("worker")
+    trend.add_argument("--days", type=int, default=90)
+    trend.add_argument("--claim")
+    trend.add_argument("--include-cached", action="store_true",
+                       help="Count results reused from the result cache")
+
+    history = commands.add_parser("history", help="Results of one claim, newest first")
+    history.add_argument("worker")
+    history.add_argument("claim_id")
+    history.add_argument("--limit", type=int, default=20)
+
+    args = parser.parse_args(argv)
+    if not Path(args.db).exists():
+        print(f"Error: No history at {args.db} (run validator.py first)")
+        sys.exit(1)
+
+    with ResultHistory(args.db) as store:
+        if args.command == "first-failure":
+            entry = store.first(args.claim_id, args.status, args.worker,
+                                include_cached=args.include_cached)
+            if entry is None:
+                print(f"{args.claim_id} never recorded as {args.status.upper()}")
+            else:
+                print(f"{entry.checked} {entry.worker} {entry.claim_id} {entry.status}: "
+                      f"{entry.details}")
+        elif args.command == "trend":
+            for day, counts in store.trend(args.worker, args.days, args.claim,
+                                          include_cached=args.include_cached):
+                print(f"{day} " + ", ".join(f"{s}: {n}" for s, n in counts.items()))
+        else:
+            for entry in store.history(args.worker, args.claim_id, limit=args.limit):
+                duration = f" ({entry.duration:.2f}s)" if entry.duration is not None else ""
+                cached = " [cached]" if entry.cached else ""
+                print(f"{entry.checked} {entry.status}{duration}{cached}: {entry.details}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,576 @@
+"""
+Local Stand-in Worker
+HTTP server that mimics the Resin MCP worker for offline tests and benchmarks
+
+Serves the same surface the validator probes on a live *.workers.dev URL:
+- GET /health, GET /ready (no auth)
+- POST /mcp JSON-RPC (Bearer auth; initialize, tools/list, tools/call)
+- Tool arguments checked against each tool's input schema (-32602 errors)
+- Security headers on every response, CORS preflight for allowed origins
+- 429 rate limiting per API key (token bucket, Retry-After)
+- Optional HTTPS with a supplied certificate (--tls-cert/--tls-key)
+- createLogger-format NDJSON logs (Request received / Request completed ...),
+  optionally appended to a file that works as a `logpush_path`
+
+Latency and failures can be injected to benchmark the validator under
+slow or flaky workers. Responses mirror mcp/resin/src/index.ts.
+
+Usage:
+  python tools/security/standin_server.py --port 8787 --api-key test-key
+  python tools/security/standin_server.py --latency-ms 50 --jitter-ms 20 \\
+      --failure-rate 0.05 --rate-limit 100 --log-path /tmp/standin/logs.ndjson
+"""
+
+import argparse
+import json
+import random
+import ssl
+import string
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+
+SECURITY_HEADERS = {
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "Content-Security-Policy": "default-src 'none'; frame-ancestors 'none'",
+    "Referrer-Policy": "no-referrer",
+}
+
+# Tools registered by mcp/resin/src/server.ts, with the JSON Schema the MCP
+# SDK derives from their zod input schemas
+_LIMIT = {"type": "integer", "minimum": 1, "maximum": 100, "default": 10}
+TOOLS = [
+    {"name": "run_soql", "description": "Execute a SOQL query against Salesforce.",
+     "inputSchema": {"type": "object", "required": ["query"], "properties": {
+         "query": {"type": "string"}, "limit": _LIMIT}}},
+    {"name": "create_record", "description": "Create any Salesforce sObject record.",
+     "inputSchema": {"type": "object", "required": ["sobject", "fields"], "properties": {
+         "sobject": {"type": "string"}, "fields": {"type": "object"}}}},
+    {"name": "update_record", "description": "Update any Salesforce sObject record by ID.",
+     "inputSchema": {"type": "object", "required": ["sobject", "record_id", "fields"],
+                     "properties": {"sobject": {"type": "string"},
+                                    "record_id": {"type": "string"},
+                                    "fields": {"type": "object"}}}},
+    {"name": "query_donors", "description": "Query donors using natural language criteria.",
+     "inputSchema": {"type": "object", "required": ["criteria"], "properties": {
+         "criteria": {"type": "string"}, "limit": _LIMIT}}},
+]
+
+PROTOCOL_VERSION = "2025-06-18"
+
+
+@dataclass
+class StandinConfig:
+    """Behaviour of the stand-in worker"""
+    api_key: str = "test-api-key-12345"
+    latency_ms: float = 0.0  # Added to every response
+    jitter_ms: float = 0.0  # Uniform extra latency in [0, jitter_ms]
+    failure_rate: float = 0.0  # Fraction of MCP requests answered with failure_status
+    failure_status: int = 500
+    rate_limit: int = 0  # Requests per rate_window per API key (0 = unlimited)
+    rate_window: float = 60.0
+    max_body_bytes: int = 1024 * 1024
+    allowed_origins: Tuple[str, ...] = ()
+    ready: bool = True
+    log_path: Optional[str] = None
+    log_buffer: int = 10000  # Recent log entries kept in memory
+    seed: Optional[int] = None
+    tls_cert: Optional[str] = None  # PEM certificate (chain); serves HTTPS when set
+    tls_key: Optional[str] = None
+    # Reject tools/call arguments that do not match the tool's input schema
+    # (as the MCP SDK does); when False, bad arguments reach the handler and
+    # fail with an unhandled error whose message is returned, as index.ts does
+    validate_tool_input: bool = True
+
+
+class TokenBucket:
+    """Per-key token buckets: `limit` requests per `window` seconds"""
+
+    def __init__(self, limit: int, window: float, clock=time.monotonic):
+        self.limit = limit
+        self.rate = limit / window
+        self.clock = clock
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: str) -> Tuple[bool, int, float]:
+        """
+        Consume one token for key
+
+        Returns:
+            (allowed, tokens remaining, seconds until the next token)
+        """
+        now = self.clock()
+        with self._lock:
+            tokens, last = self._buckets.get(key, (float(self.limit), now))
+            tokens = min(self.limit, tokens + (now - last) * self.rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+        retry_after = 0.0 if allowed else (1 - tokens) / self.rate
+        return allowed, int(tokens), retry_after
+
+
+@dataclass
+class StandinStats:
+    """Request counters, safe to read while the server runs"""
+    requests: int = 0
+    by_status: Dict[int, int] = field(default_factory=dict)
+    rate_limited: int = 0
+    injected_failures: int = 0
+    connections: int = 0  # TCP connections accepted
+    open_connections: int = 0
+    peak_connections: int = 0  # Most connections open at the same time
+
+
+class StandinServer(ThreadingHTTPServer):
+    """
+    Threaded stand-in worker
+
+    Use as a context manager to serve from a background thread:
+
+        with StandinServer(StandinConfig(latency_ms=20)) as server:
+            run_all_tests(server.url, server.config.api_key)
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    # Bursts open many connections at once; the default backlog of 5 drops
+    # SYNs and adds 1s retransmit stalls to measured latency
+    request_queue_size = 128
+
+    def __init__(self, config: Optional[StandinConfig] = None,
+                 host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StandinConfig()
+        self.stats = StandinStats()
+        self.logs: Deque[Dict] = deque(maxlen=self.config.log_buffer)
+        self.limiter = (TokenBucket(self.config.rate_limit, self.config.rate_window)
+                        if self.config.rate_limit > 0 else None)
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._log_file = None
+        if self.config.log_path:
+            path = Path(self.config.log_path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._log_file = open(path, "a", encoding="utf-8")
+        self._thread: Optional[threading.Thread] = None
+        super().__init__((host, port), StandinHandler)
+
+        if self.config.tls_cert:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self.config.tls_cert, self.config.tls_key)
+            # Handshake in the handler thread, not the accept loop
+            self.socket = context.wrap_socket(self.socket, server_side=True,
+                                              do_handshake_on_connect=False)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        scheme = "https" if self.config.tls_cert else "http"
+        return f"{scheme}://{host}:{port}"
+
+    def start(self) -> "StandinServer":
+        """Serve from a daemon thread"""
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,),
+                                        name="standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the socket and log file"""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ============================================================================
+    # Shared state used by request handlers
+    # ============================================================================
+
+    def log(self, entry: Dict):
+        """Record one createLogger entry"""
+        line = json.dumps(entry)
+        with self._lock:
+            self.logs.append(entry)
+            if self._log_file is not None:
+                self._log_file.write(line + "\n")
+                self._log_file.flush()
+
+    def delay(self) -> float:
+        """Injected latency in seconds for one request"""
+        with self._lock:
+            jitter = self._random.uniform(0, self.config.jitter_ms) if self.config.jitter_ms else 0
+        return (self.config.latency_ms + jitter) / 1000
+
+    def should_fail(self) -> bool:
+        if self.config.failure_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.config.failure_rate
+
+    def connection(self, opened: bool):
+        with self._lock:
+            if opened:
+                self.stats.connections += 1
+                self.stats.open_connections += 1
+                self.stats.peak_connections = max(self.stats.peak_connections,
+                                                  self.stats.open_connections)
+            else:
+                self.stats.open_connections -= 1
+
+    def count(self, status: int, rate_limited: bool = False, injected: bool = False):
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.by_status[status] = self.stats.by_status.get(status, 0) + 1
+            self.stats.rate_limited += rate_limited
+            self.stats.injected_failures += injected
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Routes requests the way the worker's fetch handler does"""
+
+    server: StandinServer
+    server_version = "Resin-Standin/1.0"
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment; split writes stall keep-alive
+    # clients on delayed ACKs
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        self.server.connection(opened=True)
+        super().setup()
+
+    def finish(self):
+        try:
+            super().finish()
+        finally:
+            self.server.connection(opened=False)
+
+    def do_GET(self):
+        self._handle()
+
+    def do_HEAD(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_OPTIONS(self):
+        self._handle()
+
+    def log_message(self, format, *args):
+        """Access logs go to the createLogger stream instead of stderr"""
+
+    # ============================================================================
+    # Request handling
+    # ============================================================================
+
+    def _handle(self):
+        self._start = time.perf_counter()
+        self._extra_headers: Dict[str, str] = {}
+        self._flags = {"rate_limited": False, "injected": False}
+        path = self.path.split("?", 1)[0]
+        self._context = {
+            "requestId": _request_id(),
+            "endpoint": path,
+            "method": self.command,
+        }
+        self._log("info", "Request received", {
+            "url": path,
+            "method": self.command,
+            "userAgent": self.headers.get("User-Agent"),
+        })
+
+        # Always drain the body so keep-alive connections stay in sync
+        length = int(self.headers.get("Content-Length") or 0)
+        self._too_large = length > self.server.config.max_body_bytes
+        if self._too_large:
+            self.close_connection = True
+            self._body = b""
+        else:
+            self._body = self.rfile.read(length) if length else b""
+
+        delay = self.server.delay()
+        if delay:
+            time.sleep(delay)
+
+        if self.command == "OPTIONS":
+            status, body, authenticated, error = self._preflight()
+        elif path == "/health":
+            status, body, authenticated, error = 200, {
+                "status": "ok", "timestamp": _now(), "service": "resin-mcp",
+            }, None, None
+        elif path == "/ready":
+            status, body, authenticated, error = self._ready()
+        else:
+            status, body, authenticated, error = self._mcp(path)
+
+        self._respond(status, body, authenticated, error)
+
+    def _preflight(self):
+        origin = self.headers.get("Origin")
+        if origin and origin in self.server.config.allowed_origins:
+            self._extra_headers.update({
+                "Access-Control-Allow-Origin": origin,
+                "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+                "Access-Control-Allow-Headers": "Authorization, Content-Type",
+                "Access-Control-Max-Age": "86400",
+                "Vary": "Origin",
+            })
+        return 204, None, None, None
+
+    def _ready(self):
+        if self.server.config.ready:
+            return 200, {"status": "ready", "timestamp": _now(), "salesforce": "connected"}, None, None
+        return 503, {
+            "status": "error", "timestamp": _now(),
+            "message": "Missing environment variables: SF_REFRESH_TOKEN",
+        }, None, "missing_env_vars"
+
+    def _mcp(self, path: str):
+        config = self.server.config
+
+        auth = self.headers.get("Authorization")
+        if not auth:
+            return 401, _rpc_error(None, -32600, "Missing Authorization header. "
+                                   "Expected: Bearer <api-key>"), False, "missing_auth_header"
+        if not auth.startswith("Bearer "):
+            return 401, _rpc_error(None, -32600, "Invalid Authorization header format. "
+                                   "Expected: Bearer <api-key>"), False, "invalid_auth_format"
+        api_key = auth[7:]
+        if api_key != config.api_key:
+            self._log("warn", "Authentication failed - invalid API key")
+            return 403, _rpc_error(None, -32600, "Unauthorized: Invalid API key"), \
+                False, "invalid_api_key"
+
+        if self.server.limiter is not None:
+            allowed, remaining, retry_after = self.server.limiter.take(api_key)
+            self._extra_headers.update({
+                "X-RateLimit-Limit": str(config.rate_limit),
+                "X-RateLimit-Remaining": str(remaining),
+            })
+            if not allowed:
+                self._flags["rate_limited"] = True
+                self._extra_headers["Retry-After"] = str(max(1, round(retry_after)))
+                return 429, _rpc_error(None, -32000, "Rate limit exceeded"), True, "rate_limited"
+
+        self._log("info", "Authentication successful")
+
+        if path != "/mcp":
+            return 404, _rpc_error(None, -32601, f"Not found: {path}"), True, "not_found"
+        if self.command != "POST":
+            return 405, _rpc_error(None, -32600, "Method not allowed. Use POST"), True, \
+                "method_not_allowed"
+
+        if self._too_large:
+            return 413, _rpc_error(None, -32600, "Request body too large"), True, "body_too_large"
+
+        if self.server.should_fail():
+            self._flags["injected"] = True
+            return config.failure_status, _rpc_error(None, -32603, "Internal error: injected failure"), \
+                True, "injected_failure"
+
+        try:
+            message = json.loads(self._body)
+        except ValueError:
+            return 400, _rpc_error(None, -32700, "Parse error"), True, "parse_error"
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0" \
+                or not isinstance(message.get("method"), str):
+            return 400, _rpc_error(message.get("id") if isinstance(message, dict) else None,
+                                   -32600, "Invalid Request"), True, "invalid_request"
+
+        return self._dispatch(message)
+
+    def _dispatch(self, message: Dict):
+        request_id = message.get("id")
+        method = message["method"]
+        params = message.get("params") or {}
+
+        if request_id is None:
+            # Notification (e.g. notifications/initialized): no response body
+            return 202, None, True, None
+
+        if method == "initialize":
+            result = {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "resin-mcp", "version": "standin"},
+            }
+        elif method == "tools/list":
+            result = {"tools": TOOLS}
+        elif method == "tools/call":
+            name = params.get("name") if isinstance(params, dict) else None
+            tool = next((tool for tool in TOOLS if tool["name"] == name), None)
+            if tool is None:
+                return 200, _rpc_error(request_id, -32602, f"Tool {name} not found"), True, None
+            problem = _invalid_arguments(tool["inputSchema"], params.get("arguments"))
+            if problem and self.server.config.validate_tool_input:
+                return 200, _rpc_error(request_id, -32602,
+                                       f"Invalid arguments for tool {name}: {problem}"), True, None
+            if problem:
+                self._log("error", "MCP handler error")
+                return 500, _rpc_error(request_id, -32603, (
+                    "Internal error: TypeError: Cannot read properties of undefined "
+                    f"(reading 'length') at {name} (/worker/src/lib/salesforce.ts:88:17)"
+                )), True, "internal_error"
+            result = {"content": [{"type": "text", "text": f"Stand-in result for {name}"}]}
+        elif method == "ping":
+            result = {}
+        else:
+            return 200, _rpc_error(request_id, -32601, f"Method not found: {method}"), True, None
+
+        return 200, {"jsonrpc": "2.0", "id": request_id, "result": result}, True, None
+
+    def _respond(self, status: int, body: Optional[Dict], authenticated: Optional[bool],
+                 error: Optional[str]):
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        if body is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in {**SECURITY_HEADERS, **self._extra_headers}.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if payload and self.command != "HEAD":
+            self.wfile.write(payload)
+
+        duration_ms = round((time.perf_counter() - self._start) * 1000)
+        data = {"statusCode": status, "durationMs": duration_ms}
+        if authenticated is not None:
+            data["authenticated"] = authenticated
+        if status >= 500:
+            self._log("error", "Request failed with server error", data)
+        elif status >= 400:
+            self._log("warn", "Request failed with client error", {**data, "error": error})
+        else:
+            self._log("info", "Request completed", data)
+
+        self.server.count(status, **self._flags)
+
+    def _log(self, level: str, message: str, data: Optional[Dict] = None):
+        entry = {"timestamp": _now(), "level": level, "message": message,
+                 "context": self._context}
+        if data:
+            entry["data"] = data
+        self.server.log(entry)
+
+
+# ============================================================================
+# Helper functions
+# ============================================================================
+
+def _now() -> str:
+    """ISO timestamp in the format of JavaScript's Date.toISOString()"""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _request_id() -> str:
+    """Same shape as generateRequestId() in lib/logger.ts"""
+    suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=9))
+    return f"req_{int(time.time() * 1000)}_{suffix}"
+
+
+def _invalid_arguments(schema: Dict, arguments) -> Optional[str]:
+    """First way `arguments` violates a tool input schema (None if valid)"""
+    if arguments is None:
+        arguments = {}
+    if not isinstance(arguments, dict):
+        return "Expected object"
+    for name in schema.get("required", ()):
+        if name not in arguments:
+            return f"{name}: Required"
+    for name, rules in schema["properties"].items():
+        if name not in arguments:
+            continue
+        value = arguments[name]
+        expected = rules["type"]
+        if expected == "string" and not isinstance(value, str):
+            return f"{name}: Expected string"
+        if expected == "object" and not isinstance(value, dict):
+            return f"{name}: Expected object"
+        if expected == "integer":
+            if isinstance(value, bool) or not isinstance(value, (int, float)) \
+                    or (isinstance(value, float) and not value.is_integer()):
+                return f"{name}: Expected integer"
+            if not rules["minimum"] <= value <= rules["maximum"]:
+                return f"{name}: Number must be between {rules['minimum']} and {rules['maximum']}"
+    return None
+
+
+def _rpc_error(request_id, code: int, message: str) -> Dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the Resin MCP worker")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--api-key", default=StandinConfig.api_key)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latency per response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra random latency")
+    parser.add_argument("--failure-rate", type=float, default=0.0,
+                        help="Fraction of MCP requests that fail (0-1)")
+    parser.add_argument("--failure-status", type=int, default=500)
+    parser.add_argument("--rate-limit", type=int, default=0,
+                        help="Requests per --rate-window per API key (0 = unlimited)")
+    parser.add_argument("--rate-window", type=float, default=60.0)
+    parser.add_argument("--allow-origin", action="append", default=[],
+                        help="Origin allowed by CORS preflight (repeatable)")
+    parser.add_argument("--not-ready", action="store_true", help="Answer /ready with 503")
+    parser.add_argument("--log-path", help="Append createLogger NDJSON here (usable as logpush_path)")
+    parser.add_argument("--seed", type=int, help="Seed for latency jitter and failure injection")
+    parser.add_argument("--tls-cert", help="PEM certificate; serve HTTPS")
+    parser.add_argument("--tls-key", help="PEM private key for --tls-cert")
+    parser.add_argument("--no-input-validation", action="store_true",
+                        help="Pass invalid tool arguments to the handler (unhandled 500s)")
+    args = parser.parse_args(argv)
+
+    config = StandinConfig(
+        api_key=args.api_key,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        allowed_origins=tuple(args.allow_origin),
+        ready=not args.not_ready,
+        log_path=args.log_path,
+        seed=args.seed,
+        tls_cert=args.tls_cert,
+        tls_key=args.tls_key,
+        validate_tool_input=not args.no_input_validation,
+    )
+    server = StandinServer(config, args.host, args.port)
+    print(f"Resin stand-in worker listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps({"requests": server.stats.requests,
+                          "by_status": server.stats.by_status}))
+
+
+if __name__ == "__main__":
+    main()
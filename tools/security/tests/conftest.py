@@ -0,0 +1,72 @@
+"""
+Shared pytest fixtures and helpers for the security validation tests
+"""
+
+import gzip
+import json
+import socket
+
+import pytest
+
+
+# ============================================================================
+# Network
+# ============================================================================
+
+
+@pytest.fixture
+def closed_port():
+    """A local port with nothing listening on it (connections are refused)"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# ============================================================================
+# Worker log entries
+# ============================================================================
+
+LOG_TIMESTAMP = "2025-11-05T07:19:06.947Z"
+
+
+def log_entry(i, timestamp=LOG_TIMESTAMP, duration_ms=11, context=None,
+              email_every=0, phone_every=0, no_level_every=0, **extra):
+    """
+    createLogger entry as emitted by the worker
+
+    Args:
+        i: Entry number, used for the request ID and the *_every checks
+        timestamp: ISO 8601 timestamp of the entry
+        duration_ms: data.durationMs
+        context: Keys added to (or replacing) the default request context
+        email_every: Every Nth entry's message leaks an email address
+        phone_every: Every Nth entry's message leaks a phone number
+        no_level_every: Every Nth entry has no level
+        **extra: Top-level fields to set or replace
+    """
+    entry = {
+        "timestamp": timestamp,
+        "level": "info",
+        "message": "Request completed",
+        "context": {"requestId": f"req_{i}", "endpoint": "/mcp", "method": "POST",
+                    **(context or {})},
+        "data": {"statusCode": 200, "durationMs": duration_ms},
+    }
+    if email_every and i % email_every == 0:
+        entry["message"] = f"donor{i}@example.org"
+    if phone_every and i % phone_every == 0:
+        entry["message"] = "call 555-123-4567"
+    if no_level_every and i % no_level_every == 0:
+        del entry["level"]
+    entry.update(extra)
+    return entry
+
+
+def write_lines(path, entries, mode="a", compress=False):
+    """Append entries (dicts or raw lines) to an NDJSON segment, gzip if `compress`"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    opener = gzip.open if compress else open
+    with opener(path, mode + "t") as f:
+        for entry in entries:
+            f.write((entry if isinstance(entry, str) else json.dumps(entry)) + "\n")
+    return path
@@ -0,0 +1,251 @@
+"""
+Pytest tests for the indexed audit log store (LOG_AUDIT_TRAIL)
+
+Run: uv run pytest tools/security/tests/test_audit_store.py -v
+"""
+
+import csv
+import gzip
+import io
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add parent directory to path so we can import audit_store
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import audit_store
+import pytest
+from audit_store import AuditStore, bench, check_audit_trail
+from claim_tests import ValidationStatus
+from implementations.logging_implementations import LoggingImplementations
+from tests.conftest import log_entry, write_lines
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+START = datetime(2025, 11, 1, tzinfo=timezone.utc)
+
+
+def audit_entry(i, user=True):
+    """createLogger entry i, one minute after entry i - 1"""
+    context = {"endpoint": "/mcp" if i % 2 else "/health",
+               "method": "POST" if i % 2 else "GET", "orgId": f"org_{i % 3}"}
+    if user:
+        context["userId"] = f"user_{i % 7}"
+    moment = START + timedelta(minutes=i)
+    timestamp = moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    return log_entry(i, timestamp=timestamp, duration_ms=i % 50, context=context)
+
+
+@pytest.fixture
+def logpush_dir(tmp_path):
+    """Two days of entries: a plain segment and a gzip segment"""
+    root = tmp_path / "logpush"
+    write_lines(root / "20251101" / "a.log",
+                [audit_entry(i) for i in range(1440)] + ["{truncated", {"level": "info"}])
+    write_lines(root / "20251102" / "b.log.gz",
+                [audit_entry(i) for i in range(1440, 2880)], compress=True)
+    return root
+
+
+@pytest.fixture
+def store(logpush_dir):
+    with AuditStore() as store:
+        store.ingest(logpush_dir)
+        yield store
+
+
+def at(i):
+    return (START + timedelta(minutes=i)).timestamp()
+
+
+# ============================================================================
+# Ingestion
+# ============================================================================
+
+class TestIngest:
+    """Incremental ingestion of plain and gzip segments"""
+
+    def test_ingest(self, logpush_dir):
+        with AuditStore() as store:
+            result = store.ingest(logpush_dir)
+
+            assert (result.entries, result.skipped, result.segments) == (2880, 2, 2)
+            assert len(store) == 2880
+            first = next(store.query())
+            assert (first.org, first.user, first.request_id, first.endpoint) == \
+                ("org_0", "user_0", "req_0", "/health")
+            assert (first.method, first.level, first.status) == ("GET", "info", 200)
+            assert json.loads(first.record) == audit_entry(0)
+
+    def test_only_new_data_is_read(self, logpush_dir, tmp_path):
+        segment = logpush_dir / "20251101" / "a.log"
+        with AuditStore(tmp_path / "audit.sqlite3") as store:
+            store.ingest(logpush_dir)
+            write_lines(segment, [audit_entry(5000)], mode="a")
+            with open(segment, "a") as f:
+                f.write(json.dumps(audit_entry(5001))[:40])  # Still being written
+
+            assert store.ingest(logpush_dir).entries == 1
+            assert store.ingest(logpush_dir).entries == 0
+
+            with open(segment, "a") as f:
+                f.write(json.dumps(audit_entry(5001))[40:] + "\n")
+            assert store.ingest(logpush_dir).entries == 1
+            assert store.count(since=at(5000)) == 2
+
+        with AuditStore(tmp_path / "audit.sqlite3") as reopened:
+            assert reopened.ingest(logpush_dir).entries == 0
+            assert len(reopened) == 2882
+
+    def test_deleted_and_rewritten_segments(self, store, logpush_dir):
+        (logpush_dir / "20251101" / "a.log").unlink()
+        with gzip.open(logpush_dir / "20251102" / "b.log.gz", "wt") as f:
+            f.write(json.dumps(audit_entry(9000)) + "\n")
+
+        result = store.ingest(logpush_dir)
+
+        assert (result.removed, result.entries) == (2880, 1)
+        assert [e.request_id for e in store.query()] == ["req_9000"]
+
+    def test_added_records_survive_ingest(self, store, logpush_dir):
+        store.add([audit_entry(9000)], source="<import>")
+        store.ingest(logpush_dir)
+
+        assert store.count(since=at(9000)) == 1
+
+
+# ============================================================================
+# Queries and export
+# ============================================================================
+
+class TestQueries:
+    """Filters by organization, user and time, backed by indexes"""
+
+    def test_filters_match_a_scan(self, store):
+        entries = list(store.query())
+        since, until = at(600), at(2000)
+
+        def expected(**filters):
+            return [e for e in entries
+                    if all(getattr(e, k) == v for k, v in filters.items())]
+
+        assert [e.timestamp for e in entries] == sorted(e.timestamp for e in entries)
+        assert list(store.query(org="org_1")) == expected(org="org_1")
+        assert list(store.query(user="user_3")) == expected(user="user_3")
+        assert list(store.query(since=since, until=until)) == \
+            [e for e in entries if since <= e.timestamp < until]
+        assert list(store.query(org="org_2", user="user_4", endpoint="/mcp", since=since)) == \
+            [e for e in expected(org="org_2", user="user_4", endpoint="/mcp")
+             if e.timestamp >= since]
+        assert store.count(org="org_1", since=since, until=until) == \
+            len([e for e in expected(org="org_1") if since <= e.timestamp < until])
+
+    def test_newest_first_and_limit(self, store):
+        newest = list(store.query(user="user_1", limit=3, newest_first=True))
+
+        assert [e.request_id for e in newest] == ["req_2878", "req_2871", "req_2864"]
+        assert store.latest("org") == "org_2"
+        assert store.span() == (at(0), at(2879))
+
+    @pytest.mark.parametrize("filters,index", [
+        ({"org": "org_1"}, "entries_org_time"),
+        ({"org": "org_1", "since": 0.0}, "entries_org_time"),
+        ({"user": "user_1"}, "entries_user_time"),
+        ({"since": 0.0, "until": 1.0}, "entries_time"),
+    ])
+    def test_queries_use_indexes(self, store, filters, index):
+        plan = " ".join(store.explain(**filters))
+
+        assert index in plan
+        assert "TEMP B-TREE" not in plan  # Time order comes from the index
+
+    def test_export_csv(self, store):
+        out = io.StringIO()
+
+        written = store.export(out, "csv", org="org_0", since=at(0), until=at(30))
+
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        assert written == len(rows) == 10
+        assert rows[0] == {"timestamp": "2025-11-01T00:00:00.000+00:00", "org": "org_0",
+                           "user": "user_0", "request_id": "req_0", "endpoint": "/health",
+                           "method": "GET", "level": "info", "status": "200"}
+
+    def test_export_ndjson(self, store):
+        out = io.StringIO()
+
+        written = store.export(out, "ndjson", user="user_5", limit=4)
+
+        assert written == 4
+        assert [json.loads(line) for line in out.getvalue().splitlines()] == \
+            [audit_entry(i) for i in (5, 12, 19, 26)]
+
+    def test_export_rejects_unknown_format(self, store):
+        with pytest.raises(ValueError):
+            store.export(io.StringIO(), "xml")
+
+    def test_benchmark(self, tmp_path):
+        first, second = io.StringIO(), io.StringIO()
+
+        timings = bench(20_000, tmp_path / "bench.sqlite3", orgs=100, users=5_000, out=first)
+        bench(20_000, tmp_path / "bench.sqlite3", orgs=100, users=5_000, out=second)
+
+        # Timings are reported, not asserted: index use is checked by the plans above
+        assert len(timings) == 8
+        assert first.getvalue().startswith("Built 20,000 entries")
+        assert "Built" not in second.getvalue()  # An existing store is reused
+        assert len(second.getvalue().splitlines()) == 8
+
+
+# ============================================================================
+# Claim and command line
+# ============================================================================
+
+class TestAuditTrailClaim:
+    """LOG_AUDIT_TRAIL verdicts and the CLI"""
+
+    def test_pass(self, logpush_dir, tmp_path):
+        config = {"logpush_path": str(logpush_dir), "audit_db": str(tmp_path / "a.sqlite3")}
+        tester = LoggingImplementations("https://resin.example.dev", "key", config)
+
+        status, details = tester.test_log_audit_trail()
+        again, _ = tester.test_log_audit_trail()
+
+        assert status == again == ValidationStatus.PASS
+        assert "Audit trail queryable and exportable: 2,880 entries" in details
+        assert "organization: 960" in details
+        assert "CSV and NDJSON export of 960 entries for org_2" in details
+
+    def test_entries_without_users_warn(self):
+        with AuditStore() as store:
+            store.add(audit_entry(i, user=False) for i in range(10))
+
+            status, details = check_audit_trail(store)
+
+        assert status == ValidationStatus.WARN
+        assert "userId" in details and "orgId" not in details
+
+    def test_no_archive_warns(self, tmp_path):
+        for config in ({}, {"logpush_path": str(tmp_path / "missing")}):
+            status, _ = LoggingImplementations(
+                "https://resin.example.dev", "key", config).test_log_audit_trail()
+            assert status == ValidationStatus.WARN
+
+    def test_cli(self, logpush_dir, tmp_path, capsys):
+        db = str(tmp_path / "audit.sqlite3")
+        output = tmp_path / "org_1.csv"
+
+        audit_store.main(["ingest", str(logpush_dir), "--db", db])
+        audit_store.main(["export", "--db", db, "--org", "org_1", "--since", "2025-11-02",
+                          "--format", "csv", "-o", str(output)])
+        audit_store.main(["query", "--db", db, "--user", "user_2", "--limit", "2"])
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].startswith("Added 2,880 entries from 2 segments")
+        assert lines[1] == f"Exported 480 entries to {output}"
+        assert lines[2] == "2025-11-01T00:02:00.000+00:00 org_2 user_2 GET /health 200 req_2"
+        assert len(output.read_text().splitlines()) == 481
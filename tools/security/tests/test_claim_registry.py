@@ -0,0 +1,154 @@
+"""
+Pytest tests for the claim registry and its catalogue file
+
+Run: uv run pytest tools/security/tests/test_claim_registry.py -v
+"""
+
+import dataclasses
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_registry
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import claim_registry
+import pytest
+from claim_registry import (
+    CLAIMS_FILE, ClaimCategory, ClaimDefinition, ClaimRegistry, load_registry,
+    registry_for_worker,
+)
+from claim_tests import ClaimTester, ValidationStatus, get_claim_tests
+from validator import ResinSecurityValidator
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def tenant_catalogue(path, count, prefix="TENANT"):
+    """Write a catalogue of `count` custom claims spread over categories"""
+    categories = list(ClaimCategory)
+    lines = ["version: 1", "categories:"]
+    for index, category in enumerate(categories):
+        lines.append(f"  {category.name}:")
+        for n in range(index, count, len(categories)):
+            lines += [
+                f"    - id: {prefix}_CLAIM_{n}",
+                f"      claim: \"Custom claim {n}\"",
+                "      test_procedure: |",
+                "        1. Check it",
+                f"      expected_result: \"Claim {n} holds\"",
+            ]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+class TestRegistry:
+    """Loading, indexes and immutability"""
+
+    def test_catalogue_matches_claim_tests(self):
+        registry = load_registry()
+        tests = get_claim_tests(ClaimTester("https://worker.example", "key"))
+
+        # IDs match case-insensitively (INFRA_CLOUDFLARE_DDoS in the catalogue)
+        assert [d.id.upper() for d in registry] == list(tests)
+        assert len(registry) == 26
+
+    def test_loaded_once_and_shared(self):
+        assert load_registry() is load_registry(CLAIMS_FILE)
+        assert ResinSecurityValidator().registry is ResinSecurityValidator().registry
+
+    def test_indexes(self):
+        registry = load_registry()
+
+        assert registry["ENC_TLS_TRANSIT"].category is ClaimCategory.ENCRYPTION
+        assert registry.get("enc_tls_transit") is registry["ENC_TLS_TRANSIT"]
+        assert "api_rate_limit" in registry
+        assert registry.get("NOPE") is None
+        assert [d.id for d in registry.by_category(ClaimCategory.PERFORMANCE)] == [
+            "PERF_HEALTH_LATENCY", "PERF_READY_LATENCY",
+        ]
+        assert registry["AUTH_OAUTH_PKCE"].test_procedure.startswith("1. Verify")
+
+    def test_immutable(self):
+        registry = load_registry()
+        definition = registry["ENC_TLS_TRANSIT"]
+
+        with pytest.raises(AttributeError):
+            registry._claims = ()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            definition.claim = "changed"
+        with pytest.raises(TypeError):
+            registry.ids["NEW"] = definition
+        assert not hasattr(definition, "__dict__")
+
+    def test_duplicate_ids_rejected(self):
+        definition = load_registry()["ENC_TLS_TRANSIT"]
+        copy = dataclasses.replace(definition, id="enc_tls_transit")
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            ClaimRegistry([definition, copy])
+
+    def test_invalid_catalogues_rejected(self, tmp_path):
+        unknown = tmp_path / "unknown.yaml"
+        unknown.write_text("categories:\n  NETWORKING:\n    - id: X\n")
+        missing = tmp_path / "missing.yaml"
+        missing.write_text("categories:\n  ENCRYPTION:\n    - id: ENC_X\n      claim: c\n")
+
+        with pytest.raises(ValueError, match="unknown claim category"):
+            ClaimRegistry.from_files(unknown)
+        with pytest.raises(ValueError, match="missing test_procedure, expected_result"):
+            ClaimRegistry.from_files(missing)
+
+
+# ============================================================================
+# Tenant claims
+# ============================================================================
+
+class TestTenantClaims:
+    """Custom claims layered on the shared catalogue"""
+
+    def test_claims_file_extends_catalogue(self, tmp_path):
+        path = tenant_catalogue(tmp_path / "tenant.yaml", 16)
+        registry = registry_for_worker({"claims_file": str(path)})
+
+        assert len(registry) == 26 + 16
+        assert registry is registry_for_worker({"claims_file": str(path)})
+        assert registry_for_worker({}) is load_registry()
+        performance = [d.id for d in registry.by_category(ClaimCategory.PERFORMANCE)]
+        assert performance[:2] == ["PERF_HEALTH_LATENCY", "PERF_READY_LATENCY"]
+        assert "TENANT_CLAIM_7" in performance
+
+    def test_hundreds_of_claims_share_one_registry(self, tmp_path, monkeypatch):
+        path = tenant_catalogue(tmp_path / "tenant.yaml", 800)
+        registry = load_registry(CLAIMS_FILE, path)
+        reads = []
+        monkeypatch.setattr(claim_registry, "_read_catalogue",
+                            lambda path: reads.append(path) or [])
+
+        for _ in range(20):
+            validator = ResinSecurityValidator(load_registry(CLAIMS_FILE, path))
+            validator.apply_results({"tenant_claim_5": (ValidationStatus.PASS, "ok")})
+            report = validator.generate_compliance_report()
+
+        # Parsed once per process; validators index into the shared registry
+        assert reads == []
+        assert validator.registry is registry
+        assert len(validator.claims) == 826
+        assert validator.claims["TENANT_CLAIM_5"].status.name == "PASS"
+        assert "Custom claim 799" in report
+
+    def test_add_claim_does_not_touch_shared_registry(self):
+        validator = ResinSecurityValidator()
+        validator.add_claim("API_CUSTOM", ClaimCategory.API_SECURITY, "Custom",
+                            "1. Check", "Holds")
+
+        assert "API_CUSTOM" in validator.registry
+        assert "API_CUSTOM" not in load_registry()
+        assert validator.get_claims_by_category(ClaimCategory.API_SECURITY)[-1].id == "API_CUSTOM"
+        assert isinstance(validator.registry["API_CUSTOM"], ClaimDefinition)
@@ -0,0 +1,237 @@
+"""
+Pytest tests for the compiled deployments.yaml cache
+
+Run: uv run pytest tools/security/tests/test_deployment_registry.py -v
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import deployment_registry
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import deployment_registry
+from deployment_registry import (
+    DEPLOYMENTS_FILE, DeploymentConfigError, compile_deployments, load_deployments,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def tenant_yaml(count, extra=""):
+    lines = ["deployments:"]
+    for n in range(count):
+        lines += [
+            f"  tenant{n}:",
+            f"    name: \"Tenant {n}\"",
+            f"    url: \"https://tenant{n}.mpazbot.workers.dev\"",
+            f"    api_key_env: \"TENANT{n}_API_KEY\"",
+            "    cache_ttls: {API: 600}",
+        ]
+    return "\n".join(lines) + "\n" + extra
+
+
+@pytest.fixture
+def compiled_dir(tmp_path):
+    return tmp_path / "compiled"
+
+
+@pytest.fixture
+def deployments_file(tmp_path):
+    path = tmp_path / "deployments.yaml"
+    path.write_text(tenant_yaml(3))
+    return path
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count YAML parses done by load_deployments"""
+    calls = []
+    real = deployment_registry.compile_deployments
+
+    def counting(source, path=DEPLOYMENTS_FILE):
+        calls.append(path)
+        return real(source, path)
+
+    monkeypatch.setattr(deployment_registry, "compile_deployments", counting)
+    monkeypatch.setattr(deployment_registry, "_memo", {})
+    return calls
+
+
+def touch(path, content=None):
+    """Rewrite (or just re-stamp) a file with a later mtime"""
+    if content is not None:
+        path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+# ============================================================================
+# Compiled cache
+# ============================================================================
+
+class TestCompiledCache:
+    """When deployments.yaml is (not) parsed again"""
+
+    def test_compiled_once(self, deployments_file, compiled_dir, parses):
+        first = load_deployments(deployments_file, compiled_dir)
+        deployment_registry._memo.clear()  # As in a new process
+        second = load_deployments(deployments_file, compiled_dir)
+
+        assert len(parses) == 1
+        assert dict(first) == dict(second)
+        assert second["tenant1"]["url"] == "https://tenant1.mpazbot.workers.dev"
+        assert len(list(compiled_dir.iterdir())) == 1
+
+    def test_same_process_reuses_mapping(self, deployments_file, compiled_dir, parses):
+        assert load_deployments(deployments_file, compiled_dir) is \
+            load_deployments(deployments_file, compiled_dir)
+
+    def test_touch_without_changes_is_not_reparsed(self, deployments_file, compiled_dir,
+                                                   parses):
+        load_deployments(deployments_file, compiled_dir)
+        touch(deployments_file)
+        deployment_registry._memo.clear()
+        load_deployments(deployments_file, compiled_dir)
+        deployment_registry._memo.clear()
+        load_deployments(deployments_file, compiled_dir)
+
+        assert len(parses) == 1
+
+    def test_edit_is_reparsed(self, deployments_file, compiled_dir, parses):
+        load_deployments(deployments_file, compiled_dir)
+        touch(deployments_file, tenant_yaml(5))
+        deployments = load_deployments(deployments_file, compiled_dir)
+
+        assert len(parses) == 2
+        assert "tenant4" in deployments
+
+    def test_corrupt_compiled_copy_is_rebuilt(self, deployments_file, compiled_dir, parses):
+        load_deployments(deployments_file, compiled_dir)
+        for path in compiled_dir.iterdir():
+            path.write_bytes(b"\x00garbage")
+        deployment_registry._memo.clear()
+
+        assert "tenant2" in load_deployments(deployments_file, compiled_dir)
+        assert len(parses) == 2
+
+    def test_schema_change_is_revalidated(self, deployments_file, compiled_dir, parses,
+                                          monkeypatch):
+        load_deployments(deployments_file, compiled_dir)
+
+        monkeypatch.setattr(deployment_registry, "OPTIONAL_KEYS",
+                            {**deployment_registry.OPTIONAL_KEYS, "region": (str,)})
+        deployment_registry._memo.clear()
+        load_deployments(deployments_file, compiled_dir)
+        monkeypatch.setattr(deployment_registry, "VALIDATOR_VERSION",
+                            deployment_registry.VALIDATOR_VERSION + 1)
+        deployment_registry._memo.clear()
+        load_deployments(deployments_file, compiled_dir)
+        deployment_registry._memo.clear()
+        load_deployments(deployments_file, compiled_dir)
+
+        assert len(parses) == 3
+
+    def test_read_only(self, deployments_file, compiled_dir, parses):
+        deployments = load_deployments(deployments_file, compiled_dir)
+
+        with pytest.raises(TypeError):
+            deployments["new"] = {}
+
+    def test_thousands_of_tenants(self, tmp_path, compiled_dir, parses):
+        path = tmp_path / "deployments.yaml"
+        path.write_text(tenant_yaml(5000))
+        load_deployments(path, compiled_dir)
+
+        deployment_registry._memo.clear()
+        deployments = load_deployments(path, compiled_dir)
+
+        assert len(deployments) == 5000
+        assert deployments["tenant4999"]["cache_ttls"] == {"API": 600}
+        # A fresh process loads the compiled copy instead of parsing 5000 entries
+        assert len(parses) == 1
+
+
+# ============================================================================
+# Schema
+# ============================================================================
+
+class TestSchema:
+    """Validation at compile time"""
+
+    def test_repository_file_is_valid(self):
+        deployments = compile_deployments(DEPLOYMENTS_FILE.read_bytes())
+        assert set(deployments) >= {"resin", "evergreen"}
+
+    def test_all_errors_reported_at_once(self):
+        source = tenant_yaml(1, extra="\n".join([
+            "  broken:",
+            "    url: \"ftp://broken\"",
+            "    log_scan_processes: true",
+            "    cache_ttls: {API: -1}",
+            "  empty: null",
+            "  _fleet-rollup:",
+            "    url: \"https://rollup.example.dev\"",
+            "",
+        ]))
+
+        with pytest.raises(DeploymentConfigError) as excinfo:
+            compile_deployments(source)
+
+        assert excinfo.value.errors == [
+            "broken: url must be an http(s) URL",
+            "broken: log_scan_processes must be int",
+            "broken: cache_ttls.API must be a number of seconds >= 0",
+            "empty: entry must be a mapping",
+            "_fleet-rollup: deployment names must not start with '_'",
+        ]
+
+    def test_watch_settings(self):
+        source = tenant_yaml(1, extra="\n".join([
+            "  watched:",
+            "    url: \"https://watched.example.dev\"",
+            "    watch: {intervals: {PERF: 30, API: 0}, jitter: 1.5, max_backoff: -1}",
+            "",
+        ]))
+
+        with pytest.raises(DeploymentConfigError) as excinfo:
+            compile_deployments(source)
+
+        assert excinfo.value.errors == [
+            "watched: watch.intervals.API must be a number of seconds > 0",
+            "watched: watch.max_backoff must be a number of seconds > 0",
+            "watched: watch.jitter must be a fraction in [0, 1)",
+        ]
+
+    def test_log_retention_settings(self):
+        source = tenant_yaml(1, extra="\n".join([
+            "  archived:",
+            "    url: \"https://archived.example.dev\"",
+            "    log_retention: {days: 0, grace_days: -1}",
+            "",
+        ]))
+
+        with pytest.raises(DeploymentConfigError) as excinfo:
+            compile_deployments(source)
+
+        assert excinfo.value.errors == [
+            "archived: log_retention.days must be a number of days > 0",
+            "archived: log_retention.grace_days must be a number of days >= 0",
+        ]
+
+    def test_invalid_file_is_not_cached(self, tmp_path, compiled_dir, parses):
+        path = tmp_path / "deployments.yaml"
+        path.write_text("deployments:\n  bad: {name: 1}\n")
+
+        for _ in range(2):
+            with pytest.raises(DeploymentConfigError, match="bad: url"):
+                load_deployments(path, compiled_dir)
+        assert not compiled_dir.exists() or not list(compiled_dir.iterdir())
+
+    def test_invalid_yaml(self):
+        with pytest.raises(DeploymentConfigError, match="invalid YAML"):
+            compile_deployments("deployments: [unclosed")
@@ -0,0 +1,178 @@
+"""
+Pytest tests for the concurrent claim execution engine
+
+Run: uv run pytest tools/security/tests/test_executor.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ValidationStatus, run_all_tests
+from executor import ClaimExecutor
+from standin_server import StandinConfig, StandinServer
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def worker_url():
+    """Test worker URL"""
+    return "https://resin.mpazbot.workers.dev"
+
+
+@pytest.fixture
+def api_key():
+    """Test API key"""
+    return "test-api-key-12345"
+
+
+def sleeper(seconds, status=ValidationStatus.PASS):
+    """Claim function that waits like a network probe"""
+    def claim():
+        time.sleep(seconds)
+        return (status, f"slept {seconds}s")
+    return claim
+
+
+@pytest.fixture
+def slow_claims():
+    """Four claims that each wait 0.2s"""
+    return {f"CLAIM_{i}": sleeper(0.2) for i in range(4)}
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+class TestClaimExecutor:
+    """ClaimExecutor pool, timeout and cancellation behaviour"""
+
+    def test_serial_matches_pooled_results(self, api_key):
+        """Pool size must not change the run_all_tests result dict"""
+        config = {"rate_limit_probe": {"requests": 30, "rate": 300, "after_throttled": 5}}
+        with StandinServer(StandinConfig(api_key=api_key)) as server:
+            serial = run_all_tests(server.url, api_key, worker_config=config)
+            pooled = run_all_tests(server.url, api_key, executor=ClaimExecutor(max_workers=8),
+                                   worker_config=config)
+
+        assert list(pooled.keys()) == list(serial.keys())
+        # The rate limit burst, fuzzer and latency SLOs report measured
+        # durations, so only their status is stable
+        for claim_id in ("API_RATE_LIMIT", "API_INPUT_VALIDATION", "PERF_HEALTH_LATENCY",
+                         "PERF_READY_LATENCY"):
+            assert pooled.pop(claim_id)[0] == serial.pop(claim_id)[0]
+        assert pooled == serial
+
+    def test_pool_overlaps_claims(self):
+        """Network-bound claims overlap: all four are running at the same time"""
+        barrier = threading.Barrier(4, timeout=5)
+
+        def rendezvous():
+            barrier.wait()  # Raises BrokenBarrierError unless all four overlap
+            return (ValidationStatus.PASS, "met")
+
+        executor = ClaimExecutor(max_workers=4)
+        results = executor.run({f"CLAIM_{i}": rendezvous for i in range(4)})
+
+        assert all(result == (ValidationStatus.PASS, "met") for result in results.values())
+        assert sorted(executor.report.durations) == sorted(results)
+        assert executor.report.timed_out == []
+        assert "summed claim time" in executor.report.summary()
+
+    def test_timeout_marks_claim_warn(self):
+        """A claim exceeding the timeout is abandoned and reported as WARN"""
+        release = threading.Event()
+        executor = ClaimExecutor(max_workers=2, timeout=0.1)
+        try:
+            results = executor.run({"FAST": sleeper(0.0), "SLOW": release.wait})
+        finally:
+            release.set()
+
+        assert results["FAST"][0] == ValidationStatus.PASS
+        assert results["SLOW"][0] == ValidationStatus.WARN
+        assert "timed out" in results["SLOW"][1]
+        assert executor.report.timed_out == ["SLOW"]
+        assert executor.report.durations["SLOW"] >= 0.1
+
+    def test_timeout_frees_slot_for_queued_claim(self):
+        """A hung claim's slot goes to the next queued claim once it times out"""
+        release = threading.Event()
+        executor = ClaimExecutor(max_workers=1, timeout=0.2)
+        try:
+            results = executor.run({"HUNG": release.wait, "QUEUED": sleeper(0.0)})
+            # The queued claim ran while the hung claim was still blocked
+            assert not release.is_set()
+        finally:
+            release.set()
+
+        assert results["HUNG"][0] == ValidationStatus.WARN
+        assert results["QUEUED"] == (ValidationStatus.PASS, "slept 0.0s")
+        assert executor.report.timed_out == ["HUNG"]
+        assert executor.report.durations["HUNG"] >= 0.2
+        assert "QUEUED" in executor.report.durations
+
+    def test_on_result_in_completion_order(self):
+        """Results are reported as claims finish, including timeouts"""
+        reported = []
+        executor = ClaimExecutor(max_workers=3, timeout=0.5)
+        executor.run({"SLOW": sleeper(2.0), "MID": sleeper(0.1), "FAST": sleeper(0.0)},
+                     on_result=lambda *args: reported.append(args))
+
+        assert [claim_id for claim_id, _, _ in reported] == ["FAST", "MID", "SLOW"]
+        assert reported[1][1] == (ValidationStatus.PASS, "slept 0.1s")
+        assert reported[1][2] >= 0.1
+        assert reported[2][1][0] == ValidationStatus.WARN
+
+    def test_on_result_serial_and_cancelled(self):
+        """The serial loop reports each claim before starting the next"""
+        reported = []
+
+        def check_reported():
+            assert [claim_id for claim_id, _, _ in reported] == ["FIRST"]
+            return (ValidationStatus.PASS, "ok")
+
+        cancel = threading.Event()
+        executor = ClaimExecutor(cancel_event=cancel)
+        executor.run({"FIRST": sleeper(0.0), "SECOND": check_reported,
+                      "THIRD": lambda: cancel.set() or (ValidationStatus.PASS, "ok"),
+                      "FOURTH": sleeper(0.0)},
+                     on_result=lambda *args: reported.append(args))
+
+        assert [claim_id for claim_id, _, _ in reported] == ["FIRST", "SECOND", "THIRD", "FOURTH"]
+        assert reported[3][1][0] == ValidationStatus.PENDING
+        assert reported[3][2] is None
+
+    def test_cancel_stops_unstarted_claims(self, slow_claims):
+        """Cancelling a run marks claims that have not finished as PENDING"""
+        cancel = threading.Event()
+        executor = ClaimExecutor(max_workers=1, timeout=5, cancel_event=cancel)
+        threading.Timer(0.05, cancel.set).start()
+
+        results = executor.run(slow_claims)
+
+        assert len(results) == len(slow_claims)
+        assert executor.report.cancelled
+        for claim_id in executor.report.cancelled:
+            assert results[claim_id][0] == ValidationStatus.PENDING
+
+    def test_not_implemented_becomes_pending(self):
+        """NotImplementedError keeps its PENDING mapping in the pool"""
+        def stub():
+            raise NotImplementedError("later")
+
+        results = ClaimExecutor(max_workers=2).run({"STUB": stub})
+
+        assert results["STUB"] == (ValidationStatus.PENDING, "later")
+
+    def test_invalid_pool_size(self):
+        """Pool size must be positive"""
+        with pytest.raises(ValueError):
+            ClaimExecutor(max_workers=0)
@@ -0,0 +1,137 @@
+"""
+Pytest tests for fleet-wide validation
+
+Run: uv run pytest tools/security/tests/test_fleet.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import fleet
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import fleet
+from fleet import WorkerValidation, generate_fleet_report, validate_fleet, validate_worker
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def deployments():
+    """Six tenants on two hosts, each with its own API key variable"""
+    config = {}
+    for i in range(6):
+        host = "a.example.dev" if i % 2 == 0 else "b.example.dev"
+        config[f"tenant{i}"] = {
+            "name": f"Tenant {i}",
+            "url": f"https://{host}/t{i}",
+            "api_key_env": f"TENANT{i}_API_KEY",
+        }
+    return config
+
+
+@pytest.fixture
+def api_keys(monkeypatch, deployments):
+    for config in deployments.values():
+        monkeypatch.setenv(config["api_key_env"], "test-api-key-12345")
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+class TestValidateFleet:
+    """validate_fleet concurrency caps and error isolation"""
+
+    def test_per_host_and_overall_caps(self, monkeypatch, deployments, api_keys):
+        """No more than per_host_limit workers run against one host at once"""
+        lock = threading.Lock()
+        active = {"overall": 0, "a.example.dev": 0, "b.example.dev": 0}
+        peak = dict(active)
+
+        def fake_validate(worker, config, api_key, *args, **kwargs):
+            host = fleet._host(config["url"])
+            with lock:
+                for key in ("overall", host):
+                    active[key] += 1
+                    peak[key] = max(peak[key], active[key])
+            time.sleep(0.05)
+            with lock:
+                active["overall"] -= 1
+                active[host] -= 1
+            return WorkerValidation(worker=worker, name=config["name"], url=config["url"])
+
+        monkeypatch.setattr(fleet, "validate_worker", fake_validate)
+        results = validate_fleet(list(deployments), deployments,
+                                 max_concurrency=3, per_host_limit=1)
+
+        assert [r.worker for r in results] == list(deployments)
+        assert peak["a.example.dev"] == 1
+        assert peak["b.example.dev"] == 1
+        assert peak["overall"] <= 3
+
+    def test_waiting_host_does_not_hold_a_pool_slot(self, monkeypatch, deployments, api_keys):
+        """While one host is at its limit, other hosts' workers still get every slot"""
+        host_b_done = threading.Event()
+        finished_b = []
+        waited = {}
+
+        def fake_validate(worker, config, api_key, *args, **kwargs):
+            if fleet._host(config["url"]) == "a.example.dev":
+                if worker == "tenant0":
+                    # Blocks host a until all of host b has run on the other slot
+                    waited[worker] = host_b_done.wait(2)
+            else:
+                finished_b.append(worker)
+                if len(finished_b) == 3:
+                    host_b_done.set()
+            return WorkerValidation(worker=worker, name=config["name"], url=config["url"])
+
+        monkeypatch.setattr(fleet, "validate_worker", fake_validate)
+        results = validate_fleet(list(deployments), deployments,
+                                 max_concurrency=2, per_host_limit=1)
+
+        assert waited == {"tenant0": True}
+        assert all(r.ok for r in results)
+
+    def test_missing_api_key_is_isolated(self, monkeypatch, deployments, api_keys):
+        """A worker without credentials reports an error instead of stopping the fleet"""
+        monkeypatch.delenv("TENANT0_API_KEY")
+        results = validate_fleet(["tenant0", "tenant1"], deployments, save=False)
+
+        assert not results[0].ok
+        assert "TENANT0_API_KEY" in results[0].error
+        assert results[1].ok
+        assert sum(results[1].status_counts.values()) == 26
+
+    def test_unknown_worker_rejected(self, deployments):
+        with pytest.raises(ValueError):
+            validate_fleet(["nope"], deployments)
+
+
+class TestFleetReport:
+    """Per-worker validation and fleet rollup"""
+
+    def test_validate_worker_applies_results(self, deployments):
+        result = validate_worker("tenant0", deployments["tenant0"], "key", save=False)
+
+        assert result.ok
+        assert result.status_counts.get("👤 MANUAL") == 4
+        assert "summed claim time" in result.timing
+
+    def test_rollup_lists_every_worker(self):
+        results = [
+            WorkerValidation("resin", "Resin", "https://r", {"✅ PASS": 2}, 1.0, "r.md"),
+            WorkerValidation("evergreen", "Evergreen", "https://e", error="boom"),
+        ]
+        report = generate_fleet_report(results)
+
+        assert "Workers: 2" in report
+        assert "Errors: 1" in report
+        assert "| Resin (resin)" in report
+        assert "ERROR: boom" in report
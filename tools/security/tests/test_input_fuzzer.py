@@ -0,0 +1,245 @@
+"""
+Pytest tests for the MCP tool input fuzzer and API_INPUT_VALIDATION
+
+Run: uv run pytest tools/security/tests/test_input_fuzzer.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ValidationStatus
+from implementations.api_implementations import ApiImplementations
+from implementations.input_fuzzer import (
+    STRING_PAYLOADS, FuzzCase, build_corpus, fingerprint, run_fuzz, strip_payload,
+)
+from standin_server import TOOLS, StandinConfig, StandinServer
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+API_KEY = "test-api-key-12345"
+
+
+@pytest.fixture
+def server():
+    with StandinServer(StandinConfig(api_key=API_KEY)) as server:
+        yield server
+
+
+@pytest.fixture
+def unvalidated_server():
+    """Stand-in whose tools crash on bad arguments and return the error message"""
+    with StandinServer(StandinConfig(api_key=API_KEY, validate_tool_input=False)) as server:
+        yield server
+
+
+def response(status, message):
+    return status, json.dumps({"jsonrpc": "2.0", "id": 7, **message})
+
+
+# ============================================================================
+# Corpus
+# ============================================================================
+
+class TestCorpus:
+    """Cases derived from the tools' input schemas"""
+
+    def test_every_tool_and_category_covered(self):
+        corpus = build_corpus(TOOLS, include_valid_payloads=True)
+
+        assert len(corpus) >= 500
+        assert {case.tool for case in corpus} == {tool["name"] for tool in TOOLS}
+        categories = {case.category for case in corpus}
+        assert set(STRING_PAYLOADS) <= categories
+        assert {"type_confusion", "integer_boundary", "envelope", "missing_argument"} <= categories
+
+    def test_default_corpus_is_schema_invalid(self):
+        corpus = build_corpus(TOOLS)
+
+        assert corpus and all(case.invalid for case in corpus)
+        assert {case.tool for case in corpus} == {tool["name"] for tool in TOOLS}
+        assert not {case.category for case in corpus} & set(STRING_PAYLOADS)
+        assert build_corpus(TOOLS, include_write_tools=True) == corpus
+
+    def test_write_tools_only_get_invalid_arguments(self):
+        corpus = build_corpus(TOOLS, include_valid_payloads=True)
+        writes = [case for case in corpus if case.tool in ("create_record", "update_record")]
+
+        assert writes and all(case.invalid for case in writes)
+        assert len(build_corpus(TOOLS, include_write_tools=True,
+                                include_valid_payloads=True)) > len(corpus)
+
+    def test_no_soql_payloads_as_queries(self):
+        corpus = build_corpus(TOOLS, include_valid_payloads=True)
+
+        assert not [case for case in corpus
+                    if case.argument == "query" and case.category == "soql_injection"]
+        assert [case for case in corpus if case.category == "soql_injection"]
+
+    def test_type_confusion_matches_schema(self):
+        limits = [case.value for case in build_corpus(TOOLS)
+                  if case.tool == "run_soql" and case.argument == "limit"
+                  and case.category == "type_confusion"]
+
+        assert "string" in limits and None in limits and True in limits
+        # Integers are boundary cases, not type confusion
+        assert not [value for value in limits if type(value) is int]
+
+    def test_payloads_embedded_in_context(self):
+        queries = {case.arguments["query"] for case in build_corpus(TOOLS, categories=["xss"],
+                                                            include_valid_payloads=True)
+                   if case.argument == "query" and case.category == "xss"}
+
+        assert "<script>alert(1)</script>" in queries
+        assert "SELECT Id, Name FROM Contact WHERE Name = '<script>alert(1)</script>'" in queries
+
+    def test_max_cases_samples_across_corpus(self):
+        corpus = build_corpus(TOOLS, max_cases=50)
+
+        assert len(corpus) == 50
+        assert {case.tool for case in corpus} == {tool["name"] for tool in TOOLS}
+
+    def test_unknown_category(self):
+        with pytest.raises(ValueError):
+            build_corpus(TOOLS, categories=["buffer_overflow"])
+
+
+# ============================================================================
+# Response grouping
+# ============================================================================
+
+class TestFingerprint:
+    """Payload echoes and volatile values do not split behaviours"""
+
+    def test_echoes_and_ids_collapse(self):
+        keys = set()
+        for request_id, payload in enumerate(["<svg onload=alert(1)>", "' OR 1=1--"]):
+            case = FuzzCase("run_soql", "query", "xss", payload, {"query": payload})
+            status, text = response(200, {"error": {
+                "code": -32602, "message": f"Bad query {payload} (request req_{request_id}_abc)",
+            }})
+            keys.add(fingerprint(status, strip_payload(text, case))[0])
+
+        assert len(keys) == 1
+
+    def test_status_and_message_split(self):
+        error = {"error": {"code": -32602, "message": "Expected string"}}
+        first = fingerprint(*response(200, error))
+        second = fingerprint(*response(500, error))
+        third = fingerprint(*response(200, {"result": {"content": []}}))
+
+        assert len({first[0], second[0], third[0]}) == 3
+        assert '"id"' not in first[1]
+
+    def test_escaped_echo_is_stripped(self):
+        payload = '"><img src=x onerror=alert(1)>'
+        case = FuzzCase("run_soql", "query", "xss", payload, {"query": payload})
+        text = json.dumps({"error": {"message": f"Unknown field {payload}"}})
+
+        assert "<payload>" in strip_payload(text, case)
+        assert "onerror" not in strip_payload(text, case)
+
+
+# ============================================================================
+# Fuzzing runs
+# ============================================================================
+
+class TestRunFuzz:
+    """Full corpus against the stand-in"""
+
+    def test_validated_worker(self, server):
+        report = run_fuzz(server.url, API_KEY, include_valid_payloads=True)
+
+        assert report.answered == report.planned >= 500
+        assert report.tools == [tool["name"] for tool in TOOLS]
+        # Hundreds of payloads, a few dozen distinct behaviours
+        assert len(report.behaviours) < 40
+        assert report.server_errors.count == 0
+        assert report.leaks == {}
+        assert report.accepted_invalid.count == 0
+
+    def test_unvalidated_worker(self, unvalidated_server):
+        report = run_fuzz(unvalidated_server.url, API_KEY, max_cases=200)
+
+        assert report.server_errors.count > 0
+        assert {"stack_trace", "exception", "file_path"} <= set(report.leaks)
+        assert len(report.server_errors.examples) == 3
+        assert len(report.behaviours) < 10
+
+    def test_throttled_responses_are_counted(self):
+        with StandinServer(StandinConfig(api_key=API_KEY, rate_limit=30)) as server:
+            report = run_fuzz(server.url, API_KEY, max_cases=100, concurrency=4)
+
+        assert report.throttled > 0
+        assert report.answered + report.throttled == report.sent
+
+    def test_max_duration(self):
+        with StandinServer(StandinConfig(api_key=API_KEY, latency_ms=20)) as server:
+            report = run_fuzz(server.url, API_KEY, concurrency=2, max_duration=0.2)
+
+        assert report.sent < report.planned
+        assert "not sent" in report.summary()
+
+    def test_unreachable(self, closed_port):
+        report = run_fuzz(f"http://127.0.0.1:{closed_port}", API_KEY, timeout=1)
+
+        assert report.error.startswith("worker unreachable")
+        assert report.sent == 0
+
+
+# ============================================================================
+# API_INPUT_VALIDATION claim
+# ============================================================================
+
+class TestInputValidationClaim:
+    """PASS/FAIL/WARN from the fuzzing report"""
+
+    def test_pass(self, server):
+        status, details = ApiImplementations(server.url, API_KEY).test_api_input_validation()
+
+        assert status == ValidationStatus.PASS
+        assert "distinct behaviours" in details
+        assert "Attack payloads not sent (include_valid_payloads off)" in details
+
+    def test_pass_with_attack_payloads(self, server):
+        impl = ApiImplementations(server.url, API_KEY,
+                                  {"input_fuzz": {"include_valid_payloads": True}})
+        status, details = impl.test_api_input_validation()
+
+        assert status == ValidationStatus.PASS
+        assert "Attack payloads not sent" not in details
+
+    def test_fail_on_unhandled_errors(self, unvalidated_server):
+        impl = ApiImplementations(unvalidated_server.url, API_KEY,
+                                  {"input_fuzz": {"max_cases": 100}})
+        status, details = impl.test_api_input_validation()
+
+        assert status == ValidationStatus.FAIL
+        assert "5xx responses" in details
+        assert "stack_trace in" in details
+        # Behaviours are status, error code and key; response bodies stay out
+        assert "salesforce.ts" not in details and "Cannot read" not in details
+
+    def test_warn_when_throttled(self):
+        with StandinServer(StandinConfig(api_key=API_KEY, rate_limit=10)) as server:
+            impl = ApiImplementations(server.url, API_KEY,
+                                      {"input_fuzz": {"max_cases": 60, "concurrency": 4}})
+            status, details = impl.test_api_input_validation()
+
+        assert status == ValidationStatus.WARN
+        assert "throttled" in details
+
+    def test_warn_when_unreachable(self, closed_port):
+        impl = ApiImplementations(f"http://127.0.0.1:{closed_port}", API_KEY,
+                                  {"input_fuzz": {"timeout": 1}})
+        status, details = impl.test_api_input_validation()
+
+        assert status == ValidationStatus.WARN
+        assert "incomplete" in details
@@ -0,0 +1,207 @@
+"""
+Pytest tests for per-claim instrumentation and profiling
+
+Run: uv run pytest tools/security/tests/test_instrumentation.py -v
+"""
+
+import pstats
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path so we can import instrumentation
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import instrumentation
+import pytest
+from claim_tests import ValidationStatus, run_all_tests
+from executor import ClaimExecutor
+from implementations.load_generator import run_burst
+from implementations.tls_probe import TLSProbe
+from implementations.transport import Transport
+from instrumentation import ClaimInstrumentation, ClaimStats, format_stats
+from standin_server import StandinConfig, StandinServer
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+API_KEY = "test-api-key-12345"
+
+PASS = ValidationStatus.PASS
+
+
+@pytest.fixture
+def server():
+    with StandinServer(StandinConfig(api_key=API_KEY)) as server:
+        yield server
+
+
+def busy(seconds):
+    end = time.thread_time() + seconds
+    while time.thread_time() < end:
+        pass
+
+
+def stats_of(claim_id, func, **kwargs):
+    """Run `func` as an instrumented claim; returns its ClaimStats"""
+    tracker = ClaimInstrumentation(**kwargs)
+    tracker.wrap(claim_id, func)()
+    return tracker.stats[claim_id]
+
+
+# ============================================================================
+# Timing
+# ============================================================================
+
+class TestClaimStats:
+    """Wall and CPU time, per claim and per thread"""
+
+    def test_wall_and_cpu_time(self):
+        sleeping = stats_of("SLEEP", lambda: time.sleep(0.1))
+        working = stats_of("WORK", lambda: busy(0.1))
+
+        assert sleeping.wall_time >= 0.1
+        assert sleeping.cpu_time < 0.05
+        assert working.cpu_time >= 0.09
+        assert sleeping.peak_memory is None
+
+    def test_recorded_when_claim_raises(self):
+        tracker = ClaimInstrumentation()
+
+        def claim():
+            instrumentation.record_request(10, 20)
+            raise NotImplementedError("later")
+
+        with pytest.raises(NotImplementedError):
+            tracker.call("PENDING_CLAIM", claim)
+        assert tracker.stats["PENDING_CLAIM"].requests == 1
+        assert instrumentation.current() is None
+
+    def test_requests_outside_claims_are_ignored(self):
+        instrumentation.record_request(100, 100)
+
+        assert instrumentation.current() is None
+
+    def test_concurrent_claims_are_attributed_separately(self):
+        tracker = ClaimInstrumentation()
+
+        def claim(count):
+            def run():
+                for _ in range(count):
+                    instrumentation.record_request(1, 2)
+                    time.sleep(0.001)
+                return (PASS, "")
+            return run
+
+        claims = {f"C{n}": tracker.wrap(f"C{n}", claim(n * 10)) for n in range(1, 5)}
+        ClaimExecutor(max_workers=4).run(claims)
+
+        assert {c: s.requests for c, s in tracker.stats.items()} == \
+            {"C1": 10, "C2": 20, "C3": 30, "C4": 40}
+        assert tracker.stats["C4"].bytes_received == 80
+
+    def test_peak_memory(self):
+        stats = stats_of("ALLOC", lambda: len(bytearray(4 * 1024 * 1024)), trace_memory=True)
+
+        assert stats.peak_memory >= 4 * 1024 * 1024
+        assert not tracemalloc.is_tracing()  # Left as it was found
+
+
+# ============================================================================
+# HTTP layers
+# ============================================================================
+
+class TestRequestCounting:
+    """Transport, load generator and TLS probe report requests and bytes"""
+
+    def test_transport(self, server):
+        transport = Transport()
+        session = transport.session(API_KEY)
+        body = []
+
+        def claim():
+            for _ in range(3):
+                body.append(session.get(f"{server.url}/health", timeout=5).content)
+
+        stats = stats_of("HEALTH", claim)
+        transport.close()
+
+        assert stats.requests == 3
+        assert stats.bytes_received > 3 * len(body[0])
+        assert stats.bytes_sent > 3 * len("GET /health HTTP/1.1\r\n")
+
+    def test_transport_counts_retries(self):
+        transport = Transport(backoff_factor=0.01, backoff_jitter=0)
+        with StandinServer(StandinConfig(api_key=API_KEY, ready=False)) as server:
+            stats = stats_of("READY", lambda: transport.session().get(f"{server.url}/ready",
+                                                                      timeout=5))
+        transport.close()
+
+        assert stats.requests == 3
+
+    def test_load_generator(self, server):
+        stats = stats_of("BURST", lambda: run_burst(f"{server.url}/health", total=20, rate=500))
+
+        assert stats.requests == 20
+        assert stats.bytes_sent > 20 * len("GET /health HTTP/1.1\r\n")
+        assert stats.bytes_received > stats.bytes_sent / 2
+
+    def test_tls_probe(self, server):
+        stats = stats_of("PROBE", lambda: TLSProbe(server.url, timeout=5).run())
+
+        assert stats.requests == 2  # HEAD and OPTIONS
+        assert stats.bytes_received > 0
+
+
+# ============================================================================
+# Profiles and reports
+# ============================================================================
+
+class TestProfiling:
+    """cProfile and collapsed-stack output per claim"""
+
+    def test_profile_files(self, tmp_path):
+        def slow_claim():
+            busy(0.05)
+            time.sleep(0.05)
+            return (PASS, "")
+
+        tracker = ClaimInstrumentation(profile_dir=tmp_path, sample_interval=0.002)
+        tracker.wrap("SLOW_CLAIM", slow_claim)()
+
+        profile = pstats.Stats(str(tmp_path / "SLOW_CLAIM.prof"))
+        assert any(func[2] == "busy" for func in profile.stats)
+
+        folded = (tmp_path / "SLOW_CLAIM.folded").read_text().splitlines()
+        assert folded
+        for line in folded:
+            stack, count = line.rsplit(" ", 1)
+            assert stack.startswith("slow_claim (test_instrumentation.py:")
+            assert int(count) > 0
+        assert any(";busy (" in line for line in folded)
+        assert tracker.stats["SLOW_CLAIM"].peak_memory is not None
+
+    def test_write_json_and_format(self, tmp_path):
+        tracker = ClaimInstrumentation()
+        tracker.stats = {
+            "FAST": ClaimStats("FAST", wall_time=0.1, requests=1, bytes_received=512),
+            "SLOW": ClaimStats("SLOW", wall_time=2.5, requests=40,
+                               bytes_received=3 * 1024 * 1024, peak_memory=2048),
+        }
+
+        data = tracker.write_json(tmp_path / "stats.json").read_text()
+        table = format_stats(tracker.stats, limit=1).splitlines()
+
+        assert '"bytes_received": 3145728' in data
+        assert len(table) == 2
+        assert table[1].split() == ["SLOW", "2.50s", "0.00s", "40", "0B", "3.0MiB", "2.0KiB"]
+
+    def test_run_all_tests_reports_claim_stats(self):
+        executor = ClaimExecutor()
+        results = run_all_tests("https://resin.example.dev", API_KEY, executor=executor)
+
+        assert set(executor.report.claim_stats) == set(results)
+        assert all(s.wall_time >= 0 for s in executor.report.claim_stats.values())
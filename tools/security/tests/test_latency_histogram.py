@@ -0,0 +1,200 @@
+"""
+Pytest tests for the latency histogram, closed-loop sampler and PERFORMANCE claims
+
+Run: uv run pytest tools/security/tests/test_latency_histogram.py -v
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ValidationStatus
+from implementations.latency_histogram import LatencyHistogram
+from implementations.load_generator import sample_latency
+from implementations.performance_implementations import PerformanceImplementations
+from standin_server import StandinConfig, StandinServer
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+API_KEY = "test-api-key-12345"
+
+
+@pytest.fixture
+def server():
+    with StandinServer(StandinConfig(api_key=API_KEY)) as server:
+        yield server
+
+
+def exact_percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered), max(1, math.ceil(q * len(ordered)))) - 1]
+
+
+# ============================================================================
+# Histogram
+# ============================================================================
+
+class TestHistogram:
+    """Precision, bounded memory and merging"""
+
+    def test_percentiles_within_precision(self):
+        rng = random.Random(3)
+        values = [int(rng.lognormvariate(10, 1.2)) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for q in (0.5, 0.95, 0.99, 1.0):
+            exact = exact_percentile(values, q)
+            assert histogram.value_at_quantile(q) == pytest.approx(exact, rel=0.01)
+        assert histogram.count == len(values)
+        assert histogram.min_us == min(values) and histogram.max_us == max(values)
+        assert histogram.mean_ms == pytest.approx(sum(values) / len(values) / 1000)
+
+    def test_memory_is_independent_of_sample_count(self):
+        histogram = LatencyHistogram()
+        size = len(histogram._counts)
+        for value in range(0, 2_000_000, 7):
+            histogram.record(value)
+
+        assert len(histogram._counts) == size
+        assert size <= 4096
+
+    def test_small_values_are_exact(self):
+        histogram = LatencyHistogram()
+        for value in (1, 2, 3, 100, 255):
+            histogram.record(value)
+
+        assert [value for value, _ in histogram.buckets()] == [1, 2, 3, 100, 255]
+
+    def test_values_beyond_range_are_clamped(self):
+        histogram = LatencyHistogram(highest_us=1_000_000)
+        histogram.record(5_000_000)
+        histogram.record(-5)
+
+        assert histogram.max_us == 1_000_000
+        assert histogram.min_us == 0
+
+    def test_percentiles_in_ms(self):
+        histogram = LatencyHistogram()
+        for ms in (10, 20, 30, 40):
+            histogram.record_ms(ms)
+
+        assert histogram.percentiles((0.5, 1.0)) == {
+            "p50": pytest.approx(20, rel=0.01), "p100": 40.0,
+        }
+        assert LatencyHistogram().percentiles() == {}
+
+    def test_merge(self):
+        first, second, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for value in range(1, 5000, 3):
+            (first if value % 2 else second).record(value)
+            both.record(value)
+        first.merge(second)
+
+        assert list(first.buckets()) == list(both.buckets())
+        assert (first.count, first.min_us, first.max_us) == (both.count, both.min_us, both.max_us)
+        with pytest.raises(ValueError):
+            first.merge(LatencyHistogram(significant_digits=3))
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            LatencyHistogram(lowest_us=0)
+        with pytest.raises(ValueError):
+            LatencyHistogram(significant_digits=6)
+
+
+# ============================================================================
+# Sampler
+# ============================================================================
+
+class TestSampler:
+    """Closed-loop sampling against the stand-in"""
+
+    def test_samples_are_recorded_after_warmup(self, server):
+        report = sample_latency(f"{server.url}/health", samples=50, concurrency=4, warmup=4)
+
+        assert report.histogram.count == 50
+        assert report.status_counts == {200: 50}
+        assert server.stats.requests == 54
+        assert "50 samples" in report.summary()
+
+    def test_injected_latency_shows_in_percentiles(self):
+        with StandinServer(StandinConfig(latency_ms=30)) as server:
+            report = sample_latency(f"{server.url}/health", samples=8, concurrency=4)
+
+        assert report.histogram.percentiles()["p50"] >= 30
+
+    def test_unreachable(self, closed_port):
+        report = sample_latency(f"http://127.0.0.1:{closed_port}/health", samples=3,
+                                concurrency=2, timeout=1)
+
+        assert report.errors == 3
+        assert report.answered == 0
+        assert report.first_error
+
+
+# ============================================================================
+# PERFORMANCE claims
+# ============================================================================
+
+class TestLatencyBudgetClaims:
+    """PASS/FAIL/WARN against the per-deployment budget"""
+
+    def test_pass_within_default_budget(self, server):
+        impl = PerformanceImplementations(server.url, API_KEY,
+                                          {"latency_budget": {"health": {"samples": 40}}})
+        status, details = impl.test_perf_health_latency()
+
+        assert status == ValidationStatus.PASS
+        assert "/health within latency budget (p50 100ms, p95 300ms, p99 500ms)" in details
+        assert set(impl.metrics) == {"health_p50_ms", "health_p95_ms", "health_p99_ms"}
+
+    def test_fail_over_budget(self):
+        config = {"latency_budget": {"concurrency": 2,
+                                     "health": {"samples": 6, "p50": 10, "p95": 1000}}}
+        with StandinServer(StandinConfig(latency_ms=40)) as server:
+            impl = PerformanceImplementations(server.url, API_KEY, config)
+            status, details = impl.test_perf_health_latency()
+
+        assert status == ValidationStatus.FAIL
+        assert "p50" in details and "> 10ms" in details
+        assert "p95" not in details.split(":")[0]
+
+    def test_warn_when_not_ready(self):
+        with StandinServer(StandinConfig(ready=False)) as server:
+            impl = PerformanceImplementations(server.url, API_KEY,
+                                              {"latency_budget": {"ready": {"samples": 5}}})
+            status, details = impl.test_perf_ready_latency()
+
+        assert status == ValidationStatus.WARN
+        assert "503: 5" in details
+
+    def test_warn_when_unreachable(self, closed_port):
+        impl = PerformanceImplementations(
+            f"http://127.0.0.1:{closed_port}", API_KEY,
+            {"latency_budget": {"timeout": 1, "health": {"samples": 2}}},
+        )
+        status, details = impl.test_perf_health_latency()
+
+        assert status == ValidationStatus.WARN
+        assert "not measured" in details
+
+    def test_budget_merges_overrides(self):
+        impl = PerformanceImplementations("https://worker.example", API_KEY, {
+            "latency_budget": {"concurrency": 8, "ready": {"p99": 5000}},
+        })
+        budget = impl.budget("ready")
+
+        assert budget["concurrency"] == 8
+        assert budget["p99"] == 5000
+        assert budget["p50"] == PerformanceImplementations.LATENCY_BUDGET["ready"]["p50"]
+        assert budget["path"] == "/ready"
@@ -0,0 +1,154 @@
+"""
+Pytest tests for the async burst load generator and API_RATE_LIMIT
+
+Run: uv run pytest tools/security/tests/test_load_generator.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ValidationStatus
+from implementations.api_implementations import ApiImplementations
+from implementations.load_generator import jsonrpc_body, percentile, run_burst
+from standin_server import StandinConfig, StandinServer
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+API_KEY = "test-api-key-12345"
+AUTH = {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"}
+
+
+@pytest.fixture
+def limited():
+    """Stand-in that allows 10 requests per minute per key"""
+    with StandinServer(StandinConfig(api_key=API_KEY, rate_limit=10)) as server:
+        yield server
+
+
+@pytest.fixture
+def unlimited():
+    with StandinServer(StandinConfig(api_key=API_KEY)) as server:
+        yield server
+
+
+def mcp_burst(server, **kwargs):
+    return run_burst(f"{server.url}/mcp", method="POST", headers=AUTH,
+                     body=jsonrpc_body("tools/list"), **kwargs)
+
+
+# ============================================================================
+# Burst engine
+# ============================================================================
+
+class TestBurst:
+    """Pacing, 429 detection and header parsing"""
+
+    def test_first_429_index_and_headers(self, limited):
+        report = mcp_burst(limited, total=25, rate=500, concurrency=1)
+
+        first = report.first_429
+        assert first is not None
+        assert first.index == 10
+        assert report.status_counts() == {200: 10, 429: 15}
+        headers = report.rate_limit_headers()
+        assert headers["x-ratelimit-limit"] == "10"
+        assert headers["x-ratelimit-remaining"] == "0"
+        assert int(headers["retry-after"]) >= 1
+
+    def test_percentiles_split_at_first_429(self, limited):
+        report = mcp_burst(limited, total=30, rate=1000, concurrency=4)
+
+        before = report.latency_percentiles(before_throttling=True)
+        after = report.latency_percentiles(before_throttling=False)
+        assert set(before) == set(after) == {"p50", "p95", "p99"}
+        assert "first 429 at request #" in report.summary()
+
+    def test_requests_are_paced_at_the_offered_rate(self, unlimited):
+        report = mcp_burst(unlimited, total=21, rate=100, concurrency=8)
+
+        # 21 requests at 100 req/s are due over 0.2s; none may be sent early
+        assert all(r.sent >= r.scheduled - 0.005 for r in report.results)
+        assert report.results[-1].sent == pytest.approx(0.2, abs=0.1)
+        assert report.first_429 is None
+
+    def test_stop_after_throttled(self, limited):
+        report = mcp_burst(limited, total=200, rate=1000, concurrency=1,
+                           stop_after_throttled=5)
+
+        assert len(report.results) < 20
+        assert report.first_429 is not None
+
+    def test_unreachable_target_records_errors(self, closed_port):
+        report = run_burst(f"http://127.0.0.1:{closed_port}/", total=3, rate=100, timeout=1)
+
+        assert len(report.errors) == 3
+        assert report.status_counts() == {}
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            run_burst("ftp://example.com", total=1, rate=1)
+        with pytest.raises(ValueError):
+            run_burst("http://127.0.0.1/", total=1, rate=0)
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 0.5) == 50
+        assert percentile(values, 0.99) == 99
+        assert percentile([7], 0.95) == 7
+
+
+# ============================================================================
+# API_RATE_LIMIT claim
+# ============================================================================
+
+class TestApiRateLimitClaim:
+    """Claim outcomes for throttling, no throttling and unreachable workers"""
+
+    PROBE = {"requests": 40, "rate": 500, "concurrency": 4, "after_throttled": 5}
+
+    def test_pass_when_429_seen(self, limited):
+        impl = ApiImplementations(limited.url, API_KEY, {"rate_limit_probe": self.PROBE})
+        status, details = impl.test_api_rate_limit()
+
+        assert status == ValidationStatus.PASS
+        assert "first 429 at request #11" in details
+        assert "x-ratelimit-limit: 10" in details
+
+    def test_fail_without_rate_limiting(self, unlimited):
+        impl = ApiImplementations(unlimited.url, API_KEY, {"rate_limit_probe": self.PROBE})
+        status, details = impl.test_api_rate_limit()
+
+        assert status == ValidationStatus.FAIL
+        assert "No rate limiting detected" in details
+
+    def test_warn_when_api_key_rejected(self, unlimited):
+        impl = ApiImplementations(unlimited.url, "wrong-key", {"rate_limit_probe": self.PROBE})
+        status, details = impl.test_api_rate_limit()
+
+        assert status == ValidationStatus.WARN
+        assert "verification incomplete: the API key was rejected" in details
+        assert "No rate limiting detected" not in details
+
+    def test_warn_when_headers_but_no_429(self):
+        config = StandinConfig(api_key=API_KEY, rate_limit=1000)
+        with StandinServer(config) as server:
+            impl = ApiImplementations(server.url, API_KEY, {"rate_limit_probe": self.PROBE})
+            status, details = impl.test_api_rate_limit()
+
+        assert status == ValidationStatus.WARN
+        assert "x-ratelimit-limit: 1000" in details
+
+    def test_warn_when_unreachable(self, closed_port):
+        impl = ApiImplementations(f"http://127.0.0.1:{closed_port}", API_KEY,
+                                  {"rate_limit_probe": {"timeout": 1}})
+        status, details = impl.test_api_rate_limit()
+
+        assert status == ValidationStatus.WARN
+        assert "unreachable" in details
@@ -0,0 +1,264 @@
+"""
+Pytest tests for incremental log scanning with per-worker checkpoints
+
+Run: uv run pytest tools/security/tests/test_log_checkpoints.py -v
+"""
+
+import gzip
+import json
+import sys
+import threading
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ValidationStatus
+from implementations.log_checkpoints import CheckpointStore, scan_incremental
+from implementations.log_pipeline import LogPipeline
+from implementations.log_sources import LogpushSource
+from implementations.logging_implementations import LoggingImplementations
+from tests.conftest import log_entry, write_lines
+
+PATTERNS = LoggingImplementations.SENSITIVE_PATTERNS
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def noisy_entry(i):
+    """Clean entries with a leaked email every 37th and no level every 53rd"""
+    return log_entry(i, duration_ms=i % 500, email_every=37, no_level_every=53)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CheckpointStore(tmp_path / "checkpoints")
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    directory = tmp_path / "logs"
+    directory.mkdir()
+    return directory
+
+
+def full_scan(path):
+    return LogPipeline(PATTERNS).run(LogpushSource(path))
+
+
+# ============================================================================
+# Incremental scanning
+# ============================================================================
+
+class TestScanIncremental:
+    """Incremental runs must match a full rescan while reading only new data"""
+
+    def test_appended_lines_scanned_once(self, store, log_dir):
+        segment = log_dir / "current.log"
+        write_lines(segment, [noisy_entry(i) for i in range(200)])
+        source = LogpushSource(log_dir)
+
+        pipeline, scanned = scan_incremental(store, "resin", source, PATTERNS)
+        assert scanned == 200
+
+        write_lines(segment, [noisy_entry(i) for i in range(200, 350)])
+        pipeline, scanned = scan_incremental(store, "resin", source, PATTERNS)
+
+        assert scanned == 150
+        assert pipeline.to_dict()["structure"] == full_scan(log_dir).to_dict()["structure"]
+        assert pipeline.sensitive.scanner.counts == full_scan(log_dir).sensitive.scanner.counts
+        assert pipeline.result() == full_scan(log_dir).result()
+
+    def test_no_new_data_rescans_nothing(self, store, log_dir):
+        write_lines(log_dir / "a.log", [noisy_entry(i) for i in range(50)])
+        source = LogpushSource(log_dir)
+
+        first, _ = scan_incremental(store, "resin", source, PATTERNS)
+        second, scanned = scan_incremental(store, "resin", source, PATTERNS)
+
+        assert scanned == 0
+        assert second.records == first.records == 50
+
+    def test_partial_trailing_line_waits_for_completion(self, store, log_dir):
+        segment = log_dir / "current.log"
+        write_lines(segment, [noisy_entry(1)])
+        line = json.dumps(noisy_entry(2))
+        with open(segment, "a") as f:
+            f.write(line[:20])
+
+        _, scanned = scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS)
+        assert scanned == 1
+
+        with open(segment, "a") as f:
+            f.write(line[20:] + "\n")
+        pipeline, scanned = scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS)
+
+        assert scanned == 1
+        assert pipeline.structure.invalid_count == 0
+
+    def test_new_gzip_segments_only(self, store, log_dir):
+        with gzip.open(log_dir / "20251105T0700Z.log.gz", "wt") as f:
+            f.writelines(json.dumps(noisy_entry(i)) + "\n" for i in range(100))
+        scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS)
+
+        with gzip.open(log_dir / "20251105T0800Z.log.gz", "wt") as f:
+            f.writelines(json.dumps(noisy_entry(i)) + "\n" for i in range(100, 180))
+        pipeline, scanned = scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS)
+
+        assert scanned == 80
+        assert pipeline.to_dict()["metadata"] == full_scan(log_dir).to_dict()["metadata"]
+
+    def test_truncated_file_triggers_full_rescan(self, store, log_dir):
+        segment = log_dir / "current.log"
+        write_lines(segment, [noisy_entry(i) for i in range(100)])
+        scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS)
+
+        write_lines(segment, [noisy_entry(i) for i in range(10)], mode="w")
+        pipeline, scanned = scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS)
+
+        assert scanned == 10
+        assert pipeline.records == 10
+
+    def test_deleted_segment_is_no_longer_counted(self, store, log_dir):
+        write_lines(log_dir / "20251104.log", [noisy_entry(i) for i in range(1, 60)])
+        write_lines(log_dir / "20251105.log", [noisy_entry(i) for i in range(60, 100)])
+        scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS)
+
+        (log_dir / "20251104.log").unlink()  # Expired by retention
+        pipeline, scanned = scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS)
+
+        assert scanned == pipeline.records == 40
+        assert pipeline.to_dict()["structure"] == full_scan(log_dir).to_dict()["structure"]
+        assert pipeline.sensitive.scanner.counts == full_scan(log_dir).sensitive.scanner.counts
+
+    def test_changed_patterns_start_over(self, store, log_dir):
+        write_lines(log_dir / "a.log", [noisy_entry(i) for i in range(80)])
+        scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS)
+
+        patterns = {k: v for k, v in PATTERNS.items() if k != "email"}
+        pipeline, scanned = scan_incremental(store, "resin", LogpushSource(log_dir), patterns)
+
+        assert scanned == 80
+        assert "email" not in pipeline.sensitive.scanner.counts
+
+    def test_workers_have_separate_checkpoints(self, store, tmp_path):
+        for worker, count in (("resin", 30), ("evergreen", 70)):
+            directory = tmp_path / worker
+            directory.mkdir()
+            write_lines(directory / "a.log", [noisy_entry(i) for i in range(count)])
+            scan_incremental(store, worker, LogpushSource(directory), PATTERNS)
+
+        assert store.load("resin")["pipeline"]["structure"]["records"] == 30
+        assert store.load("evergreen")["pipeline"]["structure"]["records"] == 70
+
+    def test_changed_source_path_starts_over(self, store, tmp_path):
+        for name, count in (("old", 40), ("new", 15)):
+            directory = tmp_path / name
+            directory.mkdir()
+            write_lines(directory / "a.log", [noisy_entry(i) for i in range(count)])
+
+        scan_incremental(store, "resin", LogpushSource(tmp_path / "old"), PATTERNS)
+        pipeline, _ = scan_incremental(store, "resin", LogpushSource(tmp_path / "new"), PATTERNS)
+
+        assert pipeline.records == 15
+
+    def test_sharded_incremental_matches_full_scan(self, store, log_dir):
+        segment = log_dir / "current.log"
+        write_lines(segment, [noisy_entry(i) for i in range(300)])
+        scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS,
+                         processes=2, shard_bytes=4096)
+        write_lines(segment, [noisy_entry(i) for i in range(300, 600)])
+        pipeline, scanned = scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS,
+                                             processes=2, shard_bytes=4096)
+
+        assert scanned == 300
+        assert pipeline.to_dict()["structure"] == full_scan(log_dir).to_dict()["structure"]
+
+
+# ============================================================================
+# Checkpoint store
+# ============================================================================
+
+class TestCheckpointStore:
+    """Persistence behaviour of the checkpoint directory"""
+
+    def test_missing_and_corrupt_checkpoints_load_as_none(self, store):
+        assert store.load("resin") is None
+        store.directory.mkdir(parents=True)
+        store.path_for("resin").write_text("{not json")
+        assert store.load("resin") is None
+
+    def test_clear(self, store, log_dir):
+        write_lines(log_dir / "a.log", [noisy_entry(0)])
+        scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS)
+
+        assert store.clear("resin") is True
+        assert store.clear("resin") is False
+        assert store.load("resin") is None
+
+    def test_runs_for_a_worker_are_serialised(self, store, log_dir):
+        write_lines(log_dir / "a.log", [noisy_entry(1)])
+        done = threading.Event()
+
+        def scan():
+            scan_incremental(store, "resin", LogpushSource(log_dir), PATTERNS)
+            done.set()
+
+        with store.lock("resin"):
+            thread = threading.Thread(target=scan)
+            thread.start()
+            assert not done.wait(0.2)
+        thread.join(5)
+
+        assert done.is_set()
+        assert store.load("resin")["pipeline"]["structure"]["records"] == 1
+
+    def test_worker_names_are_sanitised(self, store):
+        assert store.path_for("../etc/passwd").parent == store.directory
+
+
+# ============================================================================
+# LoggingImplementations integration
+# ============================================================================
+
+class TestIncrementalLogWhatLogged:
+    """test_log_what_logged uses checkpoints when a worker name is known"""
+
+    def test_second_run_combines_stored_counters(self, tmp_path, log_dir):
+        segment = log_dir / "current.log"
+        write_lines(segment, [noisy_entry(i) for i in range(1, 30)])
+        config = {"logpush_path": str(log_dir), "log_checkpoint_dir": str(tmp_path / "state")}
+
+        impl = LoggingImplementations("https://example.workers.dev", "key", config, "resin")
+        status, _ = impl.test_log_what_logged()
+        assert status == ValidationStatus.PASS
+
+        # The leak lands in new data only; the stored counters carry the rest
+        write_lines(segment, [noisy_entry(37)])
+        status, details = impl.test_log_what_logged()
+
+        assert status == ValidationStatus.FAIL
+        assert "email (1x)" in details
+        assert CheckpointStore(tmp_path / "state").load("resin")["pipeline"]["structure"]["records"] == 30
+
+    def test_without_worker_name_nothing_is_persisted(self, tmp_path, log_dir):
+        write_lines(log_dir / "a.log", [noisy_entry(1)])
+        config = {"logpush_path": str(log_dir), "log_checkpoint_dir": str(tmp_path / "state")}
+
+        LoggingImplementations("https://example.workers.dev", "key", config).test_log_what_logged()
+
+        assert not (tmp_path / "state").exists()
+
+    def test_incremental_can_be_disabled(self, tmp_path, log_dir):
+        write_lines(log_dir / "a.log", [noisy_entry(1)])
+        config = {"logpush_path": str(log_dir), "log_checkpoint_dir": str(tmp_path / "state"),
+                  "log_incremental": False}
+
+        impl = LoggingImplementations("https://example.workers.dev", "key", config, "resin")
+        impl.test_log_what_logged()
+
+        assert impl.checkpoints is None
+        assert not (tmp_path / "state").exists()
@@ -0,0 +1,96 @@
+"""
+Pytest tests for the single-pass log evaluation pipeline
+
+Run: uv run pytest tools/security/tests/test_log_pipeline.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ValidationStatus
+from implementations.log_pipeline import LogPipeline
+from implementations.logging_implementations import LoggingImplementations
+from tests.conftest import log_entry
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+class CountingSource:
+    """Re-iterable list that counts how often it is walked"""
+
+    def __init__(self, logs):
+        self.logs = logs
+        self.passes = 0
+
+    def __iter__(self):
+        self.passes += 1
+        return iter(self.logs)
+
+
+@pytest.fixture
+def impl():
+    return LoggingImplementations("https://resin.mpazbot.workers.dev", "test-api-key-12345")
+
+
+CASES = {
+    "clean": [log_entry(i) for i in range(10)],
+    "bad_structure": [log_entry(0), {"message": "no timestamp"}, log_entry(2)],
+    "leak": [log_entry(0, message="call 555-123-4567")] + [log_entry(i) for i in range(5)],
+    "sparse_metadata": [{"timestamp": "t", "level": "info", "message": "m"}] * 5,
+    "structure_and_leak": [{"message": "jane.doe@example.org"}],
+}
+
+
+def three_pass(impl, logs):
+    """The original three-pass evaluation order"""
+    validation = impl._validate_log_structure(logs)
+    if validation[0] != ValidationStatus.PASS:
+        return validation
+    sensitive_check = impl._check_for_sensitive_data(logs)
+    if sensitive_check[0] != ValidationStatus.PASS:
+        return sensitive_check
+    return impl._verify_metadata_presence(logs)
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+class TestLogPipeline:
+    """LogPipeline parity with the three standalone checks"""
+
+    @pytest.mark.parametrize("case", sorted(CASES))
+    def test_matches_three_pass(self, impl, case):
+        logs = CASES[case]
+        fused = LogPipeline(impl.SENSITIVE_PATTERNS).run(logs).result()
+
+        assert fused == three_pass(impl, logs)
+
+    def test_early_fail_order(self, impl):
+        """Structure problems are reported before leaks, as before"""
+        status, details = LogPipeline(impl.SENSITIVE_PATTERNS).run(CASES["structure_and_leak"]).result()
+
+        assert status == ValidationStatus.WARN
+        assert "missing fields" in details
+
+    def test_single_pass_over_source(self, impl, monkeypatch):
+        source = CountingSource(CASES["clean"])
+        monkeypatch.setattr(impl, "_fetch_recent_logs", lambda limit=None: source)
+
+        status, details = impl.test_log_what_logged()
+
+        assert source.passes == 1
+        assert status == ValidationStatus.PASS
+        assert "10 logs" in details
+
+    def test_empty_source_warns(self, impl):
+        status, details = impl.test_log_what_logged()
+
+        assert status == ValidationStatus.WARN
+        assert "No logs available" in details
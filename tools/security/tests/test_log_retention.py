@@ -0,0 +1,225 @@
+"""
+Pytest tests for the Logpush retention boundary check (LOG_RETENTION_90)
+
+Run: uv run pytest tools/security/tests/test_log_retention.py -v
+"""
+
+import gzip
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ValidationStatus
+from implementations.log_retention import DAY, RetentionChecker, record_time
+from implementations.logging_implementations import LoggingImplementations
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+NOW = datetime(2026, 2, 1, 12, 0, tzinfo=timezone.utc)
+
+SEGMENTS_PER_DAY = 4
+RECORDS_PER_SEGMENT = 50
+STEP = timedelta(hours=24 / SEGMENTS_PER_DAY) / RECORDS_PER_SEGMENT
+
+
+def clock():
+    return NOW.timestamp()
+
+
+def build_archive(root, start, end=NOW, compress=False, named=True):
+    """
+    Day partitions of Logpush segments with one record every STEP from `start` to `end`
+
+    Returns the record times (epoch seconds).
+    """
+    times = []
+    moment = start
+    while moment < end:
+        day = root / moment.strftime("%Y%m%d")
+        day.mkdir(parents=True, exist_ok=True)
+        segment_end = min(moment + STEP * RECORDS_PER_SEGMENT, end)
+        if named:
+            name = f"{moment:%Y%m%dT%H%M%SZ}_{segment_end:%Y%m%dT%H%M%SZ}_a1b2c3d4.log"
+        else:
+            name = f"part-{len(list(day.iterdir())):04d}.log"
+        lines = []
+        while moment < segment_end:
+            lines.append(json.dumps({
+                "timestamp": moment.isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+                "level": "info",
+                "message": "Request completed",
+                "context": {"requestId": f"req_{len(times)}", "endpoint": "/mcp"},
+            }) + "\n")
+            times.append(moment.timestamp())
+            moment += STEP
+        if compress:
+            with gzip.open(day / (name + ".gz"), "wt") as f:
+                f.writelines(lines)
+        else:
+            (day / name).write_text("".join(lines))
+    return times
+
+
+def days_ago(days, hours=0):
+    return NOW - timedelta(days=days, hours=hours)
+
+
+def first_at_or_after(times, cutoff):
+    return min(t for t in times if t >= cutoff)
+
+
+# ============================================================================
+# Retention verdicts
+# ============================================================================
+
+class TestRetention:
+    """PASS, FAIL and WARN from the archive's edges"""
+
+    def test_ninety_days_pass(self, tmp_path):
+        times = build_archive(tmp_path, days_ago(90, hours=-1))
+
+        report = RetentionChecker(tmp_path, clock=clock).check(days=90)
+        status, details = report.result()
+
+        assert status == ValidationStatus.PASS
+        assert "90-day log retention holds" in details
+        assert report.oldest == times[0]
+        assert report.newest == times[-1]
+        assert report.partitions == 91
+        assert report.expired_partitions == []
+
+    def test_expired_logs_fail(self, tmp_path):
+        build_archive(tmp_path, days_ago(120))
+
+        report = RetentionChecker(tmp_path, clock=clock).check(days=90, grace_days=1)
+        status, details = report.result()
+
+        assert status == ValidationStatus.FAIL
+        assert "still exist" in details
+        assert 120 <= report.oldest_age_days < 120.1
+        assert report.expired_partitions[0] == days_ago(120).date().isoformat()
+        assert report.expired_partitions[-1] == days_ago(92).date().isoformat()
+
+    def test_within_grace_period_passes(self, tmp_path):
+        # Yesterday's deletion has not run yet: 90.5 days kept
+        build_archive(tmp_path, days_ago(90, hours=12))
+
+        status, _ = RetentionChecker(tmp_path, clock=clock).check(days=90).result()
+
+        assert status == ValidationStatus.PASS
+
+    def test_young_archive_warns(self, tmp_path):
+        build_archive(tmp_path, days_ago(30))
+
+        status, details = RetentionChecker(tmp_path, clock=clock).check(days=90).result()
+
+        assert status == ValidationStatus.WARN
+        assert "30.0 days old" in details
+
+    def test_empty_archive_warns(self, tmp_path):
+        (tmp_path / "20260101").mkdir()
+        (tmp_path / "20260101" / "empty.log").write_text("")
+
+        status, details = RetentionChecker(tmp_path, clock=clock).check().result()
+
+        assert status == ValidationStatus.WARN
+        assert "No timestamped log records" in details
+
+
+# ============================================================================
+# Boundary search
+# ============================================================================
+
+class TestBoundary:
+    """Bisection over partitions, segments and byte offsets"""
+
+    @pytest.mark.parametrize("compress,named", [(False, True), (True, True), (False, False)])
+    def test_first_record_after_cutoff(self, tmp_path, compress, named):
+        times = build_archive(tmp_path, days_ago(100), compress=compress, named=named)
+        checker = RetentionChecker(tmp_path, clock=clock)
+
+        for offset in (0, 1, 431, 6 * 3600 - 1, 6 * 3600, 13 * 3600 + 7):
+            cutoff = days_ago(90).timestamp() + offset
+            stamp, segment = checker.first_at_or_after(cutoff)
+            assert stamp == first_at_or_after(times, cutoff)
+            assert segment.parent.name == datetime.fromtimestamp(
+                stamp, timezone.utc).strftime("%Y%m%d")
+
+    def test_cutoff_after_newest(self, tmp_path):
+        build_archive(tmp_path, days_ago(3))
+
+        assert RetentionChecker(tmp_path).first_at_or_after(clock() + DAY) is None
+
+    def test_reads_a_handful_of_records(self, tmp_path):
+        build_archive(tmp_path, days_ago(90, hours=-1))
+        checker = RetentionChecker(tmp_path, clock=clock)
+
+        report = checker.check(days=90)
+
+        total = 90 * SEGMENTS_PER_DAY * RECORDS_PER_SEGMENT
+        assert report.records_read < 40
+        assert report.records_read < total / 100
+
+
+# ============================================================================
+# Records and layouts
+# ============================================================================
+
+class TestLayouts:
+    """Timestamps, partition names and unsupported layouts"""
+
+    def test_record_time(self):
+        expected = datetime(2025, 11, 5, 7, 19, 6, 947000, tzinfo=timezone.utc).timestamp()
+
+        assert record_time({"timestamp": "2025-11-05T07:19:06.947Z"}) == expected
+        assert record_time({"timestamp": "2025-11-05T07:19:06.947"}) == expected
+        assert record_time({"timestamp": expected}) == expected
+        assert record_time({"EventTimestampMs": expected * 1000}) == pytest.approx(expected)
+        assert record_time({"timestamp": "yesterday"}) is None
+        assert record_time({"message": "no time"}) is None
+
+    def test_partition_names(self, tmp_path):
+        for name in ("2026-01-03", "date=2026-01-01", "20260102", "notes", "20261399"):
+            (tmp_path / name).mkdir()
+        (tmp_path / "20260104T000000Z_20260104T010000Z_ffff.log").write_text("")
+        (tmp_path / "README.txt").write_text("")
+
+        partitions = RetentionChecker(tmp_path).partitions()
+
+        assert [p.name for p in partitions] == \
+            ["2026-01-01", "2026-01-02", "2026-01-03", "2026-01-04"]
+
+    def test_claim_reports_configuration_problems(self, tmp_path):
+        single = tmp_path / "logs.ndjson"
+        single.write_text(json.dumps({"timestamp": "2026-01-01T00:00:00Z"}) + "\n")
+
+        def claim(path):
+            config = {"logpush_path": str(path)} if path else {}
+            return LoggingImplementations("https://resin.example.dev", "key",
+                                          config).test_log_retention_90()
+
+        for path, message in ((None, "No Logpush archive configured"),
+                              (tmp_path / "missing", "not found"),
+                              (single, "date-partitioned")):
+            status, details = claim(path)
+            assert status == ValidationStatus.WARN
+            assert message in details
+
+    def test_claim_uses_configured_period(self, tmp_path):
+        now = datetime.now(timezone.utc)
+        build_archive(tmp_path, now - timedelta(days=40), end=now)
+        config = {"logpush_path": str(tmp_path), "log_retention": {"days": 30}}
+
+        status, details = LoggingImplementations(
+            "https://resin.example.dev", "key", config).test_log_retention_90()
+
+        assert status == ValidationStatus.FAIL
+        assert "30-day retention" in details
@@ -0,0 +1,115 @@
+"""
+Pytest tests for the compiled sensitive data scanner
+
+Run: uv run pytest tools/security/tests/test_log_scanner.py -v
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ValidationStatus
+from implementations.log_scanner import SensitiveDataScanner
+from implementations.logging_implementations import LoggingImplementations
+
+
+PATTERNS = LoggingImplementations.SENSITIVE_PATTERNS
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def sample_logs():
+    """Clean createLogger entries mixed with leaking ones"""
+    clean = {
+        "timestamp": "2025-11-05T07:19:06.947Z",
+        "level": "info",
+        "message": "Request completed",
+        "context": {"requestId": "req_1730791146947_k2j3h4g5f", "endpoint": "/mcp", "method": "POST"},
+        "data": {"statusCode": 200, "durationMs": 11},
+    }
+    leaky = [
+        {"message": "donor contact jane.doe@example.org"},
+        {"message": "password: 123-45-6789"},  # password span overlaps the SSN
+        {"message": "client 192.168.10.20 called from 555-123-4567"},
+        {"message": "authorization: abcdefghijklmnopqrstuvwxyz012345"},
+        {"message": "card 4111111111111111 declined", "first_name": "x"},
+    ]
+    return [clean] * 20 + leaky
+
+
+def naive_counts(logs):
+    """Original per-pattern re.search implementation"""
+    counts = {}
+    for log in logs:
+        log_str = json.dumps(log)
+        for name, pattern in PATTERNS.items():
+            if re.search(pattern, log_str, re.IGNORECASE):
+                counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+class TestSensitiveDataScanner:
+    """SensitiveDataScanner attribution and throughput"""
+
+    def test_matches_naive_scan(self, sample_logs):
+        """Single-pass scanning attributes the same hits as one search per pattern"""
+        scanner = SensitiveDataScanner(PATTERNS)
+        for log in sample_logs:
+            scanner.scan_record(log)
+
+        assert scanner.counts == naive_counts(sample_logs)
+        assert list(scanner.counts) == list(naive_counts(sample_logs))
+
+    def test_overlapping_patterns_reported(self):
+        """A pattern hidden inside another pattern's match is still found"""
+        scanner = SensitiveDataScanner(PATTERNS)
+
+        assert scanner.matches("password: 123-45-6789") == ["ssn", "password"]
+
+    def test_clean_text_has_no_hits(self):
+        scanner = SensitiveDataScanner(PATTERNS)
+
+        assert scanner.scan('{"level": "info", "message": "ok"}') == []
+        assert scanner.counts == {}
+        assert scanner.records == 1
+
+    def test_throughput_reported(self, sample_logs):
+        scanner = SensitiveDataScanner(PATTERNS)
+        assert scanner.throughput_mb_s is None
+
+        for log in sample_logs:
+            scanner.scan_record(log)
+
+        assert scanner.bytes_scanned == sum(len(json.dumps(log)) for log in sample_logs)
+        assert scanner.throughput_mb_s > 0
+
+
+class TestCheckForSensitiveData:
+    """LoggingImplementations._check_for_sensitive_data on the compiled scanner"""
+
+    def test_leaks_fail(self, sample_logs):
+        impl = LoggingImplementations("https://resin.mpazbot.workers.dev", "test-api-key-12345")
+        status, details = impl._check_for_sensitive_data(sample_logs)
+
+        assert status == ValidationStatus.FAIL
+        assert "email (1x)" in details
+        assert "ssn (1x)" in details
+
+    def test_clean_logs_pass(self, sample_logs):
+        impl = LoggingImplementations("https://resin.mpazbot.workers.dev", "test-api-key-12345")
+        status, details = impl._check_for_sensitive_data(sample_logs[:20])
+
+        assert status == ValidationStatus.PASS
+        assert "MB/s" in details
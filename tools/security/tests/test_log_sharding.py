@@ -0,0 +1,90 @@
+"""
+Pytest tests for multi-core sharded log scanning
+
+Run: uv run pytest tools/security/tests/test_log_sharding.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ValidationStatus
+from implementations.log_pipeline import LogPipeline
+from implementations.log_sharding import iter_shard, plan_shards, scan_sharded
+from implementations.log_sources import LogpushSource, iter_ndjson
+from implementations.logging_implementations import LoggingImplementations
+from tests.conftest import log_entry, write_lines
+
+PATTERNS = LoggingImplementations.SENSITIVE_PATTERNS
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def noisy_entry(i):
+    """Mostly clean entries with periodic leaks and broken records"""
+    return log_entry(i, duration_ms=i % 500, email_every=97, phone_every=151,
+                     no_level_every=211)
+
+
+@pytest.fixture
+def logpush_dir(tmp_path):
+    root = tmp_path / "logpush"
+    write_lines(root / "20251105" / "a.log",
+                [noisy_entry(i) for i in range(3000)] + ["{truncated"])
+    write_lines(root / "20251106" / "b.log.gz",
+                [noisy_entry(i) for i in range(3000, 4000)], compress=True)
+    return root
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+class TestShardPlanning:
+    """Byte-range shards cover every record exactly once"""
+
+    def test_byte_ranges_partition_records(self, logpush_dir):
+        plain = logpush_dir / "20251105" / "a.log"
+        shards = plan_shards([plain], shard_bytes=4096)
+
+        assert len(shards) > 10
+        sharded = [r for shard in shards for r in iter_shard(shard)]
+        assert sharded == list(iter_ndjson(plain))
+
+    def test_gzip_is_one_shard(self, logpush_dir):
+        gz = logpush_dir / "20251106" / "b.log.gz"
+
+        assert len(plan_shards([gz], shard_bytes=10)) == 1
+
+
+class TestScanSharded:
+    """Merged shard results equal a serial run"""
+
+    @pytest.mark.parametrize("processes", [1, 3])
+    def test_matches_serial(self, logpush_dir, processes):
+        source = LogpushSource(logpush_dir)
+        serial = LogPipeline(PATTERNS).run(source)
+        sharded = scan_sharded(source.files(), PATTERNS, processes=processes, shard_bytes=8192)
+
+        assert sharded.records == serial.records
+        assert sharded.structure.invalid_count == serial.structure.invalid_count
+        assert sharded.structure.examples == serial.structure.examples
+        assert sharded.sensitive.scanner.counts == serial.sensitive.scanner.counts
+        assert list(sharded.sensitive.scanner.counts) == list(serial.sensitive.scanner.counts)
+        assert sharded.metadata.fields == serial.metadata.fields
+        assert sharded.result() == serial.result()
+
+    def test_log_what_logged_uses_processes(self, logpush_dir):
+        config = {"logpush_path": str(logpush_dir)}
+        serial = LoggingImplementations("https://r", "k", config).test_log_what_logged()
+        sharded = LoggingImplementations(
+            "https://r", "k", dict(config, log_scan_processes=2)
+        ).test_log_what_logged()
+
+        assert sharded == serial
+        assert sharded[0] == ValidationStatus.WARN
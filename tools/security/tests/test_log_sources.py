@@ -0,0 +1,112 @@
+"""
+Pytest tests for streaming Logpush log sources
+
+Run: uv run pytest tools/security/tests/test_log_sources.py -v
+"""
+
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ClaimTester, ValidationStatus
+from implementations.log_sources import LogpushSource, iter_ndjson
+from implementations.logging_implementations import LoggingImplementations
+from tests.conftest import log_entry, write_lines
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def logpush_dir(tmp_path):
+    """Two date partitions, one plain and one gzip segment"""
+    root = tmp_path / "logpush"
+    write_lines(root / "20251106" / "20251106T000000Z_20251106T010000Z_b.log.gz",
+                  [log_entry(i) for i in range(10, 20)], compress=True)
+    write_lines(root / "20251105" / "20251105T000000Z_20251105T010000Z_a.log",
+                  [log_entry(i) for i in range(10)])
+    (root / "README.txt").write_text("not a log segment")
+    return root
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+class TestLogpushSource:
+    """LogpushSource file discovery and parsing"""
+
+    def test_directory_in_time_order(self, logpush_dir):
+        source = LogpushSource(logpush_dir)
+
+        assert [p.name[:8] for p in source.files()] == ["20251105", "20251106"]
+        assert [r["context"]["requestId"] for r in source] == [f"req_{i}" for i in range(20)]
+
+    def test_re_iterable_with_limit(self, logpush_dir):
+        source = LogpushSource(logpush_dir, limit=5)
+
+        assert len(list(source)) == 5
+        assert len(list(source)) == 5
+        assert bool(source)
+
+    def test_malformed_and_trace_events(self, tmp_path):
+        trace_event = {
+            "Event": {"RayID": "abc"},
+            "Logs": [{"Level": "log", "Message": [json.dumps(log_entry(1))]},
+                     {"Level": "log", "Message": ["plain console text"]}],
+        }
+        path = write_lines(tmp_path / "mixed.ndjson", [trace_event, "{not json", "", log_entry(2)])
+
+        records = list(iter_ndjson(path))
+
+        assert records[0]["context"]["requestId"] == "req_1"
+        assert records[1] == {"_malformed": "plain console text"}
+        assert records[2] == {"_malformed": "{not json"}
+        assert records[3]["context"]["requestId"] == "req_2"
+
+    def test_missing_path(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            LogpushSource(tmp_path / "nope").files()
+
+    def test_constant_memory(self, tmp_path):
+        """Memory does not grow with the number of records streamed"""
+        path = write_lines(tmp_path / "big.log.gz", (log_entry(i) for i in range(20000)),
+                             compress=True)
+        impl = LoggingImplementations("https://resin.mpazbot.workers.dev", "test-api-key-12345",
+                                      {"logpush_path": str(path)})
+
+        tracemalloc.start()
+        status, _ = impl._verify_metadata_presence(impl._fetch_recent_logs())
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert status == ValidationStatus.PASS
+        assert peak < 2_000_000  # 20k materialised records would be several MB
+
+
+class TestLogWhatLoggedFromLogpush:
+    """LOG_WHAT_LOGGED against a configured logpush_path"""
+
+    def test_clean_logs_pass(self, logpush_dir):
+        tester = ClaimTester("https://resin.mpazbot.workers.dev", "test-api-key-12345",
+                             {"logpush_path": str(logpush_dir)})
+        status, details = tester.test_log_what_logged()
+
+        assert status == ValidationStatus.PASS
+        assert "20 logs" in details
+
+    def test_leaked_pii_fails(self, logpush_dir):
+        write_lines(logpush_dir / "20251107" / "20251107T000000Z_20251107T010000Z_c.log",
+                      [log_entry(99, message="donor jane.doe@example.org")])
+        impl = LoggingImplementations("https://resin.mpazbot.workers.dev", "test-api-key-12345",
+                                      {"logpush_path": str(logpush_dir)})
+        status, details = impl.test_log_what_logged()
+
+        assert status == ValidationStatus.FAIL
+        assert "email (1x)" in details
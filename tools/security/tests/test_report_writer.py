@@ -0,0 +1,215 @@
+"""
+Pytest tests for the streaming report writer
+
+Run: uv run pytest tools/security/tests/test_report_writer.py -v
+"""
+
+import io
+import json
+import re
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import validator
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import report_writer
+from claim_tests import ValidationStatus
+from fleet import WorkerValidation, generate_fleet_report, write_fleet_report
+from report_writer import (
+    JsonReportRenderer, MarkdownChecklistRenderer, MarkdownReportRenderer,
+    NdjsonResultStream, atomic_report, save_reports,
+)
+from standin_server import StandinConfig, StandinServer
+from validator import ResinSecurityValidator
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def validator():
+    """Validator with a few results applied"""
+    validator = ResinSecurityValidator()
+    validator.apply_results({
+        "ENC_TLS_TRANSIT": (ValidationStatus.PASS, "Negotiated TLSv1.3"),
+        "API_RATE_LIMIT": (ValidationStatus.FAIL, 'No rate limiting "detected"'),
+    })
+    return validator
+
+
+class RecordingStream(io.StringIO):
+    """StringIO that remembers how many writes it received"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def without_timestamp(text):
+    return re.sub(r"Generated: .*", "Generated: -", text)
+
+
+# ============================================================================
+# Renderers
+# ============================================================================
+
+class TestRenderers:
+    """Several formats from one pass, identical to the single-format output"""
+
+    def test_one_pass_matches_individual_reports(self, validator):
+        report, checklist, data = io.StringIO(), io.StringIO(), io.StringIO()
+        validator.write_report(MarkdownReportRenderer(report),
+                               MarkdownChecklistRenderer(checklist),
+                               JsonReportRenderer(data))
+
+        assert without_timestamp(report.getvalue()) == \
+            without_timestamp(validator.generate_compliance_report())
+        assert without_timestamp(checklist.getvalue()) == \
+            without_timestamp(validator.generate_validation_checklist())
+        assert json.loads(data.getvalue())["summary"]["total"] == len(validator.claims)
+
+    def test_json_report(self, validator):
+        data = io.StringIO()
+        validator.write_report(JsonReportRenderer(data))
+        report = json.loads(data.getvalue())
+
+        claims = {claim["id"]: claim for category in report["categories"]
+                  for claim in category["claims"]}
+        assert set(claims) == set(validator.claims)
+        assert claims["API_RATE_LIMIT"]["status"] == "FAIL"
+        assert claims["API_RATE_LIMIT"]["details"] == 'No rate limiting "detected"'
+        assert report["summary"]["by_status"]["✅ PASS"] == 1
+        assert [c["name"] for c in report["categories"]][-1] == "Performance"
+
+    def test_sections_are_written_incrementally(self, validator):
+        stream = RecordingStream()
+        validator.write_report(MarkdownChecklistRenderer(stream))
+
+        # Several writes per claim rather than one report-sized string
+        assert stream.writes > len(validator.claims) * 5
+
+    def test_markdown_contents(self, validator):
+        report = validator.generate_compliance_report()
+
+        assert "Total Claims: 26" in report
+        assert "- [✅ PASS] TLS 1.2+ encryption for data in transit" in report
+        assert validator.generate_test_script_template().startswith("#!/bin/bash\n")
+
+
+# ============================================================================
+# Files
+# ============================================================================
+
+class TestSaveReports:
+    """Atomic per-format report files"""
+
+    def test_all_formats_written(self, validator, tmp_path):
+        paths = save_reports("resin", validator, ("md", "checklist", "json"), directory=tmp_path)
+
+        assert paths["md"].name.endswith(".md") and paths["md"].name.startswith("resin-security-")
+        assert paths["checklist"].name.endswith(".checklist.md")
+        json.loads(paths["json"].read_text())
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(p.name for p in paths.values())
+        assert paths["md"].stat().st_mode & 0o777 == 0o644
+
+    def test_unknown_format_rejected(self, validator, tmp_path):
+        with pytest.raises(ValueError):
+            save_reports("resin", validator, ("pdf",), directory=tmp_path)
+
+    def test_failed_render_keeps_previous_report(self, validator, tmp_path):
+        path = tmp_path / "report.md"
+        path.write_text("previous")
+
+        with pytest.raises(RuntimeError):
+            with atomic_report(path) as stream:
+                stream.write("partial")
+                raise RuntimeError("boom")
+
+        assert path.read_text() == "previous"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_validate_worker_writes_requested_formats(self, monkeypatch, tmp_path):
+        from fleet import validate_worker
+
+        monkeypatch.setattr(report_writer, "REPORTS_DIR", tmp_path)
+        with StandinServer(StandinConfig(api_key="key")) as server:
+            config = {"url": server.url, "name": "Stand-in",
+                      "rate_limit_probe": {"requests": 5, "rate": 100}}
+            result = validate_worker("standin", config, "key", report_formats=("md", "json"))
+
+        assert set(result.report_paths) == {"md", "json"}
+        assert result.report_path == result.report_paths["md"]
+        assert Path(result.report_paths["json"]).exists()
+
+
+class TestFleetReport:
+    """Streaming fleet rollup"""
+
+    def test_stream_matches_string(self):
+        results = [
+            WorkerValidation(f"tenant{i}", f"Tenant {i}", f"https://t{i}", {"✅ PASS": i}, 1.0)
+            for i in range(50)
+        ]
+        stream = RecordingStream()
+        write_fleet_report(results, stream)
+
+        assert without_timestamp(stream.getvalue()) == \
+            without_timestamp(generate_fleet_report(results))
+        assert stream.writes > len(results)
+
+
+class TestNdjsonResults:
+    """Per-claim NDJSON records streamed as claims complete"""
+
+    def test_record_per_claim_then_summary(self):
+        stream = RecordingStream()
+        results = NdjsonResultStream(stream)
+        results.claim("resin", "API_RATE_LIMIT", (ValidationStatus.FAIL, "No 429"), 1.23456,
+                      False)
+        first = json.loads(stream.getvalue())
+        results.claim("resin", "ENC_TLS_TRANSIT", (ValidationStatus.PASS, "TLSv1.3"), None, True)
+        results.summary(status="success", worker="resin")
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+
+        assert first["type"] == "claim" and first["status"] == "FAIL"
+        assert first["duration"] == 1.235 and first["cached"] is False
+        assert records[1]["duration"] is None and records[1]["cached"] is True
+        assert records[2] == {"type": "summary", "claims": 2,
+                              "by_status": {"FAIL": 1, "PASS": 1},
+                              "status": "success", "worker": "resin"}
+
+    def test_validator_ndjson_output(self, monkeypatch, tmp_path, capsys):
+        import validator
+
+        monkeypatch.setattr(report_writer, "REPORTS_DIR", tmp_path)
+        monkeypatch.setenv("STANDIN_API_KEY", "key")
+        with StandinServer(StandinConfig(api_key="key")) as server:
+            deployments = {"standin": {
+                "url": server.url, "name": "Stand-in", "api_key_env": "STANDIN_API_KEY",
+                "rate_limit_probe": {"requests": 5, "rate": 100},
+            }}
+            monkeypatch.setattr(validator, "load_deployments_config", lambda: deployments)
+            monkeypatch.setattr(sys, "argv", [
+                "validator.py", "--worker", "standin", "--output", "ndjson", "--no-cache",
+                "--no-history", "--jobs", "4",
+            ])
+            validator.main()
+
+        captured = capsys.readouterr()
+        records = [json.loads(line) for line in captured.out.splitlines()]
+        claims = [r for r in records if r["type"] == "claim"]
+
+        assert len(claims) == 26
+        assert {r["worker"] for r in claims} == {"standin"}
+        assert all(r["duration"] is not None and not r["cached"] for r in claims)
+        assert records[-1]["type"] == "summary"
+        assert records[-1]["claims"] == 26
+        assert records[-1]["worker"] == "standin"
+        assert "Running Claim Tests" in captured.err
@@ -0,0 +1,211 @@
+"""
+Pytest tests for the TTL-based claim result cache
+
+Run: uv run pytest tools/security/tests/test_result_cache.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import claim_tests
+from claim_tests import ValidationStatus, run_all_tests
+from executor import ClaimExecutor
+from result_cache import DAY, HOUR, ResultCache
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+URL = "https://resin.mpazbot.workers.dev"
+
+
+class FakeClock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "cache" / "resin.json"
+
+
+@pytest.fixture
+def cache(cache_path, clock):
+    return ResultCache(cache_path, worker_url=URL, clock=clock)
+
+
+@pytest.fixture
+def counting_claims(monkeypatch):
+    """Replace get_claim_tests with claims that count their invocations"""
+    calls = {}
+
+    def make(claim_id, status):
+        def claim():
+            calls[claim_id] = calls.get(claim_id, 0) + 1
+            return (status, f"{claim_id} probed")
+        return claim
+
+    claims = {
+        "COMPLIANCE_SOC2": make("COMPLIANCE_SOC2", ValidationStatus.MANUAL),
+        "API_RATE_LIMIT": make("API_RATE_LIMIT", ValidationStatus.PASS),
+        "ENC_TLS_TRANSIT": make("ENC_TLS_TRANSIT", ValidationStatus.WARN),
+        "LOG_WHAT_LOGGED": make("LOG_WHAT_LOGGED", ValidationStatus.PASS),
+    }
+    monkeypatch.setattr(claim_tests, "get_claim_tests", lambda tester: dict(claims))
+    return calls
+
+
+# ============================================================================
+# TTLs
+# ============================================================================
+
+class TestTTL:
+    """TTL lookup by claim ID, then category prefix"""
+
+    def test_category_defaults(self, cache):
+        assert cache.ttl("COMPLIANCE_GDPR") == 30 * DAY
+        assert cache.ttl("API_CORS_HEADERS") == HOUR
+        assert cache.ttl("LOG_WHAT_LOGGED") == 0
+
+    def test_overrides_take_precedence(self, cache_path):
+        cache = ResultCache(cache_path, ttls={"API": 60, "API_CORS_HEADERS": 5})
+        assert cache.ttl("API_RATE_LIMIT") == 60
+        assert cache.ttl("API_CORS_HEADERS") == 5
+
+    def test_entries_expire(self, cache, clock):
+        cache.update({"API_RATE_LIMIT": (ValidationStatus.PASS, "ok")})
+        assert "API_RATE_LIMIT" in cache.lookup(["API_RATE_LIMIT"])
+
+        clock.now += HOUR
+        assert cache.lookup(["API_RATE_LIMIT"]) == {}
+
+
+# ============================================================================
+# Storage and invalidation
+# ============================================================================
+
+class TestResultCache:
+    """Which results are cached and how entries are dropped"""
+
+    def test_only_settled_results_are_cached(self, cache):
+        cache.update({
+            "COMPLIANCE_SOC2": (ValidationStatus.MANUAL, "attested"),
+            "ENC_TLS_TRANSIT": (ValidationStatus.WARN, "Claim timed out after 5s"),
+            "AUTH_OAUTH_PKCE": (ValidationStatus.PENDING, "not implemented"),
+            "LOG_WHAT_LOGGED": (ValidationStatus.PASS, "no PII"),
+        })
+        assert list(cache.lookup(["COMPLIANCE_SOC2", "ENC_TLS_TRANSIT",
+                                   "AUTH_OAUTH_PKCE", "LOG_WHAT_LOGGED"])) == ["COMPLIANCE_SOC2"]
+
+    def test_uncacheable_result_replaces_stale_entry(self, cache):
+        cache.update({"API_RATE_LIMIT": (ValidationStatus.PASS, "ok")})
+        cache.update({"API_RATE_LIMIT": (ValidationStatus.WARN, "unreachable")})
+        assert cache.lookup(["API_RATE_LIMIT"]) == {}
+
+    def test_round_trip(self, cache, cache_path, clock):
+        cache.update({"COMPLIANCE_GDPR": (ValidationStatus.MANUAL, "DPA signed")})
+        cache.save()
+
+        reloaded = ResultCache(cache_path, worker_url=URL, clock=clock)
+        assert reloaded.lookup(["COMPLIANCE_GDPR"]) == {
+            "COMPLIANCE_GDPR": (ValidationStatus.MANUAL, "DPA signed")
+        }
+
+    def test_stale_entries_on_request(self, cache, clock):
+        cache.update({"API_RATE_LIMIT": (ValidationStatus.PASS, "ok")})
+        clock.now += 2 * HOUR
+
+        assert cache.lookup(["API_RATE_LIMIT"]) == {}
+        assert cache.lookup(["API_RATE_LIMIT"], fresh_only=False) == {
+            "API_RATE_LIMIT": (ValidationStatus.PASS, "ok")
+        }
+
+    def test_changed_url_discards_entries(self, cache, cache_path):
+        cache.update({"COMPLIANCE_GDPR": (ValidationStatus.MANUAL, "DPA signed")})
+        cache.save()
+
+        assert len(ResultCache(cache_path, worker_url="https://other.workers.dev")) == 0
+
+    def test_invalidate_by_claim_and_category(self, cache):
+        cache.update({
+            "API_RATE_LIMIT": (ValidationStatus.PASS, "ok"),
+            "API_CORS_HEADERS": (ValidationStatus.PASS, "ok"),
+            "COMPLIANCE_SOC2": (ValidationStatus.MANUAL, "ok"),
+            "COMPLIANCE_GDPR": (ValidationStatus.MANUAL, "ok"),
+        })
+
+        assert sorted(cache.invalidate(["api", "COMPLIANCE_SOC2"])) == [
+            "API_CORS_HEADERS", "API_RATE_LIMIT", "COMPLIANCE_SOC2"
+        ]
+        assert cache.invalidate() == ["COMPLIANCE_GDPR"]
+        assert len(cache) == 0
+
+    def test_corrupt_file_starts_empty(self, cache_path):
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text("{not json")
+        assert len(ResultCache(cache_path)) == 0
+
+
+# ============================================================================
+# run_all_tests integration
+# ============================================================================
+
+class TestRunAllTestsWithCache:
+    """Fresh claims are served from the cache instead of being re-probed"""
+
+    def test_second_run_only_probes_uncached_claims(self, cache, counting_claims):
+        run_all_tests(URL, "key", cache=cache)
+
+        executor = ClaimExecutor()
+        results = run_all_tests(URL, "key", executor=executor, cache=cache)
+
+        assert counting_claims == {
+            "COMPLIANCE_SOC2": 1,
+            "API_RATE_LIMIT": 1,
+            "ENC_TLS_TRANSIT": 2,
+            "LOG_WHAT_LOGGED": 2,
+        }
+        assert list(results) == ["COMPLIANCE_SOC2", "API_RATE_LIMIT",
+                                 "ENC_TLS_TRANSIT", "LOG_WHAT_LOGGED"]
+        assert results["COMPLIANCE_SOC2"] == (ValidationStatus.MANUAL, "COMPLIANCE_SOC2 probed")
+        assert executor.report.cached == ["COMPLIANCE_SOC2", "API_RATE_LIMIT"]
+        assert "2 cached" in executor.report.summary()
+
+    def test_stale_claims_are_reprobed(self, cache, clock, counting_claims):
+        run_all_tests(URL, "key", cache=cache)
+        clock.now += 2 * HOUR
+        run_all_tests(URL, "key", cache=cache)
+
+        assert counting_claims["API_RATE_LIMIT"] == 2
+        assert counting_claims["COMPLIANCE_SOC2"] == 1
+
+    def test_results_persist_between_processes(self, cache, cache_path, clock, counting_claims):
+        run_all_tests(URL, "key", cache=cache)
+        run_all_tests(URL, "key", cache=ResultCache(cache_path, worker_url=URL, clock=clock))
+
+        assert counting_claims["COMPLIANCE_SOC2"] == 1
+
+    def test_cached_results_reported_first(self, cache, counting_claims):
+        run_all_tests(URL, "key", cache=cache)
+        reported = []
+        run_all_tests(URL, "key", cache=cache, on_result=lambda *args: reported.append(args))
+
+        assert [(claim_id, cached) for claim_id, _, _, cached in reported] == [
+            ("COMPLIANCE_SOC2", True), ("API_RATE_LIMIT", True),
+            ("ENC_TLS_TRANSIT", False), ("LOG_WHAT_LOGGED", False),
+        ]
+        assert reported[0][2] is None
+        assert reported[2][2] is not None
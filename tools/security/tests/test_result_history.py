@@ -0,0 +1,209 @@
+"""
+Pytest tests for the SQLite claim result history
+
+Run: uv run pytest tools/security/tests/test_result_history.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import result_history
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ValidationStatus
+from result_history import DAY, ResultHistory, main
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+NOW = 1_790_000_000.0  # 2026-09-21 (UTC)
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultHistory(tmp_path / "history.sqlite3", clock=lambda: NOW) as store:
+        yield store
+
+
+def run(store, worker, statuses, days_ago, **kwargs):
+    """Record one run of {claim_id: ValidationStatus} `days_ago` days before NOW"""
+    results = {claim_id: (status, f"{claim_id} {status.name.lower()}")
+               for claim_id, status in statuses.items()}
+    return store.record_run(worker, f"https://{worker}.example.dev", results,
+                            checked_at=NOW - days_ago * DAY, **kwargs)
+
+
+PASS, FAIL, WARN = ValidationStatus.PASS, ValidationStatus.FAIL, ValidationStatus.WARN
+
+
+# ============================================================================
+# Recording and queries
+# ============================================================================
+
+class TestRecording:
+    """Runs are appended and read back"""
+
+    def test_record_run(self, store):
+        run_id = run(store, "resin", {"API_RATE_LIMIT": FAIL, "ENC_TLS_TRANSIT": PASS}, 0,
+                     durations={"API_RATE_LIMIT": 1.5}, cached=["ENC_TLS_TRANSIT"],
+                     wall_time=2.0)
+
+        latest = store.latest("resin")
+        assert len(store) == 2
+        assert latest["API_RATE_LIMIT"].run_id == run_id
+        assert latest["API_RATE_LIMIT"].status == "FAIL"
+        assert latest["API_RATE_LIMIT"].duration == 1.5
+        assert not latest["API_RATE_LIMIT"].cached
+        assert latest["ENC_TLS_TRANSIT"].cached
+        assert latest["ENC_TLS_TRANSIT"].duration is None
+        assert latest["ENC_TLS_TRANSIT"].checked == "2026-09-21T14:13:20+00:00"
+
+    def test_persists_across_connections(self, tmp_path):
+        path = tmp_path / "history.sqlite3"
+        with ResultHistory(path) as first:
+            first.record_run("resin", None, {"API_RATE_LIMIT": (PASS, "ok")})
+        with ResultHistory(path) as second:
+            assert second.latest("resin")["API_RATE_LIMIT"].details == "ok"
+
+    def test_newer_schema_rejected(self, tmp_path):
+        path = tmp_path / "history.sqlite3"
+        ResultHistory(path).close()
+        import sqlite3
+        with sqlite3.connect(path) as db:
+            db.execute("PRAGMA user_version = 99")
+
+        with pytest.raises(RuntimeError, match="newer"):
+            ResultHistory(path)
+
+
+class TestQueries:
+    """first-failure, trend, history and latest"""
+
+    def test_first_failure(self, store):
+        run(store, "resin", {"API_RATE_LIMIT": PASS}, 30)
+        run(store, "resin", {"API_RATE_LIMIT": FAIL}, 20)
+        run(store, "evergreen", {"API_RATE_LIMIT": FAIL}, 25)
+        run(store, "resin", {"API_RATE_LIMIT": FAIL}, 10)
+
+        assert store.first("API_RATE_LIMIT", worker="resin").checked_at == NOW - 20 * DAY
+        assert store.first("API_RATE_LIMIT").worker == "evergreen"
+        assert store.first("API_RATE_LIMIT", since=NOW - 15 * DAY).checked_at == NOW - 10 * DAY
+        assert store.first("API_RATE_LIMIT", status="warn") is None
+
+    def test_trend(self, store):
+        run(store, "resin", {"A": PASS, "B": PASS}, 100)  # Outside the window
+        run(store, "resin", {"A": PASS, "B": FAIL}, 2)
+        run(store, "resin", {"A": WARN, "B": FAIL}, 2)
+        run(store, "resin", {"A": PASS, "B": PASS}, 1)
+        run(store, "evergreen", {"A": FAIL}, 1)
+
+        assert store.trend("resin", days=90) == [
+            ("2026-09-19", {"FAIL": 2, "PASS": 1, "WARN": 1}),
+            ("2026-09-20", {"PASS": 2}),
+        ]
+        assert store.trend("resin", days=90, claim_id="B") == [
+            ("2026-09-19", {"FAIL": 2}),
+            ("2026-09-20", {"PASS": 1}),
+        ]
+
+    def test_cached_results_are_not_counted(self, store):
+        run(store, "resin", {"A": FAIL}, 5)
+        run(store, "resin", {"A": FAIL}, 1, cached=["A"])  # The day-5 result, reused
+        run(store, "resin", {"B": FAIL}, 1, cached=["B"])
+
+        assert store.first("A").checked_at == NOW - 5 * DAY
+        assert store.first("B") is None
+        assert store.first("B", include_cached=True).cached
+        assert store.trend("resin") == [("2026-09-16", {"FAIL": 1})]
+        assert store.trend("resin", include_cached=True)[-1] == ("2026-09-20", {"FAIL": 2})
+
+    def test_history_newest_first(self, store):
+        for days_ago, status in [(3, PASS), (2, FAIL), (1, WARN)]:
+            run(store, "resin", {"A": status}, days_ago)
+
+        assert [e.status for e in store.history("resin", "A")] == ["WARN", "FAIL", "PASS"]
+        assert [e.status for e in store.history("resin", "A", limit=1)] == ["WARN"]
+        assert len(store.history("resin", "A", since=NOW - 2.5 * DAY)) == 2
+
+    def test_latest_is_per_claim(self, store):
+        run(store, "resin", {"A": FAIL, "B": FAIL}, 2)
+        run(store, "resin", {"A": PASS}, 1)
+
+        latest = store.latest("resin")
+        assert {claim: entry.status for claim, entry in latest.items()} == \
+            {"A": "PASS", "B": "FAIL"}
+
+    def test_large_history_queries_use_indexes(self, store):
+        """90 days x 50 workers x 26 claims, each query an index search"""
+        claims = [f"CLAIM_{n}" for n in range(26)]
+        for day in range(90):
+            for worker in range(50):
+                status = FAIL if (day + worker) % 7 == 0 else PASS
+                run(store, f"tenant{worker}", dict.fromkeys(claims, status), day)
+        assert len(store) == 90 * 50 * 26
+
+        first = store.first("CLAIM_3", worker="tenant10")
+        trend = store.trend("tenant10", days=90)
+        history = store.history("tenant10", "CLAIM_3", limit=100)
+
+        assert first.checked_at == NOW - 88 * DAY
+        assert len(trend) == 90
+        assert len(history) == 90
+        plans = {
+            "results_claim_status": store.explain("first", "CLAIM_3", worker="tenant10"),
+            "results_worker_time": store.explain("trend", "tenant10", days=90),
+            "results_worker_claim": store.explain("history", "tenant10", "CLAIM_3", limit=100),
+        }
+        for index, plan in plans.items():
+            assert plan[0].startswith("SEARCH") and index in plan[0], plan
+        # Rows come out of the index in time order; only trend's GROUP BY sorts
+        assert not [step for step in plans["results_claim_status"] +
+                    plans["results_worker_claim"] if "TEMP B-TREE" in step]
+
+    def test_explain_unknown_query(self, store):
+        with pytest.raises(ValueError):
+            store.explain("latest", "resin")
+
+
+# ============================================================================
+# Integration
+# ============================================================================
+
+class TestIntegration:
+    """validate_worker recording and the query CLI"""
+
+    def test_validate_worker_records_every_claim(self, tmp_path):
+        from fleet import validate_worker
+        config = {"name": "Tenant", "url": "https://a.example.dev/t0",
+                  "api_key_env": "TENANT0_API_KEY"}
+
+        with ResultHistory(tmp_path / "history.sqlite3") as history:
+            validate_worker("tenant0", config, "key", save=False, history=history)
+            latest = history.latest("tenant0")
+
+        assert len(latest) == 26
+        assert latest["COMPLIANCE_SOC2"].status == "MANUAL"
+        assert all(entry.duration is not None for entry in latest.values())
+
+    def test_cli(self, tmp_path, capsys):
+        path = tmp_path / "history.sqlite3"
+        with ResultHistory(path) as store:
+            store.record_run("resin", None, {"A": (FAIL, "limit not enforced")},
+                             checked_at=NOW)
+
+        main(["--db", str(path), "first-failure", "A", "--worker", "resin"])
+        main(["--db", str(path), "trend", "resin", "--days", "100000"])
+        main(["--db", str(path), "history", "resin", "A"])
+        out = capsys.readouterr().out.splitlines()
+
+        assert out[0] == "2026-09-21T14:13:20+00:00 resin A FAIL: limit not enforced"
+        assert out[1] == "2026-09-21 FAIL: 1"
+        assert out[2] == "2026-09-21T14:13:20+00:00 FAIL: limit not enforced"
+
+    def test_cli_without_database(self, tmp_path, capsys):
+        with pytest.raises(SystemExit):
+            main(["--db", str(tmp_path / "missing.sqlite3"), "trend", "resin"])
+        assert "No history" in capsys.readouterr().out
@@ -0,0 +1,208 @@
+"""
+Pytest tests for the local stand-in worker
+
+Run: uv run pytest tools/security/tests/test_standin_server.py -v
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import requests
+from implementations.log_sources import LogpushSource
+from implementations.logging_implementations import LoggingImplementations
+from claim_tests import ValidationStatus
+from standin_server import SECURITY_HEADERS, StandinConfig, StandinServer, TokenBucket
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+API_KEY = "test-api-key-12345"
+
+
+@pytest.fixture
+def server():
+    with StandinServer(StandinConfig(api_key=API_KEY)) as server:
+        yield server
+
+
+def rpc(server, method, params=None, key=API_KEY, request_id=1):
+    body = {"jsonrpc": "2.0", "method": method, "id": request_id}
+    if params is not None:
+        body["params"] = params
+    return requests.post(f"{server.url}/mcp", json=body,
+                         headers={"Authorization": f"Bearer {key}"}, timeout=5)
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
+class TestEndpoints:
+    """Health, readiness and MCP JSON-RPC responses"""
+
+    def test_health(self, server):
+        response = requests.get(f"{server.url}/health", timeout=5)
+        assert response.status_code == 200
+        assert response.json()["status"] == "ok"
+        assert response.json()["service"] == "resin-mcp"
+
+    def test_ready_and_not_ready(self, server):
+        assert requests.get(f"{server.url}/ready", timeout=5).json()["status"] == "ready"
+
+        with StandinServer(StandinConfig(ready=False)) as down:
+            assert requests.get(f"{down.url}/ready", timeout=5).status_code == 503
+
+    def test_tools_list_and_call(self, server):
+        tools = rpc(server, "tools/list").json()["result"]["tools"]
+        assert [tool["name"] for tool in tools][:2] == ["run_soql", "create_record"]
+
+        result = rpc(server, "tools/call", {"name": "run_soql",
+                                            "arguments": {"query": "SELECT Id FROM Contact"}}).json()
+        assert result["result"]["content"][0]["type"] == "text"
+        assert "inputSchema" in tools[0]
+
+        invalid = rpc(server, "tools/call", {"name": "run_soql",
+                                             "arguments": {"query": 1, "limit": 500}}).json()
+        assert invalid["error"]["code"] == -32602
+        assert "query: Expected string" in invalid["error"]["message"]
+
+        assert rpc(server, "tools/call", {"name": "drop_table"}).json()["error"]["code"] == -32602
+        assert rpc(server, "nope").json()["error"]["code"] == -32601
+
+    def test_auth_errors_match_worker(self, server):
+        missing = requests.post(f"{server.url}/mcp", json={}, timeout=5)
+        assert missing.status_code == 401
+        assert "Missing Authorization header" in missing.json()["error"]["message"]
+
+        assert rpc(server, "tools/list", key="wrong").status_code == 403
+
+    def test_malformed_and_oversized_bodies(self, server):
+        headers = {"Authorization": f"Bearer {API_KEY}"}
+        bad = requests.post(f"{server.url}/mcp", data="{not json", headers=headers, timeout=5)
+        assert bad.json()["error"]["code"] == -32700
+
+        big = "x" * (server.config.max_body_bytes + 1)
+        assert requests.post(f"{server.url}/mcp", data=big, headers=headers,
+                             timeout=5).status_code == 413
+
+    def test_security_headers_on_every_response(self, server):
+        for response in (requests.get(f"{server.url}/health", timeout=5),
+                         rpc(server, "tools/list", key="wrong")):
+            for name, value in SECURITY_HEADERS.items():
+                assert response.headers[name] == value
+
+    def test_cors_preflight_only_for_allowed_origins(self):
+        config = StandinConfig(allowed_origins=("https://app.resin.dev",))
+        with StandinServer(config) as server:
+            allowed = requests.options(f"{server.url}/mcp", timeout=5,
+                                       headers={"Origin": "https://app.resin.dev"})
+            denied = requests.options(f"{server.url}/mcp", timeout=5,
+                                      headers={"Origin": "https://evil.example"})
+
+        assert allowed.headers["Access-Control-Allow-Origin"] == "https://app.resin.dev"
+        assert "Access-Control-Allow-Origin" not in denied.headers
+
+
+# ============================================================================
+# Rate limiting, latency and failure injection
+# ============================================================================
+
+class TestInjection:
+    """Configurable 429s, latency and failures"""
+
+    def test_rate_limit_returns_429(self):
+        with StandinServer(StandinConfig(api_key=API_KEY, rate_limit=3)) as server:
+            statuses = [rpc(server, "ping").status_code for _ in range(5)]
+            limited = rpc(server, "ping")
+
+        assert statuses == [200, 200, 200, 429, 429]
+        assert int(limited.headers["Retry-After"]) >= 1
+        assert limited.headers["X-RateLimit-Remaining"] == "0"
+        assert server.stats.rate_limited == 3
+
+    def test_token_bucket_refills(self):
+        now = [0.0]
+        bucket = TokenBucket(limit=2, window=10, clock=lambda: now[0])
+
+        assert [bucket.take("k")[0] for _ in range(3)] == [True, True, False]
+        now[0] += 5
+        assert bucket.take("k")[0] is True
+        assert bucket.take("other")[0] is True
+
+    def test_latency_injection(self):
+        with StandinServer(StandinConfig(latency_ms=100)) as server:
+            start = time.perf_counter()
+            requests.get(f"{server.url}/health", timeout=5)
+            assert time.perf_counter() - start >= 0.1
+
+    def test_failure_injection_is_seeded(self):
+        config = StandinConfig(api_key=API_KEY, failure_rate=0.5, failure_status=503, seed=7)
+        runs = []
+        for _ in range(2):
+            with StandinServer(config) as server:
+                runs.append([rpc(server, "ping").status_code for _ in range(20)])
+
+        assert runs[0] == runs[1]
+        assert set(runs[0]) == {200, 503}
+        assert server.stats.injected_failures == runs[1].count(503)
+
+
+# ============================================================================
+# Structured logs
+# ============================================================================
+
+class TestLogs:
+    """createLogger-format output usable as a Logpush source"""
+
+    def test_log_entries_match_create_logger(self, server):
+        requests.get(f"{server.url}/health", timeout=5)
+
+        received, completed = list(server.logs)
+        assert received["message"] == "Request received"
+        assert completed["message"] == "Request completed"
+        assert completed["context"]["endpoint"] == "/health"
+        assert completed["context"]["requestId"].startswith("req_")
+        assert completed["data"]["statusCode"] == 200
+        assert completed["timestamp"].endswith("Z")
+
+    def test_log_file_is_scanned_by_log_what_logged(self, tmp_path):
+        log_path = tmp_path / "logs" / "standin.ndjson"
+        with StandinServer(StandinConfig(api_key=API_KEY, log_path=str(log_path))) as server:
+            for _ in range(5):
+                rpc(server, "tools/list")
+
+        lines = log_path.read_text().splitlines()
+        assert all(json.loads(line)["level"] for line in lines)
+        assert len(list(LogpushSource(log_path))) == len(lines)
+
+        impl = LoggingImplementations(server.url, API_KEY, {"logpush_path": str(log_path)})
+        status, _ = impl.test_log_what_logged()
+        assert status == ValidationStatus.WARN  # "Request received" entries carry no statusCode
+
+
+# ============================================================================
+# Validator end-to-end
+# ============================================================================
+
+class TestValidatorAgainstStandin:
+    """The whole claim suite runs offline against the stand-in"""
+
+    def test_run_all_tests(self, server, tmp_path):
+        from claim_tests import run_all_tests
+        from executor import ClaimExecutor
+
+        executor = ClaimExecutor(max_workers=4, timeout=10)
+        config = {"logpush_path": str(tmp_path),
+                  "rate_limit_probe": {"requests": 30, "rate": 300}}
+        results = run_all_tests(server.url, API_KEY, executor=executor, worker_config=config)
+
+        assert len(results) == 26
+        assert not executor.report.timed_out
@@ -0,0 +1,177 @@
+"""
+Pytest tests for validator.py startup cost and report-only regeneration
+
+Startup is measured in fresh interpreters (subprocesses) so modules already
+imported by other tests do not hide eager imports. The lazy-import checks
+always run; the wall-clock budgets depend on the machine and only run with
+SECURITY_BENCHMARKS=1.
+
+Run: uv run pytest tools/security/tests/test_startup.py -v
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import result_cache
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ValidationStatus
+from result_cache import ResultCache
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+SECURITY_DIR = Path(__file__).parent.parent
+
+# Modules that only claim runs need
+HEAVY_MODULES = ("yaml", "requests", "urllib3", "ssl", "socket", "asyncio",
+                 "concurrent.futures", "implementations", "executor")
+
+# Cumulative `import validator` time (-X importtime), best of several runs
+IMPORT_BUDGET_MS = 60
+
+# `validator.py --help` wall time above a bare interpreter start, best of several runs
+HELP_BUDGET_MS = 150
+
+# Timing budgets are opt-in: shared CI runners are too noisy for wall-clock limits
+BENCHMARKS = os.environ.get("SECURITY_BENCHMARKS") == "1"
+
+
+def run_python(*args):
+    return subprocess.run([sys.executable, *args], cwd=SECURITY_DIR, capture_output=True,
+                          text=True, timeout=60)
+
+
+def run_fresh(code):
+    """
+    Run `code` in a fresh interpreter
+
+    Returns (heavy modules left in sys.modules, stdout lines before that list)
+    """
+    probe = f"{code}\nimport json, sys\nprint(json.dumps([m for m in {HEAVY_MODULES!r} " \
+            f"if m in sys.modules]))"
+    result = run_python("-c", probe)
+    assert result.returncode == 0, result.stderr
+    *output, modules = result.stdout.splitlines()
+    return json.loads(modules), output
+
+
+def loaded_modules(code):
+    return run_fresh(code)[0]
+
+
+def import_time_ms(module):
+    """Cumulative import time of `module` reported by -X importtime"""
+    result = run_python("-X", "importtime", "-c", f"import {module}")
+    assert result.returncode == 0, result.stderr
+    # "import time: <self us> | <cumulative us> | <module>"
+    for line in result.stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise AssertionError(f"{module} missing from -X importtime output")
+
+
+def wall_time_ms(*args):
+    start = time.perf_counter()
+    result = run_python(*args)
+    elapsed = (time.perf_counter() - start) * 1000
+    assert result.returncode == 0, result.stderr
+    return elapsed
+
+
+# ============================================================================
+# Lazy imports
+# ============================================================================
+
+class TestLazyImports:
+    """Heavy modules are only imported by the code paths that need them"""
+
+    def test_import_validator(self):
+        assert loaded_modules("import validator") == []
+
+    def test_help(self):
+        result = run_python("-X", "importtime", "validator.py", "--help")
+        imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()}
+
+        assert result.returncode == 0
+        assert "--report-only" in result.stdout
+        assert imported.isdisjoint(HEAVY_MODULES)
+
+    def test_claim_tests_defers_networking(self):
+        assert loaded_modules("import claim_tests, result_cache, report_writer") == []
+        assert "requests" in loaded_modules(
+            "import claim_tests; claim_tests.ClaimTester('https://worker.example', 'key')"
+        )
+
+
+# ============================================================================
+# Startup budget
+# ============================================================================
+
+@pytest.mark.skipif(not BENCHMARKS, reason="timing budget; set SECURITY_BENCHMARKS=1")
+class TestStartupBudget:
+    """Measured startup cost (generous limits; the baseline is about a third)"""
+
+    def test_import_time(self):
+        best = min(import_time_ms("validator") for _ in range(3))
+        assert best < IMPORT_BUDGET_MS
+
+    def test_help_overhead(self):
+        baseline = min(wall_time_ms("-c", "pass") for _ in range(3))
+        best = min(wall_time_ms("validator.py", "--help") for _ in range(3))
+        assert best - baseline < HELP_BUDGET_MS
+
+
+# ============================================================================
+# Report-only regeneration
+# ============================================================================
+
+class TestReportOnly:
+    """Reports re-rendered from the result cache without claim runs"""
+
+    def test_reports_from_stale_cache(self, tmp_path):
+        url = "https://resin.mpazbot.workers.dev"
+        cache = ResultCache(tmp_path / "resin.json", worker_url=url, clock=lambda: 0.0)
+        cache.update({
+            "ENC_TLS_TRANSIT": (ValidationStatus.PASS, "Negotiated TLSv1.3"),
+            "INFRA_CLOUDFLARE_DDOS": (ValidationStatus.MANUAL, "Enterprise plan"),
+        })
+        cache.save()
+
+        deployments = {"resin": {"name": "Resin", "url": url, "result_cache_dir": str(tmp_path)}}
+        script = (
+            "import argparse, json, sys\n"
+            "from pathlib import Path\n"
+            "import report_writer, validator\n"
+            f"report_writer.REPORTS_DIR = Path({str(tmp_path)!r})\n"
+            "args = argparse.Namespace(worker='resin', workers=None, all=False,\n"
+            "                          invalidate=None, report_formats=['md', 'json'])\n"
+            f"result = validator.run_report_only(args, {deployments!r})\n"
+            "print(json.dumps(result))\n"
+        )
+        modules, output = run_fresh(script)
+        paths = json.loads(output[-1])["report_paths"]["resin"]
+        report = json.loads(Path(paths["json"]).read_text())
+
+        claims = {claim["id"]: claim for category in report["categories"]
+                  for claim in category["claims"]}
+        assert claims["ENC_TLS_TRANSIT"]["status"] == "PASS"
+        assert claims["INFRA_CLOUDFLARE_DDoS"]["status"] == "MANUAL"
+        assert claims["API_RATE_LIMIT"]["status"] == "PENDING"
+        assert "2/26 claims from cache" in output[0]
+        assert Path(paths["md"]).exists()
+        assert modules == ["yaml"]  # claims.yaml still has to be parsed
+
+    def test_rejects_cache_bypass(self):
+        result = run_python("validator.py", "--worker", "resin", "--report-only", "--force")
+
+        assert result.returncode == 2
+        assert "--report-only" in result.stderr
@@ -0,0 +1,302 @@
+"""
+Pytest tests for the shared TLS/header probe, ENC_TLS_TRANSIT and API_CORS_HEADERS
+
+Run: uv run pytest tools/security/tests/test_tls_probe.py -v
+"""
+
+import shutil
+import ssl
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ClaimTester, ValidationStatus
+from implementations import tls_probe
+from implementations.api_implementations import ApiImplementations
+from implementations.encryption_implementations import EncryptionImplementations
+from implementations.tls_probe import PROBE_ORIGIN, ProbeResponse, ProbeResult, TLSProbe
+from standin_server import StandinConfig, StandinServer
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+API_KEY = "test-api-key-12345"
+
+
+@pytest.fixture(scope="module")
+def certificate(tmp_path_factory):
+    """Self-signed certificate and key for 127.0.0.1"""
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl not available")
+    directory = tmp_path_factory.mktemp("tls")
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run([
+        "openssl", "req", "-x509", "-newkey", "ec", "-pkeyopt", "ec_paramgen_curve:prime256v1",
+        "-nodes", "-days", "1", "-subj", "/CN=127.0.0.1",
+        "-addext", "subjectAltName=IP:127.0.0.1",
+        "-keyout", str(key), "-out", str(cert),
+    ], check=True, capture_output=True)
+    return str(cert), str(key)
+
+
+@pytest.fixture
+def https(certificate):
+    cert, key = certificate
+    with StandinServer(StandinConfig(api_key=API_KEY, tls_cert=cert, tls_key=key)) as server:
+        yield server
+
+
+@pytest.fixture
+def context(certificate):
+    return ssl.create_default_context(cafile=certificate[0])
+
+
+@pytest.fixture
+def http():
+    with StandinServer(StandinConfig(api_key=API_KEY)) as server:
+        yield server
+
+
+def probe_result(headers=None, preflight_headers=None, **kwargs):
+    """ProbeResult as if a TLS 1.3 worker answered with `headers`"""
+    fields = {"url": "https://worker.example", "tls": True, "tls_version": "TLSv1.3",
+              "cipher": "TLS_AES_256_GCM_SHA384", "cipher_bits": 256, "handshake_ms": 12.0}
+    fields.update(kwargs)
+    result = ProbeResult(**fields)
+    result.responses["HEAD"] = ProbeResponse(200, headers or {}, 1.0)
+    result.responses["OPTIONS"] = ProbeResponse(204, preflight_headers or {}, 1.0)
+    return result
+
+
+SECURE_HEADERS = {
+    "strict-transport-security": "max-age=31536000; includeSubDomains",
+    "x-content-type-options": "nosniff",
+    "x-frame-options": "DENY",
+    "content-security-policy": "default-src 'none'",
+}
+
+
+# ============================================================================
+# Probe
+# ============================================================================
+
+class TestProbe:
+    """One handshake, HEAD and OPTIONS over the same connection"""
+
+    def test_single_handshake_for_both_requests(self, https, context):
+        result = TLSProbe(https.url, context=context).run()
+
+        assert result.error is None
+        assert result.tls_version in ("TLSv1.2", "TLSv1.3")
+        assert result.cipher and result.cipher_bits >= 128
+        assert result.connections == 1
+        assert result.head.status == 200
+        assert result.preflight.status == 204
+        assert set(result.metrics()) == {"dns_ms", "tcp_connect_ms", "tls_handshake_ms"}
+        assert https.stats.requests == 2
+
+    def test_headers_and_preflight_origin(self, https, context):
+        result = TLSProbe(https.url, context=context).run()
+
+        assert result.header("Strict-Transport-Security").startswith("max-age=")
+        assert result.header("x-frame-options") == "DENY"
+        assert "access-control-allow-origin" not in result.preflight.headers
+
+        received = [entry["context"] for entry in https.logs
+                    if entry["message"] == "Request received"]
+        assert [entry["method"] for entry in received] == ["HEAD", "OPTIONS"]
+
+    def test_reconnect_resumes_session(self, https, context):
+        TLSProbe(https.url, context=context).run()  # Stores the session ticket
+        result = TLSProbe(https.url, context=context).run()
+
+        assert result.connections == 1
+        assert result.resumed_connections == 1
+
+    def test_plain_http_has_no_tls_fields(self, http):
+        result = TLSProbe(http.url).run()
+
+        assert result.tls is False
+        assert result.tls_version is None
+        assert result.head.status == 200
+        assert "tls_handshake_ms" not in result.metrics()
+
+    def test_untrusted_certificate_is_an_error(self, https):
+        result = TLSProbe(https.url, timeout=2).run()
+
+        assert "SSLCertVerificationError" in result.error
+        assert result.responses == {}
+
+    def test_unreachable(self, closed_port):
+        result = TLSProbe(f"https://127.0.0.1:{closed_port}", timeout=1).run()
+
+        assert result.error is not None
+        assert result.connections == 0
+
+    def test_invalid_url(self):
+        with pytest.raises(ValueError):
+            TLSProbe("ftp://example.com")
+
+
+# ============================================================================
+# Claims
+# ============================================================================
+
+class TestTlsTransitClaim:
+    """ENC_TLS_TRANSIT outcomes"""
+
+    def test_pass_against_https_standin(self, https, context):
+        impl = EncryptionImplementations(https.url, API_KEY)
+        status, details = impl.test_enc_tls_transit(TLSProbe(https.url, context=context).run())
+
+        assert status == ValidationStatus.PASS
+        assert "TLSv1." in details and "HSTS: max-age=31536000" in details
+
+    def test_fail_for_http(self, http):
+        impl = EncryptionImplementations(http.url, API_KEY)
+        status, details = impl.test_enc_tls_transit(TLSProbe(http.url).run())
+
+        assert status == ValidationStatus.FAIL
+        assert "not HTTPS" in details
+
+    def test_fail_for_old_protocol(self):
+        impl = EncryptionImplementations("https://worker.example", API_KEY)
+        status, details = impl.test_enc_tls_transit(probe_result(SECURE_HEADERS,
+                                                                 tls_version="TLSv1.1"))
+
+        assert status == ValidationStatus.FAIL
+        assert "TLSv1.1" in details
+
+    def test_warn_without_hsts(self):
+        impl = EncryptionImplementations("https://worker.example", API_KEY)
+        headers = {**SECURE_HEADERS, "strict-transport-security": "max-age=0"}
+
+        assert impl.test_enc_tls_transit(probe_result({}))[0] == ValidationStatus.WARN
+        assert impl.test_enc_tls_transit(probe_result(headers))[0] == ValidationStatus.WARN
+
+    def test_warn_when_handshake_fails(self):
+        impl = EncryptionImplementations("https://worker.example", API_KEY)
+        failed = ProbeResult(url="https://worker.example", tls=True, error="TimeoutError: timed out")
+        status, details = impl.test_enc_tls_transit(failed)
+
+        assert status == ValidationStatus.WARN
+        assert "timed out" in details
+
+
+class TestCorsHeadersClaim:
+    """API_CORS_HEADERS outcomes"""
+
+    def test_pass_with_restrictive_headers(self):
+        impl = ApiImplementations("https://worker.example", API_KEY)
+        status, details = impl.test_api_cors_headers(probe_result(SECURE_HEADERS))
+
+        assert status == ValidationStatus.PASS
+        assert "CORS preflight" in details
+
+    def test_fail_on_missing_headers(self):
+        impl = ApiImplementations("https://worker.example", API_KEY)
+        headers = {"x-content-type-options": "nosniff", "x-frame-options": "SAMEORIGIN"}
+        status, details = impl.test_api_cors_headers(probe_result(headers))
+
+        assert status == ValidationStatus.FAIL
+        assert "x-frame-options: SAMEORIGIN" in details
+        assert "content-security-policy missing" in details
+
+    def test_fail_on_permissive_cors(self):
+        impl = ApiImplementations("https://worker.example", API_KEY)
+        for allowed in ("*", PROBE_ORIGIN):
+            result = probe_result(SECURE_HEADERS, {"access-control-allow-origin": allowed})
+            status, details = impl.test_api_cors_headers(result)
+
+            assert status == ValidationStatus.FAIL
+            assert "overly permissive CORS" in details
+
+    def test_fail_against_standin_allowing_probe_origin(self):
+        with StandinServer(StandinConfig(allowed_origins=(PROBE_ORIGIN,))) as server:
+            impl = ApiImplementations(server.url, API_KEY)
+            status, _ = impl.test_api_cors_headers()
+
+        assert status == ValidationStatus.FAIL
+
+    def test_warn_when_unreachable(self, closed_port):
+        impl = ApiImplementations(f"http://127.0.0.1:{closed_port}", API_KEY)
+        status, details = impl.test_api_cors_headers()
+
+        assert status == ValidationStatus.WARN
+        assert "incomplete" in details
+
+
+# ============================================================================
+# Shared probe in ClaimTester
+# ============================================================================
+
+class TestSharedProbe:
+    """TLS, HSTS and CORS claims share one probe per ClaimTester"""
+
+    def test_claims_share_one_probe(self, https, certificate):
+        tester = ClaimTester(https.url, API_KEY, {"tls_probe": {"ca_file": certificate[0]}})
+
+        threads = [threading.Thread(target=method) for method in (
+            tester.test_enc_tls_transit, tester.test_api_cors_headers,
+            tester._get_tls_version, tester._check_hsts_header,
+        )]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert https.stats.requests == 2
+        assert tester._get_tls_version() in ("TLSv1.2", "TLSv1.3")
+        assert tester._check_hsts_header().startswith("max-age=")
+        assert "tls_handshake_ms" in tester.metrics
+
+    def test_probe_max_age(self, https, certificate):
+        """Long-lived testers (watch mode) re-probe once the result is too old"""
+        tester = ClaimTester(https.url, API_KEY, {"tls_probe": {"ca_file": certificate[0]}})
+        tester.probe_max_age = 0.05
+
+        first = tester.tls_probe()
+        assert tester.tls_probe() is first
+        time.sleep(0.1)
+
+        assert tester.tls_probe() is not first
+        assert https.stats.requests == 4
+
+    def test_refreshed_probes_reuse_context_and_session(self, https, certificate):
+        """Re-probing with a ca_file keeps one context and one session per host"""
+        tester = ClaimTester(https.url, API_KEY, {"tls_probe": {"ca_file": certificate[0]}})
+        tester.probe_max_age = 0
+        probe = TLSProbe(https.url)
+        key = (probe.host, probe.port)
+
+        results = []
+        for _ in range(3):
+            results.append(tester.tls_probe())
+            time.sleep(0.01)
+
+        assert len({id(result) for result in results}) == 3
+        assert [k for k in tls_probe._sessions if k[:2] == key] == [key]
+        assert tls_probe._sessions[key][0] is tls_probe.default_context(certificate[0])
+        assert [result.resumed_connections for result in results[1:]] == [1, 1]
+
+    def test_handshake_metric_reaches_execution_report(self, https, certificate):
+        from claim_tests import run_all_tests
+        from executor import ClaimExecutor
+
+        executor = ClaimExecutor(max_workers=4)
+        config = {"tls_probe": {"ca_file": certificate[0]},
+                  "rate_limit_probe": {"requests": 5, "rate": 100}}
+        results = run_all_tests(https.url, API_KEY, executor=executor, worker_config=config)
+
+        assert results["ENC_TLS_TRANSIT"][0] == ValidationStatus.PASS
+        assert results["API_CORS_HEADERS"][0] == ValidationStatus.PASS
+        assert executor.report.metrics["tls_handshake_ms"] > 0
+        assert "TLS handshake" in executor.report.summary()
@@ -0,0 +1,172 @@
+"""
+Pytest tests for run tracing (Chrome trace / Perfetto export)
+
+Run: uv run pytest tools/security/tests/test_tracing.py -v
+"""
+
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path so we can import tracing
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import tracing
+from implementations.log_sharding import scan_sharded
+from implementations.logging_implementations import LoggingImplementations
+from implementations.tls_probe import TLSProbe
+from implementations.transport import Transport
+from standin_server import StandinConfig, StandinServer
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+API_KEY = "test-api-key-12345"
+
+
+@pytest.fixture
+def tracer():
+    tracer = tracing.start()
+    yield tracer
+    tracing.stop()
+
+
+@pytest.fixture
+def server():
+    with StandinServer(StandinConfig(api_key=API_KEY)) as server:
+        yield server
+
+
+def spans(tracer, category=None):
+    return [e for e in tracer.events if category is None or e["cat"] == category]
+
+
+def named(tracer, name):
+    matches = [e for e in tracer.events if e["name"] == name]
+    assert matches, f"no {name!r} span in {[e['name'] for e in tracer.events]}"
+    return matches[0]
+
+
+def contains(outer, inner):
+    """inner lies within outer on the same track"""
+    return (outer["pid"], outer["tid"]) == (inner["pid"], inner["tid"]) \
+        and outer["ts"] <= inner["ts"] \
+        and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 0.001
+
+
+# ============================================================================
+# Tracer
+# ============================================================================
+
+class TestSpans:
+    """Nesting, args and the disabled fast path"""
+
+    def test_nested_spans(self, tracer):
+        with tracing.span("run", "run"):
+            with tracing.span("resin", "worker", url="https://a.example.dev") as args:
+                time.sleep(0.01)
+                args["PASS"] = 3
+
+        run, worker = named(tracer, "run"), named(tracer, "resin")
+        assert contains(run, worker)
+        assert worker["dur"] >= 10_000
+        assert worker["args"] == {"url": "https://a.example.dev", "PASS": 3}
+
+    def test_error_recorded(self, tracer):
+        with pytest.raises(ValueError):
+            with tracing.span("claim", "claim"):
+                raise ValueError("boom")
+
+        assert named(tracer, "claim")["args"] == {"error": "ValueError"}
+
+    def test_disabled_records_nothing(self):
+        assert tracing.active() is None
+        with tracing.span("claim", "claim", worker="resin") as args:
+            args["status"] = "PASS"
+        tracing.add_span("dns", "net", 0.0, 1.0)
+
+        assert args == {"worker": "resin", "status": "PASS"}
+
+    def test_chrome_trace_format(self, tracer, tmp_path):
+        with tracing.span("claim", "claim"):
+            pass
+
+        data = json.loads(tracer.write(tmp_path / "traces" / "run.json").read_text())
+
+        metadata = [e for e in data["traceEvents"] if e["ph"] == "M"]
+        complete = [e for e in data["traceEvents"] if e["ph"] == "X"]
+        assert {e["name"] for e in metadata} == {"process_name", "thread_name"}
+        assert complete[0]["name"] == "claim"
+        assert set(complete[0]) >= {"ts", "dur", "pid", "tid", "cat"}
+
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(),
+                        reason="fork not available")
+    def test_forked_children_do_not_record(self, tracer):
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            assert pool.submit(tracing.active).result() is None
+        assert tracing.active() is tracer
+
+
+# ============================================================================
+# Instrumented layers
+# ============================================================================
+
+class TestLayers:
+    """HTTP requests, TLS probe, log shards and claims become spans"""
+
+    def test_transport_request_and_connect(self, tracer, server):
+        transport = Transport()
+        session = transport.session(API_KEY)
+        session.get(f"{server.url}/health", timeout=5)
+        session.get(f"{server.url}/health", timeout=5)
+        transport.close()
+
+        requests = [e for e in spans(tracer, "http") if e["name"] == "GET /health"]
+        connects = [e for e in spans(tracer, "net") if e["name"].startswith("connect ")]
+        assert len(requests) == 2
+        assert len(connects) == 1  # Second request reuses the connection
+        assert contains(requests[0], connects[0])
+        assert contains(connects[0], named(tracer, "dns + tcp connect"))
+        assert requests[0]["args"]["status"] == 200
+
+    def test_tls_probe_phases(self, tracer, server):
+        TLSProbe(server.url, timeout=5).run()
+
+        head = named(tracer, "HEAD /health")
+        assert named(tracer, "dns")["ts"] <= named(tracer, "tcp connect")["ts"] <= head["ts"]
+        assert contains(head, named(tracer, "server wait"))
+        assert named(tracer, "OPTIONS /mcp")["args"]["status"] == 204
+
+    def test_shards_on_process_tracks(self, tracer, tmp_path):
+        for day in range(3):
+            with open(tmp_path / f"2025110{day + 1}.log", "w") as f:
+                for i in range(200):
+                    f.write(json.dumps({"level": "info", "message": f"ok {i}"}) + "\n")
+
+        scan_sharded(sorted(tmp_path.glob("*.log")), LoggingImplementations.SENSITIVE_PATTERNS,
+                     processes=2)
+
+        shards = spans(tracer, "log")
+        assert len(shards) == 3
+        assert all(e["pid"] != tracer.pid and e["args"]["records"] == 200 for e in shards)
+        names = tracer.to_dict()["traceEvents"]
+        assert any(e["name"] == "process_name" and e["pid"] == shards[0]["pid"] for e in names)
+
+    def test_worker_and_claim_spans(self, tracer):
+        from fleet import validate_worker
+        config = {"name": "Tenant", "url": "https://a.example.dev/t0"}
+
+        validate_worker("tenant0", config, "key", save=False)
+
+        worker = named(tracer, "tenant0")
+        claims = spans(tracer, "claim")
+        assert len(claims) == 26
+        assert all(contains(worker, claim) for claim in claims)
+        assert named(tracer, "COMPLIANCE_SOC2")["args"]["status"] == "MANUAL"
@@ -0,0 +1,150 @@
+"""
+Pytest tests for the shared HTTP transport
+
+Run: uv run pytest tools/security/tests/test_transport.py -v
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add parent directory to path so we can import claim_tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from claim_tests import ClaimTester
+from implementations import transport as transport_module
+from implementations.api_implementations import ApiImplementations
+from implementations.transport import Transport, get_transport
+from standin_server import StandinConfig, StandinServer
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+API_KEY = "test-api-key-12345"
+
+
+@pytest.fixture
+def server():
+    with StandinServer(StandinConfig(api_key=API_KEY)) as server:
+        yield server
+
+
+@pytest.fixture
+def transport():
+    transport = Transport(backoff_factor=0.01, backoff_jitter=0)
+    yield transport
+    transport.close()
+
+
+# ============================================================================
+# Pooling
+# ============================================================================
+
+class TestPooling:
+    """Keep-alive connections shared across sessions, capped per host"""
+
+    def test_sessions_share_connections(self, server, transport):
+        sessions = [transport.session(f"key-{n}") for n in range(3)]
+        for _ in range(10):
+            for session in sessions:
+                assert session.get(f"{server.url}/health", timeout=5).status_code == 200
+
+        assert server.stats.requests == 30
+        assert server.stats.connections == 1
+
+    def test_per_host_connection_limit(self):
+        limited = Transport(pool_maxsize=2)
+        session = limited.session(API_KEY)
+        with StandinServer(StandinConfig(api_key=API_KEY, latency_ms=30)) as server:
+            threads = [threading.Thread(target=session.get, args=(f"{server.url}/health",),
+                                        kwargs={"timeout": 5})
+                       for _ in range(12)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            limited.close()
+
+            assert server.stats.requests == 12
+            assert server.stats.peak_connections <= 2
+
+    def test_authorization_per_session(self, transport):
+        session = transport.session(API_KEY)
+
+        assert session.headers["Authorization"] == f"Bearer {API_KEY}"
+        assert "Authorization" not in transport.session().headers
+        assert session.get_adapter("https://example.dev") is transport.adapter
+
+
+# ============================================================================
+# Retries
+# ============================================================================
+
+class TestRetries:
+    """Idempotent requests are retried on 502/503/504"""
+
+    def test_unavailable_is_retried(self, transport):
+        with StandinServer(StandinConfig(api_key=API_KEY, ready=False)) as server:
+            response = transport.session().get(f"{server.url}/ready", timeout=5)
+
+            assert response.status_code == 503
+            assert server.stats.requests == 3  # First attempt + 2 retries
+
+    def test_post_is_not_retried(self, transport):
+        config = StandinConfig(api_key=API_KEY, failure_rate=1.0, failure_status=503)
+        with StandinServer(config) as server:
+            response = transport.session(API_KEY).post(f"{server.url}/mcp", json={}, timeout=5)
+
+            assert response.status_code == 503
+            assert server.stats.requests == 1
+
+    def test_retries_disabled(self):
+        with StandinServer(StandinConfig(api_key=API_KEY, ready=False)) as server:
+            Transport(retries=0).session().get(f"{server.url}/ready", timeout=5)
+
+            assert server.stats.requests == 1
+
+    def test_backoff_settings(self, transport):
+        retry = Transport(retries=4, backoff_factor=0.5, backoff_jitter=0.25).retry
+
+        assert retry.total == 4
+        assert retry.backoff_factor == 0.5
+        assert getattr(retry, "backoff_jitter", 0.25) == 0.25
+        assert 503 in retry.status_forcelist
+
+
+# ============================================================================
+# Sharing
+# ============================================================================
+
+class TestSharedTransport:
+    """One transport per distinct `http` setting, injected everywhere"""
+
+    def test_get_transport_memoises(self, monkeypatch):
+        monkeypatch.setattr(transport_module, "_transports", {})
+
+        assert get_transport() is get_transport({})
+        assert get_transport({"retries": 1}) is get_transport({"retries": 1})
+        assert get_transport({"retries": 1}) is not get_transport()
+
+    def test_unknown_option(self):
+        with pytest.raises(ValueError, match="pool_size"):
+            Transport(pool_size=4)
+
+    def test_claim_tester_injects_transport(self, transport):
+        tester = ClaimTester("https://resin.example.dev", API_KEY, {"http": {"retries": 1}},
+                             transport=transport)
+
+        assert tester.session.get_adapter(tester.worker_url) is transport.adapter
+        assert ClaimTester("https://a.example.dev", API_KEY).transport is get_transport()
+
+    def test_implementations_use_shared_pools(self, server):
+        config = {"http": {"pool_maxsize": 4}}
+        tester = ClaimTester(server.url, API_KEY, config)
+        api = ApiImplementations(server.url, API_KEY, config)
+
+        assert api.transport is get_transport(config["http"])
+        assert tester.session.get_adapter(server.url) is api.transport.adapter
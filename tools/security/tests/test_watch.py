@@ -0,0 +1,244 @@
+"""
+Pytest tests for the continuous compliance watcher
+
+Run: uv run pytest tools/security/tests/test_watch.py -v
+"""
+
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import watch
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import watch
+from claim_tests import ValidationStatus
+from result_cache import ResultCache
+from result_history import ResultHistory
+from watch import DEFAULT_INTERVALS, ComplianceWatcher
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+URL = "https://resin.mpazbot.workers.dev"
+
+PASS, FAIL, WARN = ValidationStatus.PASS, ValidationStatus.FAIL, ValidationStatus.WARN
+
+
+class FakeClaims:
+    """Claim functions returning scripted results, counting calls"""
+
+    def __init__(self, **scripts):
+        self.scripts = {claim_id: list(results) for claim_id, results in scripts.items()}
+        self.calls = {claim_id: [] for claim_id in scripts}
+        self.lock = threading.Lock()
+
+    def claim(self, claim_id):
+        def run():
+            with self.lock:
+                self.calls[claim_id].append(time.monotonic())
+                script = self.scripts[claim_id]
+                result = script.pop(0) if len(script) > 1 else script[0]
+            if isinstance(result, Exception):
+                raise result
+            return (result, f"{claim_id} {result.name.lower()}")
+        return run
+
+    def install(self, monkeypatch):
+        monkeypatch.setattr(watch, "get_claim_tests",
+                            lambda tester: {claim_id: self.claim(claim_id)
+                                            for claim_id in self.scripts})
+        return self
+
+
+@pytest.fixture
+def config(tmp_path):
+    return {"url": URL, "result_cache_dir": str(tmp_path / "cache"),
+            "watch": {"jitter": 0}}
+
+
+def watcher_for(config, **kwargs):
+    return ComplianceWatcher({"resin": (config, "key")}, **kwargs)
+
+
+# ============================================================================
+# Scheduling
+# ============================================================================
+
+class TestIntervals:
+    """Interval lookup: claim ID, category, defaults"""
+
+    def test_lookup_order(self):
+        config = {"watch": {"intervals": {"API": 30, "API_RATE_LIMIT": 600}}}
+
+        assert ComplianceWatcher.interval(config, "API_RATE_LIMIT") == 600
+        assert ComplianceWatcher.interval(config, "API_CORS_HEADERS") == 30
+        assert ComplianceWatcher.interval(config, "PERF_HEALTH_LATENCY") == DEFAULT_INTERVALS["PERF"]
+        assert ComplianceWatcher.interval({}, "TENANT_CUSTOM") == watch.DEFAULT_INTERVAL
+
+    def test_burst_claims_run_daily(self):
+        assert ComplianceWatcher.interval({}, "API_RATE_LIMIT") == watch.DAY
+        assert ComplianceWatcher.interval({}, "API_INPUT_VALIDATION") == watch.DAY
+        assert ComplianceWatcher.interval({}, "API_CORS_HEADERS") == DEFAULT_INTERVALS["API"]
+        assert ComplianceWatcher.interval({}, "PERF_HEALTH_LATENCY") >= watch.HOUR
+
+    def test_claims_run_on_their_own_intervals(self, monkeypatch, config):
+        claims = FakeClaims(PERF_FAST=[PASS], COMPLIANCE_SLOW=[PASS]).install(monkeypatch)
+        config["watch"]["intervals"] = {"PERF_FAST": 0.05, "COMPLIANCE_SLOW": 60}
+
+        runs = watcher_for(config, max_workers=2).run(duration=0.5)
+
+        assert 6 <= len(claims.calls["PERF_FAST"]) <= 11
+        assert len(claims.calls["COMPLIANCE_SLOW"]) == 1
+        assert runs == {"resin": len(claims.calls["PERF_FAST"]) + 1}
+
+    def test_jitter_spreads_runs(self, monkeypatch, config):
+        FakeClaims(**{f"API_{n}": [PASS] for n in range(20)}).install(monkeypatch)
+        config["watch"] = {"jitter": 0.2, "intervals": {"API": 100}}
+        clock = [0.0]
+        watcher = watcher_for(config, rng=random.Random(7), clock=lambda: clock[0])
+
+        watcher._finish([(entry, (PASS, "ok"), 0.0) for entry in watcher.schedule.values()])
+        next_runs = [entry.next_run for entry in watcher.schedule.values()]
+
+        assert all(80 <= t <= 120 for t in next_runs)
+        assert len(set(next_runs)) == 20
+        assert max(next_runs) - min(next_runs) > 10
+
+
+class TestBackoff:
+    """Unsettled results back off exponentially, settled ones reset"""
+
+    def test_exponential_backoff_capped_and_reset(self, monkeypatch, config):
+        FakeClaims(API_RATE_LIMIT=[PASS]).install(monkeypatch)
+        config["watch"].update(intervals={"API": 10}, max_backoff=50)
+        clock = [0.0]
+        watcher = watcher_for(config, clock=lambda: clock[0])
+        entry = watcher.schedule["resin", "API_RATE_LIMIT"]
+
+        delays = []
+        for status in (WARN, WARN, WARN, WARN, PASS, FAIL, WARN):
+            watcher._finish([(entry, (status, "details"), 0.1)])
+            delays.append(entry.next_run - clock[0])
+
+        assert delays == [20, 40, 50, 50, 10, 10, 20]
+
+    def test_max_backoff_never_below_interval(self, monkeypatch, config):
+        FakeClaims(COMPLIANCE_SOC2=[WARN]).install(monkeypatch)
+        config["watch"].update(intervals={"COMPLIANCE": 1000}, max_backoff=50)
+        watcher = watcher_for(config, clock=lambda: 0.0)
+        entry = watcher.schedule["resin", "COMPLIANCE_SOC2"]
+
+        watcher._finish([(entry, (WARN, "unreachable"), 0.1)])
+
+        assert entry.next_run == 1000
+
+    def test_exceptions_become_warn(self, monkeypatch, config):
+        FakeClaims(API_RATE_LIMIT=[RuntimeError("socket closed"), PASS]).install(monkeypatch)
+        results = []
+        watcher = watcher_for(config, on_result=lambda *args: results.append(args))
+        watcher.run(duration=0.1)
+
+        worker, claim_id, (status, details), duration, cached = results[0]
+        assert status == WARN
+        assert details == "Claim raised RuntimeError: socket closed"
+        assert watcher.schedule["resin", "API_RATE_LIMIT"].failures == 1
+
+
+# ============================================================================
+# State kept across cycles
+# ============================================================================
+
+class TestWarmState:
+    """Result cache, history and callbacks"""
+
+    def test_fresh_cache_entries_are_not_probed_at_start(self, monkeypatch, config):
+        claims = FakeClaims(COMPLIANCE_SOC2=[PASS], API_RATE_LIMIT=[PASS]).install(monkeypatch)
+        cache = ResultCache.for_worker("resin", config)
+        cache.update({"COMPLIANCE_SOC2": (ValidationStatus.MANUAL, "Request the report")})
+        cache.save()
+        results = []
+
+        watcher_for(config, on_result=lambda *args: results.append(args)).run(duration=0.1)
+
+        assert claims.calls["COMPLIANCE_SOC2"] == []
+        assert len(claims.calls["API_RATE_LIMIT"]) == 1
+        assert results[0][1] == "COMPLIANCE_SOC2" and results[0][4] is True
+        assert ResultCache.for_worker("resin", config).lookup(["API_RATE_LIMIT"])
+
+    def test_changes_and_history(self, monkeypatch, config, tmp_path):
+        FakeClaims(PERF_HEALTH_LATENCY=[PASS, FAIL, FAIL, PASS]).install(monkeypatch)
+        config["watch"]["intervals"] = {"PERF": 0.02}
+        changes = []
+
+        with ResultHistory(tmp_path / "history.sqlite3") as history:
+            watcher = watcher_for(config, history=history, use_cache=False,
+                                  on_change=lambda *args: changes.append(args))
+            watcher.run(duration=0.2)
+            recorded = history.history("resin", "PERF_HEALTH_LATENCY")
+
+        assert changes[:2] == [("resin", "PERF_HEALTH_LATENCY", PASS, FAIL),
+                               ("resin", "PERF_HEALTH_LATENCY", FAIL, PASS)]
+        assert [e.status for e in reversed(recorded)][:4] == ["PASS", "FAIL", "FAIL", "PASS"]
+        assert all(e.duration is not None for e in recorded)
+
+    def test_one_tester_per_worker(self, monkeypatch, config):
+        testers = []
+        monkeypatch.setattr(watch, "get_claim_tests",
+                            lambda tester: testers.append(tester) or {"A": lambda: (PASS, "")})
+        watcher = ComplianceWatcher({"resin": (config, "key"), "evergreen": (config, "key")})
+
+        assert len(testers) == 2
+        assert all(tester.probe_max_age == watch.PROBE_MAX_AGE for tester in testers)
+        assert len(watcher.schedule) == 2
+
+    def test_stop_from_another_thread(self, monkeypatch, config):
+        FakeClaims(API_RATE_LIMIT=[PASS]).install(monkeypatch)
+        watcher = watcher_for(config)
+        threading.Timer(0.1, watcher.stop).start()
+
+        start = time.monotonic()
+        runs = watcher.run()
+
+        assert time.monotonic() - start < 1
+        assert runs == {"resin": 1}
+
+    def test_hung_claim_times_out_and_frees_its_slot(self, monkeypatch, config):
+        release = threading.Event()
+        claims = FakeClaims(API_RATE_LIMIT=[PASS]).install(monkeypatch)
+        hung = {"API_RATE_LIMIT": claims.claim("API_RATE_LIMIT"),
+                "AUTH_HUNG": lambda: release.wait() and (PASS, "")}
+        monkeypatch.setattr(watch, "get_claim_tests", lambda tester: hung)
+        results = {}
+        watcher = watcher_for(config, max_workers=1, claim_timeout=0.1, use_cache=False,
+                              on_result=lambda w, c, result, *_: results.setdefault(c, result))
+        try:
+            watcher.run(duration=0.5)
+        finally:
+            release.set()
+
+        assert results["AUTH_HUNG"] == (WARN, "Claim timed out after 0.1s")
+        assert results["API_RATE_LIMIT"][0] == PASS
+
+    def test_stop_while_pool_is_full(self, monkeypatch, config):
+        release = threading.Event()
+        monkeypatch.setattr(watch, "get_claim_tests",
+                            lambda tester: {"AUTH_HUNG": lambda: release.wait() and (PASS, "")})
+        watcher = watcher_for(config, max_workers=1, claim_timeout=0.5, use_cache=False)
+        threading.Timer(0.1, watcher.stop).start()
+
+        try:
+            runs = watcher.run()
+            # Returned after stop() while the hung claim was still blocked
+            assert watcher.stop_event.is_set()
+            assert not release.is_set()
+        finally:
+            release.set()
+
+        assert runs == {"resin": 1}
+        assert watcher.schedule["resin", "AUTH_HUNG"].status == WARN
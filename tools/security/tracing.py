@@ -0,0 +1,158 @@
+"""
+Run Tracing
+Nested spans of a validator run, exported as Chrome trace / Perfetto JSON
+
+A run is recorded as a tree of spans: run -> worker -> claim -> HTTP
+request (with its DNS, TCP connect and TLS handshake), log shard scan,
+burst. Spans are "complete" events of the Chrome trace event format, one
+track per thread (claims on a pool show up side by side) and one per
+process for log shards scanned on a process pool. Open the file in
+chrome://tracing or https://ui.perfetto.dev.
+
+Tracing is off unless a Tracer is started; span() and add_span() are then
+cheap no-ops, so the instrumented code paths cost nothing in normal runs.
+Timestamps come from time.perf_counter(), which is system-wide on the
+platforms we run on, so spans timed in shard processes line up with the
+parent's.
+
+Usage:
+    tracer = tracing.start()
+    with tracing.span("resin", "worker", url=url) as args:
+        ...
+        args["status"] = "PASS"  # Added to the span when it ends
+    tracing.stop().write(".state/traces/run.json")
+
+  python tools/security/validator.py --worker resin --trace
+  python tools/security/validator.py --all --trace fleet-trace.json
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+DEFAULT_TRACE_DIR = Path(__file__).resolve().parent / ".state" / "traces"
+
+
+class Tracer:
+    """Collects spans from every thread of this process"""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.origin = time.perf_counter()
+        self.events: List[Dict] = []
+        self._threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, category: str, start: float, end: float,
+            pid: Optional[int] = None, tid: Optional[int] = None, **args):
+        """
+        Record a finished span
+
+        Args:
+            name / category: Shown on the span; categories can be filtered
+            start / end: time.perf_counter() values
+            pid / tid: Track to draw on (default: this process and thread)
+            **args: Shown in the span's details
+        """
+        if tid is None:
+            tid = threading.get_native_id()
+            if tid not in self._threads:
+                with self._lock:
+                    self._threads[tid] = threading.current_thread().name
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self.origin) * 1e6, 3),
+            "dur": round(max(0.0, end - start) * 1e6, 3),
+            "pid": self.pid if pid is None else pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def to_dict(self) -> Dict:
+        """Trace in the Chrome trace event (JSON object) format"""
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["ts"])
+            threads = dict(self._threads)
+        names = {pid: f"worker process {pid}" for pid in {e["pid"] for e in events}}
+        names[self.pid] = "validator"
+        metadata = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                     "args": {"name": name}} for pid, name in sorted(names.items())]
+        metadata += [{"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid,
+                      "args": {"name": name}} for tid, name in threads.items()]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Union[str, Path]) -> Path:
+        """Write the trace as JSON (loadable by Chrome's trace viewer and Perfetto)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), separators=(",", ":")))
+        return path
+
+
+_active: Optional[Tracer] = None
+
+
+def start(tracer: Optional[Tracer] = None) -> Tracer:
+    """Start recording spans process-wide"""
+    global _active
+    _active = tracer or Tracer()
+    return _active
+
+
+def stop() -> Optional[Tracer]:
+    """Stop recording; returns the tracer that was active"""
+    global _active
+    tracer, _active = _active, None
+    return tracer
+
+
+def active() -> Optional[Tracer]:
+    return _active
+
+
+@contextmanager
+def span(name: str, category: str, **args) -> Iterator[Dict]:
+    """
+    Time the enclosed block as a span
+
+    Yields the span's args dict; values added to it are recorded when the
+    block ends. An exception is recorded as args["error"] and re-raised.
+    """
+    tracer = _active
+    if tracer is None:
+        yield args
+        return
+    start_time = time.perf_counter()
+    try:
+        yield args
+    except BaseException as e:
+        args["error"] = type(e).__name__
+        raise
+    finally:
+        tracer.add(name, category, start_time, time.perf_counter(), **args)
+
+
+def add_span(name: str, category: str, start: float, end: float, **kwargs):
+    """Record an already-timed span (perf_counter values) if tracing is on"""
+    tracer = _active
+    if tracer is not None:
+        tracer.add(name, category, start, end, **kwargs)
+
+
+def _forget_in_child():
+    # Forked shard processes must not record into (or lock) the parent's copy
+    global _active
+    _active = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_in_child)
@@ -7,32 +7,27 @@ Run as a DevOps script to audit your MCP implementations
 Usage:
   python tools/security/validator.py --worker resin
   python tools/security/validator.py --worker evergreen
+  python tools/security/validator.py --all
+  python tools/security/validator.py --workers resin,evergreen
 """
 
+import contextlib
+import io
 import json
 import sys
 import os
 import argparse
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 from enum import Enum
-from datetime import datetime
-from pathlib import Path
-
-try:
-    import yaml
-except ImportError:
-    print("Error: pyyaml not found. Run: uv sync")
-    sys.exit(1)
-
-class ClaimCategory(Enum):
-    AUTHENTICATION = "Authentication & Authorization"
-    ENCRYPTION = "Encryption"
-    DATA_HANDLING = "Data Handling"
-    INFRASTRUCTURE = "Infrastructure"
-    COMPLIANCE = "Compliance"
-    LOGGING = "Logging & Monitoring"
-    API_SECURITY = "API Security"
+from datetime import datetime, timezone
+
+# Only light, standard-library modules are imported at startup; yaml,
+# requests, the claim implementations and the executor are imported by the
+# code paths that need them, so `--help` and `--report-only` stay fast.
+from claim_registry import (
+    ClaimCategory, ClaimDefinition, ClaimRegistry, load_registry, registry_for_worker,
+)
 
 class ValidationStatus(Enum):
     PASS = "✅ PASS"
@@ -41,488 +36,194 @@ class ValidationStatus(Enum):
     PENDING = "⏳ PENDING"
     MANUAL = "👤 MANUAL"
 
-@dataclass
+@dataclass(slots=True)
 class SecurityClaim:
-    id: str
-    category: ClaimCategory
-    claim: str
-    test_procedure: str
-    expected_result: str
+    """A catalogue claim plus this validator's result for it"""
+    definition: ClaimDefinition
     status: ValidationStatus = ValidationStatus.PENDING
     details: str = ""
     last_tested: Optional[str] = None
 
+    @property
+    def id(self) -> str:
+        return self.definition.id
+
+    @property
+    def category(self) -> ClaimCategory:
+        return self.definition.category
+
+    @property
+    def claim(self) -> str:
+        return self.definition.claim
+
+    @property
+    def test_procedure(self) -> str:
+        return self.definition.test_procedure
+
+    @property
+    def expected_result(self) -> str:
+        return self.definition.expected_result
+
 class ResinSecurityValidator:
     """Main validation framework"""
     
-    def __init__(self):
-        self.claims: dict[str, SecurityClaim] = {}
+    def __init__(self, registry: Optional[ClaimRegistry] = None):
+        """
+        Args:
+            registry: Claim catalogue (default: the shared claims.yaml registry)
+        """
+        self.registry = registry or load_registry()
+        self.claims: dict[str, SecurityClaim] = {
+            definition.id: SecurityClaim(definition) for definition in self.registry
+        }
         self.test_results = []
-        self.initialize_claims()
-    
-    def initialize_claims(self):
-        """Define all security claims to validate"""
-        
-        # Authentication Claims
-        self.add_claim(
-            "AUTH_OAUTH_PKCE",
-            ClaimCategory.AUTHENTICATION,
-            "OAuth 2.0 with PKCE implementation",
-            """
-            1. Verify Cloudflare Worker initiates OAuth with code_challenge
-            2. Check PKCE parameters in Salesforce OAuth flow
-            3. Validate code_verifier is never exposed in logs
-            4. Test token expiration and revocation
-            """,
-            "OAuth tokens use PKCE, expire within configured time, can be revoked via Salesforce"
-        )
-        
-        self.add_claim(
-            "AUTH_NO_CREDENTIALS",
-            ClaimCategory.AUTHENTICATION,
-            "Credentials never stored in code or logs",
-            """
-            1. Search codebase for Salesforce credentials patterns
-            2. Verify .env file is in .gitignore
-            3. Check Cloudflare KV environment isolation
-            4. Audit log output for credential leaks
-            """,
-            "No Salesforce credentials appear in code, logs, or version control"
-        )
-        
-        self.add_claim(
-            "AUTH_USER_LEVEL",
-            ClaimCategory.AUTHENTICATION,
-            "User-level security with individual credentials",
-            """
-            1. Verify each user connects with own Salesforce credentials
-            2. Check multi-user scenarios in test environment
-            3. Validate isolation between user OAuth tokens
-            4. Test permission boundaries per user
-            """,
-            "Each user maintains separate OAuth token with own Salesforce permissions"
-        )
-        
-        # Encryption Claims
-        self.add_claim(
-            "ENC_TLS_TRANSIT",
-            ClaimCategory.ENCRYPTION,
-            "TLS 1.2+ encryption for data in transit",
-            """
-            1. Verify all API endpoints use HTTPS
-            2. Test with `openssl s_client` to check TLS version
-            3. Validate no HTTP endpoints exist
-            4. Check HSTS headers are present
-            5. Run SSL Labs test: https://www.ssllabs.com/ssltest/
-            """,
-            "TLS 1.2 or higher on all endpoints, no downgrade, HSTS headers present"
-        )
-        
-        self.add_claim(
-            "ENC_AES256_REST",
-            ClaimCategory.ENCRYPTION,
-            "AES-256 encryption for credentials at rest in Cloudflare KV",
-            """
-            1. Inspect encryption implementation in Cloudflare Workers code
-            2. Verify libsodium or similar cryptography library usage
-            3. Check key rotation procedures
-            4. Test KV encryption with sample credential
-            5. Verify encrypted values are different each time (IV randomization)
-            """,
-            "Credentials encrypted with AES-256, verified unencrypted in KV inspection"
-        )
-        
-        self.add_claim(
-            "ENC_MEMORY_PROCESSING",
-            ClaimCategory.ENCRYPTION,
-            "Data encrypted in memory during AI processing",
-            """
-            1. Review code path for Anthropic API call preparation
-            2. Verify sensitive data cleared from memory after processing
-            3. Check for memory dumps in error handling
-            4. Test with instrumented code to verify memory state
-            """,
-            "Sensitive data not persisted in application memory between requests"
-        )
-        
-        # Data Handling Claims
-        self.add_claim(
-            "DATA_EPHEMERAL",
-            ClaimCategory.DATA_HANDLING,
-            "Data is ephemeral - discarded after response",
-            """
-            1. Query Cloudflare logs for data retention
-            2. Check database schemas for donor data tables
-            3. Verify no donor data in Cloudflare D1 or KV (only tokens/logs)
-            4. Test: Make API call, verify no data persists after 5 minutes
-            5. Run query on infrastructure: SELECT donor_data FROM * - should return empty
-            """,
-            "No donor data found in persistent storage, only interaction logs"
-        )
-        
-        self.add_claim(
-            "DATA_NO_TRAINING",
-            ClaimCategory.DATA_HANDLING,
-            "No training on customer data - Anthropic commitment",
-            """
-            1. Review Anthropic API documentation for data usage policies
-            2. Check API logs that data is marked 'no-training'
-            3. Verify 'cache_control' headers if using prompt caching
-            4. Test: Query Anthropic about data retention
-            5. Review data processing agreement with Anthropic
-            """,
-            "Confirmed via Anthropic API documentation and DPA"
-        )
-        
-        self.add_claim(
-            "DATA_MINIMIZATION",
-            ClaimCategory.DATA_HANDLING,
-            "Only necessary data sent to AI - aggregated when possible",
-            """
-            1. Review API calls to Anthropic in development logs
-            2. Verify donor IDs instead of names used in prompts
-            3. Check aggregated data in reports vs raw data
-            4. Sample 10 API calls to Anthropic, verify data minimization
-            """,
-            "Aggregated data used in reports, donor IDs in prompts, no unnecessary PII"
-        )
-        
-        self.add_claim(
-            "DATA_NO_SSNS_CARDS",
-            ClaimCategory.DATA_HANDLING,
-            "Never send SSNs, credit cards, bank accounts to API",
-            """
-            1. Audit Salesforce object access - verify financial objects excluded
-            2. Check Cloudflare Worker code for field-level filtering
-            3. Test with mock Salesforce sandbox containing sensitive data
-            4. Verify filtering rules applied before Anthropic API call
-            5. Review error messages - should not leak sensitive data
-            """,
-            "Financial and sensitive fields filtered before API transmission"
-        )
-        
-        # Infrastructure Claims
-        self.add_claim(
-            "INFRA_CLOUDFLARE_DDoS",
-            ClaimCategory.INFRASTRUCTURE,
-            "DDoS protection and WAF via Cloudflare",
-            """
-            1. Verify Cloudflare zone setup and nameservers
-            2. Check Cloudflare dashboard for DDoS protection status
-            3. Verify WAF rules are active
-            4. Test rate limiting configuration
-            5. Confirm enterprise-grade infrastructure selected
-            """,
-            "Cloudflare DDoS & WAF enabled, verified in dashboard"
-        )
-        
-        self.add_claim(
-            "INFRA_CLOUDFLARE_UPTIME",
-            ClaimCategory.INFRASTRUCTURE,
-            "99.9%+ uptime via Cloudflare Workers",
-            """
-            1. Query Cloudflare API for uptime statistics
-            2. Check Statuspage for historical uptime
-            3. Review incident logs for past 90 days
-            4. Verify SLA commitments in Cloudflare plan
-            """,
-            "Cloudflare Workers infrastructure verified, 99.9% SLA confirmed"
-        )
-        
-        self.add_claim(
-            "INFRA_SERVERLESS",
-            ClaimCategory.INFRASTRUCTURE,
-            "Serverless architecture - no persistent servers",
-            """
-            1. Verify Workers deployment model (no EC2/VMs)
-            2. Confirm no static servers to compromise
-            3. Check infrastructure-as-code confirms serverless
-            4. Verify automatic scaling and updates
-            """,
-            "Serverless Workers architecture confirmed, no persistent servers"
-        )
-        
-        self.add_claim(
-            "INFRA_MULTI_TENANT_ISOLATION",
-            ClaimCategory.INFRASTRUCTURE,
-            "Multi-tenant isolation in separate storage",
-            """
-            1. Verify Cloudflare KV namespace isolation
-            2. Check that organization credentials stored in separate namespaces
-            3. Test cross-org data access attempts - should fail
-            4. Review code for organization context in all queries
-            5. Test with multiple test orgs simultaneously
-            """,
-            "Each organization in isolated KV namespace, cross-org access denied"
-        )
-        
-        # Compliance Claims
-        self.add_claim(
-            "COMPLIANCE_SOC2",
-            ClaimCategory.COMPLIANCE,
-            "SOC 2 Type II via Cloudflare infrastructure",
-            """
-            1. Request SOC 2 report from Cloudflare account
-            2. Verify report date is within last 12 months
-            3. Check audit scope includes Workers platform
-            4. Confirm your organization is documented as customer
-            5. Review report findings and control effectiveness
-            """,
-            "SOC 2 Type II report obtained from Cloudflare, reviewed"
-        )
-        
-        self.add_claim(
-            "COMPLIANCE_GDPR",
-            ClaimCategory.COMPLIANCE,
-            "GDPR compliant with DPA available",
-            """
-            1. Obtain and review Data Processing Agreement (DPA)
-            2. Verify DPA covers Cloudflare and Anthropic
-            3. Check GDPR provisions: consent, retention, deletion
-            4. Test data deletion flows per GDPR requirements
-            5. Verify appropriate data transfers if non-EU
-            """,
-            "GDPR DPA on file, deletion flows tested, transfers authorized"
-        )
-        
-        self.add_claim(
-            "COMPLIANCE_CCPA",
-            ClaimCategory.COMPLIANCE,
-            "CCPA compliant for California privacy rights",
-            """
-            1. Verify opt-out mechanisms for California users
-            2. Check data deletion request handling within 45 days
-            3. Verify no data sales or sharing
-            4. Test privacy notice display for California users
-            """,
-            "CCPA compliance verified, deletion procedures within SLA"
-        )
-        
-        self.add_claim(
-            "COMPLIANCE_AFP",
-            ClaimCategory.COMPLIANCE,
-            "Compliant with AFP Code of Ethics and Donor Bill of Rights",
-            """
-            1. Review implementation against AFP standards
-            2. Verify donor privacy respected in recommendations
-            3. Confirm transparency about data usage
-            4. Check donor rights implementation (access, deletion)
-            5. Test that data doesn't enable unethical practices
-            """,
-            "AFP compliance verified through design review"
-        )
-        
-        # Logging Claims
-        self.add_claim(
-            "LOG_WHAT_LOGGED",
-            ClaimCategory.LOGGING,
-            "Appropriate logging: timestamp, user, query type, response time",
-            """
-            1. Inspect log sample from past 24 hours
-            2. Verify no full donor data in logs
-            3. Verify no sensitive field values in logs
-            4. Check timestamp, user, query type all present
-            5. Verify PII never logged
-            """,
-            "Metadata-only logging confirmed, no sensitive data in logs"
-        )
-        
-        self.add_claim(
-            "LOG_RETENTION_90",
-            ClaimCategory.LOGGING,
-            "Logs retained for 90 days, then deleted",
-            """
-            1. Query log storage timestamps
-            2. Verify logs older than 90 days are deleted
-            3. Check deletion automation via Cloudflare cron trigger
-            4. Verify encryption of logs at rest
-            5. Test 90-day retention boundary
-            """,
-            "Automatic deletion after 90 days confirmed, encryption verified"
-        )
-        
-        self.add_claim(
-            "LOG_AUDIT_TRAIL",
-            ClaimCategory.LOGGING,
-            "Audit trail accessible for compliance review",
-            """
-            1. Test audit log retrieval via Cloudflare Analytics/Logs
-            2. Verify filtering by organization, user, date range
-            3. Check export capabilities for audits
-            4. Test log accessibility in compliance scenarios
-            """,
-            "Audit logs queryable and exportable for compliance"
-        )
-        
-        # API Security Claims
-        self.add_claim(
-            "API_RATE_LIMIT",
-            ClaimCategory.API_SECURITY,
-            "Rate limiting to prevent abuse",
-            """
-            1. Test API rate limiting configuration
-            2. Verify limits per user and per org
-            3. Test exceeding limits returns appropriate errors
-            4. Check rate limit headers in responses
-            5. Verify graceful handling when limits hit
-            """,
-            "Rate limiting configured and tested"
-        )
-        
-        self.add_claim(
-            "API_INPUT_VALIDATION",
-            ClaimCategory.API_SECURITY,
-            "Input validation on all API endpoints",
-            """
-            1. Test with malicious inputs (SQL injection, XSS, etc.)
-            2. Verify error handling doesn't reveal system details
-            3. Check type validation on all parameters
-            4. Test boundary conditions
-            5. Verify no command injection vectors
-            """,
-            "Input validation tested against common attack vectors"
-        )
-        
-        self.add_claim(
-            "API_CORS_HEADERS",
-            ClaimCategory.API_SECURITY,
-            "Proper CORS and security headers",
-            """
-            1. Curl endpoint and check CORS headers
-            2. Verify X-Content-Type-Options: nosniff
-            3. Verify X-Frame-Options: DENY
-            4. Check Content-Security-Policy headers
-            5. Verify no overly permissive CORS
-            """,
-            "Security headers present and restrictive"
-        )
     
     def add_claim(self, claim_id: str, category: ClaimCategory, claim: str, 
                   test_procedure: str, expected_result: str):
-        """Add a security claim to validate"""
-        self.claims[claim_id] = SecurityClaim(
+        """Add a security claim to validate (this validator only)"""
+        definition = ClaimDefinition(
             id=claim_id,
             category=category,
             claim=claim,
             test_procedure=test_procedure,
             expected_result=expected_result
         )
+        self.registry = ClaimRegistry([*self.registry, definition])
+        self.claims[claim_id] = SecurityClaim(definition)
     
+    def apply_results(self, results: dict):
+        """
+        Record claim test results (from claim_tests.run_all_tests) on the claims
+
+        Claim IDs are matched case-insensitively; statuses are converted by value
+        since claim_tests defines its own ValidationStatus enum.
+        """
+        tested_at = datetime.now().isoformat()
+
+        for claim_id, (status, details) in results.items():
+            definition = self.registry.get(claim_id)
+            if definition is None:
+                continue
+            claim = self.claims[definition.id]
+            claim.status = ValidationStatus(status.value)
+            claim.details = details
+            claim.last_tested = tested_at
+
     def get_claims_by_category(self, category: ClaimCategory) -> list[SecurityClaim]:
         """Get all claims in a category"""
-        return [c for c in self.claims.values() if c.category == category]
-    
-    def generate_validation_checklist(self) -> str:
-        """Generate markdown checklist for manual validation"""
-        output = "# Security Claims Validation Checklist\n\n"
-        output += f"Generated: {datetime.now().isoformat()}\n\n"
-        
-        for category in ClaimCategory:
-            claims = self.get_claims_by_category(category)
-            if not claims:
-                continue
-            
-            output += f"## {category.value}\n\n"
-            for claim in claims:
-                output += f"### {claim.claim} ({claim.id})\n\n"
-                output += f"**Expected Result:** {claim.expected_result}\n\n"
-                output += f"**Test Procedure:**\n"
-                output += f"{claim.test_procedure}\n\n"
-                output += f"**Status:** {claim.status.value}\n\n"
-                if claim.details:
-                    output += f"**Details:** {claim.details}\n\n"
-                output += "---\n\n"
-        
-        return output
+        return [self.claims[d.id] for d in self.registry.by_category(category)]
     
-    def generate_compliance_report(self) -> str:
-        """Generate comprehensive compliance report"""
-        output = "# Resin AI Security Compliance Report\n\n"
-        output += f"Generated: {datetime.now().isoformat()}\n"
-        output += f"Document Version: 1.0 (Nov 4, 2025)\n\n"
-        
-        # Summary stats
-        total_claims = len(self.claims)
+    def write_report(self, *renderers):
+        """
+        Stream the report to every renderer in one pass over the claims
+
+        Args:
+            renderers: report_writer.Renderer instances, one per output format
+        """
+        from report_writer import ReportWriter
+
         by_status = {}
         for claim in self.claims.values():
             status = claim.status.value
             by_status[status] = by_status.get(status, 0) + 1
-        
-        output += "## Summary\n\n"
-        output += f"Total Claims: {total_claims}\n"
-        for status, count in sorted(by_status.items()):
-            output += f"{status}: {count}\n"
-        output += "\n"
-        
-        # Claims by category
-        output += "## Claims by Category\n\n"
+
+        writer = ReportWriter(renderers)
+        writer.begin(len(self.claims), by_status)
         for category in ClaimCategory:
             claims = self.get_claims_by_category(category)
-            if not claims:
-                continue
-            
-            output += f"### {category.value} ({len(claims)} claims)\n\n"
-            for claim in claims:
-                output += f"- [{claim.status.value}] {claim.claim}\n"
-            output += "\n"
-        
-        return output
+            if claims:
+                writer.category(category.value, claims)
+        writer.end()
+
+    def generate_validation_checklist(self) -> str:
+        """Generate markdown checklist for manual validation"""
+        from report_writer import MarkdownChecklistRenderer
+
+        output = io.StringIO()
+        self.write_report(MarkdownChecklistRenderer(output))
+        return output.getvalue()
+    
+    def generate_compliance_report(self) -> str:
+        """Generate comprehensive compliance report"""
+        from report_writer import MarkdownReportRenderer
+
+        output = io.StringIO()
+        self.write_report(MarkdownReportRenderer(output))
+        return output.getvalue()
     
     def generate_test_script_template(self) -> str:
         """Generate template for automated testing"""
-        output = "#!/bin/bash\n"
-        output += "# Automated Security Validation Tests\n"
-        output += "# Run this regularly to validate security claims\n\n"
-        
-        output += "set -e\n\n"
-        output += "API_BASE='https://your-api.resin.team'\n"
-        output += "TEST_ORG_ID='test-org-123'\n\n"
-        
-        output += "# TLS Version Test\n"
-        output += f'echo "Testing TLS version..."\n'
-        output += f'echo | openssl s_client -connect $(echo {"{API_BASE}"} | sed "s|https://||"):443 2>/dev/null | grep "TLSv"\n\n'
-        
-        output += "# HTTPS Only Test\n"
-        output += f'echo "Testing HTTP endpoints (should fail)..."\n'
-        output += f'curl -I http://your-api.resin.team 2>&1 | grep -q "Connection refused" && echo "✓ HTTP rejected" || echo "✗ HTTP accepted"\n\n'
-        
-        output += "# HSTS Headers Test\n"
-        output += f'echo "Testing HSTS headers..."\n'
-        output += f'curl -I {"{API_BASE}"} | grep -i "strict-transport-security" && echo "✓ HSTS present" || echo "✗ HSTS missing"\n\n'
-        
-        output += "# Rate Limiting Test\n"
-        output += f'echo "Testing rate limiting..."\n'
-        output += f'for i in {{1..101}}; do curl -s {"{API_BASE}"}/api/test > /dev/null; done\n'
-        output += f'curl -v {"{API_BASE}"}/api/test 2>&1 | grep -i "429\\|x-ratelimit" && echo "✓ Rate limiting active" || echo "⚠ Rate limiting check"\n\n'
-        
-        output += "# CORS Headers Test\n"
-        output += f'echo "Testing CORS headers..."\n'
-        output += f'curl -I -H "Origin: http://example.com" {"{API_BASE}"} | grep -i "access-control" || echo "⚠ CORS policy review needed"\n\n'
-        
-        output += "# OAuth Token Test\n"
-        output += f'echo "Testing OAuth token isolation (manual: verify token A cannot access org B)..."\n\n'
-        
-        output += "echo 'Manual tests required:'\n"
-        output += "echo '- OAuth PKCE flow validation'\n"
-        output += "echo '- Multi-tenant data isolation'\n"
-        output += "echo '- Memory encryption verification'\n"
-        output += "echo '- Log retention verification'\n"
-        
-        return output
+        output = io.StringIO()
+        self.write_test_script_template(output)
+        return output.getvalue()
+
+    def write_test_script_template(self, stream):
+        """Write the bash test script template to a text stream"""
+        write = stream.write
+        write("#!/bin/bash\n")
+        write("# Automated Security Validation Tests\n")
+        write("# Run this regularly to validate security claims\n\n")
+
+        write("set -e\n\n")
+        write("API_BASE='https://your-api.resin.team'\n")
+        write("TEST_ORG_ID='test-org-123'\n\n")
+
+        write("# TLS Version Test\n")
+        write(f'echo "Testing TLS version..."\n')
+        write(f'echo | openssl s_client -connect $(echo {"{API_BASE}"} | sed "s|https://||"):443 2>/dev/null | grep "TLSv"\n\n')
+
+        write("# HTTPS Only Test\n")
+        write(f'echo "Testing HTTP endpoints (should fail)..."\n')
+        write(f'curl -I http://your-api.resin.team 2>&1 | grep -q "Connection refused" && echo "✓ HTTP rejected" || echo "✗ HTTP accepted"\n\n')
+
+        write("# HSTS Headers Test\n")
+        write(f'echo "Testing HSTS headers..."\n')
+        write(f'curl -I {"{API_BASE}"} | grep -i "strict-transport-security" && echo "✓ HSTS present" || echo "✗ HSTS missing"\n\n')
+
+        write("# Rate Limiting Test\n")
+        write(f'echo "Testing rate limiting..."\n')
+        write(f'for i in {{1..101}}; do curl -s {"{API_BASE}"}/api/test > /dev/null; done\n')
+        write(f'curl -v {"{API_BASE}"}/api/test 2>&1 | grep -i "429\\|x-ratelimit" && echo "✓ Rate limiting active" || echo "⚠ Rate limiting check"\n\n')
+
+        write("# CORS Headers Test\n")
+        write(f'echo "Testing CORS headers..."\n')
+        write(f'curl -I -H "Origin: http://example.com" {"{API_BASE}"} | grep -i "access-control" || echo "⚠ CORS policy review needed"\n\n')
+
+        write("# OAuth Token Test\n")
+        write(f'echo "Testing OAuth token isolation (manual: verify token A cannot access org B)..."\n\n')
+
+        write("echo 'Manual tests required:'\n")
+        write("echo '- OAuth PKCE flow validation'\n")
+        write("echo '- Multi-tenant data isolation'\n")
+        write("echo '- Memory encryption verification'\n")
+        write("echo '- Log retention verification'\n")
 
 
 def load_deployments_config():
-    """Load deployments configuration from YAML"""
-    config_path = Path(__file__).parent / "deployments.yaml"
+    """
+    Load deployments configuration from YAML
 
-    if not config_path.exists():
-        print(f"Error: Deployments config not found at {config_path}")
-        sys.exit(1)
+    Goes through deployment_registry, which only re-parses deployments.yaml
+    when it has changed and reports every schema error at once.
+    """
+    from deployment_registry import DEPLOYMENTS_FILE, DeploymentConfigError, load_deployments
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    if not DEPLOYMENTS_FILE.exists():
+        print(f"Error: Deployments config not found at {DEPLOYMENTS_FILE}")
+        sys.exit(1)
 
-    return config.get("deployments", {})
+    try:
+        return load_deployments()
+    except ModuleNotFoundError as e:
+        if e.name != "yaml":
+            raise
+        print("Error: pyyaml not found. Run: uv sync")
+        sys.exit(1)
+    except DeploymentConfigError as e:
+        print(f"Error: Invalid deployments config {e.path}")
+        for error in e.errors:
+            print(f"  - {error}")
+        sys.exit(1)
 
 
 def get_worker_config(worker_name: str, deployments: dict):
@@ -555,26 +256,26 @@ def get_api_key(config: dict):
 
 def save_report(worker_name: str, report_content: str):
     """Save report to docs/reports/{worker}-security-{date}.md"""
-    # Get repo root
-    script_dir = Path(__file__).parent
-    repo_root = script_dir.parent.parent
-    reports_dir = repo_root / "docs" / "reports"
-
-    # Create directory if needed
-    reports_dir.mkdir(parents=True, exist_ok=True)
+    from report_writer import atomic_report, report_path
 
-    # Generate filename: {worker}-security-{date}.md
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    filename = f"{worker_name}-security-{date_str}.md"
-    output_path = reports_dir / filename
-
-    # Write report
-    with open(output_path, "w") as f:
+    output_path = report_path(worker_name)
+    with atomic_report(output_path) as f:
         f.write(report_content)
 
     return output_path
 
 
+def reset_log_checkpoints(worker_names: List[str], deployments: dict):
+    """Drop incremental log scan checkpoints so the next run rescans everything"""
+    from implementations.log_checkpoints import DEFAULT_CHECKPOINT_DIR, CheckpointStore
+
+    for worker_name in worker_names:
+        config = deployments[worker_name]
+        store = CheckpointStore(config.get("log_checkpoint_dir", DEFAULT_CHECKPOINT_DIR))
+        if store.clear(worker_name):
+            print(f"✓ Cleared log checkpoint for {worker_name}")
+
+
 def main():
     """Run validation framework"""
 
@@ -586,22 +287,223 @@ def main():
 Examples:
   python tools/security/validator.py --worker resin
   python tools/security/validator.py --worker evergreen
+  python tools/security/validator.py --all --max-concurrency 32 --per-host-limit 4
+  python tools/security/validator.py --workers resin,evergreen --jobs 8
+  python tools/security/validator.py --all --force
+  python tools/security/validator.py --all --report-only --report-formats md,json
+  python tools/security/validator.py --all --output ndjson | jq -c 'select(.status == "FAIL")'
+  python tools/security/validator.py --all --watch --jobs 8
+  python tools/security/validator.py --worker resin --profile --force
+  python tools/security/validator.py --all --trace fleet-trace.json
         """
     )
-    parser.add_argument(
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
         "--worker",
-        required=True,
         help="Worker deployment to validate (resin, evergreen, etc.)"
     )
+    target.add_argument(
+        "--workers",
+        help="Comma-separated worker deployments to validate concurrently"
+    )
+    target.add_argument(
+        "--all",
+        action="store_true",
+        help="Validate every deployment in deployments.yaml concurrently"
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=16,
+        help="Fleet mode: workers validated at the same time (default: 16)"
+    )
+    parser.add_argument(
+        "--per-host-limit",
+        type=int,
+        default=4,
+        help="Fleet mode: workers validated at the same time per host (default: 4)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Claims run in parallel per worker (default: 1, serial)"
+    )
+    parser.add_argument(
+        "--claim-timeout",
+        type=float,
+        default=None,
+        help="Per-claim timeout in seconds (default: none; 10 minutes with --watch)"
+    )
+    parser.add_argument(
+        "--full-log-scan",
+        action="store_true",
+        help="Discard log scan checkpoints and rescan all Logpush data"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore cached claim results and re-run every claim"
+    )
+    parser.add_argument(
+        "--invalidate",
+        help="Comma-separated claim IDs or categories (e.g. API,ENC_TLS_TRANSIT) "
+             "to drop from the result cache before running"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write the claim result cache"
+    )
+    parser.add_argument(
+        "--report-only",
+        action="store_true",
+        help="Regenerate reports from cached claim results without contacting "
+             "any worker (no API key needed)"
+    )
+    parser.add_argument(
+        "--report-formats",
+        default="md",
+        help="Comma-separated per-worker report formats written in one pass: "
+             "md, checklist, json (default: md)"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running: re-check each claim on its own interval (deployment "
+             "`watch` settings) until interrupted; --jobs sets the claims run at once"
+    )
+    parser.add_argument(
+        "--watch-duration",
+        type=float,
+        default=None,
+        help="With --watch: stop after this many seconds (default: run until interrupted)"
+    )
+    parser.add_argument(
+        "--output",
+        choices=["text", "ndjson"],
+        default="text",
+        help="text: progress and a JSON summary on stdout (default); ndjson: one "
+             "JSON record per claim on stdout as it completes, then a summary "
+             "record (progress goes to stderr)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="With --worker: run claims serially and write a cProfile (.prof) and "
+             "collapsed-stack (.folded) profile per claim, plus stats.json, to "
+             "tools/security/.state/profiles/"
+    )
+    parser.add_argument(
+        "--trace",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help="Record the run as nested spans (run, worker, claim, HTTP request, "
+             "log shard) in a Chrome trace / Perfetto JSON file (default: "
+             "tools/security/.state/traces/<target>-<time>.json)"
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not append claim results to the result history database"
+    )
+    parser.add_argument(
+        "--history-db",
+        default=None,
+        help="Result history database (default: tools/security/.state/history.sqlite3)"
+    )
 
     args = parser.parse_args()
+    args.invalidate = [c.strip() for c in args.invalidate.split(",")] if args.invalidate else None
+    args.report_formats = [f.strip() for f in args.report_formats.split(",") if f.strip()]
+    from report_writer import RENDERERS
+    unknown = [f for f in args.report_formats if f not in RENDERERS]
+    if unknown or not args.report_formats:
+        parser.error(f"--report-formats must be among: {', '.join(RENDERERS)}")
+    if args.report_only and (args.no_cache or args.force):
+        parser.error("--report-only reads the result cache; drop --no-cache/--force")
+    if args.watch and args.report_only:
+        parser.error("--watch probes workers; it cannot be combined with --report-only")
+    if args.watch_duration is not None and not args.watch:
+        parser.error("--watch-duration requires --watch")
+    if args.profile and (not args.worker or args.watch or args.report_only):
+        parser.error("--profile runs claims against one worker; use it with --worker only")
+    if args.profile and args.jobs > 1:
+        parser.error("--profile runs claims serially; drop --jobs")
+
+    if args.output == "ndjson":
+        from report_writer import NdjsonResultStream
+        stream = NdjsonResultStream(sys.stdout)
+        # Keep stdout machine-readable: everything else is printed to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            result = run(args, on_result=stream.claim)
+        stream.summary(status="success", **result)
+        return result
+
+    result = run(args)
+    print("\n" + "="*70)
+    print(json.dumps({"status": "success", **result}, indent=2))
+    print("="*70)
+    return result
+
+
+def run(args, on_result=None) -> dict:
+    """Load deployments and dispatch to the selected mode, traced with --trace"""
+    if args.trace is None:
+        return dispatch(args, on_result)
+
+    import tracing
+    from tracing import DEFAULT_TRACE_DIR
+
+    path = args.trace
+    if not path:
+        started = datetime.now(timezone.utc)
+        path = DEFAULT_TRACE_DIR / f"{args.worker or 'fleet'}-{started:%Y%m%dT%H%M%SZ}.json"
+    tracing.start()
+    try:
+        with tracing.span("run", "run", argv=" ".join(sys.argv[1:])):
+            result = dispatch(args, on_result)
+    finally:
+        path = tracing.stop().write(path)
+        print(f"✓ Trace saved to: {path}")
+    return {**result, "trace_path": str(path)}
+
+
+def dispatch(args, on_result=None) -> dict:
+    """Load deployments and run the selected mode"""
+    import tracing
+
+    with tracing.span("load deployments", "config"):
+        deployments = load_deployments_config()
+
+    if args.report_only:
+        return run_report_only(args, deployments, on_result)
+    if args.watch:
+        return run_watch(args, deployments, on_result)
+    if args.worker:
+        return run_single(args, deployments, on_result)
+    return run_fleet(args, deployments, on_result)
 
-    # Load deployments config
-    deployments = load_deployments_config()
+
+def open_history(args):
+    """ResultHistory to record this run in, or None with --no-history"""
+    if args.no_history:
+        return None
+    from result_history import DEFAULT_HISTORY_PATH, ResultHistory
+    return ResultHistory(args.history_db or DEFAULT_HISTORY_PATH)
+
+
+def run_single(args, deployments: dict, on_result=None) -> dict:
+    """Validate one worker and print the full walkthrough"""
+    from fleet import validate_worker
 
     # Get worker configuration
     worker_config = get_worker_config(args.worker, deployments)
     api_key = get_api_key(worker_config)
+    if args.full_log_scan:
+        reset_log_checkpoints([args.worker], deployments)
 
     print("\n" + "="*70)
     print(f"Resin AI Security Claims Validation Framework")
@@ -609,7 +511,7 @@ Examples:
     print(f"URL: {worker_config['url']}")
     print("="*70 + "\n")
 
-    validator = ResinSecurityValidator()
+    validator = ResinSecurityValidator(registry_for_worker(worker_config))
 
     # Show stats
     print(f"Total Claims to Validate: {len(validator.claims)}\n")
@@ -620,17 +522,38 @@ Examples:
             print(f"{category.value}: {len(claims)} claims")
 
     print("\n" + "="*70)
-    print("Output Files Generation")
+    print("Running Claim Tests")
     print("="*70 + "\n")
 
-    # Generate outputs
-    checklist = validator.generate_validation_checklist()
-    report = validator.generate_compliance_report()
-    test_script = validator.generate_test_script_template()
-
-    print("✓ Generated validation checklist (comprehensive)")
-    print("✓ Generated compliance report")
-    print("✓ Generated test script template")
+    from instrumentation import ClaimInstrumentation, DEFAULT_PROFILE_DIR, format_stats
+
+    profile_dir = None
+    if args.profile:
+        started = datetime.now(timezone.utc)
+        profile_dir = DEFAULT_PROFILE_DIR / f"{args.worker}-{started:%Y%m%dT%H%M%SZ}"
+    instrumentation = ClaimInstrumentation(profile_dir)
+
+    # Run claims and save report to docs/reports
+    history = open_history(args)
+    try:
+        result = validate_worker(args.worker, worker_config, api_key,
+                                 claim_workers=args.jobs, claim_timeout=args.claim_timeout,
+                                 validator=validator, use_cache=not args.no_cache,
+                                 force=args.force, invalidate=args.invalidate,
+                                 report_formats=args.report_formats, history=history,
+                                 on_result=on_result, instrumentation=instrumentation)
+    finally:
+        if history is not None:
+            history.close()
+
+    for status, count in sorted(result.status_counts.items()):
+        print(f"{status}: {count}")
+    print(f"\n{result.timing}")
+    if result.claim_stats:
+        print(f"\nSlowest claims:\n{format_stats(result.claim_stats, limit=5)}")
+    if profile_dir is not None:
+        instrumentation.write_json(profile_dir / "stats.json")
+        print(f"\n✓ Claim profiles saved to: {profile_dir}")
 
     print("\n" + "="*70)
     print("Key Validation Recommendations")
@@ -654,26 +577,171 @@ Examples:
     print("Saving Report")
     print("="*70 + "\n")
 
-    # Save report to docs/reports
-    output_path = save_report(args.worker, report)
-    print(f"✓ Report saved to: {output_path}")
+    for path in result.report_paths.values():
+        print(f"✓ Report saved to: {path}")
 
     return {
         "worker": args.worker,
+        "report_path": result.report_path,
+        "report_paths": result.report_paths,
+        "total_claims": len(validator.claims),
+        "total_categories": len(ClaimCategory)
+    }
+
+
+def run_report_only(args, deployments: dict, on_result=None) -> dict:
+    """
+    Re-render worker reports from the result cache
+
+    Uses every cached entry regardless of its TTL and leaves claims without
+    one PENDING. Nothing here imports requests, ssl or the claim
+    implementations, so it is cheap enough to run from cron or CI hooks.
+    """
+    from report_writer import save_reports
+    from result_cache import ResultCache
+
+    if args.worker:
+        worker_names = [args.worker]
+    elif args.all:
+        worker_names = list(deployments.keys())
+    else:
+        worker_names = [w.strip() for w in args.workers.split(",") if w.strip()]
+
+    reports = {}
+    for worker_name in worker_names:
+        worker_config = get_worker_config(worker_name, deployments)
+        cache = ResultCache.for_worker(worker_name, worker_config)
+        if args.invalidate:
+            cache.invalidate(args.invalidate)
+
+        validator = ResinSecurityValidator(registry_for_worker(worker_config))
+        # Cache entries use claim_tests IDs (upper case, e.g. INFRA_CLOUDFLARE_DDOS)
+        claim_ids = [claim_id.upper() for claim_id in validator.claims]
+        results = cache.lookup(claim_ids, fresh_only=False)
+        validator.apply_results(results)
+        if on_result is not None:
+            for claim_id, result in results.items():
+                on_result(worker_name, claim_id, result, None, True)
+        paths = save_reports(worker_name, validator, args.report_formats)
+        reports[worker_name] = {name: str(path) for name, path in paths.items()}
+
+        cached = sum(1 for c in validator.claims.values()
+                     if c.status is not ValidationStatus.PENDING)
+        print(f"✓ {worker_name}: {cached}/{len(validator.claims)} claims from cache "
+              f"-> {', '.join(reports[worker_name].values())}")
+
+    return {"workers": worker_names, "report_paths": reports}
+
+
+def run_watch(args, deployments: dict, on_result=None) -> dict:
+    """Re-check claims on their schedules until interrupted (or --watch-duration)"""
+    import signal
+    from watch import DEFAULT_CLAIM_TIMEOUT, ComplianceWatcher
+
+    if args.worker:
+        worker_names = [args.worker]
+    elif args.all:
+        worker_names = list(deployments.keys())
+    else:
+        worker_names = [w.strip() for w in args.workers.split(",") if w.strip()]
+    workers = {}
+    for worker_name in worker_names:
+        worker_config = get_worker_config(worker_name, deployments)
+        workers[worker_name] = (worker_config, get_api_key(worker_config))
+    if args.full_log_scan:
+        reset_log_checkpoints(worker_names, deployments)
+    if args.force and not args.no_cache:
+        from result_cache import ResultCache
+        for worker_name, (worker_config, _) in workers.items():
+            ResultCache.for_worker(worker_name, worker_config).invalidate()
+
+    def on_change(worker, claim_id, old, new):
+        print(f"{datetime.now():%Y-%m-%d %H:%M:%S} {worker} {claim_id}: "
+              f"{old.value} -> {new.value}")
+
+    history = open_history(args)
+    try:
+        watcher = ComplianceWatcher(workers, max_workers=args.jobs,
+                                    use_cache=not args.no_cache, history=history,
+                                    on_result=on_result, on_change=on_change,
+                                    claim_timeout=args.claim_timeout or DEFAULT_CLAIM_TIMEOUT)
+        print(f"Watching {len(watcher.schedule)} claims on {len(workers)} worker(s) "
+              f"({args.jobs} at a time); Ctrl-C to stop")
+
+        previous = {sig: signal.signal(sig, lambda *_: watcher.stop())
+                    for sig in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            runs = watcher.run(duration=args.watch_duration)
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+    finally:
+        if history is not None:
+            history.close()
+
+    print(f"Stopped after {sum(runs.values())} claim runs")
+    return {"workers": worker_names, "runs": runs}
+
+
+def run_fleet(args, deployments: dict, on_result=None) -> dict:
+    """Validate several workers concurrently and save a fleet rollup"""
+    from fleet import FLEET_REPORT_NAME, validate_fleet, write_fleet_report
+    from report_writer import atomic_report, report_path
+
+    if args.all:
+        worker_names = list(deployments.keys())
+    else:
+        worker_names = [w.strip() for w in args.workers.split(",") if w.strip()]
+        for worker_name in worker_names:
+            get_worker_config(worker_name, deployments)
+
+    print("\n" + "="*70)
+    print(f"Resin AI Security Claims Validation Framework - Fleet")
+    print(f"Workers: {len(worker_names)}")
+    print(f"Concurrency: {args.max_concurrency} overall, {args.per_host_limit} per host")
+    print("="*70 + "\n")
+
+    if args.full_log_scan:
+        reset_log_checkpoints(worker_names, deployments)
+
+    def on_complete(result):
+        if result.ok:
+            print(f"✓ {result.worker}: {result.duration:.2f}s -> {result.report_path}")
+        else:
+            print(f"✗ {result.worker}: {result.error}")
+
+    history = open_history(args)
+    try:
+        results = validate_fleet(
+            worker_names, deployments,
+            max_concurrency=args.max_concurrency,
+            per_host_limit=args.per_host_limit,
+            claim_workers=args.jobs,
+            claim_timeout=args.claim_timeout,
+            on_complete=on_complete,
+            use_cache=not args.no_cache,
+            force=args.force,
+            invalidate=args.invalidate,
+            report_formats=args.report_formats,
+            history=history,
+            on_result=on_result,
+        )
+    finally:
+        if history is not None:
+            history.close()
+
+    output_path = report_path(FLEET_REPORT_NAME)
+    with atomic_report(output_path) as stream:
+        write_fleet_report(results, stream)
+    print(f"\n✓ Fleet report saved to: {output_path}")
+
+    return {
+        "workers": [r.worker for r in results],
         "report_path": str(output_path),
-        "claims_count": len(validator.claims),
-        "categories": len(ClaimCategory)
+        "worker_reports": {r.worker: r.report_path for r in results if r.ok},
+        "errors": {r.worker: r.error for r in results if not r.ok},
     }
 
 
 if __name__ == "__main__":
-    result = main()
-    print("\n" + "="*70)
-    print(json.dumps({
-        "status": "success",
-        "worker": result["worker"],
-        "report_path": result["report_path"],
-        "total_claims": result["claims_count"],
-        "total_categories": result["categories"]
-    }, indent=2))
-    print("="*70)
+    main()
@@ -0,0 +1,308 @@
+"""
+Continuous Compliance Watch
+Long-running daemon that re-checks each claim on its own schedule
+
+A one-shot validator run pays interpreter start, deployments.yaml
+parsing, TLS setup and connection establishment every time it is
+launched from cron. The watcher loads everything once and keeps it warm:
+one ClaimTester (and its HTTP session) per worker, one claim thread pool,
+the workers' result caches and the result history stay open across
+cycles.
+
+Scheduling:
+- Each claim has an interval: exact claim ID, then category prefix from
+  the deployment's `watch.intervals`, then DEFAULT_INTERVALS
+- Every next run is jittered by +/- `watch.jitter` (a fraction of the
+  delay) so claims and workers drift apart instead of probing in lockstep
+- A claim that could not settle (WARN, including claims that raised)
+  backs off exponentially: interval x 2^failures, capped at
+  `watch.max_backoff` (never below the interval itself); the next
+  PASS, FAIL or MANUAL resets the claim to its normal interval
+- Claims with a fresh entry in the result cache start from it instead
+  of being probed at startup
+- Each check runs under a per-claim timeout (--claim-timeout, default
+  DEFAULT_CLAIM_TIMEOUT): a hung probe is reported as WARN and abandoned
+  so it cannot hold a pool slot, and stop() is noticed within STOP_POLL
+  seconds even while every slot is busy
+
+Usage:
+  python tools/security/validator.py --worker resin --watch
+  python tools/security/validator.py --all --watch --jobs 8 --output ndjson
+"""
+
+import heapq
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+import tracing
+from claim_tests import ClaimTester, ValidationStatus, get_claim_tests
+from executor import ClaimExecutor
+from result_cache import ResultCache
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Seconds between checks per claim ID or category prefix of the claim ID
+DEFAULT_INTERVALS: Dict[str, float] = {
+    "COMPLIANCE": DAY,  # Manual attestations; re-emitted so dashboards stay current
+    # Bursts of hundreds of requests that trip the worker's own rate limiter
+    "API_RATE_LIMIT": DAY,
+    "API_INPUT_VALIDATION": DAY,
+    "INFRA": 6 * HOUR,
+    "ENC": HOUR,
+    "PERF": HOUR,  # Latency samples add load of their own
+    "AUTH": 15 * MINUTE,
+    "DATA": 15 * MINUTE,
+    "API": 15 * MINUTE,
+    "LOG": 5 * MINUTE,  # Incremental: only new Logpush segments are scanned
+}
+
+DEFAULT_INTERVAL: float = 15 * MINUTE
+DEFAULT_JITTER = 0.1
+DEFAULT_MAX_BACKOFF: float = 4 * HOUR
+DEFAULT_CLAIM_TIMEOUT: float = 10 * MINUTE
+
+# Longest the scheduler waits on running claims before re-checking stop()
+STOP_POLL: float = 1.0
+
+# Reuse of a worker's TLS probe between the claims that share it
+PROBE_MAX_AGE: float = MINUTE
+
+ClaimResult = Tuple[ValidationStatus, str]
+
+
+@dataclass
+class ScheduledClaim:
+    """Scheduling state of one claim on one worker"""
+    worker: str
+    claim_id: str
+    interval: float
+    next_run: float = 0.0  # Scheduler clock (time.monotonic)
+    failures: int = 0  # Consecutive unsettled results
+    status: Optional[ValidationStatus] = None
+    runs: int = 0
+    running: bool = False
+
+
+@dataclass
+class _Worker:
+    tester: ClaimTester
+    claims: Dict[str, Callable[[], ClaimResult]]
+    cache: Optional[ResultCache]
+
+
+class ComplianceWatcher:
+    """
+    Run claims on a per-claim schedule until stopped
+
+    on_result receives the same arguments as fleet.validate_worker's
+    callback (worker, claim_id, (status, details), duration, cached) and
+    on_change is called as on_change(worker, claim_id, old, new) when a
+    claim's status differs from its previous result. Both are called from
+    the thread running run().
+    """
+
+    def __init__(self, workers: Mapping[str, Tuple[Dict, str]], max_workers: int = 4,
+                 use_cache: bool = True, history=None,
+                 on_result: Optional[Callable] = None, on_change: Optional[Callable] = None,
+                 rng: Optional[random.Random] = None, clock=time.monotonic,
+                 claim_timeout: Optional[float] = DEFAULT_CLAIM_TIMEOUT):
+        """
+        Args:
+            workers: Worker name -> (deployment entry, API key)
+            max_workers: Claims run at the same time across all workers
+            use_cache: Start from, and keep updating, each worker's result cache
+            history: result_history.ResultHistory to record every result in
+            on_result / on_change: Callbacks, see the class docstring
+            rng: Random source for jitter (seed it for reproducible schedules)
+            clock: Monotonic time source
+            claim_timeout: Seconds before a running claim is reported as WARN
+                and abandoned (None = no limit)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.history = history
+        self.on_result = on_result
+        self.on_change = on_change
+        self.rng = rng or random.Random()
+        self.clock = clock
+        self.claim_timeout = claim_timeout
+        self.stop_event = threading.Event()
+
+        self._workers: Dict[str, _Worker] = {}
+        self._configs: Dict[str, Dict] = {}
+        self.schedule: Dict[Tuple[str, str], ScheduledClaim] = {}
+        now = clock()
+        for name, (config, api_key) in workers.items():
+            tester = ClaimTester(config["url"], api_key, config, name)
+            tester.probe_max_age = PROBE_MAX_AGE
+            cache = ResultCache.for_worker(name, config) if use_cache else None
+            worker = _Worker(tester, get_claim_tests(tester), cache)
+            self._workers[name] = worker
+            self._configs[name] = config
+
+            cached = cache.lookup(worker.claims) if cache is not None else {}
+            for claim_id in worker.claims:
+                entry = ScheduledClaim(name, claim_id, self.interval(config, claim_id),
+                                       next_run=now)
+                if claim_id in cached:
+                    entry.status = cached[claim_id][0]
+                    entry.next_run = now + self._jittered(entry.interval, name)
+                    self._report(name, claim_id, cached[claim_id], None, True)
+                self.schedule[name, claim_id] = entry
+
+    @staticmethod
+    def interval(config: Dict, claim_id: str) -> float:
+        """Seconds between checks of a claim for a deployment entry"""
+        overrides = (config.get("watch") or {}).get("intervals") or {}
+        category = claim_id.split("_", 1)[0]
+        for table in (overrides, DEFAULT_INTERVALS):
+            for key in (claim_id, category):
+                if key in table:
+                    return float(table[key])
+        return DEFAULT_INTERVAL
+
+    def stop(self):
+        """Stop after the claims currently running finish (or time out)"""
+        self.stop_event.set()
+
+    def run(self, duration: Optional[float] = None) -> Dict[str, int]:
+        """
+        Check claims as they fall due until stop() (or `duration` seconds)
+
+        Returns:
+            Runs per worker
+        """
+        deadline = None if duration is None else self.clock() + duration
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="watch") as pool:
+            while not self.stop_event.is_set():
+                now = self.clock()
+                if deadline is not None and now >= deadline:
+                    break
+                for entry in self._due(now, self.max_workers - len(running)):
+                    entry.running = True
+                    future = pool.submit(self._check, entry)
+                    running[future] = entry
+
+                if len(running) < self.max_workers:
+                    timeout = self._next_wake(now, deadline)
+                else:
+                    # Pool full: nothing new can start before a claim finishes
+                    timeout = STOP_POLL if deadline is None else max(0.0, deadline - now)
+                if running:
+                    # Bounded so stop() is honoured while claims are running
+                    done, _ = wait(running, timeout=min(timeout, STOP_POLL),
+                                   return_when=FIRST_COMPLETED)
+                    self._finish([(running.pop(f), *f.result()) for f in done])
+                else:
+                    self.stop_event.wait(timeout)
+
+            # Let running claims finish (bounded by claim_timeout) so their
+            # results are recorded
+            if running:
+                done, _ = wait(running)
+                self._finish([(running.pop(f), *f.result()) for f in done])
+
+        runs: Dict[str, int] = {}
+        for entry in self.schedule.values():
+            runs[entry.worker] = runs.get(entry.worker, 0) + entry.runs
+        return runs
+
+    # ============================================================================
+    # Helper methods
+    # ============================================================================
+
+    def _due(self, now: float, slots: int) -> List[ScheduledClaim]:
+        """Up to `slots` idle claims whose time has come, most overdue first"""
+        if slots <= 0:
+            return []
+        due = [e for e in self.schedule.values() if not e.running and e.next_run <= now]
+        return heapq.nsmallest(slots, due, key=lambda e: e.next_run)
+
+    def _next_wake(self, now: float, deadline: Optional[float]) -> float:
+        idle = [e.next_run for e in self.schedule.values() if not e.running]
+        wake = min(idle, default=now + DEFAULT_INTERVAL)
+        if deadline is not None:
+            wake = min(wake, deadline)
+        return max(0.0, wake - now)
+
+    def _check(self, entry: ScheduledClaim) -> Tuple[ClaimResult, float]:
+        """Run one claim (in a pool thread) under the per-claim timeout"""
+        start = time.perf_counter()
+        func = self._workers[entry.worker].claims[entry.claim_id]
+        with tracing.span(entry.claim_id, "claim", worker=entry.worker) as span_args:
+            try:
+                if self.claim_timeout is None:
+                    result = func()
+                else:
+                    # A claim that times out keeps running in the executor's
+                    # own thread; this pool slot is freed for the next check
+                    executor = ClaimExecutor(timeout=self.claim_timeout)
+                    result = executor.run({entry.claim_id: func})[entry.claim_id]
+            except NotImplementedError as e:
+                result = (ValidationStatus.PENDING, str(e))
+            except Exception as e:
+                result = (ValidationStatus.WARN, f"Claim raised {type(e).__name__}: {e}")
+            span_args["status"] = result[0].name
+        return result, time.perf_counter() - start
+
+    def _finish(self, completed: List[Tuple[ScheduledClaim, ClaimResult, float]]):
+        """Reschedule finished claims and record their results"""
+        if not completed:
+            return
+        now = self.clock()
+        by_worker: Dict[str, Dict[str, Tuple[ClaimResult, float]]] = {}
+        for entry, result, duration in completed:
+            entry.running = False
+            entry.runs += 1
+            status = result[0]
+            if status is ValidationStatus.WARN:
+                entry.failures += 1
+                delay = min(entry.interval * 2 ** entry.failures,
+                            max(entry.interval, self._option(entry.worker, "max_backoff")))
+            else:
+                # Settled, or not implemented (PENDING): back to the normal interval
+                entry.failures = 0
+                delay = entry.interval
+            entry.next_run = now + self._jittered(delay, entry.worker)
+
+            previous, entry.status = entry.status, status
+            if self.on_change is not None and previous is not None and previous != status:
+                self.on_change(entry.worker, entry.claim_id, previous, status)
+            self._report(entry.worker, entry.claim_id, result, duration, False)
+            by_worker.setdefault(entry.worker, {})[entry.claim_id] = (result, duration)
+
+        for name, finished in by_worker.items():
+            results = {claim_id: result for claim_id, (result, _) in finished.items()}
+            cache = self._workers[name].cache
+            if cache is not None:
+                cache.update(results)
+                cache.save()
+            if self.history is not None:
+                self.history.record_run(
+                    name, self._configs[name]["url"], results,
+                    durations={claim_id: d for claim_id, (_, d) in finished.items()},
+                )
+
+    def _option(self, worker: str, key: str) -> float:
+        """`watch.max_backoff` / `watch.jitter` of a worker's deployment entry"""
+        watch = self._configs[worker].get("watch") or {}
+        default = {"max_backoff": DEFAULT_MAX_BACKOFF, "jitter": DEFAULT_JITTER}[key]
+        return float(watch.get(key, default))
+
+    def _jittered(self, delay: float, worker: str) -> float:
+        jitter = self._option(worker, "jitter")
+        return delay * (1 + self.rng.uniform(-jitter, jitter))
+
+    def _report(self, worker: str, claim_id: str, result: ClaimResult,
+                duration: Optional[float], cached: bool):
+        if self.on_result is not None:
+            self.on_result(worker, claim_id, result, duration, cached)